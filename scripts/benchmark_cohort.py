@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+End-to-end cohort benchmark.
+
+Seeds N new hires and M departures into the local fake services, points
+CONFIG at them, and drives the real `job_scan_dual_validation` (with a fake
+`gam` binary and a WinRM stub). Writes a JSON report with wall-clock time,
+per-step p50/p95/p99 and outbound calls per integration so branches can be
+compared run-for-run. `--record` captures the run's HTTP traffic to a
+cassette; `--cassette` replays one (fakes are not started) instead.
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Allow running as `python3 scripts/benchmark_cohort.py` or by absolute path.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from servus import cassette, tracing
+from servus.config import CONFIG
+from servus.fake_services import SERVICES, FakeServices
+from servus.integrations import ad, badge_queue, google_gam
+from servus.state import RunState
+
+SCHEDULER_PATH = REPO_ROOT / "scripts" / "scheduler.py"
+OUTBOUND_KINDS = {"http", "subprocess", "winrm"}
+
+FAKE_GAM_SOURCE = """#!{python}
+import os, sys, time
+latency_ms = float(os.environ.get("SERVUS_FAKE_GAM_LATENCY_MS") or 0)
+if latency_ms:
+    time.sleep(latency_ms / 1000.0)
+args = sys.argv[1:]
+if args[:2] == ["info", "user"] and len(args) > 2:
+    email = args[2]
+    if "-archive@" in email:
+        sys.stderr.write("ERROR: User: " + email + ", Does not exist\\n")
+        sys.exit(56)
+    print("User: " + email)
+    print("Org Unit Path: /New Hires")
+    print("Account suspended: False")
+    sys.exit(0)
+print("OK: " + " ".join(args))
+"""
+
+
+class _StubWinRMResult:
+    def __init__(self, std_out):
+        self.status_code = 0
+        self.std_out = std_out.encode("utf-8")
+        self.std_err = b""
+
+
+class StubWinRMSession:
+    """Answers the two PowerShell scripts SERVUS sends, after optional latency."""
+
+    def __init__(self, latency_ms=0.0):
+        self.latency_ms = latency_ms
+
+    def run_ps(self, script):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        if "Disable-ADAccount" in script:
+            return _StubWinRMResult("DISABLED|MOVED")
+        return _StubWinRMResult("FOUND\nGROUPS:CN=FTE,OU=Groups\nEMPTYPE:Full-Time")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for an empty series."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(math.ceil(pct / 100.0 * len(ordered))))
+    return round(ordered[rank - 1], 3)
+
+
+def _latency_summary(durations_ms):
+    return {
+        "count": len(durations_ms),
+        "p50_ms": percentile(durations_ms, 50),
+        "p95_ms": percentile(durations_ms, 95),
+        "p99_ms": percentile(durations_ms, 99),
+        "max_ms": round(max(durations_ms), 3) if durations_ms else None,
+        "total_ms": round(sum(durations_ms), 3),
+    }
+
+
+def summarize_spans(spans):
+    """Fold collected span dicts into per-step, per-integration and per-run stats."""
+    steps, outbound, runs = {}, {}, {}
+    for item in spans:
+        attributes = item.get("attributes") or {}
+        duration = float(item.get("duration_ms") or 0.0)
+        failed = item.get("status") == tracing.STATUS_ERROR
+        if item.get("kind") in OUTBOUND_KINDS:
+            bucket = outbound.setdefault(attributes.get("integration") or "unknown", {"durations": [], "errors": 0})
+        elif item.get("name") == "workflow.step":
+            bucket = steps.setdefault(attributes.get("action") or "unknown", {"durations": [], "errors": 0})
+        elif item.get("name") == "workflow.run":
+            bucket = runs.setdefault(attributes.get("workflow") or "unknown", {"durations": [], "errors": 0})
+        else:
+            continue
+        bucket["durations"].append(duration)
+        bucket["errors"] += 1 if failed else 0
+
+    def _fold(buckets, error_key):
+        folded = {}
+        for name in sorted(buckets):
+            summary = _latency_summary(buckets[name]["durations"])
+            summary[error_key] = buckets[name]["errors"]
+            folded[name] = summary
+        return folded
+
+    return {
+        "steps": _fold(steps, "failures"),
+        "outbound": _fold(outbound, "errors"),
+        "runs": _fold(runs, "failed"),
+    }
+
+
+_scheduler_module = None
+
+
+def _load_scheduler():
+    # Loaded once: importing the scheduler attaches log handlers to the root logger.
+    global _scheduler_module
+    if _scheduler_module is None:
+        spec = importlib.util.spec_from_file_location("servus_benchmark_scheduler", SCHEDULER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(module)
+        _scheduler_module = module
+    return _scheduler_module
+
+
+def _write_fake_gam(directory):
+    path = Path(directory) / "gam"
+    path.write_text(FAKE_GAM_SOURCE.format(python=sys.executable), encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return str(path)
+
+
+def _git_revision():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD", "HEAD"],
+            cwd=str(REPO_ROOT),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        branch, commit = (result.stdout.split() + ["", ""])[:2]
+        return {"branch": branch or None, "commit": commit or None}
+    except Exception:
+        return {"branch": None, "commit": None}
+
+
+def run_benchmark(
+    new_hires=25,
+    departures=10,
+    scans=1,
+    seed=None,
+    latency_ms=0.0,
+    jitter_ms=0.0,
+    error_rate=0.0,
+    rate_limit=0.0,
+    service_latency=None,
+    gam_latency_ms=0.0,
+    winrm_latency_ms=0.0,
+    label=None,
+    record_path=None,
+    replay_path=None,
+    latency_scale=0.0,
+):
+    """
+    Run the cohort through the scheduler against fresh fakes and return the
+    report dict. With `replay_path` the HTTP traffic comes from a cassette.
+    """
+    spans = []
+
+    def _collect(span):
+        spans.append(span.to_dict())
+
+    with tempfile.TemporaryDirectory(prefix="servus_bench_") as work_dir, ExitStack() as stack:
+        fakes = FakeServices(seed=seed)
+        fakes.set_behavior(latency_ms=latency_ms, jitter_ms=jitter_ms, error_rate=error_rate,
+                           rate_limit_per_sec=rate_limit)
+        for service, value in (service_latency or {}).items():
+            fakes.set_behavior(service, latency_ms=value)
+        if replay_path:
+            player = cassette.CassettePlayer(replay_path)
+            seeded = {"new_hires": [], "departures": []}
+            overrides = dict(fakes.config_overrides())
+            overrides.update(player.endpoints)
+            # Webhook posts are never recorded; SQS goes through boto3, not the
+            # cassette, so badge jobs are accepted locally like GAM and WinRM.
+            overrides["SLACK_WEBHOOK_URL"] = None
+            stack.enter_context(patch.object(badge_queue, "send_print_job", lambda user_data: True))
+        else:
+            seeded = fakes.seed_cohort(new_hires, departures)
+            stack.enter_context(fakes)
+            overrides = dict(fakes.config_overrides())
+
+        scheduler = _load_scheduler()
+        overrides.update({
+            "OFFBOARDING_EXECUTION_MODE": "live",
+            "SLACK_NOTIFICATION_MODE": "summary",
+            "AD_USER": "benchmark",
+            "AD_PASS": "benchmark",
+            # Measure the scan's runs themselves, not the wait for each trigger's effective time.
+            "LIFECYCLE_TIMERS_ENABLED": False,
+        })
+        stack.enter_context(patch.dict(CONFIG, overrides))
+        stack.enter_context(patch.dict(os.environ, {"SERVUS_FAKE_GAM_LATENCY_MS": str(gam_latency_ms)}))
+        stack.enter_context(patch.object(google_gam, "GAM_PATH", _write_fake_gam(work_dir)))
+        stack.enter_context(patch.object(ad, "get_session", lambda: StubWinRMSession(winrm_latency_ms)))
+        stack.enter_context(patch.object(
+            scheduler, "scheduler_state", RunState(state_file=str(Path(work_dir) / "scheduler_state.json"))
+        ))
+        stack.enter_context(patch.object(
+            scheduler, "OVERRIDE_CSV_PATH", str(Path(work_dir) / "manual_onboarding_overrides.csv")
+        ))
+        stack.enter_context(patch.object(
+            scheduler, "PENDING_OFFBOARD_CSV_PATH", str(Path(work_dir) / "pending_offboards.csv")
+        ))
+        scheduler.ensure_override_csv(scheduler.OVERRIDE_CSV_PATH)
+        scheduler._ensure_pending_offboarding_csv(scheduler.PENDING_OFFBOARD_CSV_PATH)
+
+        tracing.instrument_http()
+        if replay_path:
+            cassette.start_replay(replay_path, latency_scale=latency_scale)
+            stack.callback(cassette.stop)
+        elif record_path:
+            cassette.start_recording(record_path, endpoints={key: overrides.get(key) for key in cassette.ENDPOINT_KEYS})
+            stack.callback(cassette.stop)
+        tracing.add_span_listener(_collect)
+        scan_seconds = []
+        try:
+            for _ in range(max(1, scans)):
+                started = time.perf_counter()
+                scheduler.job_scan_dual_validation()
+                scan_seconds.append(round(time.perf_counter() - started, 4))
+        finally:
+            tracing.remove_span_listener(_collect)
+
+        summary = summarize_spans(spans)
+        report = {
+            "label": label,
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "parameters": {
+                "new_hires": new_hires,
+                "departures": departures,
+                "scans": max(1, scans),
+                "seed": seed,
+                "latency_ms": latency_ms,
+                "jitter_ms": jitter_ms,
+                "error_rate": error_rate,
+                "rate_limit_per_sec": rate_limit,
+                "service_latency_ms": dict(service_latency or {}),
+                "gam_latency_ms": gam_latency_ms,
+                "winrm_latency_ms": winrm_latency_ms,
+                "cassette_recorded_to": record_path,
+                "cassette_replayed_from": replay_path,
+                "cassette_latency_scale": latency_scale if replay_path else None,
+            },
+            "wall_clock_seconds": round(sum(scan_seconds), 4),
+            "scan_seconds": scan_seconds,
+            "runs": summary["runs"],
+            "completed": {
+                "onboarding": len(scheduler.scheduler_state.get(scheduler.ONBOARDING_SUCCESS_KEY, {})),
+                "offboarding": len(scheduler.scheduler_state.get(scheduler.OFFBOARDING_SUCCESS_KEY, {})),
+                "seeded_new_hires": len(seeded["new_hires"]),
+                "seeded_departures": len(seeded["departures"]),
+            },
+            "steps": summary["steps"],
+            "outbound": summary["outbound"],
+            "outbound_calls_total": sum(item["count"] for item in summary["outbound"].values()),
+            "fake_service_calls": dict(fakes.call_counts),
+            "fake_service_throttled": dict(fakes.throttled_counts),
+        }
+    return report
+
+
+def _print_report(report, output_path):
+    print("")
+    print(f"Cohort benchmark ({report['parameters']['new_hires']} hires / "
+          f"{report['parameters']['departures']} departures): {report['wall_clock_seconds']:.2f}s wall clock")
+    completed = report["completed"]
+    print(f"  completed onboarding={completed['onboarding']}/{completed['seeded_new_hires']} "
+          f"offboarding={completed['offboarding']}/{completed['seeded_departures']}")
+    print("  Steps (p50 / p95 / p99 ms):")
+    for action, stats in report["steps"].items():
+        print(f"    {action:<36} n={stats['count']:<5} {stats['p50_ms']} / {stats['p95_ms']} / {stats['p99_ms']}"
+              f"  failures={stats['failures']}")
+    print("  Outbound calls:")
+    for integration, stats in report["outbound"].items():
+        print(f"    {integration:<16} calls={stats['count']:<6} errors={stats['errors']:<4} p95={stats['p95_ms']}ms")
+    print(f"  Total outbound calls: {report['outbound_calls_total']}")
+    print(f"Report written to {output_path}")
+
+
+def _parse_service_latency(raw_items):
+    values = {}
+    for raw in raw_items or []:
+        service, sep, value = str(raw).partition("=")
+        service = service.strip().lower()
+        if not sep or service not in SERVICES:
+            raise SystemExit(f"--service-latency expects service=ms with service in {', '.join(SERVICES)}")
+        values[service] = float(value)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a seeded cohort through the real scheduler scan.")
+    parser.add_argument("--new-hires", type=int, default=25)
+    parser.add_argument("--departures", type=int, default=10)
+    parser.add_argument("--scans", type=int, default=1, help="Scans to run back-to-back (later scans hit dedupe).")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fake SaaS latency for every service.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests/sec per fake service before 429.")
+    parser.add_argument("--service-latency", action="append", metavar="SERVICE=MS")
+    parser.add_argument("--gam-latency-ms", type=float, default=0.0, help="Latency of each fake gam invocation.")
+    parser.add_argument("--winrm-latency-ms", type=float, default=0.0, help="Latency of each stubbed WinRM call.")
+    parser.add_argument("--record", default=None, metavar="PATH", help="Record the run's HTTP traffic to a cassette.")
+    parser.add_argument("--cassette", default=None, metavar="PATH", help="Replay HTTP traffic from a cassette.")
+    parser.add_argument("--latency-scale", type=float, default=0.0,
+                        help="Replay latency as a multiple of recorded latency (0 = instant).")
+    parser.add_argument("--label", default=None, help="Free-form label stored in the report (e.g. branch name).")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="JSON report path (default: servus_state/benchmarks/cohort_<timestamp>.json).",
+    )
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        new_hires=args.new_hires,
+        departures=args.departures,
+        scans=args.scans,
+        seed=args.seed,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        service_latency=_parse_service_latency(args.service_latency),
+        gam_latency_ms=args.gam_latency_ms,
+        winrm_latency_ms=args.winrm_latency_ms,
+        label=args.label,
+        record_path=args.record,
+        replay_path=args.cassette,
+        latency_scale=args.latency_scale,
+    )
+
+    output_path = args.output or str(
+        REPO_ROOT / "servus_state" / "benchmarks" / f"cohort_{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+    _print_report(report, output_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
+import argparse
 import sys
 import os
 import logging
 from datetime import datetime
+from unittest.mock import patch
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from servus import cassette, tracing
+from servus.config import CONFIG
+from servus.core import trigger_validator
 from servus.orchestrator import Orchestrator
 from servus.models import UserProfile
 from servus.state import RunState
@@ -19,9 +24,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger("servus.dry_run")
 
+# Credentials the clients check before calling out; replay never sends them anywhere.
+REPLAY_PLACEHOLDER_CREDENTIALS = {
+    "RIPPLING_API_TOKEN": "replay",
+    "FRESHSERVICE_API_KEY": "replay",
+    "OKTA_TOKEN": "replay",
+}
+
+
+def _run_dry_workflow(workflow_name, user_profile):
+    workflow_path = os.path.join("servus", "workflows", workflow_name)
+    workflow = load_workflow(workflow_path)
+    context = {"user_profile": user_profile, "dry_run": True}
+    orch = Orchestrator(workflow, context, RunState(), logger)
+    return orch.run(dry_run=True)
+
+
 def run_simulation():
     logger.info("🧪 STARTING FULL ORCHESTRATION DRY RUN")
-    
+
     # 1. Mock Data
     mock_profile = UserProfile(
         first_name="Simulation",
@@ -33,23 +54,14 @@ def run_simulation():
         manager_email="manager@boom.aero",
         start_date=datetime.now().strftime("%Y-%m-%d")
     )
-    
-    context = {
-        "user_profile": mock_profile,
-        "dry_run": True
-    }
-    
+
     logger.info(f"   Target: {mock_profile.work_email}")
     logger.info(f"   Role: {mock_profile.employment_type}")
     logger.info("------------------------------------------------")
 
     # 2. Load workflow and run orchestrator in dry-run mode.
     try:
-        workflow_path = os.path.join("servus", "workflows", "onboard_us.yaml")
-        workflow = load_workflow(workflow_path)
-        state = RunState()
-        orch = Orchestrator(workflow, context, state, logger)
-        result = orch.run(dry_run=True)
+        result = _run_dry_workflow("onboard_us.yaml", mock_profile)
 
         logger.info("------------------------------------------------")
         logger.info("✅ DRY RUN COMPLETE (success=%s)", result.get("success"))
@@ -58,5 +70,52 @@ def run_simulation():
         import traceback
         traceback.print_exc()
 
+
+def run_cassette_simulation(cassette_path, latency_scale=0.0, as_of=None):
+    """
+    Replay a recorded day's scan offline: dual validation reads come from the
+    cassette, then every validated person runs through the workflows in dry-run.
+    """
+    tracing.instrument_http()
+    player = cassette.start_replay(cassette_path, latency_scale=latency_scale)
+    scan_date = as_of or player.recorded_date
+    logger.info("🧪 STARTING CASSETTE REPLAY DRY RUN (%d interactions, date=%s)", len(player), scan_date)
+
+    overrides = dict(REPLAY_PLACEHOLDER_CREDENTIALS)
+    overrides.update(player.endpoints)
+    try:
+        with patch.dict(CONFIG, overrides):
+            onboarding = trigger_validator.validate_and_fetch_onboarding_context(as_of=scan_date)
+            offboarding = trigger_validator.validate_and_fetch_offboarding_context(as_of=scan_date)
+            logger.info("------------------------------------------------")
+            logger.info("   Validated onboarding=%d offboarding=%d", len(onboarding), len(offboarding))
+            for trigger in onboarding:
+                result = _run_dry_workflow("onboard_us.yaml", trigger.user_profile)
+                logger.info("   onboarding %s success=%s", trigger.user_profile.work_email, result.get("success"))
+            for trigger in offboarding:
+                result = _run_dry_workflow("offboard_us.yaml", trigger.user_profile)
+                logger.info("   offboarding %s success=%s", trigger.user_profile.work_email, result.get("success"))
+    finally:
+        cassette.stop()
+
+    if player.misses:
+        logger.warning("⚠️ %d request(s) had no cassette entry (first: %s)", len(player.misses), player.misses[0])
+    logger.info("✅ CASSETTE REPLAY COMPLETE")
+
+
 if __name__ == "__main__":
-    run_simulation()
+    parser = argparse.ArgumentParser(description="SERVUS orchestration dry run.")
+    parser.add_argument("--cassette", help="Replay a recorded cassette (SERVUS_CASSETTE_MODE=record) offline.")
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=0.0,
+        help="Replay latency as a multiple of the recorded latency (0 = instant, 1 = original).",
+    )
+    parser.add_argument("--date", help="Scan date to replay (YYYY-MM-DD, default: the cassette's recorded date).")
+    args = parser.parse_args()
+
+    if args.cassette:
+        run_cassette_simulation(args.cassette, latency_scale=args.latency_scale, as_of=args.date)
+    else:
+        run_simulation()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Allow running as `python3 scripts/fake_services.py` or by absolute path.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from servus.fake_services import SERVICES, FakeServices
+
+
+def _parse_service_values(raw_items, option_name):
+    """Parse repeated `service=value` options into a dict of floats."""
+    values = {}
+    for raw in raw_items or []:
+        service, sep, value = str(raw).partition("=")
+        service = service.strip().lower()
+        if not sep or service not in SERVICES:
+            raise SystemExit(f"{option_name} expects service=value with service in {', '.join(SERVICES)}")
+        values[service] = float(value)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run local fakes for Rippling, Freshservice, Okta, Slack, Zoom, Linear and SQS."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--new-hires", type=int, default=0, help="Seed N new hires starting today.")
+    parser.add_argument("--departures", type=int, default=0, help="Seed M departures ending today.")
+    parser.add_argument("--date", default=None, help="Seed date (YYYY-MM-DD, default today).")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for jitter/error injection.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency for every service.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform random extra latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 500.")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests/sec per service before 429s.")
+    parser.add_argument(
+        "--service-latency",
+        action="append",
+        metavar="SERVICE=MS",
+        help="Per-service latency override (repeatable), e.g. rippling=250.",
+    )
+    parser.add_argument(
+        "--service-rate-limit",
+        action="append",
+        metavar="SERVICE=RPS",
+        help="Per-service rate limit override (repeatable), e.g. slack=1.",
+    )
+    args = parser.parse_args()
+
+    fakes = FakeServices(host=args.host, port=args.port, seed=args.seed)
+    fakes.set_behavior(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_per_sec=args.rate_limit,
+    )
+    for service, value in _parse_service_values(args.service_latency, "--service-latency").items():
+        fakes.set_behavior(service, latency_ms=value)
+    for service, value in _parse_service_values(args.service_rate_limit, "--service-rate-limit").items():
+        fakes.set_behavior(service, rate_limit_per_sec=value)
+
+    seeded = fakes.seed_cohort(args.new_hires, args.departures, on_date=args.date)
+    fakes.start()
+
+    print(f"Fake services listening on {fakes.base_url}")
+    print(f"Seeded {len(seeded['new_hires'])} new hire(s) and {len(seeded['departures'])} departure(s).")
+    print("Point SERVUS at the fakes with:")
+    for key, value in sorted(fakes.env_overrides().items()):
+        print(f"  export {key}={value}")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\nStopping fake services.")
+        print("Calls per service: " + ", ".join(f"{name}={count}" for name, count in fakes.call_counts.items()))
+    finally:
+        fakes.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from servus.config import CONFIG
+from servus.control import send_command
 from servus.core.manual_override_enrichment import enrich_from_integrations
 from servus.core.manual_override_queue import (
     HOLD_STATUS,
@@ -230,7 +231,7 @@ def main() -> int:
             args.csv_path,
         )
         if enqueue_status == READY_STATUS:
-            logger.info("Scheduler will pick this up on the next polling cycle.")
+            _notify_scheduler(request_id)
         else:
             logger.info("Request is HOLD. Set status=READY (or re-run with --ready --allow-update) when approved.")
         return 0
@@ -239,6 +240,22 @@ def main() -> int:
         return 1
 
 
+def _notify_scheduler(request_id: str) -> None:
+    """Ask a running scheduler to dispatch the READY row now; otherwise the next poll picks it up."""
+    socket_path = str(CONFIG.get("SCHEDULER_CONTROL_SOCKET") or "").strip()
+    if socket_path:
+        try:
+            reply = send_command(socket_path, "enqueue", request_id=request_id)
+        except OSError as exc:
+            logger.info("Scheduler control socket unavailable (%s).", exc)
+        else:
+            if reply.get("ok"):
+                logger.info("Scheduler accepted request_id=%s: %s %s", request_id, reply.get("outcome"), reply.get("reason") or "")
+                return
+            logger.warning("Scheduler did not dispatch request_id=%s: %s", request_id, reply.get("error"))
+    logger.info("Scheduler will pick this up on the next polling cycle.")
+
+
 def _resolve_confirmation_sources(
     args: argparse.Namespace,
     auto_sources: List[str],
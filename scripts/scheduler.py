@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 
+import argparse
+import contextvars
 import csv
 import logging
+import multiprocessing
 import os
 import re
 import shutil
+import signal
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -19,20 +25,34 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from servus import bulkheads, cassette, control, hot_reload, metrics, tracing, webhooks
+from servus.cadence import AdaptiveCadence, parse_hour_range
 from servus.actions import ACTIONS
 from servus.config import CONFIG
 from servus.core import trigger_validator
+from servus.core.trigger_validator import ValidatedTrigger
+from servus.filelock import InterprocessLock
+from servus.inflight import InflightRegistry
+from servus.lease import configure_lease, default_instance_id
+from servus.core.match_table import match_table
+from servus.integrations import rippling
+from servus.models import UserProfile
 from servus.core.manual_override_queue import (
+    READY_STATUS,
     ManualOverrideRequest,
     build_onboarding_dedupe_key,
     ensure_override_csv,
+    find_requests,
     load_ready_requests,
     mark_request_error,
     remove_request,
+    request_from_row,
 )
 from servus.orchestrator import Orchestrator
 from servus.safety import protected_policy_summary
 from servus.state import RunState
+from servus.timers import effective_at, location_timezone, timer_queue
+from servus.work_queue import configure_work_queue
 from servus.workflow import load_workflow
 
 # Configure Logging (Rotating File + Stream)
@@ -63,6 +83,60 @@ ensure_override_csv(OVERRIDE_CSV_PATH)
 PENDING_OFFBOARD_CSV_PATH = CONFIG.get("OFFBOARDING_PENDING_CSV", "servus_state/pending_offboards.csv")
 
 ONBOARDING_SUCCESS_KEY = "onboarding_success"
+# Set by the webhook receiver; the main loop runs a scan as soon as it sees it.
+scan_requested = threading.Event()
+# Workflow runs keyed by dedupe key. Inline until run_scheduler() configures
+# executor threads, so direct callers (tests, benchmark) stay synchronous.
+run_registry = InflightRegistry(max_workers=0)
+# Runs on executor threads share the success history and the CSV queues with the scan thread.
+# With a worker fleet the CSV locks also extend to worker processes (see _share_state_with_workers).
+_history_lock = InterprocessLock()
+_pending_csv_lock = InterprocessLock()
+_override_csv_lock = InterprocessLock()
+# Set by run_scheduler when SCHEDULER_LEASE_FILE is configured; None means single-instance (always active).
+scheduler_lease = None
+# Lease epoch the current run started under (see _run_under_epoch); stamped on its completion record.
+_run_epoch = contextvars.ContextVar("servus_run_epoch", default=None)
+# Set by run_scheduler when WORK_QUEUE_BACKEND is configured; runs are then published for worker processes.
+work_queue = None
+# Item a worker process is executing; a drain that passes its deadline hands it back to the queue.
+_active_work_item = None
+# SIGHUP asks the main loop to reload config, policies and workflows; SIGTERM starts a graceful drain.
+reload_requested = threading.Event()
+draining = threading.Event()
+PARKED_RUNS_KEY = "parked_runs"
+# Read once at startup: a SIGHUP reload warns that these need a restart instead.
+RESTART_REQUIRED_CONFIG = (
+    "SCHEDULER_STATE_FILE",
+    "ONBOARDING_OVERRIDE_CSV",
+    "OFFBOARDING_PENDING_CSV",
+    "SCHEDULER_ASYNC_RUNS_ENABLED",
+    "SCHEDULER_RUN_CONCURRENCY",
+    "SCHEDULER_REVOCATION_RESERVED_WORKERS",
+    "SCHEDULER_ADAPTIVE_ENABLED",
+    "SCHEDULER_MIN_INTERVAL_SECONDS",
+    "SCHEDULER_MAX_INTERVAL_SECONDS",
+    "SCHEDULER_BACKOFF_FACTOR",
+    "SCHEDULER_HOT_HOURS",
+    "SCHEDULER_CONTROL_SOCKET",
+    "SCHEDULER_LEASE_FILE",
+    "SCHEDULER_LEASE_TTL_SECONDS",
+    "SCHEDULER_INSTANCE_ID",
+    "WORK_QUEUE_BACKEND",
+    "WORK_QUEUE_FILE",
+    "WORK_QUEUE_SQS_URL",
+    "WEBHOOK_PORT",
+    "WEBHOOK_HOST",
+    "WEBHOOK_RECONCILE_MINUTES",
+    "RIPPLING_WEBHOOK_SECRET",
+    "FRESHSERVICE_WEBHOOK_SECRET",
+    "RIPPLING_DIRECTORY_REFRESH_SECONDS",
+    "METRICS_TEXTFILE",
+    "METRICS_HTTP_PORT",
+    "METRICS_HTTP_HOST",
+    "TRACE_ENABLED",
+    "TRACE_FILE",
+)
 OFFBOARDING_SUCCESS_KEY = "offboarding_success"
 
 scheduler_state = RunState(state_file=SCHEDULER_STATE_FILE)
@@ -197,6 +271,11 @@ def _build_offboarding_dedupe_key(user_profile):
 
 
 def _stage_pending_offboarding(validated_trigger, status="PENDING", last_error=""):
+    with _pending_csv_lock:
+        return _stage_pending_offboarding_locked(validated_trigger, status=status, last_error=last_error)
+
+
+def _stage_pending_offboarding_locked(validated_trigger, status, last_error):
     rows, headers = _read_pending_offboarding_rows(PENDING_OFFBOARD_CSV_PATH)
 
     user = validated_trigger.user_profile
@@ -244,12 +323,13 @@ def _stage_pending_offboarding(validated_trigger, status="PENDING", last_error="
 
 def _remove_pending_offboarding(user_profile):
     dedupe_key = _build_offboarding_dedupe_key(user_profile)
-    rows, headers = _read_pending_offboarding_rows(PENDING_OFFBOARD_CSV_PATH)
-    remaining = [row for row in rows if row.get("dedupe_key") != dedupe_key]
-    if len(remaining) == len(rows):
-        return False
-    _write_pending_offboarding_rows(PENDING_OFFBOARD_CSV_PATH, headers, remaining)
-    return True
+    with _pending_csv_lock:
+        rows, headers = _read_pending_offboarding_rows(PENDING_OFFBOARD_CSV_PATH)
+        remaining = [row for row in rows if row.get("dedupe_key") != dedupe_key]
+        if len(remaining) == len(rows):
+            return False
+        _write_pending_offboarding_rows(PENDING_OFFBOARD_CSV_PATH, headers, remaining)
+        return True
 
 
 # -----------------
@@ -269,13 +349,13 @@ def run_onboarding(user_profile, trigger_source="dual_validation", request_id=No
     """Helper to trigger the Onboarding Workflow."""
     try:
         logger.info(
-            "🚀 Triggering Onboarding for %s (source=%s, request_id=%s)...",
+            "🚀 Triggering Onboarding for %s (source=%s, request_id=%s, instance=%s)...",
             user_profile.work_email,
             trigger_source,
             request_id or "n/a",
+            _instance_id(),
         )
 
-        wf = load_workflow(ONBOARD_WORKFLOW_PATH)
         state = RunState()
         context = {
             "config": CONFIG,
@@ -285,8 +365,11 @@ def run_onboarding(user_profile, trigger_source="dual_validation", request_id=No
             "request_id": request_id,
         }
 
-        orch = Orchestrator(wf, context, state, logger)
-        result = orch.run(dry_run=False)
+        # The run keeps this workflow and these policies even if a SIGHUP reload lands mid-run.
+        with hot_reload.pinned():
+            wf = hot_reload.load(ONBOARD_WORKFLOW_PATH, load_workflow)
+            orch = Orchestrator(wf, context, state, logger)
+            result = orch.run(dry_run=False)
         success = bool(result.get("success", True)) if isinstance(result, dict) else True
         if success:
             _record_successful_onboarding(user_profile, trigger_source, request_id=request_id)
@@ -301,14 +384,14 @@ def run_offboarding(user_profile, trigger_source="dual_validation_departure", re
     try:
         mode = "DRY RUN" if dry_run else "LIVE"
         logger.info(
-            "🛑 Triggering Offboarding (%s) for %s (source=%s, request_id=%s)...",
+            "🛑 Triggering Offboarding (%s) for %s (source=%s, request_id=%s, instance=%s)...",
             mode,
             user_profile.work_email,
             trigger_source,
             request_id or "n/a",
+            _instance_id(),
         )
 
-        wf = load_workflow(OFFBOARD_WORKFLOW_PATH)
         state = RunState()
         context = {
             "config": CONFIG,
@@ -318,8 +401,10 @@ def run_offboarding(user_profile, trigger_source="dual_validation_departure", re
             "request_id": request_id,
         }
 
-        orch = Orchestrator(wf, context, state, logger)
-        result = orch.run(dry_run=dry_run)
+        with hot_reload.pinned():
+            wf = hot_reload.load(OFFBOARD_WORKFLOW_PATH, load_workflow)
+            orch = Orchestrator(wf, context, state, logger)
+            result = orch.run(dry_run=dry_run)
         success = bool(result.get("success", True)) if isinstance(result, dict) else True
         if success and not dry_run:
             _record_successful_offboarding(user_profile, trigger_source, request_id=request_id)
@@ -331,39 +416,154 @@ def run_offboarding(user_profile, trigger_source="dual_validation_departure", re
 
 def _record_successful_onboarding(user_profile, trigger_source, request_id=None):
     dedupe_key = build_onboarding_dedupe_key(user_profile)
-    history = scheduler_state.get(ONBOARDING_SUCCESS_KEY, {})
-    history[dedupe_key] = {
+    record = {
         "work_email": user_profile.work_email,
         "start_date": user_profile.start_date,
         "completed_at": datetime.now(timezone.utc).isoformat(),
         "trigger_source": trigger_source,
         "request_id": request_id,
+        "instance": _instance_id(),
+        "epoch": _run_epoch.get(),
     }
-    scheduler_state.set(ONBOARDING_SUCCESS_KEY, history)
+    # Not fenced: the run's side effects already happened, so the record must
+    # land even if the lease was lost mid-run, or the next holder repeats them.
+    with _history_lock:
+        scheduler_state.update(ONBOARDING_SUCCESS_KEY, lambda history: {**(history or {}), dedupe_key: record}, fenced=False)
 
 
 def _record_successful_offboarding(user_profile, trigger_source, request_id=None):
     dedupe_key = _build_offboarding_dedupe_key(user_profile)
-    history = scheduler_state.get(OFFBOARDING_SUCCESS_KEY, {})
-    history[dedupe_key] = {
+    record = {
         "work_email": user_profile.work_email,
         "end_date": getattr(user_profile, "end_date", None),
         "completed_at": datetime.now(timezone.utc).isoformat(),
         "trigger_source": trigger_source,
         "request_id": request_id,
+        "instance": _instance_id(),
+        "epoch": _run_epoch.get(),
     }
-    scheduler_state.set(OFFBOARDING_SUCCESS_KEY, history)
+    # Not fenced: the run's side effects already happened, so the record must
+    # land even if the lease was lost mid-run, or the next holder repeats them.
+    with _history_lock:
+        scheduler_state.update(OFFBOARDING_SUCCESS_KEY, lambda history: {**(history or {}), dedupe_key: record}, fenced=False)
+
+
+def _run_key(kind, user_profile):
+    """In-flight registry key: one run per person and lifecycle event, whatever the trigger source."""
+    if kind == "onboarding":
+        return f"onboarding:{build_onboarding_dedupe_key(user_profile)}"
+    return f"offboarding:{_build_offboarding_dedupe_key(user_profile)}"
+
+
+def _instance_id():
+    if scheduler_lease is not None:
+        return scheduler_lease.instance_id
+    return str(CONFIG.get("SCHEDULER_INSTANCE_ID") or "").strip() or default_instance_id()
+
+
+def _is_active():
+    """True unless this instance is a lease standby."""
+    return scheduler_lease is None or scheduler_lease.held
+
+
+def _dispatch_run(key, fn, *args, description="", priority="onboarding"):
+    """
+    Hand a run to the in-flight registry, or publish it for the worker fleet
+    when a work queue is configured; False when the same key is already
+    queued or running, when this instance has lost the lease, or while it
+    drains for shutdown.
+    """
+    if not _is_active():
+        logger.warning("🛑 Standby instance %s is not dispatching %s.", _instance_id(), key)
+        return False
+    if draining.is_set():
+        logger.warning("🛑 Draining for shutdown; not dispatching %s.", key)
+        return False
+    if work_queue is not None:
+        kind, payload = _work_item_for(fn, args)
+        if kind is not None:
+            return work_queue.publish(kind, key, payload, priority=priority, description=description)
+    if scheduler_lease is not None:
+        fn, args = _run_under_epoch, (scheduler_lease.epoch, key, fn) + args
+    return run_registry.submit(key, fn, *args, description=description, priority=priority) is not None
+
+
+def _run_active(key):
+    """True while `key` is in flight here or, with a worker fleet, queued or claimed in the work queue."""
+    return run_registry.is_inflight(key) or (work_queue is not None and work_queue.is_active(key))
+
+
+def _run_under_epoch(epoch, key, fn, *args):
+    """
+    Start a run only if the lease epoch it was dispatched under is still
+    current; a queued run from an instance that has since lost the lease is
+    dropped, and the new active instance dispatches it from its own scan.
+    Only the start is fenced: a run that began under the lease finishes and
+    records its completion, stamped with `epoch`.
+    """
+    if not scheduler_lease.verify(epoch):
+        logger.warning("🛑 Lease epoch %s is no longer held by %s; not starting %s.", epoch, _instance_id(), key)
+        return False
+    token = _run_epoch.set(epoch)
+    try:
+        return fn(*args)
+    finally:
+        _run_epoch.reset(token)
+
+
+def _lease_fence():
+    """Write fence for the shared scheduler state and match table."""
+    return scheduler_lease is None or scheduler_lease.verify()
+
+
+def _offboarding_priority(user_profile, today=None, now=None):
+    """
+    Departures past their effective time (OFFBOARDING_EFFECTIVE_TIME on the
+    end date, local to the worker) still have live access: revoke those
+    first. Scans only validate same-day departures, so the end time counts,
+    not just the date.
+    """
+    end_date = _parse_iso_date(str(getattr(user_profile, "end_date", "") or ""))
+    location = getattr(user_profile, "location", None)
+    now = time.time() if now is None else now
+    today = today or datetime.fromtimestamp(now, location_timezone(location)).date()
+    if end_date is None or end_date > today:
+        return "offboarding"
+    if end_date < today:
+        return "emergency_revocation"
+    due = effective_at(end_date, CONFIG.get("OFFBOARDING_EFFECTIVE_TIME", "17:00"), location)
+    if due is not None and due <= now:
+        return "emergency_revocation"
+    return "offboarding"
+
+
+def configure_run_registry(config):
+    """
+    Run workflows on SCHEDULER_RUN_CONCURRENCY worker threads when
+    SCHEDULER_ASYNC_RUNS_ENABLED, plus SCHEDULER_REVOCATION_RESERVED_WORKERS
+    threads that only take offboarding work.
+    """
+    global run_registry
+    workers = int(config.get("SCHEDULER_RUN_CONCURRENCY") or 0)
+    if not config.get("SCHEDULER_ASYNC_RUNS_ENABLED", True) or workers <= 0:
+        return run_registry
+    run_registry = InflightRegistry(
+        max_workers=workers,
+        reserved_workers=int(config.get("SCHEDULER_REVOCATION_RESERVED_WORKERS") or 0),
+    )
+    return run_registry
 
 
 def _has_successful_onboarding(user_profile):
     dedupe_key = build_onboarding_dedupe_key(user_profile)
-    history = scheduler_state.get(ONBOARDING_SUCCESS_KEY, {})
+    # Fresh: with a worker fleet, other processes record successes in the same file.
+    history = scheduler_state.get(ONBOARDING_SUCCESS_KEY, {}, fresh=True)
     return dedupe_key in history
 
 
 def _has_successful_offboarding(user_profile):
     dedupe_key = _build_offboarding_dedupe_key(user_profile)
-    history = scheduler_state.get(OFFBOARDING_SUCCESS_KEY, {})
+    history = scheduler_state.get(OFFBOARDING_SUCCESS_KEY, {}, fresh=True)
     return dedupe_key in history
 
 
@@ -410,6 +610,44 @@ def _manual_request_ready_for_execution(request: ManualOverrideRequest, today=No
     return True, "Eligible by start-date policy.", False
 
 
+def _workflow_preflight_issues(workflow_path, workflow):
+    """(unregistered actions, blocking issues) for one parsed workflow; shared by preflight and SIGHUP reload."""
+    missing_actions = []
+    blocking = []
+    for step in workflow.steps:
+        if step.type != "action":
+            continue
+        if not step.action:
+            missing_actions.append(f"{workflow_path}:{step.id}:<missing-action-id>")
+            continue
+        if step.action not in ACTIONS:
+            missing_actions.append(f"{workflow_path}:{step.id}:{step.action}")
+
+    workflow_name = str(getattr(workflow, "name", "") or "").strip().lower()
+    workflow_file = os.path.basename(str(workflow_path)).strip().lower()
+    is_offboarding_workflow = "offboard" in workflow_name or "offboard" in workflow_file
+    if is_offboarding_workflow:
+        has_policy_gate = any(
+            step.type == "action" and step.action == "builtin.validate_target_email"
+            for step in workflow.steps
+        )
+        has_manager_gate = any(
+            step.type == "action" and step.action == "okta.verify_manager_resolved"
+            for step in workflow.steps
+        )
+        if not has_policy_gate:
+            blocking.append(
+                f"Offboarding workflow '{workflow_path}' missing required action "
+                "'builtin.validate_target_email'."
+            )
+        if not has_manager_gate:
+            blocking.append(
+                f"Offboarding workflow '{workflow_path}' missing required action "
+                "'okta.verify_manager_resolved'."
+            )
+    return missing_actions, blocking
+
+
 def run_startup_preflight():
     """
     Validate action wiring and baseline runtime prerequisites.
@@ -427,37 +665,9 @@ def run_startup_preflight():
             blocking.append(f"Failed to load workflow '{workflow_path}': {exc}")
             continue
 
-        for step in workflow.steps:
-            if step.type != "action":
-                continue
-            if not step.action:
-                missing_actions.append(f"{workflow_path}:{step.id}:<missing-action-id>")
-                continue
-            if step.action not in ACTIONS:
-                missing_actions.append(f"{workflow_path}:{step.id}:{step.action}")
-
-        workflow_name = str(getattr(workflow, "name", "") or "").strip().lower()
-        workflow_file = os.path.basename(str(workflow_path)).strip().lower()
-        is_offboarding_workflow = "offboard" in workflow_name or "offboard" in workflow_file
-        if is_offboarding_workflow:
-            has_policy_gate = any(
-                step.type == "action" and step.action == "builtin.validate_target_email"
-                for step in workflow.steps
-            )
-            has_manager_gate = any(
-                step.type == "action" and step.action == "okta.verify_manager_resolved"
-                for step in workflow.steps
-            )
-            if not has_policy_gate:
-                blocking.append(
-                    f"Offboarding workflow '{workflow_path}' missing required action "
-                    "'builtin.validate_target_email'."
-                )
-            if not has_manager_gate:
-                blocking.append(
-                    f"Offboarding workflow '{workflow_path}' missing required action "
-                    "'okta.verify_manager_resolved'."
-                )
+        workflow_missing, workflow_blocking = _workflow_preflight_issues(workflow_path, workflow)
+        missing_actions.extend(workflow_missing)
+        blocking.extend(workflow_blocking)
     if missing_actions:
         blocking.append(f"Workflow action(s) not registered: {', '.join(missing_actions)}")
 
@@ -506,6 +716,11 @@ def run_startup_preflight():
 
 
 def _process_manual_override_queue():
+    with _override_csv_lock:
+        return _process_manual_override_queue_locked()
+
+
+def _process_manual_override_queue_locked():
     requests, invalid_rows = load_ready_requests(OVERRIDE_CSV_PATH)
 
     for request_id, error_text in invalid_rows:
@@ -520,38 +735,62 @@ def _process_manual_override_queue():
 
     if not requests:
         logger.info("   (No READY manual override onboarding requests found)")
-        return
+        return 0
 
     logger.info("📥 Found %d READY manual override request(s)", len(requests))
+    dispatched = 0
     for request in requests:
-        user = request.user_profile
-        ready_for_execution, policy_reason, is_invalid = _manual_request_ready_for_execution(request)
-        if not ready_for_execution:
-            if is_invalid:
-                logger.error(
-                    "⚠️  Manual override request %s invalid for execution policy: %s",
-                    request.request_id,
-                    policy_reason,
-                )
-                mark_request_error(OVERRIDE_CSV_PATH, request.request_id, policy_reason)
-            else:
-                logger.info("🕒 Deferring manual override request %s: %s", request.request_id, policy_reason)
-            continue
+        outcome, _ = _handle_manual_override_request(request)
+        dispatched += outcome == "dispatched"
+    return dispatched
 
-        if _has_successful_onboarding(user):
-            logger.info(
-                "♻️  Manual override already satisfied for %s; removing request %s.",
-                user.work_email,
+
+def _handle_manual_override_request(request):
+    """
+    Apply the execution policy to one READY request and dispatch it. Returns
+    the outcome: "dispatched", "in_flight", "deferred", "invalid" or
+    "already_completed", plus the policy reason when there is one.
+    """
+    user = request.user_profile
+    ready_for_execution, policy_reason, is_invalid = _manual_request_ready_for_execution(request)
+    if not ready_for_execution:
+        if is_invalid:
+            logger.error(
+                "⚠️  Manual override request %s invalid for execution policy: %s",
                 request.request_id,
+                policy_reason,
             )
-            remove_request(OVERRIDE_CSV_PATH, request.request_id)
-            continue
+            mark_request_error(OVERRIDE_CSV_PATH, request.request_id, policy_reason)
+            return "invalid", policy_reason
+        logger.info("🕒 Deferring manual override request %s: %s", request.request_id, policy_reason)
+        return "deferred", policy_reason
 
-        success = run_onboarding(
-            user,
-            trigger_source="manual_override_csv",
-            request_id=request.request_id,
+    if _has_successful_onboarding(user):
+        logger.info(
+            "♻️  Manual override already satisfied for %s; removing request %s.",
+            user.work_email,
+            request.request_id,
         )
+        remove_request(OVERRIDE_CSV_PATH, request.request_id)
+        return "already_completed", ""
+
+    dispatched = _dispatch_run(
+        _run_key("onboarding", user),
+        _execute_manual_override,
+        request,
+        description=f"manual override {request.request_id}",
+        priority="manual_override",
+    )
+    return ("dispatched" if dispatched else "in_flight"), ""
+
+
+def _execute_manual_override(request):
+    success = run_onboarding(
+        request.user_profile,
+        trigger_source="manual_override_csv",
+        request_id=request.request_id,
+    )
+    with _override_csv_lock:
         if success:
             removed = remove_request(OVERRIDE_CSV_PATH, request.request_id)
             if removed:
@@ -561,7 +800,7 @@ def _process_manual_override_queue():
                     "⚠️  Manual override request %s succeeded but row was not found during dequeue.",
                     request.request_id,
                 )
-            continue
+            return True
 
         logger.error(
             "❌ Manual override request %s failed. Marking row ERROR to prevent retry loops.",
@@ -572,29 +811,47 @@ def _process_manual_override_queue():
             request.request_id,
             "onboarding execution failed; review scheduler logs and set status=READY after remediation",
         )
+        return False
 
 
-def _process_validated_onboarding():
-    validated_triggers = trigger_validator.validate_and_fetch_onboarding_context()
+def _process_validated_onboarding(rippling_client=None):
+    validated_triggers = trigger_validator.validate_and_fetch_onboarding_context(
+        state=scheduler_state, rippling=rippling_client
+    )
     if not validated_triggers:
         logger.info("   (No validated new hires found)")
-        return
+        return 0
 
     logger.info("🚀 Found %d validated new hire(s)", len(validated_triggers))
+    dispatched = 0
     for trigger in validated_triggers:
         user = trigger.user_profile
         if _has_successful_onboarding(user):
             logger.info("♻️  Skipping already-completed onboarding for %s", user.work_email)
             continue
-        request_id = _build_dual_validation_request_id("ONB", trigger.confirmation_source_b)
-        run_onboarding(user, trigger_source="dual_validation", request_id=request_id)
+        if _defer_to_timer("onboarding", trigger):
+            continue
+        dispatched += _dispatch_run(
+            _run_key("onboarding", user),
+            _execute_validated_onboarding,
+            trigger,
+            description=f"onboarding {user.work_email}",
+        )
+    return dispatched
+
 
+def _execute_validated_onboarding(trigger):
+    request_id = _build_dual_validation_request_id("ONB", trigger.confirmation_source_b)
+    return run_onboarding(trigger.user_profile, trigger_source="dual_validation", request_id=request_id)
 
-def _process_validated_offboarding():
-    validated_triggers = trigger_validator.validate_and_fetch_offboarding_context()
+
+def _process_validated_offboarding(rippling_client=None):
+    validated_triggers = trigger_validator.validate_and_fetch_offboarding_context(
+        state=scheduler_state, rippling=rippling_client
+    )
     if not validated_triggers:
         logger.info("   (No validated departures found)")
-        return
+        return 0
 
     execution_mode = _offboarding_execution_mode()
     execute_live, execute_reason = _offboarding_live_allowed()
@@ -606,6 +863,7 @@ def _process_validated_offboarding():
     )
     logger.info("   Offboarding execution decision: %s", execute_reason)
 
+    dispatched = 0
     for trigger in validated_triggers:
         user = trigger.user_profile
 
@@ -613,6 +871,9 @@ def _process_validated_offboarding():
             logger.info("♻️  Skipping already-completed offboarding for %s", user.work_email)
             _remove_pending_offboarding(user)
             continue
+        if _run_active(_run_key("offboarding", user)):
+            logger.info("⏭️  Offboarding for %s is already queued or running; leaving it alone.", user.work_email)
+            continue
 
         staged_action, request_id = _stage_pending_offboarding(trigger, status="PENDING")
         logger.info(
@@ -629,42 +890,709 @@ def _process_validated_offboarding():
             )
             continue
 
-        success = run_offboarding(
-            user,
-            trigger_source="dual_validation_departure",
-            request_id=request_id,
-            dry_run=False,
-        )
-        if success:
-            removed = _remove_pending_offboarding(user)
-            if removed:
-                logger.info("🧹 Removed completed pending offboarding row for %s", user.work_email)
+        if _defer_to_timer("offboarding", trigger):
             continue
-
-        logger.error("❌ Offboarding failed for %s. Marking pending row ERROR.", user.work_email)
-        _stage_pending_offboarding(
+        dispatched += _dispatch_run(
+            _run_key("offboarding", user),
+            _execute_validated_offboarding,
             trigger,
-            status="ERROR",
-            last_error="offboarding execution failed; investigate and retrigger once remediated",
+            request_id,
+            description=f"offboarding {user.work_email}",
+            priority=_offboarding_priority(user),
         )
+    return dispatched
+
+
+def _execute_validated_offboarding(trigger, request_id):
+    user = trigger.user_profile
+    success = run_offboarding(
+        user,
+        trigger_source="dual_validation_departure",
+        request_id=request_id,
+        dry_run=False,
+    )
+    if success:
+        removed = _remove_pending_offboarding(user)
+        if removed:
+            logger.info("🧹 Removed completed pending offboarding row for %s", user.work_email)
+        return True
+
+    logger.error("❌ Offboarding failed for %s. Marking pending row ERROR.", user.work_email)
+    _stage_pending_offboarding(
+        trigger,
+        status="ERROR",
+        last_error="offboarding execution failed; investigate and retrigger once remediated",
+    )
+    return False
+
+
+def _lifecycle_timer_key(kind, user_profile):
+    return f"{kind}:{str(user_profile.work_email).strip().lower()}"
+
+
+def _defer_to_timer(kind, trigger):
+    """
+    Schedule `trigger` for its effective time (start date at
+    ONBOARDING_EFFECTIVE_TIME / end date at OFFBOARDING_EFFECTIVE_TIME, in the
+    worker's location timezone). Returns False when timers are disabled or the
+    effective time has already passed, so the caller runs it now.
+    """
+    queue = timer_queue(scheduler_state)
+    if queue is None:
+        return False
+    user = trigger.user_profile
+    if kind == "onboarding":
+        due = effective_at(user.start_date, CONFIG.get("ONBOARDING_EFFECTIVE_TIME", "00:00"), user.location)
+    else:
+        due = effective_at(user.end_date, CONFIG.get("OFFBOARDING_EFFECTIVE_TIME", "17:00"), user.location)
+    key = _lifecycle_timer_key(kind, user)
+    if due is None or due <= time.time():
+        queue.cancel(key)
+        return False
+    queue.schedule(key, due, kind, _trigger_payload(trigger))
+    return True
+
+
+def _trigger_payload(trigger):
+    """Plain-JSON form of a ValidatedTrigger, for timers and work items."""
+    return {
+        "user_profile": trigger.user_profile.model_dump(mode="json"),
+        "confirmation_source_a": trigger.confirmation_source_a,
+        "confirmation_source_b": trigger.confirmation_source_b,
+    }
+
+
+def _trigger_from_payload(payload):
+    return ValidatedTrigger(
+        user_profile=UserProfile(**payload["user_profile"]),
+        confirmation_source_a=payload["confirmation_source_a"],
+        confirmation_source_b=payload["confirmation_source_b"],
+    )
+
+
+def _run_due_timers(now=None):
+    """Execute lifecycle timers whose effective time has arrived; returns how many fired."""
+    queue = timer_queue(scheduler_state)
+    if queue is None:
+        return 0
+    fired = queue.pop_due(now)
+    for timer in fired:
+        trigger = _trigger_from_payload(timer["payload"])
+        user = trigger.user_profile
+        logger.info("⏰ Lifecycle timer fired: %s", timer["key"])
+        try:
+            if timer["kind"] == "onboarding":
+                if _has_successful_onboarding(user):
+                    continue
+                _dispatch_run(
+                    _run_key("onboarding", user),
+                    _execute_validated_onboarding,
+                    trigger,
+                    description=f"onboarding {user.work_email} (timer)",
+                )
+                continue
+
+            if _has_successful_offboarding(user):
+                _remove_pending_offboarding(user)
+                continue
+            execute_live, execute_reason = _offboarding_live_allowed()
+            if not execute_live:
+                logger.info("🧯 Offboarding timer for %s left staged: %s", user.work_email, execute_reason)
+                continue
+            _, request_id = _stage_pending_offboarding(trigger, status="PENDING")
+            _dispatch_run(
+                _run_key("offboarding", user),
+                _execute_validated_offboarding,
+                trigger,
+                request_id,
+                description=f"offboarding {user.work_email} (timer)",
+                priority=_offboarding_priority(user),
+            )
+        except Exception as exc:
+            logger.error("❌ Lifecycle timer %s failed: %s", timer["key"], exc)
+    metrics.LIFECYCLE_TIMERS_PENDING.set(len(queue))
+    return len(fired)
 
 
 def job_scan_dual_validation():
     """
     Production Job: Dual-Validation Trigger (Rippling + Freshservice).
+    Returns how many runs the scan dispatched; triggers that were already
+    completed, in flight or deferred do not count as activity for the cadence.
     """
     logger.info("⏰ Scheduler: Running Dual-Validation Scan...")
+    if scheduler_state.shared:
+        # Worker processes record completed runs in the same state file.
+        scheduler_state.load()
+
+    started = time.perf_counter()
+    outcome = "succeeded"
+    activity = 0
+    with tracing.span("scheduler.scan") as scan_span:
+        try:
+            # One Rippling client per scan: the worker list is fetched once and shared by both phases.
+            shared_rippling = rippling.RipplingClient(roster=rippling.roster_snapshot(scheduler_state), share_scan=True)
+            phases = {
+                "onboarding": lambda: _process_validated_onboarding(shared_rippling),
+                "offboarding": lambda: _process_validated_offboarding(shared_rippling),
+                "manual_override": _process_manual_override_queue,
+            }
+            for phase, (count, error) in _run_scan_phases(phases).items():
+                activity += count or 0
+                if error is not None:
+                    outcome = "failed"
+                    scan_span.set_status(tracing.STATUS_ERROR, error)
+                    logger.error("❌ Scheduler Scan Failed (%s phase): %s", phase, error)
+        except Exception as exc:
+            outcome = "failed"
+            scan_span.set_status(tracing.STATUS_ERROR, exc)
+            logger.error("❌ Scheduler Scan Failed: %s", exc)
+
+    metrics.SCAN_DURATION.observe(time.perf_counter() - started)
+    metrics.SCANS_TOTAL.inc(outcome=outcome)
+    metrics.write_textfile()
+    return activity
+
+
+def _run_scan_phases(phases):
+    """
+    Run discovery phases concurrently when SCHEDULER_PARALLEL_PHASES (else in
+    order). Returns {phase: (result, exception)}; one failing phase does not
+    stop the others.
+    """
+    def _phase(name, fn):
+        with tracing.span("scheduler.phase", attributes={"phase": name}):
+            return fn()
+
+    results = {}
+    if not CONFIG.get("SCHEDULER_PARALLEL_PHASES", True) or len(phases) < 2:
+        for name, fn in phases.items():
+            try:
+                results[name] = (_phase(name, fn), None)
+            except Exception as exc:
+                results[name] = (0, exc)
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(phases), thread_name_prefix="servus-scan") as pool:
+        futures = {
+            name: pool.submit(contextvars.copy_context().run, _phase, name, fn) for name, fn in phases.items()
+        }
+    for name, future in futures.items():
+        error = future.exception()
+        results[name] = (0, error) if error is not None else (future.result(), None)
+    return results
+
+
+def _build_cadence(reconcile_seconds=None):
+    """AdaptiveCadence from SCHEDULER_* config, or None for the fixed interval."""
+    if not CONFIG.get("SCHEDULER_ADAPTIVE_ENABLED", True):
+        return None
+    max_seconds = CONFIG.get("SCHEDULER_MAX_INTERVAL_SECONDS", 900)
+    if reconcile_seconds:
+        max_seconds = max(max_seconds, reconcile_seconds)
+    return AdaptiveCadence(
+        min_seconds=CONFIG.get("SCHEDULER_MIN_INTERVAL_SECONDS", 60),
+        max_seconds=max_seconds,
+        backoff=CONFIG.get("SCHEDULER_BACKOFF_FACTOR", 2.0),
+        hot_hours=parse_hour_range(CONFIG.get("SCHEDULER_HOT_HOURS", "0-18")),
+    )
+
+
+def _refresh_lifecycle_dates(cadence):
+    roster = rippling.roster_snapshot(scheduler_state)
+    if roster is not None:
+        cadence.set_lifecycle_dates(roster.lifecycle_dates())
+
+
+def _on_lease_acquired():
+    """Another instance may have been active: re-read the shared state before scanning."""
+    scheduler_state.load()
+    queue = timer_queue(scheduler_state)
+    if queue is not None:
+        queue.reload()
+    match_table(scheduler_state).reload()
+
+
+# -----------------
+# Reload and drain
+# -----------------
+
+def _reload_runtime():
+    """
+    SIGHUP / `servusctl.py reload`: swap in new config, policies and
+    workflows. Runs already executing keep the generation they started with.
+    A workflow that would fail preflight (unregistered action, missing
+    offboarding gate) rejects the whole reload.
+    """
+    def _check(candidate):
+        blocking = []
+        missing_actions = []
+        for workflow_path in _workflow_paths_for_preflight():
+            workflow_missing, workflow_blocking = _workflow_preflight_issues(
+                workflow_path, candidate.load(workflow_path, load_workflow)
+            )
+            missing_actions.extend(workflow_missing)
+            blocking.extend(workflow_blocking)
+        if missing_actions:
+            blocking.append(f"Workflow action(s) not registered: {', '.join(missing_actions)}")
+        return blocking
+
+    result = hot_reload.reload(check=_check)
+    if not result["ok"]:
+        return result
+    changed = set(result["config_changed"])
+    restart_required = [key for key in RESTART_REQUIRED_CONFIG if key in changed]
+    if restart_required:
+        logger.warning("⚠️ Reloaded, but these settings only take effect after a restart: %s", ", ".join(restart_required))
+    if changed & {"BULKHEADS_ENABLED", "BULKHEAD_SIZES", "BULKHEAD_DEFAULT_SIZE"}:
+        # Steps already in a pool finish there; new steps get pools sized from the new config.
+        bulkheads.shutdown_bulkheads(wait=False)
+    if control.is_running():
+        # The socket keeps listening; later connections are answered by the reloaded handlers.
+        control.configure_control(CONFIG, CONTROL_HANDLERS)
+    return {**result, "restart_required": restart_required}
+
+
+def _request_reload(signum=None, frame=None):
+    reload_requested.set()
+
+
+def _request_drain(signum=None, frame=None):
+    draining.set()
+    # Wake the main loop instead of waiting out its poll interval.
+    scan_requested.set()
+
+
+def _drain(timeout=None):
+    """
+    Graceful stop: refuse new work, park runs that have not started, and
+    give running ones `timeout` seconds (SCHEDULER_DRAIN_TIMEOUT_SECONDS).
+    Runs still executing at the deadline are recorded as parked as well.
+    Parked triggers are still pending, so the next scan dispatches them
+    again. Returns True when every running run finished.
+    """
+    draining.set()
+    timeout = float(CONFIG.get("SCHEDULER_DRAIN_TIMEOUT_SECONDS") or 0) if timeout is None else timeout
+    parked = run_registry.park_queued()
+    if len(run_registry):
+        logger.info("   Waiting up to %.0fs for %d in-flight run(s) to finish...", timeout, len(run_registry))
+    finished = run_registry.wait(timeout)
+    if not finished:
+        unfinished = run_registry.snapshot()
+        logger.warning(
+            "⚠️ Drain deadline passed; exiting with %d run(s) still executing: %s",
+            len(unfinished),
+            ", ".join(run["key"] for run in unfinished),
+        )
+        parked.extend(unfinished)
+    _record_parked_runs(parked)
+    run_registry.shutdown(wait=finished)
+    bulkheads.shutdown_bulkheads(wait=finished)
+    control.stop_control_server()
+    if scheduler_lease is not None:
+        scheduler_lease.stop(release=True)
+    return finished
+
+
+def _record_parked_runs(parked):
+    if not parked:
+        return
+    parked_at = _now_iso()
+    entries = [
+        {
+            "key": run["key"],
+            "description": run["description"],
+            "priority": run["priority"],
+            "parked_at": parked_at,
+            "instance": _instance_id(),
+        }
+        for run in parked
+    ]
+    with _history_lock:
+        scheduler_state.update(PARKED_RUNS_KEY, lambda existing: list(existing or []) + entries)
+
+
+def _report_parked_runs():
+    """Log (and clear) runs the previous shutdown parked; the first scan re-dispatches them."""
+    with _history_lock:
+        parked = scheduler_state.get(PARKED_RUNS_KEY) or []
+        if not parked:
+            return 0
+        scheduler_state.set(PARKED_RUNS_KEY, [])
+    logger.warning(
+        "🅿️ %d run(s) were parked by the last shutdown and will be re-dispatched if their trigger is still pending: %s",
+        len(parked),
+        ", ".join(run["key"] for run in parked),
+    )
+    return len(parked)
+
+
+# -----------------
+# Worker fleet
+# -----------------
+
+def _work_item_for(fn, args):
+    """(kind, JSON payload) for a run the worker fleet can execute, or (None, None) to run it here."""
+    if fn is _execute_validated_onboarding:
+        return "validated_onboarding", {"trigger": _trigger_payload(args[0])}
+    if fn is _execute_validated_offboarding:
+        return "validated_offboarding", {"trigger": _trigger_payload(args[0]), "request_id": args[1]}
+    if fn is _execute_manual_override:
+        return "manual_override", {"row": args[0].to_row(status=READY_STATUS)}
+    return None, None
+
 
+def _execute_work_item(item):
+    """
+    Run one claimed work item. A redelivered item may already have completed
+    before its worker died, so the success history is checked first.
+    """
+    payload = item["payload"]
+    if item["kind"] == "manual_override":
+        request = request_from_row(payload["row"])
+        if _has_successful_onboarding(request.user_profile):
+            with _override_csv_lock:
+                remove_request(OVERRIDE_CSV_PATH, request.request_id)
+            return True
+        return _execute_manual_override(request)
+
+    trigger = _trigger_from_payload(payload["trigger"])
+    if item["kind"] == "validated_onboarding":
+        if _has_successful_onboarding(trigger.user_profile):
+            return True
+        return _execute_validated_onboarding(trigger)
+    if item["kind"] == "validated_offboarding":
+        if _has_successful_offboarding(trigger.user_profile):
+            _remove_pending_offboarding(trigger.user_profile)
+            return True
+        return _execute_validated_offboarding(trigger, payload["request_id"])
+    raise ValueError(f"unknown work item kind: {item['kind']}")
+
+
+def _share_state_with_workers():
+    """Scheduler and worker processes write the same state file and CSV queues: lock them across processes."""
+    scheduler_state.share()
+    _pending_csv_lock.bind(PENDING_OFFBOARD_CSV_PATH + ".lock")
+    _override_csv_lock.bind(OVERRIDE_CSV_PATH + ".lock")
+
+
+def work_once(queue, worker_id, visibility_seconds=None):
+    """
+    Claim and run one work item, heartbeating while it runs. Returns the
+    item, or None when nothing was visible. Failed runs are completed too:
+    their CSV rows are already marked ERROR for an operator, the same as
+    in-process runs. Only an unexpected exception releases the item for retry.
+    """
+    global _active_work_item
+    visibility = float(visibility_seconds or CONFIG.get("WORK_QUEUE_VISIBILITY_SECONDS") or 300)
+    item = queue.claim(worker_id, visibility)
+    if item is None:
+        return None
+    _active_work_item = item
+
+    stop = threading.Event()
+
+    def _heartbeat():
+        while not stop.wait(visibility / 3):
+            if not queue.heartbeat(item, visibility):
+                logger.warning("⚠️ Lost the claim on %s; another worker may run it again.", item["key"])
+                return
+
+    heartbeat = threading.Thread(target=_heartbeat, name="servus-work-heartbeat", daemon=True)
+    heartbeat.start()
+    logger.info("🔧 Worker %s running %s (attempt %d).", worker_id, item["description"], item["attempts"])
     try:
-        _process_validated_onboarding()
-        _process_validated_offboarding()
-        _process_manual_override_queue()
+        _execute_work_item(item)
     except Exception as exc:
-        logger.error("❌ Scheduler Scan Failed: %s", exc)
+        logger.error("❌ Work item %s raised: %s", item["key"], exc)
+        queue.fail(item, str(exc))
+    else:
+        queue.complete(item)
+    finally:
+        _active_work_item = None
+        stop.set()
+        heartbeat.join()
+        metrics.write_textfile()
+    return item
+
+
+def _park_work_item_after_deadline(queue, timeout):
+    """Worker drain deadline: hand the unfinished item back to the queue for redelivery, then exit."""
+    time.sleep(timeout)
+    item = _active_work_item
+    if item is None:
+        return
+    logger.warning("⚠️ Drain deadline passed; parking work item %s for redelivery.", item["key"])
+    queue.fail(item, "parked by drain deadline", retry_after=0)
+    logging.shutdown()
+    os._exit(0)
+
+
+def _per_worker_path(path, worker):
+    root, ext = os.path.splitext(path)
+    return f"{root}.{worker}{ext}"
+
+
+def _configure_worker_exporters(index):
+    """
+    Metrics and traces from worker N go to their own exporters: METRICS_TEXTFILE
+    becomes `<name>.worker-N.prom`, METRICS_HTTP_PORT becomes port + 1 + N and
+    TRACE_FILE becomes `<name>.worker-N.jsonl`. Samples carry worker="worker-N"
+    so node-exporter does not see duplicate series across the fleet.
+    """
+    worker = f"worker-{index}"
+    overrides = {}
+    textfile = str(CONFIG.get("METRICS_TEXTFILE") or "").strip()
+    if textfile:
+        overrides["METRICS_TEXTFILE"] = _per_worker_path(textfile, worker)
+    port = int(CONFIG.get("METRICS_HTTP_PORT") or 0)
+    if port > 0:
+        overrides["METRICS_HTTP_PORT"] = port + 1 + index
+    overrides["TRACE_FILE"] = _per_worker_path(str(CONFIG.get("TRACE_FILE") or "servus_state/traces.jsonl"), worker)
+    worker_config = {**CONFIG, **overrides}
+    metrics.REGISTRY.constant_labels = {"worker": worker}
+    tracing.configure_tracing(worker_config)
+    return metrics.configure_metrics(worker_config)
+
+
+def _worker_process_main(index):
+    _share_state_with_workers()
+    _configure_worker_exporters(index)
+    queue = configure_work_queue(CONFIG, SCHEDULER_STATE_DIR or ".")
+    worker_id = f"{_instance_id()}/worker-{index}"
+    poll = float(CONFIG.get("WORK_QUEUE_POLL_SECONDS") or 2.0)
+
+    def _on_sigterm(signum, frame):
+        if draining.is_set():
+            return
+        draining.set()
+        deadline = float(CONFIG.get("SCHEDULER_DRAIN_TIMEOUT_SECONDS") or 0)
+        threading.Thread(
+            target=_park_work_item_after_deadline, args=(queue, deadline), name="servus-drain-deadline", daemon=True
+        ).start()
+
+    signal.signal(signal.SIGHUP, _request_reload)
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    logger.info("👷 Worker %s consuming %s work queue.", worker_id, CONFIG.get("WORK_QUEUE_BACKEND"))
+    try:
+        while not draining.is_set():
+            if reload_requested.is_set():
+                reload_requested.clear()
+                _reload_runtime()
+            if work_once(queue, worker_id) is None:
+                draining.wait(poll)
+        logger.info("🛑 Worker %s drained; exiting.", worker_id)
+    except KeyboardInterrupt:
+        logger.info("🛑 Worker %s stopping.", worker_id)
+    finally:
+        bulkheads.shutdown_bulkheads()
+
+
+def run_workers(processes=None):
+    """Start the worker fleet: `processes` worker processes consuming WORK_QUEUE_BACKEND until interrupted."""
+    if not str(CONFIG.get("WORK_QUEUE_BACKEND") or "").strip():
+        logger.error("🛑 SERVUS_WORK_QUEUE_BACKEND is not set; there is no queue for workers to consume.")
+        return
+    processes = max(1, int(processes or CONFIG.get("WORKER_PROCESSES") or 1))
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_worker_process_main, args=(index,), name=f"servus-worker-{index}")
+        for index in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    def _forward(signum, frame):
+        # SIGHUP reloads and SIGTERM drains each worker; the workers enforce the drain deadline themselves.
+        for worker in workers:
+            if worker.is_alive():
+                os.kill(worker.pid, signum)
+
+    signal.signal(signal.SIGHUP, _forward)
+    signal.signal(signal.SIGTERM, _forward)
+    logger.info("🚀 SERVUS worker fleet started: %d process(es).", processes)
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        logger.info("🛑 Worker fleet interrupted by operator; an interrupted item is redelivered after its visibility timeout.")
+        # Ctrl-C reaches the whole process group; workers stop on their own, so later interrupts are ignored here.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        for worker in workers:
+            worker.join()
+
+
+# -----------------
+# Control socket
+# -----------------
+
+def _control_enqueue(request):
+    """
+    Dispatch a READY manual override row now instead of at the next scan.
+    The reply comes back once the run is handed to a worker thread (or the
+    work queue); without either, it requests a scan instead of running inline.
+    """
+    request_id = str(request.get("request_id") or "").strip()
+    if not request_id:
+        raise ValueError("enqueue needs a request_id")
+    _require_active()
+    with _override_csv_lock:
+        ready, invalid_rows = load_ready_requests(OVERRIDE_CSV_PATH)
+        match = next((item for item in ready if item.request_id == request_id), None)
+        if match is None:
+            for invalid_id, error_text in invalid_rows:
+                if invalid_id == request_id:
+                    mark_request_error(OVERRIDE_CSV_PATH, request_id, error_text)
+                    return {"request_id": request_id, "outcome": "invalid", "reason": error_text}
+            rows = find_requests(OVERRIDE_CSV_PATH, request_id)
+            if not rows:
+                raise ValueError(f"request_id {request_id} is not in the manual override queue")
+            return {"request_id": request_id, "outcome": "not_ready", "reason": f"queue status is {rows[0].get('status')}"}
+        if work_queue is None and run_registry.max_workers == 0:
+            # An inline registry would run the whole workflow on the socket
+            # thread under the CSV lock; let the main loop's scan pick it up.
+            scan_requested.set()
+            logger.info("🎛️ Control enqueue %s: runs execute inline; requested a scan instead.", request_id)
+            return {
+                "request_id": request_id,
+                "outcome": "scan_requested",
+                "reason": "async runs are disabled; the row runs in the next scan",
+            }
+        outcome, reason = _handle_manual_override_request(match)
+    logger.info("🎛️ Control enqueue %s: %s", request_id, outcome)
+    return {"request_id": request_id, "outcome": outcome, "reason": reason}
+
+
+def _require_active():
+    if draining.is_set():
+        raise ValueError(f"instance {_instance_id()} is draining for shutdown")
+    if not _is_active():
+        holder = scheduler_lease.holder() or {}
+        raise ValueError(f"instance {_instance_id()} is standby; the active scheduler is {holder.get('holder') or 'unknown'}")
+
+
+def _control_scan_now(request):
+    _require_active()
+    scan_requested.set()
+    return {"scan_requested": True}
+
+
+def _control_reload(request):
+    """Same as SIGHUP, but reports whether the reload was applied."""
+    result = _reload_runtime()
+    if not result["ok"]:
+        raise ValueError("reload rejected: " + "; ".join(result["errors"]))
+    return result
+
+
+def _control_status(request):
+    """Everything the scheduler knows about one request_id or work email."""
+    query = str(request.get("query") or "").strip()
+    if not query:
+        raise ValueError("status needs a request_id or email")
+    needle = query.lower()
+
+    with _override_csv_lock:
+        manual_rows = find_requests(OVERRIDE_CSV_PATH, query)
+    with _pending_csv_lock:
+        pending_rows, _ = _read_pending_offboarding_rows(PENDING_OFFBOARD_CSV_PATH)
+    pending_rows = [
+        row for row in pending_rows if row.get("request_id") == query or row.get("work_email", "").lower() == needle
+    ]
+    emails = {row.get("work_email", "").lower() for row in manual_rows + pending_rows} - {""}
+    if "@" in needle:
+        emails.add(needle)
+
+    with _history_lock:
+        completed = [
+            {"kind": kind, **record}
+            for kind, history_key in (("onboarding", ONBOARDING_SUCCESS_KEY), ("offboarding", OFFBOARDING_SUCCESS_KEY))
+            for record in scheduler_state.get(history_key, {}).values()
+            if record.get("request_id") == query or str(record.get("work_email") or "").lower() in emails
+        ]
+    emails.update(str(record.get("work_email") or "").lower() for record in completed)
+
+    queue = timer_queue(scheduler_state)
+    timers = [
+        {
+            "key": timer["key"],
+            "kind": timer["kind"],
+            "due": datetime.fromtimestamp(timer["due"], tz=timezone.utc).isoformat(timespec="minutes"),
+        }
+        for timer in (queue.list() if queue is not None else [])
+        if timer["key"].partition(":")[2] in emails
+    ]
+    table = match_table(scheduler_state)
+    matches = {
+        f"{kind}:{email}": entry
+        for kind in ("onboarding", "offboarding")
+        for email in sorted(emails)
+        for entry in [table.get(kind, email)]
+        if entry is not None
+    }
+    inflight = [run for run in run_registry.snapshot() if _run_matches(run, needle, emails)]
+    return {
+        "query": query,
+        "inflight": inflight,
+        "manual_queue": manual_rows,
+        "pending_offboarding": pending_rows,
+        "timers": timers,
+        "match_table": matches,
+        "completed": completed,
+    }
+
+
+def _run_matches(run, needle, emails):
+    email = run["key"].partition(":")[2].partition("|")[0]
+    return email in emails or needle in run["description"].lower().split()
+
+
+def _control_list_inflight(request):
+    queue = timer_queue(scheduler_state)
+    return {
+        "runs": run_registry.snapshot(),
+        "timers_pending": len(queue) if queue is not None else 0,
+        "bulkheads": bulkheads.snapshot(),
+        "work_queue": work_queue.stats() if work_queue is not None else None,
+        "instance": _instance_id(),
+        "active": _is_active(),
+        "draining": draining.is_set(),
+        "generation": hot_reload.current().number,
+        "lease": scheduler_lease.holder() if scheduler_lease is not None else None,
+        "scan_requested": scan_requested.is_set(),
+    }
+
+
+CONTROL_HANDLERS = {
+    "enqueue": _control_enqueue,
+    "scan-now": _control_scan_now,
+    "status": _control_status,
+    "list-inflight": _control_list_inflight,
+    "reload": _control_reload,
+}
 
 
 def run_scheduler():
+    global scheduler_lease, work_queue
     _ensure_pending_offboarding_csv(PENDING_OFFBOARD_CSV_PATH)
+    tracing.configure_tracing(CONFIG)
+    metrics.configure_metrics(CONFIG)
+    cassette.configure_cassette(CONFIG)
+    rippling.start_directory_refresh()
+    configure_run_registry(CONFIG)
+    work_queue = configure_work_queue(CONFIG, SCHEDULER_STATE_DIR or ".")
+    if work_queue is not None:
+        _share_state_with_workers()
+    # Elect before the webhook receiver starts so a standby answers 503 from the first delivery.
+    scheduler_lease = configure_lease(CONFIG)
+    if scheduler_lease is not None:
+        scheduler_state.fence = _lease_fence
+        match_table(scheduler_state).fence = _lease_fence
+    receiver = webhooks.configure_webhooks(
+        CONFIG, match_table(scheduler_state), on_event=scan_requested.set, accepting=_is_active
+    )
+    control_api = control.configure_control(CONFIG, CONTROL_HANDLERS)
+    scan_minutes = max(1, int(CONFIG.get("WEBHOOK_RECONCILE_MINUTES") or 30)) if receiver is not None else 5
 
     preflight = run_startup_preflight()
     for warning in preflight.get("warnings", []):
@@ -674,11 +1602,35 @@ def run_scheduler():
             logger.error("❌ Preflight blocking issue: %s", issue)
         if CONFIG.get("PREFLIGHT_STRICT", False):
             logger.error("🛑 PREFLIGHT_STRICT enabled. Scheduler startup aborted.")
+            if scheduler_lease is not None:
+                scheduler_lease.stop(release=True)
             return
         logger.warning("⚠️ Continuing despite preflight blocking issues because PREFLIGHT_STRICT is disabled.")
 
     logger.info("🚀 SERVUS Scheduler Started (Production Mode).")
-    logger.info("   - Dual-Validation Scan: Every 5 minutes")
+    cadence = _build_cadence(scan_minutes * 60 if receiver is not None else None)
+    if cadence is not None:
+        logger.info(
+            "   - Dual-Validation Scan: Adaptive, every %.0f-%.0f seconds",
+            cadence.min_seconds,
+            cadence.max_seconds,
+        )
+    else:
+        logger.info("   - Dual-Validation Scan: Every %d minutes", scan_minutes)
+    if receiver is not None:
+        logger.info("   - Webhooks: enabled (scans also run on each lifecycle event)")
+    if control_api is not None:
+        logger.info("   - Control socket: %s", CONFIG.get("SCHEDULER_CONTROL_SOCKET"))
+    if work_queue is not None:
+        logger.info("   - Work queue: %s (runs execute in `scheduler.py worker` processes)", CONFIG.get("WORK_QUEUE_BACKEND"))
+    if scheduler_lease is not None:
+        logger.info(
+            "   - HA lease: %s as %s (%s)",
+            CONFIG.get("SCHEDULER_LEASE_FILE"),
+            scheduler_lease.instance_id,
+            "active" if scheduler_lease.held else "standby",
+        )
+    logger.info("   - SIGHUP reloads config/policies/workflows; SIGTERM drains for up to %ss", CONFIG.get("SCHEDULER_DRAIN_TIMEOUT_SECONDS"))
     logger.info("   - Manual Override CSV: %s", OVERRIDE_CSV_PATH)
     logger.info("   - Pending Offboarding CSV: %s", PENDING_OFFBOARD_CSV_PATH)
     logger.info(
@@ -687,18 +1639,68 @@ def run_scheduler():
     )
 
     # Schedule
-    schedule.every(5).minutes.do(job_scan_dual_validation)
+    if cadence is None:
+        schedule.every(scan_minutes).minutes.do(job_scan_dual_validation)
+
+    def _scan():
+        activity = job_scan_dual_validation()
+        if cadence is not None:
+            _refresh_lifecycle_dates(cadence)
+            interval = cadence.after_scan(activity)
+            metrics.SCAN_INTERVAL.set(interval)
+            logger.info("   Next dual-validation scan in %.0fs", interval)
+        return time.monotonic()
+
+    signal.signal(signal.SIGHUP, _request_reload)
+    signal.signal(signal.SIGTERM, _request_drain)
+    _report_parked_runs()
 
     try:
-        # Run once immediately
-        job_scan_dual_validation()
+        # Run once immediately (when active)
+        was_active = _is_active()
+        last_scan = _scan() if was_active else time.monotonic()
+
+        while not draining.is_set():
+            if reload_requested.is_set():
+                reload_requested.clear()
+                _reload_runtime()
+            active = _is_active()
+            if active and not was_active:
+                logger.info("🎖️ Took over as the active scheduler; reloading shared state and scanning now.")
+                _on_lease_acquired()
+                last_scan = _scan()
+            was_active = active
+            if not active:
+                # Standby: webhook nudges are for the active instance.
+                if scan_requested.wait(timeout=1):
+                    scan_requested.clear()
+                continue
 
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+            if cadence is None:
+                schedule.run_pending()
+            elif time.monotonic() - last_scan >= cadence.current():
+                last_scan = _scan()
+            _run_due_timers()
+            if scan_requested.wait(timeout=1):
+                scan_requested.clear()
+                if draining.is_set():
+                    break
+                logger.info("📬 Scan requested (webhook event or control socket); running dual-validation scan now.")
+                last_scan = _scan()
+        logger.info("🛑 SIGTERM received; draining and exiting.")
     except KeyboardInterrupt:
         logger.info("🛑 Scheduler interrupted by operator. Exiting cleanly.")
+    return _drain()
 
 
 if __name__ == "__main__":
-    run_scheduler()
+    parser = argparse.ArgumentParser(description="SERVUS scheduler, or a worker fleet for its work queue.")
+    parser.add_argument("mode", nargs="?", choices=["scheduler", "worker"], default="scheduler")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default SERVUS_WORKER_PROCESSES).")
+    cli_args = parser.parse_args()
+    if cli_args.mode == "worker":
+        run_workers(cli_args.processes)
+    elif run_scheduler() is False:
+        # Runs that missed the drain deadline are parked; don't let interpreter exit wait on their threads.
+        logging.shutdown()
+        os._exit(0)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Talk to a running SERVUS scheduler over its control socket.
+
+Examples:
+  python3 scripts/servusctl.py list-inflight
+  python3 scripts/servusctl.py status REQ-20260301120000-jane-doe
+  python3 scripts/servusctl.py status jane.doe@boom.aero
+  python3 scripts/servusctl.py enqueue REQ-20260301120000-jane-doe
+  python3 scripts/servusctl.py scan-now
+  python3 scripts/servusctl.py reload
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Allow running as `python3 scripts/servusctl.py` from repo root.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from servus.config import CONFIG
+from servus.control import send_command
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query or nudge the running SERVUS scheduler.")
+    parser.add_argument(
+        "--socket",
+        default=CONFIG.get("SCHEDULER_CONTROL_SOCKET") or "servus_state/scheduler.sock",
+        help="Scheduler control socket path",
+    )
+    parser.add_argument("--timeout", type=float, default=5.0, help="Seconds to wait for a reply")
+    commands = parser.add_subparsers(dest="command", required=True)
+    enqueue = commands.add_parser("enqueue", help="Dispatch a READY manual override request now")
+    enqueue.add_argument("request_id")
+    commands.add_parser("scan-now", help="Run a dual-validation scan without waiting for the next tick")
+    status = commands.add_parser("status", help="Show what the scheduler knows about a request_id or email")
+    status.add_argument("query")
+    commands.add_parser("list-inflight", help="List workflow runs currently executing")
+    commands.add_parser("reload", help="Reload config, policies and workflows (like SIGHUP) and report the result")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    fields = {}
+    if args.command == "enqueue":
+        fields["request_id"] = args.request_id
+    elif args.command == "status":
+        fields["query"] = args.query
+
+    try:
+        reply = send_command(args.socket, args.command, timeout=args.timeout, **fields)
+    except OSError as exc:
+        print(f"Scheduler control socket unavailable at {args.socket}: {exc}", file=sys.stderr)
+        return 2
+
+    print(json.dumps(reply, indent=2, sort_keys=True))
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Allow running as `python3 scripts/trace_critical_path.py` or by absolute path.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from servus.config import CONFIG
+from servus.tracing import critical_path, load_spans, self_time_ms, trace_file_paths
+
+
+def _span_label(span):
+    attributes = span.get("attributes") or {}
+    details = []
+    for key in ("workflow", "step_id", "action", "integration", "http.method", "http.url", "gam.command",
+                "winrm.operation", "http.status_code"):
+        value = attributes.get(key)
+        if value not in (None, ""):
+            details.append(f"{key}={value}")
+    suffix = f" [{', '.join(details)}]" if details else ""
+    return f"{span.get('name')}{suffix}"
+
+
+def _format_start(span):
+    try:
+        return datetime.fromtimestamp(float(span.get("start")), tz=timezone.utc).isoformat(timespec="seconds")
+    except (TypeError, ValueError):
+        return "unknown"
+
+
+def print_trace(trace_id, trace_spans, top):
+    path = critical_path(trace_spans)
+    if not path:
+        return
+    root = path[0]
+    print(f"\nTrace {trace_id}  started={_format_start(root)}  "
+          f"total={float(root.get('duration_ms') or 0.0):.1f}ms  status={root.get('status')}  "
+          f"spans={len(trace_spans)}")
+    print("Critical path:")
+    for depth, span in enumerate(path):
+        marker = "!" if span.get("status") == "error" else " "
+        print(
+            f" {marker} {'  ' * depth}{_span_label(span)}  "
+            f"{float(span.get('duration_ms') or 0.0):.1f}ms (self {self_time_ms(span, trace_spans):.1f}ms)"
+        )
+        if span.get("status_detail"):
+            print(f"   {'  ' * depth}  -> {span.get('status_detail')}")
+
+    leaves = sorted(
+        (span for span in trace_spans if span is not root),
+        key=lambda span: float(span.get("duration_ms") or 0.0),
+        reverse=True,
+    )[:top]
+    if leaves:
+        print(f"Slowest spans (top {len(leaves)}):")
+        for span in leaves:
+            print(f"   {float(span.get('duration_ms') or 0.0):>10.1f}ms  {_span_label(span)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the critical path of SERVUS runs for a request_id")
+    parser.add_argument("--request-id", required=True, help="request_id recorded on the workflow run")
+    parser.add_argument("--trace-file", default=CONFIG.get("TRACE_FILE"), help="Span JSONL file")
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest spans to list per trace")
+    parser.add_argument("--latest", action="store_true", help="Only print the most recent trace")
+    args = parser.parse_args()
+
+    paths = trace_file_paths(args.trace_file, int(CONFIG.get("TRACE_BACKUP_COUNT") or 5))
+    if not paths:
+        print(f"No trace files found at {args.trace_file}. Is SERVUS_TRACE_ENABLED=true?")
+        sys.exit(1)
+
+    by_trace = {}
+    for span in load_spans(paths):
+        if span.get("request_id") != args.request_id:
+            continue
+        by_trace.setdefault(span.get("trace_id"), []).append(span)
+
+    if not by_trace:
+        print(f"No spans recorded for request_id={args.request_id}.")
+        sys.exit(1)
+
+    ordered = sorted(by_trace.items(), key=lambda item: min(float(s.get("start") or 0.0) for s in item[1]))
+    if args.latest:
+        ordered = ordered[-1:]
+    for trace_id, trace_spans in ordered:
+        print_trace(trace_id, trace_spans, args.top)
+
+
+if __name__ == "__main__":
+    main()
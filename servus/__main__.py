@@ -4,6 +4,8 @@ import sys
 import json
 import os
 from .config import load_config
+from .tracing import configure_tracing
+from .cassette import configure_cassette
 from .state import RunState
 from .orchestrator import Orchestrator
 from .workflow import load_workflow
@@ -49,6 +51,8 @@ def main():
     
     # 1. Load Config
     config = load_config()
+    configure_tracing(config)
+    configure_cassette(config)
     
     # 2. Load Workflow
     try:
@@ -0,0 +1,135 @@
+"""
+Per-integration execution bulkheads.
+
+Each integration (the action prefix: `google_gam`, `ad`, `okta`, `slack`, ...)
+gets its own bounded thread pool, and workflow steps are dispatched to their
+integration's pool. A slow dependency such as GAM subprocesses or WinRM to AD
+can then only tie up its own slots. Steps for other integrations keep
+flowing, and the extra demand shows up as queued steps and saturation
+metrics for that integration. Local `builtin.*` steps run inline.
+"""
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from servus import metrics
+from servus.config import CONFIG
+
+logger = logging.getLogger("servus.bulkheads")
+
+DEFAULT_SIZE = 4
+INLINE_INTEGRATIONS = ("builtin",)
+
+
+def parse_sizes(value) -> Dict[str, int]:
+    """'google_gam=2,ad=1' -> {"google_gam": 2, "ad": 1}; malformed or non-positive entries are skipped."""
+    sizes = {}
+    for item in str(value or "").split(","):
+        name, _, size = item.partition("=")
+        try:
+            parsed = int(size.strip())
+        except ValueError:
+            continue
+        if name.strip() and parsed > 0:
+            sizes[name.strip().lower()] = parsed
+    return sizes
+
+
+def integration_for(action: str) -> str:
+    return str(action or "").split(".", 1)[0].strip().lower()
+
+
+class Bulkhead:
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = max(1, int(size))
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix=f"servus-{name}")
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """Run `fn` on this integration's pool and return its result (or raise its exception)."""
+        queued_at = time.monotonic()
+        with self._lock:
+            saturated = self._active + self._queued >= self.size
+            self._queued += 1
+            self._publish_locked()
+        if saturated:
+            metrics.BULKHEAD_SATURATED.inc(integration=self.name)
+            logger.info("🚧 %s bulkhead full (%d slot(s)); step queued.", self.name, self.size)
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, self._run, fn, queued_at, args, kwargs).result()
+
+    def _run(self, fn, queued_at, args, kwargs):
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._publish_locked()
+        metrics.BULKHEAD_WAIT.observe(time.monotonic() - queued_at, integration=self.name)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._publish_locked()
+
+    def _publish_locked(self):
+        metrics.BULKHEAD_ACTIVE.set(self._active, integration=self.name)
+        metrics.BULKHEAD_QUEUED.set(self._queued, integration=self.name)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": self.size, "active": self._active, "queued": self._queued}
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+def bulkhead(integration: str) -> Optional[Bulkhead]:
+    """
+    Pool for `integration`, sized from BULKHEAD_SIZES (else
+    BULKHEAD_DEFAULT_SIZE). None when BULKHEADS_ENABLED is off or the
+    integration runs inline.
+    """
+    if not CONFIG.get("BULKHEADS_ENABLED", True) or not integration or integration in INLINE_INTEGRATIONS:
+        return None
+    with _bulkheads_lock:
+        pool = _bulkheads.get(integration)
+        if pool is None:
+            size = parse_sizes(CONFIG.get("BULKHEAD_SIZES")).get(integration) or int(
+                CONFIG.get("BULKHEAD_DEFAULT_SIZE") or DEFAULT_SIZE
+            )
+            pool = Bulkhead(integration, size)
+            _bulkheads[integration] = pool
+        return pool
+
+
+def call(action: str, fn: Callable, *args, **kwargs):
+    """Run the step `fn` for `action` in its integration's bulkhead."""
+    pool = bulkhead(integration_for(action))
+    if pool is None:
+        return fn(*args, **kwargs)
+    return pool.call(fn, *args, **kwargs)
+
+
+def snapshot() -> Dict[str, dict]:
+    with _bulkheads_lock:
+        pools = dict(_bulkheads)
+    return {name: pool.stats() for name, pool in sorted(pools.items())}
+
+
+def shutdown_bulkheads(wait: bool = True) -> None:
+    """Drop every pool; the next step recreates them from current config."""
+    with _bulkheads_lock:
+        pools = list(_bulkheads.values())
+        _bulkheads.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+_bulkheads: Dict[str, Bulkhead] = {}
+_bulkheads_lock = threading.Lock()
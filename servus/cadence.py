@@ -0,0 +1,61 @@
+"""
+Adaptive dual-validation scan cadence.
+
+Scans that dispatch lifecycle runs drop the interval to its floor. Quiet scans
+back it off exponentially up to the ceiling. During the hot window on a known
+start or end date from the roster snapshot (mornings by default), the
+interval is held at the floor regardless of backoff.
+"""
+import logging
+from datetime import datetime
+from typing import Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger("servus.cadence")
+
+
+def parse_hour_range(value, default: Tuple[int, int] = (0, 18)) -> Tuple[int, int]:
+    """'6-12' -> (6, 12): local hours [start, end) on lifecycle dates that count as hot."""
+    try:
+        start, end = (int(part) for part in str(value).split("-", 1))
+    except (TypeError, ValueError):
+        return default
+    if not (0 <= start < end <= 24):
+        return default
+    return start, end
+
+
+class AdaptiveCadence:
+    def __init__(
+        self,
+        min_seconds: float = 60.0,
+        max_seconds: float = 900.0,
+        backoff: float = 2.0,
+        hot_hours: Tuple[int, int] = (0, 18),
+    ):
+        self.min_seconds = max(1.0, float(min_seconds))
+        self.max_seconds = max(self.min_seconds, float(max_seconds))
+        self.backoff = max(1.0, float(backoff))
+        self.hot_hours = hot_hours
+        self.interval = self.min_seconds
+        self.lifecycle_dates: Set[str] = set()
+
+    def set_lifecycle_dates(self, dates: Iterable[str]) -> None:
+        self.lifecycle_dates = {str(value)[:10] for value in dates if value}
+
+    def is_hot(self, now: datetime) -> bool:
+        start, end = self.hot_hours
+        return now.date().isoformat() in self.lifecycle_dates and start <= now.hour < end
+
+    def after_scan(self, activity: int, now: Optional[datetime] = None) -> float:
+        """Seconds until the next scan, given how many runs the last scan dispatched."""
+        if activity > 0:
+            self.interval = self.min_seconds
+        else:
+            self.interval = min(self.max_seconds, self.interval * self.backoff)
+        return self.current(now)
+
+    def current(self, now: Optional[datetime] = None) -> float:
+        now = now or datetime.now()
+        if self.is_hot(now):
+            return self.min_seconds
+        return self.interval
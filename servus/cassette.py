@@ -0,0 +1,265 @@
+"""
+HTTP record/replay cassettes on the shared transport layer.
+
+Record mode passes every outbound call through and appends a sanitized
+request/response pair to a JSONL cassette: no request headers are kept,
+secret-looking query parameters and JSON fields are masked, and only the
+response headers clients actually read are stored. Replay mode serves the
+pairs back in recorded order per request key, optionally sleeping for the
+original latency times CASSETTE_LATENCY_SCALE, so a real day's scan can be
+rerun offline by `scripts/dry_run_simulation.py` or the cohort benchmark.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from servus import transport
+
+logger = logging.getLogger("servus.cassette")
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+FORMAT_VERSION = 1
+
+REDACTED = "***"
+# Substrings marking a query parameter or JSON key as secret.
+SECRET_MARKERS = ("token", "secret", "password", "passwd", "api_key", "apikey", "authorization", "credential")
+# Query parameters that change on every scan (e.g. lookback windows) and must not affect matching.
+VOLATILE_PARAMS = {"updated_since"}
+KEPT_RESPONSE_HEADERS = ("Content-Type", "Link", "Retry-After")
+# Non-secret CONFIG keys stored in the header so replay can route clients to the recorded hosts.
+ENDPOINT_KEYS = (
+    "RIPPLING_BASE_URL",
+    "FRESHSERVICE_DOMAIN",
+    "FRESHSERVICE_BASE_URL",
+    "OKTA_DOMAIN",
+    "OKTA_BASE_URL",
+    "SLACK_API_BASE_URL",
+    "SLACK_SCIM_BASE_URL",
+    "ZOOM_API_BASE_URL",
+    "ZOOM_OAUTH_URL",
+    "LINEAR_API_URL",
+)
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """Replay found no recorded interaction; clients see it as a connection failure."""
+
+
+def _is_secret(name) -> bool:
+    lowered = str(name).lower()
+    return any(marker in lowered for marker in SECRET_MARKERS)
+
+
+def sanitize_payload(value):
+    """Recursively mask secret-looking keys in decoded JSON."""
+    if isinstance(value, dict):
+        return {key: (REDACTED if _is_secret(key) else sanitize_payload(item)) for key, item in value.items()}
+    if isinstance(value, list):
+        return [sanitize_payload(item) for item in value]
+    return value
+
+
+def sanitize_url(url: str) -> str:
+    parsed = urllib.parse.urlsplit(str(url or ""))
+    pairs = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+    cleaned = [(key, REDACTED if _is_secret(key) else value) for key, value in pairs]
+    return urllib.parse.urlunsplit((parsed.scheme, parsed.netloc, parsed.path, urllib.parse.urlencode(cleaned), ""))
+
+
+def request_key(method: str, url: str, body) -> str:
+    """Stable match key: method, host/path, sorted non-volatile query, body digest."""
+    parsed = urllib.parse.urlsplit(sanitize_url(url))
+    pairs = sorted(
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if key not in VOLATILE_PARAMS
+    )
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else "-"
+    return f"{str(method).upper()} {parsed.netloc}{parsed.path}?{urllib.parse.urlencode(pairs)} {digest}"
+
+
+def _sanitize_body_text(text: str) -> str:
+    try:
+        return json.dumps(sanitize_payload(json.loads(text)), separators=(",", ":"))
+    except (ValueError, TypeError):
+        return text
+
+
+class CassetteRecorder:
+    """Middleware that passes calls through and appends sanitized pairs to `path`."""
+
+    def __init__(self, path, endpoints: Optional[Dict[str, object]] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        header = {
+            "servus_cassette": FORMAT_VERSION,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "recorded_date": datetime.now().strftime("%Y-%m-%d"),
+            "endpoints": {key: value for key, value in (endpoints or {}).items() if value},
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(header, separators=(",", ":")) + "\n")
+        self.recorded = 0
+
+    def __call__(self, request, send):
+        started = time.perf_counter()
+        response = send(request)
+        elapsed_ms = round((time.perf_counter() - started) * 1000.0, 3)
+        integration = transport.integration_for_url(request.url)
+        if integration == "slack_webhook":
+            # Incoming-webhook URLs embed their secret in the path; never persist them.
+            return response
+        try:
+            body_text = response.content.decode(response.encoding or "utf-8", errors="replace")
+            entry = {
+                "key": request_key(request.method, request.url, request.body),
+                "method": request.method,
+                "url": sanitize_url(request.url),
+                "integration": integration,
+                "status": response.status_code,
+                "headers": {
+                    name: response.headers[name] for name in KEPT_RESPONSE_HEADERS if name in response.headers
+                },
+                "body": _sanitize_body_text(body_text),
+                "elapsed_ms": elapsed_ms,
+            }
+            line = json.dumps(entry, separators=(",", ":"))
+            with self._lock:
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+                self.recorded += 1
+        except Exception as exc:
+            logger.debug("Cassette record failed for %s: %s", transport.redact_url(request.url), exc)
+        return response
+
+
+class CassettePlayer:
+    """
+    Middleware that answers from a cassette without touching the network.
+    Repeated keys are served in recorded order; once exhausted, the last
+    response repeats (polling loops). Unknown keys raise CassetteMiss.
+    """
+
+    def __init__(self, path, latency_scale: float = 0.0):
+        self.path = path
+        self.latency_scale = max(float(latency_scale or 0.0), 0.0)
+        self.header: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[dict]] = {}
+        self._cursor: Dict[str, int] = {}
+        self.misses: List[str] = []
+        self._load()
+
+    def _load(self):
+        with open(self.path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if "servus_cassette" in entry:
+                    self.header = entry
+                    continue
+                self._entries.setdefault(entry["key"], []).append(entry)
+
+    @property
+    def endpoints(self) -> Dict[str, object]:
+        return dict(self.header.get("endpoints") or {})
+
+    @property
+    def recorded_date(self) -> Optional[str]:
+        return self.header.get("recorded_date")
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def __call__(self, request, send):
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses.append(key)
+                entry = None
+            else:
+                index = self._cursor.get(key, 0)
+                entry = entries[min(index, len(entries) - 1)]
+                self._cursor[key] = index + 1
+        if entry is None:
+            raise CassetteMiss(f"No cassette entry for {key}", request=request)
+
+        if self.latency_scale:
+            time.sleep(float(entry.get("elapsed_ms") or 0.0) * self.latency_scale / 1000.0)
+        return _build_response(request, entry)
+
+
+def _build_response(request, entry) -> requests.Response:
+    response = requests.Response()
+    response.status_code = int(entry.get("status") or 200)
+    response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+    response._content = str(entry.get("body") or "").encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    response.reason = "Replayed"
+    return response
+
+
+_active = None
+
+
+def configure_cassette(config):
+    """
+    Enable record or replay from CASSETTE_MODE / CASSETTE_FILE.
+    Register after tracing so replayed calls still produce spans and metrics.
+    Returns the active recorder/player, or None.
+    """
+    mode = str(config.get("CASSETTE_MODE") or "").strip().lower()
+    path = str(config.get("CASSETTE_FILE") or "").strip()
+    if mode not in {MODE_RECORD, MODE_REPLAY}:
+        return None
+    if not path:
+        logger.warning("⚠️ CASSETTE_MODE=%s set without CASSETTE_FILE; cassette disabled.", mode)
+        return None
+    if mode == MODE_RECORD:
+        return start_recording(path, endpoints={key: config.get(key) for key in ENDPOINT_KEYS})
+    return start_replay(path, latency_scale=config.get("CASSETTE_LATENCY_SCALE") or 0.0)
+
+
+def start_recording(path, endpoints=None) -> CassetteRecorder:
+    stop()
+    global _active
+    _active = CassetteRecorder(path, endpoints=endpoints)
+    transport.add_middleware(_active)
+    logger.info("📼 Recording outbound HTTP to cassette %s", path)
+    return _active
+
+
+def start_replay(path, latency_scale=0.0) -> CassettePlayer:
+    stop()
+    global _active
+    _active = CassettePlayer(path, latency_scale=latency_scale)
+    transport.add_middleware(_active)
+    logger.info("📼 Replaying %d interaction(s) from cassette %s (latency x%s)", len(_active), path, latency_scale)
+    return _active
+
+
+def stop() -> None:
+    global _active
+    if _active is not None:
+        transport.remove_middleware(_active)
+        _active = None
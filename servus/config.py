@@ -3,11 +3,17 @@ import logging
 import json
 import boto3
 from botocore.exceptions import ClientError
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+
+# Process environment before .env is applied, so a reload can tell which values came from the file.
+_PROCESS_ENVIRON = dict(os.environ)
 
 # Load .env file immediately (Local Fallback)
 load_dotenv()
 
+# Keys the current .env put into os.environ, so a reload can unset the ones it drops.
+_DOTENV_KEYS = {key for key, value in dotenv_values().items() if value is not None and key not in _PROCESS_ENVIRON}
+
 logger = logging.getLogger("servus.config")
 
 
@@ -18,6 +24,22 @@ def _as_bool(value, default=False):
         return value
     return str(value).strip().lower() in {"1", "true", "yes", "y", "on"}
 
+def _as_int(value, default=0):
+    if value is None or str(value).strip() == "":
+        return default
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return default
+
+def _as_float(value, default=0.0):
+    if value is None or str(value).strip() == "":
+        return default
+    try:
+        return float(str(value).strip())
+    except ValueError:
+        return default
+
 def fetch_aws_secrets():
     """
     Fetches secrets from AWS Secrets Manager.
@@ -96,105 +118,259 @@ if os.getenv("SERVUS_USE_AWS_SECRETS"):
         pass
 
 # 4. Build Global CONFIG
-CONFIG = {
-    # Infrastructure
-    "AD_HOST": env_config.get("SERVUS_AD_HOST", "10.1.0.3"),
-    "AD_USER": env_config.get("SERVUS_AD_USERNAME"),
-    "AD_PASS": env_config.get("SERVUS_AD_PASSWORD"),
+def _build_config(env_config):
+    return {
+        # Infrastructure
+        "AD_HOST": env_config.get("SERVUS_AD_HOST", "10.1.0.3"),
+        "AD_USER": env_config.get("SERVUS_AD_USERNAME"),
+        "AD_PASS": env_config.get("SERVUS_AD_PASSWORD"),
     
-    # Okta
-    "OKTA_DOMAIN": env_config.get("SERVUS_OKTA_DOMAIN", "boom.okta.com"),
-    "OKTA_TOKEN": env_config.get("SERVUS_OKTA_TOKEN"),
-    "OKTA_APP_AD": env_config.get("SERVUS_OKTA_DIRINTEGRATION_AD_IMPORT", "0oacrzpehXApFBO95696"),
-    "OKTA_GROUP_CONTRACTORS": env_config.get("SERVUS_OKTA_GROUP_CONTRACTORS"),
-    "OKTA_APP_SLACK": env_config.get("SERVUS_OKTA_APP_SLACK"),
+        # Okta
+        "OKTA_DOMAIN": env_config.get("SERVUS_OKTA_DOMAIN", "boom.okta.com"),
+        "OKTA_TOKEN": env_config.get("SERVUS_OKTA_TOKEN"),
+        "OKTA_APP_AD": env_config.get("SERVUS_OKTA_DIRINTEGRATION_AD_IMPORT", "0oacrzpehXApFBO95696"),
+        "OKTA_GROUP_CONTRACTORS": env_config.get("SERVUS_OKTA_GROUP_CONTRACTORS"),
+        "OKTA_APP_SLACK": env_config.get("SERVUS_OKTA_APP_SLACK"),
     
-    # Integrations
-    "SLACK_TOKEN": env_config.get("SERVUS_SLACK_ADMIN_TOKEN"),
-    "GAM_PATH": env_config.get("GAM_PATH", "/Users/dan.driver/bin/gam7/gam"),
+        # Integrations
+        "SLACK_TOKEN": env_config.get("SERVUS_SLACK_ADMIN_TOKEN"),
+        "GAM_PATH": env_config.get("GAM_PATH", "/Users/dan.driver/bin/gam7/gam"),
     
-    # Freshservice
-    "FRESHSERVICE_DOMAIN": env_config.get("SERVUS_FRESHSERVICE_DOMAIN"),
-    "FRESHSERVICE_API_KEY": env_config.get("SERVUS_FRESHSERVICE_API_KEY"),
+        # Freshservice
+        "FRESHSERVICE_DOMAIN": env_config.get("SERVUS_FRESHSERVICE_DOMAIN"),
+        "FRESHSERVICE_API_KEY": env_config.get("SERVUS_FRESHSERVICE_API_KEY"),
     
-    # Rippling
-    "RIPPLING_API_TOKEN": env_config.get("SERVUS_RIPPLING_API_TOKEN"),
+        # Rippling
+        "RIPPLING_API_TOKEN": env_config.get("SERVUS_RIPPLING_API_TOKEN"),
     
-    # AD Structure
-    "AD_BASE_DN": env_config.get("AD_BASE_DN", "DC=boom,DC=local"),
-    "AD_USERS_ROOT": env_config.get("AD_USERS_ROOT", "OU=Boom Users"),
-
-    # Brivo Structure
-    "BRIVO_API_KEY": env_config.get("SERVUS_BRIVO_API_KEY"),
-    "BRIVO_USERNAME": env_config.get("SERVUS_BRIVO_USERNAME"),
-    "BRIVO_PASSWORD": env_config.get("SERVUS_BRIVO_PASSWORD"),
-    "BRIVO_QUEUE_REQUIRED": _as_bool(
-        env_config.get("SERVUS_BRIVO_QUEUE_REQUIRED"),
-        default=False,
-    ),
-
-    # AWS SQS (Badge Printing)
-    "SQS_BADGE_QUEUE_URL": env_config.get("SERVUS_SQS_BADGE_QUEUE_URL"),
-    "AWS_REGION": env_config.get("SERVUS_AWS_REGION", "us-east-1"),
-    "SQS_ENDPOINT_URL": env_config.get("SERVUS_SQS_ENDPOINT_URL"),
+        # AD Structure
+        "AD_BASE_DN": env_config.get("AD_BASE_DN", "DC=boom,DC=local"),
+        "AD_USERS_ROOT": env_config.get("AD_USERS_ROOT", "OU=Boom Users"),
+
+        # Brivo Structure
+        "BRIVO_API_KEY": env_config.get("SERVUS_BRIVO_API_KEY"),
+        "BRIVO_USERNAME": env_config.get("SERVUS_BRIVO_USERNAME"),
+        "BRIVO_PASSWORD": env_config.get("SERVUS_BRIVO_PASSWORD"),
+        "BRIVO_QUEUE_REQUIRED": _as_bool(
+            env_config.get("SERVUS_BRIVO_QUEUE_REQUIRED"),
+            default=False,
+        ),
+
+        # AWS SQS (Badge Printing)
+        "SQS_BADGE_QUEUE_URL": env_config.get("SERVUS_SQS_BADGE_QUEUE_URL"),
+        "AWS_REGION": env_config.get("SERVUS_AWS_REGION", "us-east-1"),
+        "SQS_ENDPOINT_URL": env_config.get("SERVUS_SQS_ENDPOINT_URL"),
     
-    # Offboarding
-    "OFFBOARDING_ADMIN_EMAIL": env_config.get("SERVUS_OFFBOARDING_ADMIN", "admin-wolverine@boom.aero"),
-    "PROTECTED_TARGETS_FILE": env_config.get(
-        "SERVUS_PROTECTED_TARGETS_FILE", "servus/data/protected_targets.yaml"
-    ),
-    "PROTECTED_EMAILS": env_config.get("SERVUS_PROTECTED_EMAILS", ""),
-    "PROTECTED_USERNAMES": env_config.get("SERVUS_PROTECTED_USERNAMES", ""),
-    "PROTECTED_DOMAINS": env_config.get("SERVUS_PROTECTED_DOMAINS", ""),
-    "PROTECTED_DEPARTMENTS": env_config.get("SERVUS_PROTECTED_DEPARTMENTS", ""),
-    "PROTECTED_TITLES": env_config.get("SERVUS_PROTECTED_TITLES", ""),
-    "PROTECTED_AD_OU_PATTERNS": env_config.get(
-        "SERVUS_PROTECTED_AD_OU_PATTERNS", "OU=Service Accounts,OU=Boom Users"
-    ),
-
-    # Notifications
-    "SLACK_WEBHOOK_URL": env_config.get("SERVUS_SLACK_WEBHOOK_URL"),
-    "SLACK_NOTIFICATION_MODE": env_config.get("SERVUS_SLACK_NOTIFICATION_MODE", "summary"),
-
-    # New SaaS
-    "LINEAR_API_KEY": env_config.get("SERVUS_LINEAR_API_KEY"),
-    "ZOOM_ACCOUNT_ID": env_config.get("SERVUS_ZOOM_ACCOUNT_ID"),
-    "ZOOM_CLIENT_ID": env_config.get("SERVUS_ZOOM_CLIENT_ID"),
-    "ZOOM_CLIENT_SECRET": env_config.get("SERVUS_ZOOM_CLIENT_SECRET"),
-    "RAMP_API_KEY": env_config.get("SERVUS_RAMP_API_KEY"),
-
-    # Scheduler / Manual Override Queue
-    "ONBOARDING_OVERRIDE_CSV": env_config.get(
-        "SERVUS_ONBOARDING_OVERRIDE_CSV", "servus_state/manual_onboarding_overrides.csv"
-    ),
-    "SCHEDULER_STATE_FILE": env_config.get(
-        "SERVUS_SCHEDULER_STATE_FILE", "servus_state/scheduler_state.json"
-    ),
-    "OFFBOARDING_PENDING_CSV": env_config.get(
-        "SERVUS_OFFBOARDING_PENDING_CSV", "servus_state/pending_offboards.csv"
-    ),
-    "OFFBOARDING_EXECUTION_MODE": env_config.get("SERVUS_OFFBOARDING_EXECUTION_MODE", "").strip().lower(),
-    "OFFBOARDING_EXECUTION_ENABLED": _as_bool(
-        env_config.get("SERVUS_OFFBOARDING_EXECUTION_ENABLED"),
-        default=False,
-    ),
-    "OFFBOARDING_TRANSFER_FALLBACK_TO_ADMIN": _as_bool(
-        env_config.get("SERVUS_OFFBOARDING_TRANSFER_FALLBACK_TO_ADMIN"),
-        default=False,
-    ),
-    "MANUAL_OVERRIDE_ENFORCE_START_DATE": _as_bool(
-        env_config.get("SERVUS_MANUAL_OVERRIDE_ENFORCE_START_DATE"),
-        default=True,
-    ),
-    "MANUAL_OVERRIDE_ALLOW_EARLY_GLOBAL": _as_bool(
-        env_config.get("SERVUS_MANUAL_OVERRIDE_ALLOW_EARLY_GLOBAL"),
-        default=False,
-    ),
-    "PREFLIGHT_STRICT": _as_bool(
-        env_config.get("SERVUS_PREFLIGHT_STRICT"),
-        default=False,
-    ),
-}
+        # Offboarding
+        "OFFBOARDING_ADMIN_EMAIL": env_config.get("SERVUS_OFFBOARDING_ADMIN", "admin-wolverine@boom.aero"),
+        "PROTECTED_TARGETS_FILE": env_config.get(
+            "SERVUS_PROTECTED_TARGETS_FILE", "servus/data/protected_targets.yaml"
+        ),
+        "PROTECTED_EMAILS": env_config.get("SERVUS_PROTECTED_EMAILS", ""),
+        "PROTECTED_USERNAMES": env_config.get("SERVUS_PROTECTED_USERNAMES", ""),
+        "PROTECTED_DOMAINS": env_config.get("SERVUS_PROTECTED_DOMAINS", ""),
+        "PROTECTED_DEPARTMENTS": env_config.get("SERVUS_PROTECTED_DEPARTMENTS", ""),
+        "PROTECTED_TITLES": env_config.get("SERVUS_PROTECTED_TITLES", ""),
+        "PROTECTED_AD_OU_PATTERNS": env_config.get(
+            "SERVUS_PROTECTED_AD_OU_PATTERNS", "OU=Service Accounts,OU=Boom Users"
+        ),
+
+        # Notifications
+        "SLACK_WEBHOOK_URL": env_config.get("SERVUS_SLACK_WEBHOOK_URL"),
+        "SLACK_NOTIFICATION_MODE": env_config.get("SERVUS_SLACK_NOTIFICATION_MODE", "summary"),
+
+        # New SaaS
+        "LINEAR_API_KEY": env_config.get("SERVUS_LINEAR_API_KEY"),
+        "ZOOM_ACCOUNT_ID": env_config.get("SERVUS_ZOOM_ACCOUNT_ID"),
+        "ZOOM_CLIENT_ID": env_config.get("SERVUS_ZOOM_CLIENT_ID"),
+        "ZOOM_CLIENT_SECRET": env_config.get("SERVUS_ZOOM_CLIENT_SECRET"),
+        "RAMP_API_KEY": env_config.get("SERVUS_RAMP_API_KEY"),
+
+        # API endpoints (override to point at sandboxes or scripts/fake_services.py)
+        "RIPPLING_BASE_URL": env_config.get("SERVUS_RIPPLING_BASE_URL", "https://rest.ripplingapis.com"),
+        "FRESHSERVICE_BASE_URL": env_config.get("SERVUS_FRESHSERVICE_BASE_URL", ""),
+        "OKTA_BASE_URL": env_config.get("SERVUS_OKTA_BASE_URL", ""),
+        "SLACK_API_BASE_URL": env_config.get("SERVUS_SLACK_API_BASE_URL", "https://slack.com/api"),
+        "SLACK_SCIM_BASE_URL": env_config.get("SERVUS_SLACK_SCIM_BASE_URL", "https://api.slack.com/scim/v1"),
+        "ZOOM_API_BASE_URL": env_config.get("SERVUS_ZOOM_API_BASE_URL", "https://api.zoom.us/v2"),
+        "ZOOM_OAUTH_URL": env_config.get("SERVUS_ZOOM_OAUTH_URL", "https://zoom.us/oauth/token"),
+        "LINEAR_API_URL": env_config.get("SERVUS_LINEAR_API_URL", "https://api.linear.app/graphql"),
+
+        # Rippling worker directory (email -> worker/profile index)
+        "RIPPLING_DIRECTORY_ENABLED": _as_bool(env_config.get("SERVUS_RIPPLING_DIRECTORY_ENABLED"), default=True),
+        "RIPPLING_DIRECTORY_REFRESH_SECONDS": _as_int(
+            env_config.get("SERVUS_RIPPLING_DIRECTORY_REFRESH_SECONDS"), default=300
+        ),
+        "RIPPLING_DIRECTORY_PROFILE_TTL_SECONDS": _as_int(
+            env_config.get("SERVUS_RIPPLING_DIRECTORY_PROFILE_TTL_SECONDS"), default=900
+        ),
+        "RIPPLING_HYDRATION_CONCURRENCY": _as_int(env_config.get("SERVUS_RIPPLING_HYDRATION_CONCURRENCY"), default=8),
+        "RIPPLING_DELTA_SYNC_ENABLED": _as_bool(env_config.get("SERVUS_RIPPLING_DELTA_SYNC_ENABLED"), default=True),
+        "RIPPLING_ROSTER_SNAPSHOT_FILE": env_config.get("SERVUS_RIPPLING_ROSTER_SNAPSHOT_FILE", ""),
+
+        # Freshservice ticket cache (scheduler scans)
+        "FRESHSERVICE_TICKET_CACHE_ENABLED": _as_bool(
+            env_config.get("SERVUS_FRESHSERVICE_TICKET_CACHE_ENABLED"), default=True
+        ),
+        "FRESHSERVICE_TICKET_CACHE_FILE": env_config.get("SERVUS_FRESHSERVICE_TICKET_CACHE_FILE", ""),
+        # keywords | filter | hybrid (filter queries use Freshservice /tickets/filter syntax)
+        "FRESHSERVICE_SCAN_MODE": env_config.get("SERVUS_FRESHSERVICE_SCAN_MODE", "keywords").strip().lower(),
+        "FRESHSERVICE_ONBOARDING_FILTER_QUERY": env_config.get("SERVUS_FRESHSERVICE_ONBOARDING_FILTER_QUERY", ""),
+        "FRESHSERVICE_OFFBOARDING_FILTER_QUERY": env_config.get("SERVUS_FRESHSERVICE_OFFBOARDING_FILTER_QUERY", ""),
+
+        # Dual-validation match table (Rippling x Freshservice, persisted next to scheduler state)
+        "TRIGGER_MATCH_TABLE_ENABLED": _as_bool(env_config.get("SERVUS_TRIGGER_MATCH_TABLE_ENABLED"), default=True),
+        "TRIGGER_MATCH_TABLE_FILE": env_config.get("SERVUS_TRIGGER_MATCH_TABLE_FILE", ""),
+        # How long a webhook-observed side survives scans that do not list it yet.
+        "TRIGGER_MATCH_EVENT_GRACE_MINUTES": _as_int(env_config.get("SERVUS_TRIGGER_MATCH_EVENT_GRACE_MINUTES"), default=60),
+
+        # Adaptive scan cadence: floor after activity / on lifecycle dates, exponential backoff when quiet.
+        "SCHEDULER_ADAPTIVE_ENABLED": _as_bool(env_config.get("SERVUS_SCHEDULER_ADAPTIVE_ENABLED"), default=True),
+        "SCHEDULER_MIN_INTERVAL_SECONDS": _as_int(env_config.get("SERVUS_SCHEDULER_MIN_INTERVAL_SECONDS"), default=60),
+        "SCHEDULER_MAX_INTERVAL_SECONDS": _as_int(env_config.get("SERVUS_SCHEDULER_MAX_INTERVAL_SECONDS"), default=900),
+        "SCHEDULER_BACKOFF_FACTOR": _as_float(env_config.get("SERVUS_SCHEDULER_BACKOFF_FACTOR"), default=2.0),
+        # Local hours [start-end) on a roster start/end date that are scanned at the floor interval.
+        "SCHEDULER_HOT_HOURS": env_config.get("SERVUS_SCHEDULER_HOT_HOURS", "0-18"),
+
+        # Background workflow runs: scans enqueue into an in-flight registry and return; runs use executor threads.
+        "SCHEDULER_ASYNC_RUNS_ENABLED": _as_bool(env_config.get("SERVUS_SCHEDULER_ASYNC_RUNS_ENABLED"), default=True),
+        "SCHEDULER_RUN_CONCURRENCY": _as_int(env_config.get("SERVUS_SCHEDULER_RUN_CONCURRENCY"), default=4),
+        # Extra workers that only take offboarding/revocation runs, so they never wait behind onboardings.
+        "SCHEDULER_REVOCATION_RESERVED_WORKERS": _as_int(
+            env_config.get("SERVUS_SCHEDULER_REVOCATION_RESERVED_WORKERS"), default=1
+        ),
+        # SIGTERM: seconds running workflow runs get to finish before the scheduler exits and parks them.
+        "SCHEDULER_DRAIN_TIMEOUT_SECONDS": _as_int(env_config.get("SERVUS_SCHEDULER_DRAIN_TIMEOUT_SECONDS"), default=120),
+        # Active/standby HA: instances sharing this SQLite lease file elect one active scheduler (empty = single instance).
+        "SCHEDULER_LEASE_FILE": env_config.get("SERVUS_SCHEDULER_LEASE_FILE", ""),
+        "SCHEDULER_LEASE_TTL_SECONDS": _as_int(env_config.get("SERVUS_SCHEDULER_LEASE_TTL_SECONDS"), default=15),
+        # Recorded on each completed run; defaults to "<hostname>:<pid>".
+        "SCHEDULER_INSTANCE_ID": env_config.get("SERVUS_SCHEDULER_INSTANCE_ID", ""),
+        # Per-integration step pools (action prefix -> size), e.g. "google_gam=2,ad=2,slack=8".
+        "BULKHEADS_ENABLED": _as_bool(env_config.get("SERVUS_BULKHEADS_ENABLED"), default=True),
+        "BULKHEAD_SIZES": env_config.get("SERVUS_BULKHEAD_SIZES", "google_gam=2,ad=2,okta=4,slack=4,zoom=4"),
+        "BULKHEAD_DEFAULT_SIZE": _as_int(env_config.get("SERVUS_BULKHEAD_DEFAULT_SIZE"), default=4),
+        # Worker fleet: publish validated runs to a durable queue ("sqlite" or "sqs") for `scheduler.py worker` processes.
+        "WORK_QUEUE_BACKEND": env_config.get("SERVUS_WORK_QUEUE_BACKEND", ""),
+        "WORK_QUEUE_FILE": env_config.get("SERVUS_WORK_QUEUE_FILE", ""),
+        "WORK_QUEUE_SQS_URL": env_config.get("SERVUS_WORK_QUEUE_SQS_URL", ""),
+        "WORK_QUEUE_VISIBILITY_SECONDS": _as_int(env_config.get("SERVUS_WORK_QUEUE_VISIBILITY_SECONDS"), default=300),
+        "WORK_QUEUE_MAX_ATTEMPTS": _as_int(env_config.get("SERVUS_WORK_QUEUE_MAX_ATTEMPTS"), default=3),
+        "WORK_QUEUE_DEDUPE_SECONDS": _as_int(env_config.get("SERVUS_WORK_QUEUE_DEDUPE_SECONDS"), default=300),
+        "WORK_QUEUE_POLL_SECONDS": _as_float(env_config.get("SERVUS_WORK_QUEUE_POLL_SECONDS"), default=2.0),
+        "WORKER_PROCESSES": _as_int(env_config.get("SERVUS_WORKER_PROCESSES"), default=2),
+        # Onboarding / offboarding / manual-override discovery phases run concurrently within a scan.
+        "SCHEDULER_PARALLEL_PHASES": _as_bool(env_config.get("SERVUS_SCHEDULER_PARALLEL_PHASES"), default=True),
+
+        # Lifecycle timers: validated triggers fire at their effective local time instead of at scan time.
+        "LIFECYCLE_TIMERS_ENABLED": _as_bool(env_config.get("SERVUS_LIFECYCLE_TIMERS_ENABLED"), default=True),
+        "LIFECYCLE_TIMERS_FILE": env_config.get("SERVUS_LIFECYCLE_TIMERS_FILE", ""),
+        "ONBOARDING_EFFECTIVE_TIME": env_config.get("SERVUS_ONBOARDING_EFFECTIVE_TIME", "00:00"),
+        "OFFBOARDING_EFFECTIVE_TIME": env_config.get("SERVUS_OFFBOARDING_EFFECTIVE_TIME", "17:00"),
+        # Worker location -> IANA timezone, e.g. "US=America/Denver,GB=Europe/London"
+        "LIFECYCLE_TIMEZONES": env_config.get("SERVUS_LIFECYCLE_TIMEZONES", "US=America/Denver"),
+        "LIFECYCLE_DEFAULT_TIMEZONE": env_config.get("SERVUS_LIFECYCLE_DEFAULT_TIMEZONE", "America/Denver"),
+
+        # Webhook receiver (0 = polling only). Deliveries must be timestamped and HMAC-SHA256 signed with the source's secret.
+        "WEBHOOK_PORT": _as_int(env_config.get("SERVUS_WEBHOOK_PORT"), default=0),
+        "WEBHOOK_HOST": env_config.get("SERVUS_WEBHOOK_HOST", "127.0.0.1"),
+        "RIPPLING_WEBHOOK_SECRET": env_config.get("SERVUS_RIPPLING_WEBHOOK_SECRET", ""),
+        "FRESHSERVICE_WEBHOOK_SECRET": env_config.get("SERVUS_FRESHSERVICE_WEBHOOK_SECRET", ""),
+        # Max age (either direction) of a delivery's signed X-Servus-Timestamp.
+        "WEBHOOK_TOLERANCE_SECONDS": _as_int(env_config.get("SERVUS_WEBHOOK_TOLERANCE_SECONDS"), default=300),
+        # Polling interval kept as a reconciliation backstop while webhooks are enabled.
+        "WEBHOOK_RECONCILE_MINUTES": _as_int(env_config.get("SERVUS_WEBHOOK_RECONCILE_MINUTES"), default=30),
+
+        # Local Unix control socket (enqueue / scan-now / status / list-inflight); empty disables.
+        "SCHEDULER_CONTROL_SOCKET": env_config.get("SERVUS_SCHEDULER_CONTROL_SOCKET", "servus_state/scheduler.sock"),
+
+        # Scheduler / Manual Override Queue
+        "ONBOARDING_OVERRIDE_CSV": env_config.get(
+            "SERVUS_ONBOARDING_OVERRIDE_CSV", "servus_state/manual_onboarding_overrides.csv"
+        ),
+        "SCHEDULER_STATE_FILE": env_config.get(
+            "SERVUS_SCHEDULER_STATE_FILE", "servus_state/scheduler_state.json"
+        ),
+        "OFFBOARDING_PENDING_CSV": env_config.get(
+            "SERVUS_OFFBOARDING_PENDING_CSV", "servus_state/pending_offboards.csv"
+        ),
+        "OFFBOARDING_EXECUTION_MODE": env_config.get("SERVUS_OFFBOARDING_EXECUTION_MODE", "").strip().lower(),
+        "OFFBOARDING_EXECUTION_ENABLED": _as_bool(
+            env_config.get("SERVUS_OFFBOARDING_EXECUTION_ENABLED"),
+            default=False,
+        ),
+        "OFFBOARDING_TRANSFER_FALLBACK_TO_ADMIN": _as_bool(
+            env_config.get("SERVUS_OFFBOARDING_TRANSFER_FALLBACK_TO_ADMIN"),
+            default=False,
+        ),
+        "MANUAL_OVERRIDE_ENFORCE_START_DATE": _as_bool(
+            env_config.get("SERVUS_MANUAL_OVERRIDE_ENFORCE_START_DATE"),
+            default=True,
+        ),
+        "MANUAL_OVERRIDE_ALLOW_EARLY_GLOBAL": _as_bool(
+            env_config.get("SERVUS_MANUAL_OVERRIDE_ALLOW_EARLY_GLOBAL"),
+            default=False,
+        ),
+        "PREFLIGHT_STRICT": _as_bool(
+            env_config.get("SERVUS_PREFLIGHT_STRICT"),
+            default=False,
+        ),
+
+        # Observability / Tracing
+        "TRACE_ENABLED": _as_bool(env_config.get("SERVUS_TRACE_ENABLED"), default=False),
+        "TRACE_FILE": env_config.get("SERVUS_TRACE_FILE", "servus_state/traces.jsonl"),
+        "TRACE_MAX_BYTES": _as_int(env_config.get("SERVUS_TRACE_MAX_BYTES"), default=10 * 1024 * 1024),
+        "TRACE_BACKUP_COUNT": _as_int(env_config.get("SERVUS_TRACE_BACKUP_COUNT"), default=5),
+        "METRICS_TEXTFILE": env_config.get("SERVUS_METRICS_TEXTFILE", ""),
+        "METRICS_HTTP_PORT": _as_int(env_config.get("SERVUS_METRICS_HTTP_PORT"), default=0),
+        "METRICS_HTTP_HOST": env_config.get("SERVUS_METRICS_HTTP_HOST", "127.0.0.1"),
+        "CASSETTE_MODE": env_config.get("SERVUS_CASSETTE_MODE", "").strip().lower(),
+        "CASSETTE_FILE": env_config.get("SERVUS_CASSETTE_FILE", ""),
+        "CASSETTE_LATENCY_SCALE": _as_float(env_config.get("SERVUS_CASSETTE_LATENCY_SCALE"), default=0.0),
+    }
+
+
+CONFIG = _build_config(env_config)
+
+
+def read_config():
+    """
+    Build a fresh config from .env (process environment still wins) and AWS
+    secrets without applying anything. Returns `(config, dotenv)`: `dotenv`
+    holds the .env values for os.environ, applied by `reload_config` only
+    once the reload is accepted. Keys an earlier .env set but this one no
+    longer has are left out of the fresh config, so deleting a line unsets it.
+    """
+    dotenv = {key: value for key, value in dotenv_values().items() if value is not None and key not in _PROCESS_ENVIRON}
+    fresh_env = {key: value for key, value in os.environ.items() if key not in _DOTENV_KEYS}
+    fresh_env.update(dotenv)
+    fresh_env.update(fetch_aws_secrets())
+    return _build_config(fresh_env), dotenv
+
+
+def reload_config(fresh=None, dotenv=None):
+    """
+    Update CONFIG in place (default: from `read_config()`) with one
+    dict.update, so modules holding a reference see the new values and
+    readers never see a half-built config. `dotenv` replaces the .env values
+    in os.environ. Returns the changed key names.
+    """
+    if fresh is None:
+        fresh, dotenv = read_config()
+    if dotenv is not None:
+        _apply_dotenv(dotenv)
+    changed = sorted(key for key, value in fresh.items() if CONFIG.get(key) != value)
+    CONFIG.update(fresh)
+    return changed
+
+
+def _apply_dotenv(values):
+    global _DOTENV_KEYS
+    for key in _DOTENV_KEYS - set(values):
+        os.environ.pop(key, None)
+    os.environ.update(values)
+    _DOTENV_KEYS = set(values)
+
 
 def load_config():
     """
@@ -0,0 +1,158 @@
+"""
+Local control socket for the running scheduler.
+
+Operators (and helpers such as `scripts/offcycle_onboard.sh`) talk to the
+scheduler over a Unix socket: one JSON object per line in, one JSON object
+per line out. Commands are answered from the scheduler's in-memory state
+(in-flight registry, timers, match table, success history), so `status` and
+`list-inflight` respond immediately instead of waiting for a scan or a log
+tail. The socket is created with owner-only permissions; anyone who can
+reach it can already read the state files it reports on.
+"""
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger("servus.control")
+
+MAX_REQUEST_BYTES = 64 * 1024
+
+_server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+
+class ControlAPI:
+    """
+    Dispatches `{"command": ..., **args}` requests to `handlers`. Each
+    handler takes the request dict and returns a JSON-serializable dict;
+    raising ValueError reports a client error. `handle` is transport-agnostic
+    so it can be driven without a socket.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[dict], dict]]):
+        self.handlers = dict(handlers)
+
+    def handle(self, request) -> dict:
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "expected a JSON object"}
+        command = str(request.get("command") or "").strip()
+        handler = self.handlers.get(command)
+        if handler is None:
+            return {"ok": False, "error": f"unknown command {command!r}", "commands": sorted(self.handlers)}
+        try:
+            result = handler(request)
+        except ValueError as exc:
+            return {"ok": False, "error": str(exc)}
+        except Exception as exc:
+            logger.error("❌ Control command %s failed: %s", command, exc)
+            return {"ok": False, "error": "internal error"}
+        return {"ok": True, **(result or {})}
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    api: ControlAPI = None
+
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+        if len(line) > MAX_REQUEST_BYTES:
+            response = {"ok": False, "error": "request too large"}
+        else:
+            try:
+                request = json.loads(line.decode("utf-8") or "null")
+            except ValueError:
+                response = {"ok": False, "error": "invalid JSON"}
+            else:
+                response = self.api.handle(request)
+        self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+
+def start_control_server(api: ControlAPI, path: str) -> socketserver.ThreadingUnixStreamServer:
+    """Serve `api` on the Unix socket at `path` from a daemon thread, replacing a stale socket file."""
+    global _server
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    try:
+        if stat.S_ISSOCK(os.lstat(path).st_mode):
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+    handler = type("ControlHandler", (_ControlHandler,), {"api": api})
+    # Bind under an owner-only umask so the socket is never reachable by others, not even before the chmod.
+    previous_umask = os.umask(0o077)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, handler)
+    finally:
+        os.umask(previous_umask)
+    server.daemon_threads = True
+    os.chmod(path, 0o600)
+    thread = threading.Thread(target=server.serve_forever, name="servus-control", daemon=True)
+    thread.start()
+    _server = server
+    logger.info("🎛️ Control socket listening on %s", path)
+    return server
+
+
+def stop_control_server() -> None:
+    global _server
+    if _server is not None:
+        path = _server.server_address
+        _server.shutdown()
+        _server.server_close()
+        _server = None
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def is_running() -> bool:
+    return _server is not None
+
+
+def configure_control(config, handlers: Dict[str, Callable[[dict], dict]]) -> Optional[ControlAPI]:
+    """
+    Start the control socket at SCHEDULER_CONTROL_SOCKET (empty disables).
+    If it is already running (hot reload), the new handlers replace the old
+    ones on the live server. Returns the API, or None.
+    """
+    path = str(config.get("SCHEDULER_CONTROL_SOCKET") or "").strip()
+    if not path:
+        return None
+    if not hasattr(socket, "AF_UNIX"):
+        logger.warning("⚠️ Unix sockets are unavailable on this platform; control socket not started.")
+        return None
+    api = ControlAPI(handlers)
+    if _server is not None:
+        _server.RequestHandlerClass.api = api
+        return api
+    try:
+        start_control_server(api, path)
+    except OSError as exc:
+        logger.error("❌ Could not start control socket %s: %s", path, exc)
+        return None
+    return api
+
+
+def send_command(path: str, command: str, timeout: float = 5.0, **args) -> dict:
+    """
+    Send one command to the scheduler at `path` and return its reply.
+    Raises OSError when no scheduler is listening.
+    """
+    payload = json.dumps({"command": command, **args}).encode("utf-8") + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path)
+        client.sendall(payload)
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    return json.loads(b"".join(chunks).decode("utf-8") or "{}")
@@ -171,6 +171,19 @@ def remove_request(csv_path: str, request_id: str) -> bool:
     return True
 
 
+def find_requests(csv_path: str, request_id_or_email: str) -> List[Dict[str, str]]:
+    """Queue rows whose request_id or work_email matches (email compared case-insensitively)."""
+    needle = (request_id_or_email or "").strip()
+    if not needle:
+        return []
+    rows, _ = _read_rows(csv_path)
+    return [
+        row
+        for row in rows
+        if _row_request_id(row) == needle or (row.get("work_email") or "").lower() == needle.lower()
+    ]
+
+
 def mark_request_error(csv_path: str, request_id: str, error_text: str) -> bool:
     rows, headers = _read_rows(csv_path)
     updated = False
@@ -198,6 +211,11 @@ def build_onboarding_dedupe_key(user_profile: UserProfile) -> str:
     return f"{email}|{start_date}"
 
 
+def request_from_row(row: Dict[str, str]) -> ManualOverrideRequest:
+    """Rebuild a request from `ManualOverrideRequest.to_row()` output (or a queue row); raises ValueError if invalid."""
+    return _parse_request(row)
+
+
 def _parse_request(row: Dict[str, str]) -> ManualOverrideRequest:
     for column in REQUIRED_COLUMNS:
         value = (row.get(column) or "").strip()
@@ -0,0 +1,244 @@
+"""
+Two-sided trigger match table for dual validation.
+
+Rippling candidates and Freshservice tickets are recorded per lifecycle kind
+and keyed by lowercased work email. A trigger is validated the moment both
+sides are present, whichever arrives second, and each side remembers when it
+was first seen so the backlog can report how long it has been waiting for
+the other source. Persisted next to the scheduler state so the waiting clock
+survives restarts.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from servus import metrics
+from servus.config import CONFIG
+
+logger = logging.getLogger("servus.match_table")
+
+SIDES = ("rippling", "freshservice")
+# One-sided entries not re-observed for this long are dropped.
+MATCH_TABLE_RETENTION_SECONDS = 2 * 24 * 3600
+# Event-observed sides a scan has not listed yet survive `sync` this long.
+DEFAULT_EVENT_GRACE_MINUTES = 60
+
+
+class MatchTable:
+    """
+    `{kind: {email: {"rippling": side, "freshservice": side, "matched_at": ts}}}`
+    where each side is `{"ref", "first_seen", "last_seen"}` (plus
+    `"observed": True` once an event reported it) or None.
+
+    `sync` replaces one side with a feed's full current view (scans);
+    `observe` adds a single sighting (events). An event can land before the
+    next scan lists it, so an event-observed side survives `sync` for
+    TRIGGER_MATCH_EVENT_GRACE_MINUTES; the first sync that includes the email
+    clears the flag. Matched entries stay out of the backlog until one side
+    drops out and the pair has to re-match.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, Dict[str, dict]] = {}
+        self._dirty = False
+        # Optional callable; saves are skipped while it returns False (lease fencing).
+        self.fence = None
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.warning("⚠️ Ignoring unreadable trigger match table %s: %s", self.path, exc)
+            return
+        self.entries = {kind: dict(rows) for kind, rows in (payload.get("entries") or {}).items()}
+
+    def reload(self) -> None:
+        """Replace in-memory entries with the file's, e.g. after another instance wrote it."""
+        with self._lock:
+            self.entries = {}
+            self._dirty = False
+            self._load()
+
+    def sync(self, kind: str, side: str, refs: Dict[str, str], now: Optional[float] = None) -> List[str]:
+        """
+        Make `side` of `kind` match `refs` ({email: ref}); emails missing
+        from the feed lose that side unless an event observed it within the
+        grace window. Returns emails newly matched by this call.
+        """
+        now = time.time() if now is None else now
+        keep = {_key(email) for email in refs}
+        grace = _event_grace_seconds()
+        with self._lock:
+            for email, entry in list(self.entries.get(kind, {}).items()):
+                current = entry.get(side)
+                if current is None or email in keep:
+                    continue
+                if not current.get("observed") or now - current["last_seen"] > grace:
+                    entry[side] = None
+                    entry["matched_at"] = None
+                    self._dirty = True
+            resolved = [email for email, ref in refs.items() if self._record(kind, side, email, ref, now)]
+            self._drop_empty(kind)
+            self._publish(now)
+        return resolved
+
+    def observe(self, kind: str, side: str, email: str, ref, now: Optional[float] = None) -> bool:
+        """Record one sighting of `email` on `side`; True when it completes the match."""
+        now = time.time() if now is None else now
+        with self._lock:
+            resolved = self._record(kind, side, email, ref, now, observed=True)
+            self._publish(now)
+        return resolved
+
+    def _record(self, kind, side, email, ref, now, observed=False) -> bool:
+        email = _key(email)
+        if not email:
+            return False
+        entry = self.entries.setdefault(kind, {}).setdefault(
+            email, {"rippling": None, "freshservice": None, "matched_at": None}
+        )
+        current = entry.get(side)
+        if current is None or current.get("ref") != str(ref):
+            current = entry[side] = {"ref": str(ref), "first_seen": now, "last_seen": now}
+        else:
+            current["last_seen"] = now
+        if observed:
+            current["observed"] = True
+        else:
+            current.pop("observed", None)
+        self._dirty = True
+        if entry["matched_at"] is not None or any(entry.get(other) is None for other in SIDES):
+            return False
+        entry["matched_at"] = now
+        waited = now - max(entry[other]["first_seen"] for other in SIDES)
+        waiting_side = min(SIDES, key=lambda other: entry[other]["first_seen"])
+        metrics.TRIGGER_MATCH_WAIT.observe(waited, kind=kind, side=waiting_side)
+        if waited >= 1:
+            logger.info("🔗 %s %s matched after %s waited %.0fs for the other source.", kind, email, waiting_side, waited)
+        return True
+
+    def get(self, kind: str, email: str) -> Optional[dict]:
+        with self._lock:
+            entry = self.entries.get(kind, {}).get(_key(email))
+            return json.loads(json.dumps(entry)) if entry is not None else None
+
+    def ref(self, kind: str, email: str, side: str) -> Optional[str]:
+        entry = self.get(kind, email)
+        if entry is None or entry.get(side) is None:
+            return None
+        return entry[side]["ref"]
+
+    def matched(self, kind: str) -> List[str]:
+        with self._lock:
+            return sorted(email for email, entry in self.entries.get(kind, {}).items() if entry.get("matched_at"))
+
+    def waiting(self, kind: str, side: str, now: Optional[float] = None) -> Dict[str, float]:
+        """Emails where only `side` is present, with seconds waited for the other source."""
+        now = time.time() if now is None else now
+        with self._lock:
+            return {
+                email: now - entry[side]["first_seen"]
+                for email, entry in self.entries.get(kind, {}).items()
+                if entry.get(side) is not None and all(entry.get(other) is None for other in SIDES if other != side)
+            }
+
+    def prune(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        removed = 0
+        with self._lock:
+            for kind in list(self.entries):
+                for email, entry in list(self.entries[kind].items()):
+                    seen = [entry[side]["last_seen"] for side in SIDES if entry.get(side) is not None]
+                    if not seen or now - max(seen) > MATCH_TABLE_RETENTION_SECONDS:
+                        del self.entries[kind][email]
+                        removed += 1
+                self._drop_empty(kind)
+            if removed:
+                self._dirty = True
+                self._publish(now)
+        return removed
+
+    def _drop_empty(self, kind):
+        rows = self.entries.get(kind)
+        if rows is None:
+            return
+        for email in [email for email, entry in rows.items() if all(entry.get(side) is None for side in SIDES)]:
+            del rows[email]
+        if not rows:
+            del self.entries[kind]
+
+    def _publish(self, now):
+        for kind in set(self.entries) | {"onboarding", "offboarding"}:
+            for side in SIDES:
+                waits = self.waiting(kind, side, now=now)
+                metrics.TRIGGER_MATCH_BACKLOG.set(len(waits), kind=kind, side=side)
+                metrics.TRIGGER_MATCH_OLDEST_WAIT.set(max(waits.values(), default=0), kind=kind, side=side)
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or not self.path:
+                self._dirty = False
+                return
+            if self.fence is not None and not self.fence():
+                logger.error("❌ Not saving trigger match table %s: this instance no longer holds the scheduler lease.", self.path)
+                return
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".trigger_match_table_", dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump({"entries": self.entries}, handle, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except Exception as exc:
+                logger.warning("⚠️ Could not persist trigger match table %s: %s", self.path, exc)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+            self._dirty = False
+
+
+def _key(email) -> str:
+    return str(email or "").strip().lower()
+
+
+def _event_grace_seconds() -> float:
+    minutes = CONFIG.get("TRIGGER_MATCH_EVENT_GRACE_MINUTES")
+    return float(DEFAULT_EVENT_GRACE_MINUTES if minutes is None else minutes) * 60
+
+
+_match_tables: Dict[str, MatchTable] = {}
+_match_tables_lock = threading.Lock()
+
+
+def match_table(state) -> MatchTable:
+    """
+    Match table tied to a scheduler RunState: `trigger_match_table.json` next
+    to the state file (TRIGGER_MATCH_TABLE_FILE overrides). Without a state,
+    or with TRIGGER_MATCH_TABLE_ENABLED off, returns a throwaway in-memory
+    table so each scan matches only what it saw itself.
+    """
+    if state is None or not CONFIG.get("TRIGGER_MATCH_TABLE_ENABLED", True):
+        return MatchTable()
+    path = str(CONFIG.get("TRIGGER_MATCH_TABLE_FILE") or "").strip()
+    if not path:
+        state_dir = os.path.dirname(os.path.abspath(getattr(state, "state_file", "servus_state.json")))
+        path = os.path.join(state_dir, "trigger_match_table.json")
+    key = os.path.abspath(path)
+    with _match_tables_lock:
+        table = _match_tables.get(key)
+        if table is None:
+            table = MatchTable(path)
+            _match_tables[key] = table
+        return table
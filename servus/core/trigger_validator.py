@@ -1,8 +1,11 @@
 import logging
+import time
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional
 
-from servus.integrations.rippling import RipplingClient
+from servus import metrics
+from servus.core.match_table import MatchTable, match_table
+from servus.integrations.rippling import RipplingClient, roster_snapshot
 from servus.integrations import freshservice
 
 logger = logging.getLogger("servus.trigger_validator")
@@ -22,39 +25,56 @@ def validate_and_fetch_context():
     return [match.user_profile for match in validate_and_fetch_onboarding_context()]
 
 
-def validate_and_fetch_onboarding_context(minutes_lookback=1440) -> List[ValidatedTrigger]:
+def validate_and_fetch_onboarding_context(
+    minutes_lookback=1440, as_of=None, state=None, rippling: Optional[RipplingClient] = None
+) -> List[ValidatedTrigger]:
     """
     Dual-Validation Logic:
     1. Poll Rippling for "Ready" users (Completed pre-reqs).
     2. Poll Freshservice for "New Hire" tickets.
     3. Match them.
     4. Return list of validated user profiles.
+    `as_of` (YYYY-MM-DD) overrides "today", e.g. when replaying a recorded day.
+    `state` (the scheduler RunState) enables the delta-synced Rippling roster,
+    the Freshservice ticket cache and the persistent match table.
+    `rippling` lets a caller share one client (and its worker scan) across phases.
     """
     logger.info("🔒 Trigger Validator: Starting Onboarding Dual-Validation Scan...")
+    table = match_table(state)
     
     # 1. Rippling Scan
-    rippling = RipplingClient()
+    rippling = rippling or RipplingClient(roster=roster_snapshot(state))
     # Assuming get_new_hires returns users starting TODAY
     # In a real "completed pre-reqs" scenario, we might query a different status field
     # But for now, we stick to the start_date logic as the proxy for "Ready"
-    rippling_users = rippling.get_new_hires() 
-    
-    if not rippling_users:
-        logger.info("   No Rippling users found for today.")
-        return []
+    rippling_users = rippling.get_new_hires(as_of)
 
     # 2. Freshservice Scan
-    # We look back 24 hours to be safe, or just check open tickets
-    ticket_ids = freshservice.scan_for_onboarding_tickets(minutes_lookback=minutes_lookback)
-    freshservice_ticket_by_email = freshservice.map_ticket_ids_by_email(ticket_ids)
-
-    # 3. Match & Validate
+    # We look back 24 hours to be safe, or just check open tickets. Scanned
+    # even without Rippling candidates so tickets waiting on Rippling stay in
+    # the match table's backlog.
+    tickets = freshservice.ticket_cache(state)
+    ticket_ids = freshservice.scan_for_onboarding_tickets(minutes_lookback=minutes_lookback, cache=tickets)
+    freshservice_ticket_by_email = _map_tickets(ticket_ids, tickets)
+
+    # 3. Match & Validate (both feeds go through the match table; a trigger
+    # resolves as soon as the second side is present). A feed that failed
+    # (None) is not synced, so its last known entries stay in the table.
+    now = time.time()
+    hires = None if rippling_users is None else {u.work_email: u.start_date for u in rippling_users}
+    _sync_sides(table, "onboarding", {"rippling": hires, "freshservice": freshservice_ticket_by_email}, now=now)
+    if not rippling_users:
+        if rippling_users is not None:
+            logger.info("   No Rippling users found for today.")
+        return []
+    metrics.TRIGGERS_FOUND.inc(len(rippling_users), kind="onboarding")
     validated_matches: List[ValidatedTrigger] = []
     
     for r_user in rippling_users:
         email = r_user.work_email.lower()
-        ticket_id = freshservice_ticket_by_email.get(email)
+        ticket_id = table.ref("onboarding", email, "freshservice")
         if ticket_id:
+            metrics.TRIGGERS_VALIDATED.inc(kind="onboarding")
             logger.info(f"✅ VALIDATED MATCH: {email}")
             logger.info(f"   - Rippling: Ready")
             logger.info(f"   - Freshservice: Ticket #{ticket_id} Exists")
@@ -66,28 +86,40 @@ def validate_and_fetch_onboarding_context(minutes_lookback=1440) -> List[Validat
                 )
             )
         else:
-            logger.warning(f"⚠️  MISMATCH: {email} found in Rippling but NO Freshservice ticket found.")
-            # Alert IT? (Log is the alert for now)
+            metrics.TRIGGERS_MISMATCHED.inc(kind="onboarding")
+            _log_waiting(table, "onboarding", email, now, "found in Rippling but NO Freshservice ticket found.")
             
     return validated_matches
 
 
-def validate_and_fetch_offboarding_context(minutes_lookback=1440) -> List[ValidatedTrigger]:
+def validate_and_fetch_offboarding_context(
+    minutes_lookback=1440, as_of=None, state=None, rippling: Optional[RipplingClient] = None
+) -> List[ValidatedTrigger]:
     """
     Dual-confirmed departures:
-    1. Rippling departure feed for today.
+    1. Rippling departure feed for today (or `as_of`).
     2. Freshservice offboarding ticket feed.
     """
     logger.info("🔒 Trigger Validator: Starting Offboarding Dual-Validation Scan...")
+    table = match_table(state)
+
+    rippling = rippling or RipplingClient(roster=roster_snapshot(state))
+    departures = rippling.get_departures(as_of)
 
-    rippling = RipplingClient()
-    departures = rippling.get_departures()
+    tickets = freshservice.ticket_cache(state)
+    ticket_ids = freshservice.scan_for_offboarding_tickets(minutes_lookback=minutes_lookback, cache=tickets)
+    freshservice_ticket_by_email = _map_tickets(ticket_ids, tickets)
+
+    now = time.time()
+    departing = None
+    if departures is not None:
+        departing = {u.work_email: u.end_date for u in departures if (u.work_email or "").strip()}
+    _sync_sides(table, "offboarding", {"rippling": departing, "freshservice": freshservice_ticket_by_email}, now=now)
     if not departures:
-        logger.info("   No Rippling departures found for today.")
+        if departures is not None:
+            logger.info("   No Rippling departures found for today.")
         return []
-
-    ticket_ids = freshservice.scan_for_offboarding_tickets(minutes_lookback=minutes_lookback)
-    freshservice_ticket_by_email = freshservice.map_ticket_ids_by_email(ticket_ids)
+    metrics.TRIGGERS_FOUND.inc(len(departures), kind="offboarding")
 
     validated_matches: List[ValidatedTrigger] = []
     for departing_user in departures:
@@ -95,8 +127,9 @@ def validate_and_fetch_offboarding_context(minutes_lookback=1440) -> List[Valida
         if not email:
             continue
 
-        ticket_id = freshservice_ticket_by_email.get(email)
+        ticket_id = table.ref("offboarding", email, "freshservice")
         if ticket_id:
+            metrics.TRIGGERS_VALIDATED.inc(kind="offboarding")
             logger.info("✅ VALIDATED DEPARTURE: %s", email)
             logger.info("   - Rippling: Departure detected")
             logger.info("   - Freshservice: Ticket #%s Exists", ticket_id)
@@ -108,9 +141,35 @@ def validate_and_fetch_offboarding_context(minutes_lookback=1440) -> List[Valida
                 )
             )
         else:
-            logger.warning(
-                "⚠️  MISMATCH: %s found in Rippling departures but no Freshservice offboarding ticket found.",
-                email,
+            metrics.TRIGGERS_MISMATCHED.inc(kind="offboarding")
+            _log_waiting(
+                table, "offboarding", email, now, "found in Rippling departures but no Freshservice offboarding ticket found."
             )
 
     return validated_matches
+
+
+def _map_tickets(ticket_ids, cache) -> Optional[Dict[str, str]]:
+    if ticket_ids is None:
+        return None
+    return freshservice.map_ticket_ids_by_email(ticket_ids, cache=cache)
+
+
+def _sync_sides(table: MatchTable, kind, feeds: Dict[str, Optional[dict]], now=None) -> None:
+    """Sync each side's refs into the table, skipping sides whose feed failed (None)."""
+    for side, refs in feeds.items():
+        if refs is None:
+            logger.warning("⚠️ %s %s feed unavailable; keeping its last synced entries.", side.title(), kind)
+            continue
+        table.sync(kind, side, {email: "" if ref is None else ref for email, ref in refs.items()}, now=now)
+    table.prune(now=now)
+    table.save()
+
+
+def _log_waiting(table: MatchTable, kind, email, now, message) -> None:
+    """Warn once when a candidate starts waiting; later scans only note how long it has waited."""
+    waited = table.waiting(kind, "rippling", now=now).get(email, 0.0)
+    if waited <= 0:
+        logger.warning("⚠️  MISMATCH: %s %s", email, message)
+    else:
+        logger.info("⏳ %s still waiting on Freshservice for %.0f min (%s).", email, waited / 60, kind)
@@ -0,0 +1,855 @@
+"""
+Local stand-ins for the SaaS APIs SERVUS calls.
+
+A single ThreadingHTTPServer serves every fake under its own path prefix:
+
+    /rippling      /workers, /workers/{id}, /users/{id}
+    /freshservice  /api/v2/tickets, /api/v2/tickets/{id}
+    /okta          /api/v1/users, groups, lifecycle, apps
+    /slack         /api/<method>, /scim/v1/Users/{id}, /webhook (notifier sink)
+    /zoom          /oauth/token, /v2/users/{id}
+    /linear        /graphql (invite + users query)
+    /sqs           SendMessage (JSON and query protocols); ReceiveMessage,
+                   DeleteMessage, ChangeMessageVisibility (JSON protocol)
+
+Rosters are seeded in-process (`seed_cohort`, `add_worker`, `add_ticket`).
+Latency, error injection and 429 rate limiting are configurable per service
+so benchmarks exercise the real clients without touching production.
+`config_overrides()` returns the CONFIG keys that point SERVUS at the fakes.
+"""
+import hashlib
+import itertools
+import json
+import logging
+import random
+import re
+import threading
+import time
+import urllib.parse
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("servus.fake_services")
+
+SERVICES = ("rippling", "freshservice", "okta", "slack", "zoom", "linear", "sqs")
+FAKE_QUEUE_NAME = "servus-badges"
+
+# CONFIG key -> environment variable, where the two differ beyond the SERVUS_ prefix.
+_ENV_NAMES = {"SLACK_TOKEN": "SERVUS_SLACK_ADMIN_TOKEN"}
+
+_DEPARTMENTS = ("Engineering", "Manufacturing", "Flight Test", "Finance", "People")
+_TITLES = ("Engineer", "Technician", "Analyst", "Manager", "Specialist")
+
+
+@dataclass
+class ServiceBehavior:
+    """Per-service knobs. `rate_limit_per_sec` of 0 disables throttling."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit_per_sec: float = 0.0
+    retry_after_seconds: int = 1
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeServices:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self._lock = threading.RLock()
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.behavior: Dict[str, ServiceBehavior] = {name: ServiceBehavior() for name in SERVICES}
+        self._windows: Dict[str, deque] = {name: deque() for name in SERVICES}
+        self.call_counts: Dict[str, int] = {name: 0 for name in SERVICES}
+        self.throttled_counts: Dict[str, int] = {name: 0 for name in SERVICES}
+
+        self.workers: Dict[str, dict] = {}
+        self.rippling_users: Dict[str, dict] = {}
+        self.tickets: Dict[int, dict] = {}
+        self.okta_users: Dict[str, dict] = {}
+        self.okta_group_members: Dict[str, set] = {}
+        self.slack_users: Dict[str, dict] = {}
+        self.slack_channel_members: Dict[str, set] = {}
+        self.slack_webhook_posts: List[dict] = []
+        self.zoom_users: Dict[str, dict] = {}
+        self.linear_users: Dict[str, dict] = {}
+        self.sqs_messages: List[dict] = []
+
+    # -----------------
+    # Lifecycle
+    # -----------------
+
+    def start(self) -> "FakeServices":
+        if self._server is not None:
+            return self
+        handler = type("_BoundFakeHandler", (_FakeHandler,), {"fakes": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_port
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="servus-fake-services", daemon=True
+        )
+        self._thread.start()
+        logger.info("🧪 Fake services listening on %s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, service: str) -> str:
+        return f"{self.base_url}/{service}"
+
+    def config_overrides(self) -> Dict[str, object]:
+        """CONFIG values that route every supported integration to this server."""
+        return {
+            "RIPPLING_API_TOKEN": "fake-rippling-token",
+            "RIPPLING_BASE_URL": self.url("rippling"),
+            "FRESHSERVICE_DOMAIN": f"{self.host}:{self.port}",
+            "FRESHSERVICE_API_KEY": "fake-freshservice-key",
+            "FRESHSERVICE_BASE_URL": self.url("freshservice"),
+            "OKTA_DOMAIN": f"{self.host}:{self.port}",
+            "OKTA_TOKEN": "fake-okta-token",
+            "OKTA_BASE_URL": self.url("okta"),
+            "SLACK_TOKEN": "xoxb-fake",
+            "SLACK_API_BASE_URL": f"{self.url('slack')}/api",
+            "SLACK_SCIM_BASE_URL": f"{self.url('slack')}/scim/v1",
+            "SLACK_WEBHOOK_URL": f"{self.url('slack')}/webhook",
+            "ZOOM_ACCOUNT_ID": "fake-account",
+            "ZOOM_CLIENT_ID": "fake-client",
+            "ZOOM_CLIENT_SECRET": "fake-secret",
+            "ZOOM_API_BASE_URL": f"{self.url('zoom')}/v2",
+            "ZOOM_OAUTH_URL": f"{self.url('zoom')}/oauth/token",
+            "LINEAR_API_KEY": "fake-linear-key",
+            "LINEAR_API_URL": f"{self.url('linear')}/graphql",
+            "SQS_ENDPOINT_URL": self.url("sqs"),
+            "SQS_BADGE_QUEUE_URL": f"{self.url('sqs')}/000000000000/{FAKE_QUEUE_NAME}",
+            "AWS_REGION": "us-east-1",
+        }
+
+    def env_overrides(self) -> Dict[str, str]:
+        """Same as `config_overrides`, keyed by the SERVUS_* environment variable names."""
+        return {
+            _ENV_NAMES.get(key, f"SERVUS_{key}"): str(value)
+            for key, value in self.config_overrides().items()
+        }
+
+    # -----------------
+    # Behavior knobs
+    # -----------------
+
+    def set_behavior(self, service: Optional[str] = None, **changes) -> None:
+        """Update knobs for one service, or all services when `service` is None."""
+        targets = SERVICES if service is None else (service,)
+        with self._lock:
+            for name in targets:
+                if name not in self.behavior:
+                    raise ValueError(f"Unknown fake service: {name}")
+                for key, value in changes.items():
+                    if not hasattr(self.behavior[name], key):
+                        raise ValueError(f"Unknown behavior knob: {key}")
+                    setattr(self.behavior[name], key, value)
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            for name in SERVICES:
+                self.call_counts[name] = 0
+                self.throttled_counts[name] = 0
+
+    def _admit(self, service: str):
+        """
+        Apply latency / rate limit / error injection for one request.
+        Returns (status, payload, headers) to short-circuit, or None to proceed.
+        """
+        with self._lock:
+            behavior = self.behavior[service]
+            self.call_counts[service] += 1
+            delay = behavior.latency_ms + (self._random.uniform(0, behavior.jitter_ms) if behavior.jitter_ms else 0)
+            inject_error = behavior.error_rate > 0 and self._random.random() < behavior.error_rate
+
+            if behavior.rate_limit_per_sec > 0:
+                now = time.monotonic()
+                window = self._windows[service]
+                while window and now - window[0] >= 1.0:
+                    window.popleft()
+                if len(window) >= behavior.rate_limit_per_sec:
+                    self.throttled_counts[service] += 1
+                    headers = {"Retry-After": str(behavior.retry_after_seconds)}
+                    return 429, {"error": "ratelimited", "message": "Too Many Requests"}, headers
+                window.append(now)
+
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if inject_error:
+            return behavior.error_status, {"error": "injected_failure", "message": "Injected fake-service error"}, {}
+        return None
+
+    # -----------------
+    # Seeding
+    # -----------------
+
+    def add_worker(
+        self,
+        first_name: str,
+        last_name: str,
+        *,
+        email_domain: str = "boom.aero",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        department: str = "Engineering",
+        title: str = "Engineer",
+        employment_type: str = "Full-Time",
+        manager_email: Optional[str] = None,
+        in_downstream_systems: bool = True,
+    ) -> dict:
+        """
+        Add a Rippling worker (+ user record). When `in_downstream_systems` is
+        set the person is also provisioned in Okta, Slack, Zoom and Linear.
+        """
+        with self._lock:
+            index = next(self._ids)
+            email = f"{first_name}.{last_name}@{email_domain}".lower()
+            worker_id = f"wrk-{index:06d}"
+            user_id = f"usr-{index:06d}"
+            timestamp = _now_iso()
+            worker = {
+                "id": worker_id,
+                "user_id": user_id,
+                "work_email": email,
+                "personal_email": f"{first_name}.{last_name}@example.com".lower(),
+                "start_date": start_date,
+                "end_date": end_date,
+                "status": "TERMINATED" if end_date else "ACTIVE",
+                "title": title,
+                "department_id": f"dep-{department.lower().replace(' ', '-')}",
+                "employment_type_id": f"emt-{employment_type.lower()}",
+                "country": "US",
+                "manager_email": manager_email,
+                "created_at": timestamp,
+                "updated_at": timestamp,
+                # Expandable relations; only returned when ?expand= asks for them.
+                "_department": {"id": f"dep-{department.lower().replace(' ', '-')}", "name": department},
+                "_employment_type": {"id": f"emt-{employment_type.lower()}", "label": employment_type},
+            }
+            self.workers[worker_id] = worker
+            self.rippling_users[user_id] = {
+                "id": user_id,
+                "name": {"given_name": first_name, "family_name": last_name, "preferred_given_name": None},
+            }
+            if in_downstream_systems:
+                self._provision_downstream(email, first_name, last_name, manager_email, index)
+            return worker
+
+    def _provision_downstream(self, email, first_name, last_name, manager_email, index):
+        okta_id = f"00u{index:010d}"
+        self.okta_users[okta_id] = {
+            "id": okta_id,
+            "status": "ACTIVE",
+            "profile": {
+                "login": email,
+                "email": email,
+                "firstName": first_name,
+                "lastName": last_name,
+                "managerEmail": manager_email or "manager@boom.aero",
+            },
+        }
+        self.slack_users[email] = {"id": f"U{index:08d}", "deleted": False}
+        self.zoom_users[email] = {"id": f"zoom-{index:06d}", "email": email, "type": 1}
+
+    def add_ticket(
+        self,
+        subject: str,
+        description: str,
+        *,
+        requester_email: Optional[str] = None,
+        category: Optional[str] = None,
+        ticket_type: str = "Incident",
+        custom_fields: Optional[dict] = None,
+    ) -> dict:
+        with self._lock:
+            ticket_id = 1000 + next(self._ids)
+            timestamp = _now_iso()
+            ticket = {
+                "id": ticket_id,
+                "subject": subject,
+                "description_text": description,
+                "description": f"<div>{description}</div>",
+                "requester_email": requester_email or "people-ops@boom.aero",
+                "status": 2,
+                "type": ticket_type,
+                "category": category,
+                "custom_fields": dict(custom_fields or {}),
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            }
+            self.tickets[ticket_id] = ticket
+            return ticket
+
+    def seed_cohort(
+        self,
+        new_hires: int = 0,
+        departures: int = 0,
+        *,
+        on_date: Optional[str] = None,
+        with_tickets: bool = True,
+        email_domain: str = "boom.aero",
+    ) -> Dict[str, List[str]]:
+        """
+        Seed `new_hires` starting and `departures` leaving on `on_date`
+        (default today), each with a matching Freshservice ticket.
+        Returns {"new_hires": [emails], "departures": [emails]}.
+        """
+        target_date = on_date or datetime.now().strftime("%Y-%m-%d")
+        seeded = {"new_hires": [], "departures": []}
+        for number in range(new_hires):
+            first, last = "Hire", f"N{number:05d}"
+            worker = self.add_worker(
+                first,
+                last,
+                email_domain=email_domain,
+                start_date=target_date,
+                department=_DEPARTMENTS[number % len(_DEPARTMENTS)],
+                title=_TITLES[number % len(_TITLES)],
+                employment_type="Full-Time" if number % 4 else "Contractor",
+                manager_email=f"manager.{number % 7}@{email_domain}",
+                in_downstream_systems=True,
+            )
+            email = worker["work_email"]
+            seeded["new_hires"].append(email)
+            if with_tickets:
+                self.add_ticket(
+                    f"New Hire Onboarding: {first} {last}",
+                    f"Please onboard the following employee - {first} {last} has been hired.\n"
+                    f"Work email: {email}\nStart date of: {target_date}",
+                    category="Employee Onboarding",
+                    ticket_type="Service Request",
+                )
+        for number in range(departures):
+            first, last = "Leaver", f"D{number:05d}"
+            worker = self.add_worker(
+                first,
+                last,
+                email_domain=email_domain,
+                start_date="2020-01-06",
+                end_date=target_date,
+                department=_DEPARTMENTS[number % len(_DEPARTMENTS)],
+                title=_TITLES[number % len(_TITLES)],
+            )
+            email = worker["work_email"]
+            seeded["departures"].append(email)
+            if with_tickets:
+                self.add_ticket(
+                    f"Offboarding: {first} {last}",
+                    f"Termination for {email} effective {target_date}.",
+                    category="Employee Offboarding",
+                    ticket_type="Service Request",
+                )
+        return seeded
+
+    # -----------------
+    # Routing
+    # -----------------
+
+    def handle(self, method: str, raw_path: str, headers, body: bytes):
+        parsed = urllib.parse.urlsplit(raw_path)
+        segments = [urllib.parse.unquote(part) for part in parsed.path.split("/") if part]
+        if not segments or segments[0] not in SERVICES:
+            return 404, {"error": "unknown_service"}, {}
+        service, rest = segments[0], segments[1:]
+        query = {key: values[-1] for key, values in urllib.parse.parse_qs(parsed.query).items()}
+
+        short_circuit = self._admit(service)
+        if short_circuit is not None:
+            return short_circuit
+
+        handler = getattr(self, f"_handle_{service}")
+        with self._lock:
+            return handler(method, rest, query, headers, body)
+
+    # Rippling ---------------------------------------------------------------
+
+    def _worker_view(self, worker, expand, fields=None):
+        view = {key: value for key, value in worker.items() if not key.startswith("_")}
+        if "department" in expand:
+            view["department"] = dict(worker["_department"])
+        if "employment_type" in expand:
+            view["employment_type"] = dict(worker["_employment_type"])
+        if "manager" in expand and worker.get("manager_email"):
+            view["manager"] = {"work_email": worker["manager_email"]}
+        if "user" in expand and worker.get("user_id") in self.rippling_users:
+            view["user"] = json.loads(json.dumps(self.rippling_users[worker["user_id"]]))
+        if fields:
+            view = {key: value for key, value in view.items() if key in fields or key == "id"}
+        return view
+
+    def _handle_rippling(self, method, rest, query, headers, body):
+        if method != "GET":
+            return 405, {"detail": "Method not allowed"}, {}
+        expand = {part.strip() for part in str(query.get("expand") or "").split(",") if part.strip()}
+        fields = {part.strip() for part in str(query.get("fields") or "").split(",") if part.strip()}
+
+        if rest == ["workers"]:
+            # Newest first, like the live API's default ordering.
+            workers = sorted(self.workers.values(), key=lambda item: item["id"], reverse=True)
+            filter_expr = str(query.get("filter") or "").strip()
+            if filter_expr:
+                field, op, value = (filter_expr.split(None, 2) + ["", ""])[:3]
+                value = value.strip().strip("'\"").lower()
+                if field == "email":
+                    field = "work_email"
+                if op == "gt":
+                    workers = [item for item in workers if str(item.get(field) or "").lower() > value]
+                elif op == "ge":
+                    workers = [item for item in workers if str(item.get(field) or "").lower() >= value]
+                else:
+                    workers = [item for item in workers if str(item.get(field) or "").lower() == value]
+            limit = max(1, min(int(query.get("limit") or 50), 1000))
+            offset = int(query.get("cursor") or 0)
+            page = workers[offset:offset + limit]
+            payload = {"results": [self._worker_view(item, expand, fields) for item in page]}
+            if offset + limit < len(workers):
+                next_query = dict(query, cursor=str(offset + limit))
+                payload["next_link"] = f"{self.url('rippling')}/workers?{urllib.parse.urlencode(next_query)}"
+            return 200, payload, {}
+
+        if len(rest) == 2 and rest[0] == "workers":
+            worker = self.workers.get(rest[1])
+            if not worker:
+                return 404, {"detail": "Worker not found"}, {}
+            return 200, self._worker_view(worker, expand, fields), {}
+
+        if len(rest) == 2 and rest[0] == "users":
+            user = self.rippling_users.get(rest[1])
+            if not user:
+                return 404, {"detail": "User not found"}, {}
+            return 200, user, {}
+
+        return 404, {"detail": "Not found"}, {}
+
+    # Freshservice -----------------------------------------------------------
+
+    def _handle_freshservice(self, method, rest, query, headers, body):
+        if method != "GET" or rest[:2] != ["api", "v2"] or len(rest) < 3 or rest[2] != "tickets":
+            return 404, {"description": "Not found"}, {}
+
+        if rest[3:] == ["filter"]:
+            return self._filter_tickets(query)
+
+        if len(rest) == 4:
+            try:
+                ticket = self.tickets.get(int(rest[3]))
+            except ValueError:
+                ticket = None
+            if not ticket:
+                return 404, {"description": "Ticket not found"}, {}
+            return 200, {"ticket": dict(ticket)}, {}
+
+        tickets = sorted(self.tickets.values(), key=lambda item: item["id"], reverse=True)
+        updated_since = str(query.get("updated_since") or "")
+        if updated_since:
+            tickets = [item for item in tickets if item["updated_at"] >= updated_since]
+        per_page = max(1, min(int(query.get("per_page") or 30), 100))
+        page = max(1, int(query.get("page") or 1))
+        start = (page - 1) * per_page
+        selected = tickets[start:start + per_page]
+        extra_headers = {}
+        if start + per_page < len(tickets):
+            next_query = dict(query, page=str(page + 1))
+            next_url = f"{self.url('freshservice')}/api/v2/tickets?{urllib.parse.urlencode(next_query)}"
+            extra_headers["Link"] = f'<{next_url}>; rel="next"'
+        return 200, {"tickets": [dict(item) for item in selected]}, extra_headers
+
+    def _filter_tickets(self, query):
+        """
+        `/tickets/filter?query="..."`: `field:'value'` / `field:>'value'` terms
+        combined with AND/OR and parentheses; unknown fields match
+        custom_fields. 30 results per page, like the live endpoint.
+        """
+        expression = str(query.get("query") or "").strip().strip('"')
+        tokens = re.findall(r"\(|\)|\bAND\b|\bOR\b|[^()\s:]+:[<>]?(?:'[^']*'|[^()\s]+)", expression)
+        if not tokens:
+            return 400, {"description": "Validation failed", "errors": [{"field": "query"}]}, {}
+
+        def term_matches(ticket, term):
+            field, _, value = term.partition(":")
+            op = "="
+            if value[:1] in ("<", ">"):
+                op, value = value[0], value[1:]
+            value = value.strip("'").lower()
+            actual = ticket.get(field, (ticket.get("custom_fields") or {}).get(field))
+            actual = str(actual if actual is not None else "").lower()
+            if op == ">":
+                return actual > value
+            if op == "<":
+                return actual < value
+            return actual == value
+
+        def parse_or(position):
+            node, position = parse_and(position)
+            nodes = [node]
+            while position < len(tokens) and tokens[position] == "OR":
+                node, position = parse_and(position + 1)
+                nodes.append(node)
+            return ("or", nodes), position
+
+        def parse_and(position):
+            node, position = parse_atom(position)
+            nodes = [node]
+            while position < len(tokens) and tokens[position] == "AND":
+                node, position = parse_atom(position + 1)
+                nodes.append(node)
+            return ("and", nodes), position
+
+        def parse_atom(position):
+            if tokens[position] == "(":
+                node, position = parse_or(position + 1)
+                if tokens[position] != ")":
+                    raise ValueError("unbalanced parentheses")
+                return node, position + 1
+            if tokens[position] in (")", "AND", "OR"):
+                raise ValueError(f"unexpected {tokens[position]}")
+            return ("term", tokens[position]), position + 1
+
+        def evaluate(node, ticket):
+            kind, value = node
+            if kind == "term":
+                return term_matches(ticket, value)
+            results = (evaluate(child, ticket) for child in value)
+            return any(results) if kind == "or" else all(results)
+
+        try:
+            tree, end = parse_or(0)
+            if end != len(tokens):
+                raise ValueError("trailing tokens")
+        except (IndexError, ValueError):
+            return 400, {"description": "Validation failed", "errors": [{"field": "query"}]}, {}
+        tickets = sorted(self.tickets.values(), key=lambda item: item["id"], reverse=True)
+        matches = [item for item in tickets if evaluate(tree, item)]
+        page = max(1, int(query.get("page") or 1))
+        selected = matches[(page - 1) * 30:page * 30]
+        return 200, {"tickets": [dict(item) for item in selected], "total": len(matches)}, {}
+
+    # Okta -------------------------------------------------------------------
+
+    def _find_okta_user(self, key):
+        if key in self.okta_users:
+            return self.okta_users[key]
+        login = str(key or "").lower()
+        return next((user for user in self.okta_users.values() if user["profile"]["login"] == login), None)
+
+    def _handle_okta(self, method, rest, query, headers, body):
+        if rest[:2] != ["api", "v1"]:
+            return 404, {"errorSummary": "Not found"}, {}
+        rest = rest[2:]
+
+        if rest == ["users"] and method == "GET":
+            term = str(query.get("q") or "").lower()
+            limit = int(query.get("limit") or 200)
+            matches = [
+                user
+                for user in self.okta_users.values()
+                if not term
+                or user["profile"]["email"].lower().startswith(term)
+                or user["profile"]["firstName"].lower().startswith(term)
+                or user["profile"]["lastName"].lower().startswith(term)
+            ]
+            return 200, matches[:limit], {}
+
+        if len(rest) == 2 and rest[0] == "users" and method == "GET":
+            user = self._find_okta_user(rest[1])
+            if not user:
+                return 404, {"errorCode": "E0000007", "errorSummary": "Not found: Resource not found"}, {}
+            return 200, user, {}
+
+        if len(rest) == 4 and rest[0] == "users" and rest[2] == "lifecycle" and method == "POST":
+            user = self._find_okta_user(rest[1])
+            if not user:
+                return 404, {"errorCode": "E0000007", "errorSummary": "Not found: Resource not found"}, {}
+            if rest[3] == "deactivate":
+                user["status"] = "DEPROVISIONED"
+            return 200, {}, {}
+
+        if len(rest) == 4 and rest[0] == "groups" and rest[2] == "users" and method == "PUT":
+            self.okta_group_members.setdefault(rest[1], set()).add(rest[3])
+            return 204, None, {}
+
+        if len(rest) == 4 and rest[0] == "apps" and rest[2] == "users" and method == "DELETE":
+            return 204, None, {}
+
+        return 404, {"errorSummary": "Not found"}, {}
+
+    # Slack ------------------------------------------------------------------
+
+    def _slack_user_by_id(self, user_id):
+        for email, user in self.slack_users.items():
+            if user["id"] == user_id:
+                return email, user
+        return None, None
+
+    def _handle_slack(self, method, rest, query, headers, body):
+        if rest == ["webhook"] and method == "POST":
+            self.slack_webhook_posts.append(_parse_body(headers, body))
+            return 200, "ok", {"Content-Type": "text/plain"}
+
+        if rest[:2] == ["scim", "v1"] and len(rest) == 4 and rest[2] == "Users" and method == "DELETE":
+            _, user = self._slack_user_by_id(rest[3])
+            if not user:
+                return 404, {"Errors": {"description": "user not found", "code": 404}}, {}
+            user["deleted"] = True
+            return 204, None, {}
+
+        if len(rest) != 2 or rest[0] != "api":
+            return 404, {"ok": False, "error": "unknown_method"}, {}
+        api_method = rest[1]
+        params = dict(query)
+        params.update(_parse_body(headers, body))
+
+        if api_method == "auth.test":
+            return 200, {"ok": True, "team": "boom-fake", "user": "servus"}, {}
+        if api_method == "users.lookupByEmail":
+            user = self.slack_users.get(str(params.get("email") or "").lower())
+            if not user or user["deleted"]:
+                return 200, {"ok": False, "error": "users_not_found"}, {}
+            return 200, {"ok": True, "user": {"id": user["id"], "deleted": user["deleted"]}}, {}
+        if api_method == "users.info":
+            _, user = self._slack_user_by_id(params.get("user"))
+            if not user:
+                return 200, {"ok": False, "error": "user_not_found"}, {}
+            return 200, {"ok": True, "user": {"id": user["id"], "deleted": user["deleted"]}}, {}
+        if api_method == "conversations.invite":
+            channel = str(params.get("channel") or "")
+            users = [item for item in str(params.get("users") or "").split(",") if item]
+            if not channel:
+                return 200, {"ok": False, "error": "channel_not_found"}, {}
+            members = self.slack_channel_members.setdefault(channel, set())
+            if users and all(user in members for user in users):
+                return 200, {"ok": False, "error": "already_in_channel"}, {}
+            members.update(users)
+            return 200, {"ok": True, "channel": {"id": channel}}, {}
+        if api_method == "users.admin.setInactive":
+            _, user = self._slack_user_by_id(params.get("user"))
+            if not user:
+                return 200, {"ok": False, "error": "user_not_found"}, {}
+            user["deleted"] = True
+            return 200, {"ok": True}, {}
+        return 200, {"ok": False, "error": "unknown_method"}, {}
+
+    # Zoom -------------------------------------------------------------------
+
+    def _handle_zoom(self, method, rest, query, headers, body):
+        if rest == ["oauth", "token"] and method == "POST":
+            return 200, {"access_token": "fake-zoom-token", "token_type": "bearer", "expires_in": 3600}, {}
+
+        if len(rest) == 3 and rest[:2] == ["v2", "users"]:
+            key = rest[2].lower()
+            user = self.zoom_users.get(key) or next(
+                (item for item in self.zoom_users.values() if item["id"] == rest[2]), None
+            )
+            if not user:
+                return 404, {"code": 1001, "message": "User does not exist."}, {}
+            if method == "GET":
+                return 200, dict(user), {}
+            if method == "PATCH":
+                payload = _parse_body(headers, body)
+                if "type" in payload:
+                    user["type"] = payload["type"]
+                return 204, None, {}
+
+        return 404, {"code": 404, "message": "Not found"}, {}
+
+    # Linear -----------------------------------------------------------------
+
+    def _handle_linear(self, method, rest, query, headers, body):
+        if rest != ["graphql"] or method != "POST":
+            return 404, {"errors": [{"message": "Not found"}]}, {}
+        payload = _parse_body(headers, body)
+        document = str(payload.get("query") or "")
+        variables = payload.get("variables") or {}
+
+        if "organizationInviteCreate" in document:
+            invite = (variables.get("input") or {}) if isinstance(variables, dict) else {}
+            email = str(invite.get("email") or "").lower()
+            if email in self.linear_users:
+                return 200, {"errors": [{"message": "User already exists in organization"}]}, {}
+            self.linear_users[email] = {"id": f"lin-{uuid.uuid4().hex[:8]}", "email": email, "active": True}
+            result = {
+                "success": True,
+                "organizationInvite": {"id": self.linear_users[email]["id"], "email": email,
+                                       "role": invite.get("role"), "acceptedAt": None},
+            }
+            return 200, {"data": {"organizationInviteCreate": result}}, {}
+
+        if "users(" in document:
+            email = str((variables or {}).get("email") or "").lower()
+            nodes = [dict(user) for user in self.linear_users.values() if not email or user["email"] == email]
+            return 200, {"data": {"users": {"nodes": nodes}}}, {}
+
+        return 400, {"errors": [{"message": "Unsupported fake GraphQL operation"}]}, {}
+
+    # SQS --------------------------------------------------------------------
+
+    def _handle_sqs(self, method, rest, query, headers, body):
+        target = str(headers.get("X-Amz-Target") or "")
+        if target:
+            action = target.rsplit(".", 1)[-1]
+            params = _parse_body(headers, body)
+        else:
+            params = dict(query)
+            params.update(_parse_body(headers, body))
+            action = str(params.get("Action") or "")
+
+        if target and action in {"ReceiveMessage", "DeleteMessage", "ChangeMessageVisibility"}:
+            return self._handle_sqs_consumer(action, params)
+        if action != "SendMessage":
+            return 400, {"__type": "InvalidAction", "message": f"Unsupported fake SQS action: {action}"}, {}
+
+        message_body = str(params.get("MessageBody") or "")
+        message_id = str(uuid.uuid4())
+        digest = hashlib.md5(message_body.encode("utf-8")).hexdigest()
+        with self._lock:
+            self.sqs_messages.append(
+                {
+                    "MessageId": message_id,
+                    "QueueUrl": params.get("QueueUrl"),
+                    "Body": message_body,
+                    "visible_at": 0.0,
+                    "receive_count": 0,
+                    "ReceiptHandle": None,
+                }
+            )
+        if target:
+            return 200, {"MessageId": message_id, "MD5OfMessageBody": digest}, {
+                "Content-Type": "application/x-amz-json-1.0"
+            }
+        xml = (
+            '<?xml version="1.0"?><SendMessageResponse xmlns="http://queue.amazonaws.com/doc/2012-11-05/">'
+            f"<SendMessageResult><MD5OfMessageBody>{digest}</MD5OfMessageBody>"
+            f"<MessageId>{message_id}</MessageId></SendMessageResult>"
+            f"<ResponseMetadata><RequestId>{uuid.uuid4()}</RequestId></ResponseMetadata>"
+            "</SendMessageResponse>"
+        )
+        return 200, xml, {"Content-Type": "text/xml"}
+
+
+    def _handle_sqs_consumer(self, action, params):
+        """
+        Visibility-timeout semantics for worker-queue tests. ReceiveMessage
+        never long-polls: WaitTimeSeconds is ignored and an empty queue
+        answers at once.
+        """
+        json_headers = {"Content-Type": "application/x-amz-json-1.0"}
+        now = time.time()
+        with self._lock:
+            if action == "ReceiveMessage":
+                limit = max(1, int(params.get("MaxNumberOfMessages") or 1))
+                visibility = float(params.get("VisibilityTimeout") or 30)
+                received = []
+                for message in self.sqs_messages:
+                    if len(received) >= limit:
+                        break
+                    if message.get("QueueUrl") != params.get("QueueUrl") or message.get("visible_at", 0.0) > now:
+                        continue
+                    message["visible_at"] = now + visibility
+                    message["receive_count"] = message.get("receive_count", 0) + 1
+                    message["ReceiptHandle"] = uuid.uuid4().hex
+                    received.append(
+                        {
+                            "MessageId": message["MessageId"],
+                            "ReceiptHandle": message["ReceiptHandle"],
+                            "Body": message["Body"],
+                            "MD5OfBody": hashlib.md5(message["Body"].encode("utf-8")).hexdigest(),
+                            "Attributes": {"ApproximateReceiveCount": str(message["receive_count"])},
+                        }
+                    )
+                return 200, ({"Messages": received} if received else {}), json_headers
+
+            handle = params.get("ReceiptHandle")
+            message = next((item for item in self.sqs_messages if handle and item.get("ReceiptHandle") == handle), None)
+            if message is None:
+                return 400, {"__type": "ReceiptHandleIsInvalid", "message": "The receipt handle is not valid."}, json_headers
+            if action == "DeleteMessage":
+                self.sqs_messages.remove(message)
+            else:
+                message["visible_at"] = now + float(params.get("VisibilityTimeout") or 0)
+            return 200, {}, json_headers
+
+
+def _parse_body(headers, body: bytes) -> Dict[str, object]:
+    if not body:
+        return {}
+    content_type = str(headers.get("Content-Type") or "").lower()
+    text = body.decode("utf-8", errors="replace")
+    if "json" in content_type:
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    return {key: values[-1] for key, values in urllib.parse.parse_qs(text).items()}
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    fakes: FakeServices = None
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            status, payload, extra_headers = self.fakes.handle(self.command, self.path, self.headers, body)
+        except Exception as exc:
+            logger.exception("Fake service handler failed")
+            status, payload, extra_headers = 500, {"error": f"fake handler crashed: {exc}"}, {}
+
+        if payload is None:
+            data = b""
+        elif isinstance(payload, (bytes, str)):
+            data = payload.encode("utf-8") if isinstance(payload, str) else payload
+        else:
+            data = json.dumps(payload).encode("utf-8")
+
+        self.send_response(status)
+        headers = {"Content-Type": "application/json"}
+        headers.update(extra_headers or {})
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+    do_PATCH = _dispatch
+    do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        logger.debug("fake services: " + format, *args)
@@ -0,0 +1,65 @@
+"""
+Reentrant lock that can extend across processes.
+
+`InterprocessLock()` behaves like `threading.RLock`. Once bound to a path
+(`bind`), the outermost acquire also takes an exclusive `flock` on that
+file, so scheduler and worker processes sharing a state directory serialize
+their read-modify-write cycles on CSV queues and the state file. Nested
+acquires in the same thread reuse the held flock, because a second `open()`
+of the lock file would otherwise deadlock against it.
+"""
+import os
+import threading
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock; fall back to in-process locking.
+    fcntl = None
+
+
+class InterprocessLock:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._handle = None
+
+    def bind(self, path: Optional[str]) -> None:
+        with self._lock:
+            self.path = path
+
+    def acquire(self):
+        self._lock.acquire()
+        try:
+            if self._depth == 0 and self.path and fcntl is not None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                handle = open(self.path, "a+")
+                try:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                except Exception:
+                    handle.close()
+                    raise
+                self._handle = handle
+        except Exception:
+            self._lock.release()
+            raise
+        self._depth += 1
+        return True
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0 and self._handle is not None:
+            handle, self._handle = self._handle, None
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            finally:
+                handle.close()
+        self._lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
@@ -0,0 +1,132 @@
+"""
+Hot-reloadable runtime inputs: config, provisioning policies and workflows.
+
+Policy files (google_groups.yaml, slack_channels.yaml, protected_targets.yaml)
+and workflow YAML are parsed once per *generation* through `load(path,
+loader)`, instead of on every step. SIGHUP (or `servusctl.py reload`) calls
+`reload()`, which re-reads CONFIG (`servus.config.read_config`) and
+re-parses every file the current generation has loaded into a new
+generation. Nothing is swapped until every file parses and `check` passes,
+so a half-edited policy leaves the previous config and generation in place
+and the reload reports the error.
+
+A workflow run pins the generation current when it starts (`pinned()`);
+the pin is a context variable, so it follows the run onto bulkhead threads.
+In-flight runs therefore finish with the policies and workflow they started
+with, and the next run picks up the new ones. CONFIG has no generations:
+it is updated in place, and running steps see new values on their next read.
+"""
+import contextlib
+import contextvars
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from servus import config as servus_config
+
+logger = logging.getLogger("servus.hot_reload")
+
+
+class Generation:
+    """Parsed files keyed by (loader, path); entries are filled on first use."""
+
+    def __init__(self, number: int, entries: Optional[Dict[tuple, tuple]] = None):
+        self.number = number
+        self.loaded_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self._entries: Dict[tuple, tuple] = dict(entries or {})
+        self._lock = threading.Lock()
+
+    def load(self, path: str, loader: Callable, fallback=None):
+        key = (loader, str(path))
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key][2]
+        try:
+            value = loader(path)
+        except Exception as exc:
+            if fallback is None:
+                raise
+            logger.error("❌ Could not load %s: %s", path, exc)
+            return fallback() if callable(fallback) else fallback
+        with self._lock:
+            return self._entries.setdefault(key, (loader, path, value))[2]
+
+    def files(self) -> List[str]:
+        with self._lock:
+            return sorted({path for _, path, _ in self._entries.values()})
+
+    def rebuild(self) -> "Generation":
+        """
+        Next generation with every known file re-parsed; raises on the first
+        file that fails. Files that no longer exist are dropped, so the next
+        use loads them the way a first use would.
+        """
+        with self._lock:
+            known = list(self._entries.items())
+        entries = {
+            key: (loader, path, loader(path)) for key, (loader, path, _) in known if path and os.path.exists(path)
+        }
+        return Generation(self.number + 1, entries)
+
+
+_current = Generation(1)
+_pinned: contextvars.ContextVar[Optional[Generation]] = contextvars.ContextVar("servus_generation", default=None)
+_reload_lock = threading.Lock()
+
+
+def current() -> Generation:
+    """The generation pinned by the running workflow, else the latest one."""
+    return _pinned.get() or _current
+
+
+def load(path: str, loader: Callable, fallback=None):
+    """
+    `loader(path)`, parsed once per generation. When the first load fails,
+    `fallback` (a value or a callable) is returned and nothing is cached;
+    without a fallback the error propagates.
+    """
+    return current().load(path, loader, fallback)
+
+
+@contextlib.contextmanager
+def pinned():
+    """Pin the latest generation for the duration of one workflow run."""
+    token = _pinned.set(_current)
+    try:
+        yield _current
+    finally:
+        _pinned.reset(token)
+
+
+def reload(check: Optional[Callable[[Generation], List[str]]] = None) -> dict:
+    """
+    Re-read CONFIG and build the next generation from every loaded file.
+    `check(candidate)` may load more files into the candidate (e.g.
+    workflows not run yet) and returns blocking issues; any issue or parse
+    error keeps the current config and generation. Returns {"ok",
+    "generation", "files", "config_changed", "errors"}.
+    """
+    global _current
+    with _reload_lock:
+        try:
+            fresh_config, dotenv = servus_config.read_config()
+            candidate = _current.rebuild()
+            errors = list(check(candidate) if check is not None else [])
+        except Exception as exc:
+            errors = [str(exc)]
+        if errors:
+            for error in errors:
+                logger.error("❌ Reload rejected; keeping generation %d and the current config: %s", _current.number, error)
+            return {"ok": False, "generation": _current.number, "files": _current.files(), "config_changed": [], "errors": errors}
+
+        changed = servus_config.reload_config(fresh_config, dotenv)
+        _current = candidate
+    logger.info(
+        "🔄 Reloaded config (%d changed key(s)) and %d policy/workflow file(s) as generation %d.",
+        len(changed),
+        len(candidate.files()),
+        candidate.number,
+    )
+    return {"ok": True, "generation": candidate.number, "files": candidate.files(), "config_changed": changed, "errors": []}
@@ -0,0 +1,246 @@
+"""
+In-flight workflow run registry.
+
+Scans hand runs to `InflightRegistry.submit`, which queues them for worker
+threads and returns right away. Each run is keyed by its dedupe key, and a
+key that is already queued or running is refused, so a scan that overlaps a
+slow run skips it instead of starting it twice. A registry without workers
+(`max_workers=0`) runs work inline, which matches the historical behavior.
+
+Queued runs are ordered by priority class (see `PRIORITIES`), then by age
+within a class. A revocation therefore jumps ahead of every parked
+onboarding run. `reserved_workers` adds threads that only take revocation
+work, so access removal starts even while every general worker is busy with
+long onboardings. Runs that have already started are never interrupted,
+because stopping a workflow between provisioning steps would leave accounts
+half-created.
+"""
+import contextvars
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from servus import metrics
+
+logger = logging.getLogger("servus.inflight")
+
+# Highest priority first.
+PRIORITIES = ("emergency_revocation", "offboarding", "manual_override", "onboarding")
+REVOCATION_PRIORITIES = ("emergency_revocation", "offboarding")
+_RANKS = {name: rank for rank, name in enumerate(PRIORITIES)}
+_REVOCATION_RANK = max(_RANKS[name] for name in REVOCATION_PRIORITIES)
+
+
+class InflightRegistry:
+    def __init__(self, max_workers: int = 4, reserved_workers: int = 0):
+        self.max_workers = max(0, int(max_workers))
+        self.reserved_workers = max(0, int(reserved_workers)) if self.max_workers > 0 else 0
+        self._runs: Dict[str, dict] = {}
+        self._queue: List[tuple] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._work_ready = threading.Condition(self._lock)
+        self._threads: List[threading.Thread] = []
+        self._shutdown = False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._runs)
+
+    def is_inflight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._runs
+
+    def submit(
+        self, key: str, fn: Callable, *args, description: str = "", priority: str = "onboarding", **kwargs
+    ) -> Optional[Future]:
+        """
+        Queue `fn(*args, **kwargs)` under `key` at `priority` (one of
+        PRIORITIES). Returns None when `key` is already queued or running.
+        Otherwise returns a Future, already resolved when the registry runs
+        work inline.
+        """
+        if priority not in _RANKS:
+            raise ValueError(f"Unknown run priority: {priority}")
+        with self._lock:
+            if key in self._runs:
+                run = self._runs[key]
+                logger.info("⏭️  %s already %s since %s; skipping.", key, run["state"], run["started"] or run["queued"])
+                return None
+            if self._shutdown:
+                raise RuntimeError("cannot submit runs after shutdown")
+            run = {
+                "key": key,
+                "description": description or key,
+                "priority": priority,
+                "state": "queued",
+                "queued": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "queued_monotonic": time.monotonic(),
+                "started": None,
+                "started_monotonic": None,
+                "future": Future(),
+            }
+            self._runs[key] = run
+            metrics.INFLIGHT_RUNS.set(len(self._runs))
+            if self.max_workers > 0:
+                run["call"] = (contextvars.copy_context(), fn, args, kwargs)
+                heapq.heappush(self._queue, (_RANKS[priority], next(self._seq), key))
+                self._publish_queue_locked()
+                self._start_workers_locked()
+                self._work_ready.notify_all()
+                return run["future"]
+            self._mark_started_locked(run)
+
+        self._execute(run, contextvars.copy_context(), fn, args, kwargs)
+        return run["future"]
+
+    def _start_workers_locked(self):
+        if self._threads:
+            return
+        lanes = [False] * self.max_workers + [True] * self.reserved_workers
+        for index, reserved in enumerate(lanes):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(reserved,),
+                name=f"servus-run{'-reserved' if reserved else ''}-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self, reserved: bool) -> None:
+        while True:
+            with self._work_ready:
+                while True:
+                    run = self._next_locked(reserved)
+                    if run is not None:
+                        break
+                    if self._shutdown:
+                        return
+                    self._work_ready.wait()
+                self._mark_started_locked(run)
+                context, fn, args, kwargs = run.pop("call")
+            if not run["future"].set_running_or_notify_cancel():
+                self._finish(run, None)
+                continue
+            self._execute(run, context, fn, args, kwargs)
+
+    def _next_locked(self, reserved: bool) -> Optional[dict]:
+        """Oldest run of the highest waiting class; reserved workers only take revocation work."""
+        if not self._queue:
+            return None
+        if reserved and self._queue[0][0] > _REVOCATION_RANK:
+            return None
+        _, _, key = heapq.heappop(self._queue)
+        self._publish_queue_locked()
+        return self._runs[key]
+
+    def _mark_started_locked(self, run: dict) -> None:
+        run["state"] = "running"
+        run["started"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        run["started_monotonic"] = time.monotonic()
+        metrics.RUN_QUEUE_WAIT.observe(run["started_monotonic"] - run["queued_monotonic"], priority=run["priority"])
+
+    def _publish_queue_locked(self):
+        depth = {name: 0 for name in PRIORITIES}
+        for rank, _, _ in self._queue:
+            depth[PRIORITIES[rank]] += 1
+        for name, count in depth.items():
+            metrics.RUN_QUEUE_DEPTH.set(count, priority=name)
+
+    def _execute(self, run: dict, context, fn, args, kwargs) -> None:
+        try:
+            result = context.run(fn, *args, **kwargs)
+        except Exception as exc:
+            self._finish(run, exc)
+            run["future"].set_exception(exc)
+        except BaseException as exc:
+            self._finish(run, exc)
+            run["future"].set_exception(exc)
+            raise
+        else:
+            self._finish(run, None)
+            run["future"].set_result(result)
+
+    def _finish(self, run: dict, exc: Optional[BaseException]) -> None:
+        """Release the key before the Future resolves, so a caller woken by it can resubmit."""
+        with self._lock:
+            self._runs.pop(run["key"], None)
+            metrics.INFLIGHT_RUNS.set(len(self._runs))
+        if exc is not None:
+            logger.error("❌ In-flight run %s raised: %s", run["key"], exc)
+        elif run["started_monotonic"] is not None:
+            logger.debug("In-flight run %s finished in %.1fs", run["key"], time.monotonic() - run["started_monotonic"])
+
+    def snapshot(self) -> List[dict]:
+        """
+        Entries (key, description, priority, state, queued, started, seconds):
+        running runs oldest first, then queued runs in the order they will start.
+        `seconds` is time running, or time waiting for queued runs.
+        """
+        now = time.monotonic()
+        with self._lock:
+            runs = sorted(
+                self._runs.values(),
+                key=lambda run: (
+                    run["state"] != "running",
+                    0 if run["state"] == "running" else _RANKS[run["priority"]],
+                    run["started_monotonic"] or run["queued_monotonic"],
+                ),
+            )
+            return [
+                {
+                    "key": run["key"],
+                    "description": run["description"],
+                    "priority": run["priority"],
+                    "state": run["state"],
+                    "queued": run["queued"],
+                    "started": run["started"],
+                    "seconds": round(now - (run["started_monotonic"] or run["queued_monotonic"]), 1),
+                }
+                for run in runs
+            ]
+
+    def park_queued(self) -> List[dict]:
+        """
+        Drop every run that has not started and cancel its Future. Returns the
+        parked entries; their triggers are still pending, so the next scan
+        (here or on another instance) dispatches them again.
+        """
+        with self._lock:
+            parked = [self._runs.pop(key) for _, _, key in sorted(self._queue) if key in self._runs]
+            self._queue = []
+            self._publish_queue_locked()
+            metrics.INFLIGHT_RUNS.set(len(self._runs))
+        for run in parked:
+            run["future"].cancel()
+        if parked:
+            logger.info("🅿️ Parked %d queued run(s) that had not started.", len(parked))
+        return [
+            {"key": run["key"], "description": run["description"], "priority": run["priority"], "queued": run["queued"]}
+            for run in parked
+        ]
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is queued or running; False if `timeout` elapsed first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not len(self):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting runs. Workers drain the queue before exiting; `wait` joins them."""
+        with self._work_ready:
+            self._shutdown = True
+            self._work_ready.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -1,6 +1,7 @@
 import logging
 import winrm
 import time
+from servus import tracing
 from servus.config import CONFIG
 
 logger = logging.getLogger("servus.ad")
@@ -30,6 +31,18 @@ def get_session():
     # Ensure requests-ntlm is installed in your environment
     return winrm.Session(host, auth=(user, password), transport='ntlm')
 
+
+def _run_ps(session, ps_script, operation):
+    """Run a PowerShell script over WinRM inside a tracing span."""
+    attributes = {"integration": "ad", "winrm.operation": operation}
+    with tracing.span("winrm.run_ps", kind="winrm", attributes=attributes) as winrm_span:
+        result = session.run_ps(ps_script)
+        status_code = getattr(result, "status_code", None)
+        winrm_span.set_attribute("status_code", status_code)
+        if status_code not in (0, None):
+            winrm_span.set_status(tracing.STATUS_ERROR, f"status code {status_code}")
+        return result
+
 def validate_user_exists(context):
     """
     Passively checks if the user exists in AD (synced from Okta).
@@ -81,7 +94,7 @@ def validate_user_exists(context):
         """
         
         try:
-            result = session.run_ps(ps_script)
+            result = _run_ps(session, ps_script, "validate_user_exists")
             output = result.std_out.decode()
             
             if result.status_code == 0 and "FOUND" in output:
@@ -225,7 +238,7 @@ def ensure_user_disabled(context):
     """
     
     try:
-        result = session.run_ps(ps_script)
+        result = _run_ps(session, ps_script, "ensure_user_disabled")
         output = result.std_out.decode().strip()
         error_out = result.std_err.decode().strip()
 
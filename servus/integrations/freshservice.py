@@ -1,12 +1,16 @@
+import json
 import logging
+import os
 import re
+import tempfile
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Iterable, List, Optional, Set
 
 import requests
 
 from servus.config import CONFIG
-from servus.integrations.rippling import RipplingClient
+from servus.integrations.rippling import RipplingClient, WorkerDirectory, worker_directory
 from servus.models import UserProfile
 
 logger = logging.getLogger("servus.freshservice")
@@ -21,6 +25,191 @@ OFFBOARDING_KEYWORDS = (
     "departure",
     "separation",
 )
+LIFECYCLE_KEYWORDS = {"onboarding": ONBOARDING_KEYWORDS, "offboarding": OFFBOARDING_KEYWORDS}
+# Cached tickets last updated this long before the widest scan window are pruned.
+TICKET_CACHE_RETENTION = timedelta(days=2)
+# FRESHSERVICE_SCAN_MODE values: keyword scan only, server-side filter query
+# (keyword scan if the query is unset or rejected), or the union of both.
+SCAN_MODE_KEYWORDS = "keywords"
+SCAN_MODE_FILTER = "filter"
+SCAN_MODE_HYBRID = "hybrid"
+# The filter endpoint returns 30 tickets per page and stops at page 10.
+FILTER_PAGE_SIZE = 30
+FILTER_MAX_PAGES = 10
+
+
+class TicketCache:
+    """
+    Memo of lifecycle tickets keyed by id: `updated_at`, subject, keyword
+    classification and (once fetched) extracted emails. An entry is only
+    re-processed when its `updated_at` moves, and scans list just the tickets
+    updated since the watermark instead of the whole lookback window.
+    Persisted to `path` when one is given.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.watermark: Optional[str] = None
+        self.covered_since: Optional[str] = None
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        # Held across a list call + observe so concurrent scans do not list the same tickets twice.
+        self.refresh_lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.warning("⚠️ Ignoring unreadable Freshservice ticket cache %s: %s", self.path, exc)
+            return
+        self.watermark = payload.get("watermark")
+        self.covered_since = payload.get("covered_since")
+        self.entries = {str(key): value for key, value in (payload.get("tickets") or {}).items()}
+
+    def covers(self, window_start: str) -> bool:
+        """True once earlier listings reached back to `window_start`."""
+        with self._lock:
+            return bool(self.watermark and self.covered_since and self.covered_since <= window_start)
+
+    def list_since(self, window_start: str) -> str:
+        """`updated_since` for the next list call: the watermark once the window is covered."""
+        with self._lock:
+            if self.covers(window_start):
+                return max(self.watermark, window_start)
+            return window_start
+
+    def observe(self, tickets, listed_since: str) -> List[str]:
+        """Merge listed tickets; returns ids that were new or whose `updated_at` moved."""
+        changed = []
+        with self._lock:
+            for ticket in tickets:
+                ticket_id = ticket.get("id")
+                if ticket_id is None:
+                    continue
+                key = str(ticket_id)
+                updated_at = str(ticket.get("updated_at") or "")
+                entry = self.entries.get(key)
+                if entry is not None and entry.get("updated_at") == updated_at:
+                    continue
+                self.entries[key] = {
+                    "updated_at": updated_at,
+                    "subject": str(ticket.get("subject") or ""),
+                    "labels": _classify_ticket(ticket),
+                    "emails": None,
+                }
+                changed.append(key)
+                if updated_at and (self.watermark is None or updated_at > self.watermark):
+                    self.watermark = updated_at
+            if self.covered_since is None or listed_since < self.covered_since:
+                self.covered_since = listed_since
+            self._dirty = True
+        return changed
+
+    def tag(self, tickets, label: str) -> None:
+        """Record tickets a server-side filter matched for `label` without moving the watermark."""
+        with self._lock:
+            for ticket in tickets:
+                if ticket.get("id") is None:
+                    continue
+                key = str(ticket["id"])
+                updated_at = str(ticket.get("updated_at") or "")
+                entry = self.entries.get(key)
+                if entry is None or entry.get("updated_at") != updated_at:
+                    entry = {
+                        "updated_at": updated_at,
+                        "subject": str(ticket.get("subject") or ""),
+                        "labels": _classify_ticket(ticket),
+                        "emails": None,
+                    }
+                    self.entries[key] = entry
+                if label not in entry["labels"]:
+                    entry["labels"] = list(entry["labels"]) + [label]
+                self._dirty = True
+
+    def candidates(self, label: str, window_start: str) -> List[str]:
+        """Ticket ids classified as `label` and updated within the window, newest first."""
+        with self._lock:
+            ids = [
+                key
+                for key, entry in self.entries.items()
+                if label in (entry.get("labels") or []) and str(entry.get("updated_at") or "") >= window_start
+            ]
+        return sorted(ids, key=lambda key: int(key) if key.isdigit() else key, reverse=True)
+
+    def emails(self, ticket_id) -> Optional[List[str]]:
+        with self._lock:
+            entry = self.entries.get(str(ticket_id).strip())
+            emails = entry.get("emails") if entry else None
+            return list(emails) if emails is not None else None
+
+    def store_emails(self, ticket_id, emails: List[str]) -> None:
+        with self._lock:
+            entry = self.entries.get(str(ticket_id).strip())
+            if entry is not None:
+                entry["emails"] = list(emails)
+                self._dirty = True
+
+    def prune(self, before: str) -> None:
+        with self._lock:
+            stale = [key for key, entry in self.entries.items() if str(entry.get("updated_at") or "") < before]
+            for key in stale:
+                del self.entries[key]
+            if self.covered_since and self.covered_since < before:
+                self.covered_since = before
+            if stale:
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or not self.path:
+                self._dirty = False
+                return
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            payload = {"watermark": self.watermark, "covered_since": self.covered_since, "tickets": self.entries}
+            fd, tmp_path = tempfile.mkstemp(prefix=".freshservice_tickets_", dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except Exception as exc:
+                logger.warning("⚠️ Could not persist Freshservice ticket cache %s: %s", self.path, exc)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+            self._dirty = False
+
+
+_ticket_caches: Dict[tuple, TicketCache] = {}
+_ticket_caches_lock = threading.Lock()
+
+
+def ticket_cache(state) -> Optional[TicketCache]:
+    """
+    Ticket cache tied to a scheduler RunState, or None when disabled. The
+    file defaults to `freshservice_ticket_cache.json` next to the state file
+    (FRESHSERVICE_TICKET_CACHE_FILE overrides).
+    """
+    if state is None or not CONFIG.get("FRESHSERVICE_TICKET_CACHE_ENABLED", True):
+        return None
+    path = str(CONFIG.get("FRESHSERVICE_TICKET_CACHE_FILE") or "").strip()
+    if not path:
+        state_dir = os.path.dirname(os.path.abspath(getattr(state, "state_file", "servus_state.json")))
+        path = os.path.join(state_dir, "freshservice_ticket_cache.json")
+    key = (_api_base(CONFIG.get("FRESHSERVICE_DOMAIN")), os.path.abspath(path))
+    with _ticket_caches_lock:
+        cache = _ticket_caches.get(key)
+        if cache is None:
+            cache = TicketCache(path)
+            _ticket_caches[key] = cache
+        return cache
 
 
 def fetch_ticket_data(ticket_id):
@@ -40,6 +229,7 @@ def fetch_ticket_data(ticket_id):
         date_match = re.search(r"start date of: (.*?)\s*$", description, re.MULTILINE | re.IGNORECASE)
 
         guessed_email = None
+        full_name = ""
         first_name = ""
         last_name = ""
         start_date = date_match.group(1).strip() if date_match else None
@@ -56,18 +246,31 @@ def fetch_ticket_data(ticket_id):
 
         # 2. Enrichment (preferred source of truth)
         rippling_client = RipplingClient()
-        ticket_emails = extract_ticket_emails(ticket_id)
-        if guessed_email:
+        ticket_emails = _emails_from_ticket(ticket)
+        directory = worker_directory(rippling_client.base_url)
+        if directory is not None and directory.loaded_at is not None:
+            # Roster is indexed: resolve by name/email lookup instead of probing guessed emails.
+            match_email = _match_worker_email(directory, full_name, ticket_emails, ticket_id)
+            if match_email is None and directory.refresh(rippling_client):
+                match_email = _match_worker_email(directory, full_name, ticket_emails, ticket_id)
+            if match_email:
+                rippling_profile = rippling_client.find_user_by_email(match_email)
+                if rippling_profile:
+                    logger.info("✅ Found match in Rippling directory: %s", rippling_profile.email)
+                    return rippling_profile
+            guessed_email = match_email or guessed_email
+        elif guessed_email:
             rippling_profile = rippling_client.find_user_by_email(guessed_email)
             if rippling_profile:
                 logger.info("✅ Found match in Rippling: %s", rippling_profile.email)
                 return rippling_profile
 
-        for email in ticket_emails:
-            rippling_profile = rippling_client.find_user_by_email(email)
-            if rippling_profile:
-                logger.info("✅ Found match in Rippling via ticket email: %s", rippling_profile.email)
-                return rippling_profile
+        if directory is None or directory.loaded_at is None:
+            for email in ticket_emails:
+                rippling_profile = rippling_client.find_user_by_email(email)
+                if rippling_profile:
+                    logger.info("✅ Found match in Rippling via ticket email: %s", rippling_profile.email)
+                    return rippling_profile
 
         # 3. Fallback profile from ticket data.
         fallback_email = guessed_email or next(iter(ticket_emails), None)
@@ -101,23 +304,46 @@ def fetch_ticket_data(ticket_id):
         return None
 
 
-def scan_for_onboarding_tickets(minutes_lookback=60):
+def _match_worker_email(directory: WorkerDirectory, full_name, ticket_emails, ticket_id) -> Optional[str]:
+    """
+    Resolve a ticket to one indexed work email: a unique name match first,
+    then a name match narrowed by the ticket's emails, then the first ticket
+    email that is a known worker. Ambiguous names are reported, not guessed.
+    """
+    candidates = directory.match_name(full_name) if full_name else []
+    if len(candidates) == 1:
+        return candidates[0]
+    if candidates:
+        narrowed = [email for email in candidates if email in ticket_emails]
+        if len(narrowed) == 1:
+            return narrowed[0]
+        logger.warning(
+            "⚠️ Ticket #%s: '%s' matches %d Rippling workers (%s); not guessing.",
+            ticket_id,
+            full_name,
+            len(candidates),
+            ", ".join(candidates),
+        )
+    return next((email for email in ticket_emails if email in directory), None)
+
+
+def scan_for_onboarding_tickets(minutes_lookback=60, cache: Optional[TicketCache] = None):
     """
     Scans Freshservice for recent onboarding-related tickets.
-    Returns a list of ticket IDs.
+    Returns a list of ticket IDs, or None when Freshservice could not be read.
     """
-    return _scan_tickets_by_keywords(minutes_lookback, ONBOARDING_KEYWORDS, label="onboarding")
+    return _scan_tickets(minutes_lookback, ONBOARDING_KEYWORDS, label="onboarding", cache=cache)
 
 
-def scan_for_offboarding_tickets(minutes_lookback=60):
+def scan_for_offboarding_tickets(minutes_lookback=60, cache: Optional[TicketCache] = None):
     """
     Scans Freshservice for recent offboarding-related tickets.
-    Returns a list of ticket IDs.
+    Returns a list of ticket IDs, or None when Freshservice could not be read.
     """
-    return _scan_tickets_by_keywords(minutes_lookback, OFFBOARDING_KEYWORDS, label="offboarding")
+    return _scan_tickets(minutes_lookback, OFFBOARDING_KEYWORDS, label="offboarding", cache=cache)
 
 
-def map_ticket_ids_by_email(ticket_ids: Iterable[object]) -> Dict[str, str]:
+def map_ticket_ids_by_email(ticket_ids: Iterable[object], cache: Optional[TicketCache] = None) -> Dict[str, str]:
     """
     Builds email -> ticket_id mapping for candidate lifecycle tickets.
     First-seen ticket wins to keep mapping deterministic.
@@ -127,19 +353,31 @@ def map_ticket_ids_by_email(ticket_ids: Iterable[object]) -> Dict[str, str]:
         normalized_id = str(ticket_id).strip()
         if not normalized_id:
             continue
-        for email in extract_ticket_emails(normalized_id):
+        for email in extract_ticket_emails(normalized_id, cache=cache):
             mapping.setdefault(email, normalized_id)
+    if cache is not None:
+        cache.save()
     return mapping
 
 
-def extract_ticket_emails(ticket_id: object) -> List[str]:
+def extract_ticket_emails(ticket_id: object, cache: Optional[TicketCache] = None) -> List[str]:
     """
     Extract candidate work emails from ticket metadata/subject/body.
+    With a cache, emails are fetched once per ticket `updated_at`.
     """
+    cached = cache.emails(ticket_id) if cache is not None else None
+    if cached is not None:
+        return cached
     ticket = _fetch_ticket(ticket_id)
     if not ticket:
         return []
+    emails = _emails_from_ticket(ticket)
+    if cache is not None:
+        cache.store_emails(ticket_id, emails)
+    return emails
+
 
+def _emails_from_ticket(ticket) -> List[str]:
     candidates: Set[str] = set()
 
     for key in ("email", "requester_email", "responder_email"):
@@ -162,37 +400,178 @@ def extract_ticket_emails(ticket_id: object) -> List[str]:
     return sorted(candidates)
 
 
-def _scan_tickets_by_keywords(minutes_lookback, keywords, *, label):
+def _scan_tickets(minutes_lookback, keywords, *, label, cache: Optional[TicketCache] = None):
+    """
+    Candidate ticket ids for `label` per FRESHSERVICE_SCAN_MODE. Filter mode
+    asks Freshservice for tickets matching FRESHSERVICE_<LABEL>_FILTER_QUERY
+    (category, type or a custom field); hybrid adds keyword-scan hits so
+    untagged tickets are still found.
+    """
+    mode = str(CONFIG.get("FRESHSERVICE_SCAN_MODE") or SCAN_MODE_KEYWORDS).strip().lower()
+    filter_query = str(CONFIG.get(f"FRESHSERVICE_{label.upper()}_FILTER_QUERY") or "").strip()
+    if mode not in {SCAN_MODE_FILTER, SCAN_MODE_HYBRID}:
+        return _scan_tickets_by_keywords(minutes_lookback, keywords, label=label, cache=cache)
+    if not filter_query:
+        logger.warning("FRESHSERVICE_SCAN_MODE=%s but no %s filter query is set; using keyword scan.", mode, label)
+        return _scan_tickets_by_keywords(minutes_lookback, keywords, label=label, cache=cache)
+
+    filtered = _scan_tickets_by_filter(minutes_lookback, filter_query, label=label, cache=cache)
+    if filtered is None:
+        logger.warning("⚠️ Freshservice %s filter query failed; falling back to keyword scan.", label)
+        return _scan_tickets_by_keywords(minutes_lookback, keywords, label=label, cache=cache)
+    if mode == SCAN_MODE_FILTER:
+        return filtered
+
+    keyword_matches = _scan_tickets_by_keywords(minutes_lookback, keywords, label=label, cache=cache)
+    if keyword_matches is None:
+        return None
+    merged = set(filtered) | set(keyword_matches)
+    return sorted(merged, key=lambda key: int(key) if key.isdigit() else key, reverse=True)
+
+
+def _scan_tickets_by_filter(minutes_lookback, filter_query, *, label, cache: Optional[TicketCache] = None):
+    """Server-side filter via `/api/v2/tickets/filter`; returns None if the query is rejected."""
     domain = CONFIG.get("FRESHSERVICE_DOMAIN")
     api_key = CONFIG.get("FRESHSERVICE_API_KEY")
     if not domain or not api_key:
         logger.warning("Freshservice config missing; cannot scan %s tickets.", label)
-        return []
+        return None
+
+    window = datetime.utcnow() - timedelta(minutes=minutes_lookback)
+    start_time = window.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # The filter API only compares dates; the exact window is applied below.
+    expression = f"({filter_query}) AND updated_at:>'{(window - timedelta(days=1)).strftime('%Y-%m-%d')}'"
+    logger.info("🔍 Freshservice: Filtering %s tickets server-side (%s)...", label, filter_query)
 
-    start_time = (datetime.utcnow() - timedelta(minutes=minutes_lookback)).strftime("%Y-%m-%dT%H:%M:%SZ")
-    url = f"https://{domain}/api/v2/tickets?updated_since={start_time}&order_by=created_at&order_type=desc"
+    tickets: List[Dict[str, object]] = []
+    try:
+        for page in range(1, FILTER_MAX_PAGES + 1):
+            resp = requests.get(
+                f"{_api_base(domain)}/api/v2/tickets/filter",
+                params={"query": f'"{expression}"', "page": page},
+                auth=(api_key, "X"),
+                timeout=15,
+            )
+            if resp.status_code != 200:
+                logger.error("❌ Freshservice Filter Error (%s): %s", resp.status_code, resp.text)
+                return None
+            batch = resp.json().get("tickets", [])
+            tickets.extend(batch)
+            if len(batch) < FILTER_PAGE_SIZE:
+                break
+    except Exception as exc:
+        logger.error("❌ Freshservice Filter Error: %s", exc)
+        return None
 
-    logger.info("🔍 Freshservice: Scanning for %s tickets updated since %s...", label, start_time)
+    in_window = [ticket for ticket in tickets if str(ticket.get("updated_at") or "") >= start_time]
+    if cache is not None:
+        cache.tag(in_window, label)
+        cache.save()
     matches = []
+    for ticket in in_window:
+        if ticket.get("id") is None:
+            continue
+        logger.info("   found candidate ticket: #%s - %s", ticket["id"], ticket.get("subject") or "")
+        matches.append(str(ticket["id"]))
+    return matches
+
+
+def _scan_tickets_by_keywords(minutes_lookback, keywords, *, label, cache: Optional[TicketCache] = None):
+    """
+    Keyword-matched ticket ids in the lookback window. Returns None when the
+    listing fails; with a cache that already covers the window, the cached
+    candidates are returned instead.
+    """
+    domain = CONFIG.get("FRESHSERVICE_DOMAIN")
+    api_key = CONFIG.get("FRESHSERVICE_API_KEY")
+    if not domain or not api_key:
+        logger.warning("Freshservice config missing; cannot scan %s tickets.", label)
+        return None
+
+    window = datetime.utcnow() - timedelta(minutes=minutes_lookback)
+    start_time = window.strftime("%Y-%m-%dT%H:%M:%SZ")
+    list_since = start_time
+
+    if cache is not None:
+        changed = set()
+        # Concurrent onboarding/offboarding scans share one listing: the
+        # second waits here and then lists only what moved past the watermark.
+        with cache.refresh_lock:
+            list_since = cache.list_since(start_time)
+            logger.info("🔍 Freshservice: Scanning for %s tickets updated since %s...", label, list_since)
+            tickets = _list_tickets_or_none(domain, api_key, list_since)
+            if tickets is None:
+                if not cache.covers(start_time):
+                    return None
+                logger.warning("⚠️ Freshservice listing failed; using cached %s candidates.", label)
+            else:
+                changed = set(cache.observe(tickets, list_since))
+                cache.prune((window - TICKET_CACHE_RETENTION).strftime("%Y-%m-%dT%H:%M:%SZ"))
+                cache.save()
+        matches = cache.candidates(label, start_time)
+        for ticket_id in matches:
+            if ticket_id in changed:
+                logger.info("   found candidate ticket: #%s - %s", ticket_id, cache.entries[ticket_id]["subject"])
+        return matches
+
+    logger.info("🔍 Freshservice: Scanning for %s tickets updated since %s...", label, list_since)
+    tickets = _list_tickets_or_none(domain, api_key, list_since)
+    if tickets is None:
+        return None
+    matches = []
+    for ticket in tickets:
+        if _ticket_matches(ticket, keywords):
+            ticket_id = ticket.get("id")
+            if ticket_id is None:
+                continue
+            logger.info("   found candidate ticket: #%s - %s", ticket_id, ticket.get("subject") or "")
+            matches.append(str(ticket_id))
+    return matches
+
+
+def _list_tickets_or_none(domain, api_key, updated_since) -> Optional[List[Dict[str, object]]]:
     try:
+        return _list_tickets(domain, api_key, updated_since)
+    except Exception as exc:
+        logger.error("❌ Freshservice Scan Error: %s", exc)
+        return None
+
+
+def _list_tickets(domain, api_key, updated_since) -> Optional[List[Dict[str, object]]]:
+    """All tickets updated since `updated_since`, following `Link: rel="next"` pages."""
+    url = (
+        f"{_api_base(domain)}/api/v2/tickets?updated_since={updated_since}"
+        "&order_by=created_at&order_type=desc&per_page=100"
+    )
+    tickets: List[Dict[str, object]] = []
+    while url:
         resp = requests.get(url, auth=(api_key, "X"), timeout=15)
         if resp.status_code != 200:
             logger.error("❌ Freshservice Scan Error (%s): %s", resp.status_code, resp.text)
-            return []
+            return None
+        tickets.extend(resp.json().get("tickets", []))
+        url = (resp.links.get("next") or {}).get("url")
+    return tickets
 
-        for ticket in resp.json().get("tickets", []):
-            subject = str(ticket.get("subject") or "")
-            description = str(ticket.get("description_text") or ticket.get("description") or "")
-            haystack = f"{subject}\n{description}".lower()
-            if any(keyword in haystack for keyword in keywords):
-                ticket_id = ticket.get("id")
-                if ticket_id is None:
-                    continue
-                logger.info("   found candidate ticket: #%s - %s", ticket_id, subject)
-                matches.append(str(ticket_id))
-    except Exception as exc:
-        logger.error("❌ Freshservice Scan Error: %s", exc)
-    return matches
+
+def lifecycle_ticket_emails(ticket) -> Dict[str, List[str]]:
+    """`{"onboarding"|"offboarding": [emails]}` for a single ticket payload (e.g. a webhook event)."""
+    labels = _classify_ticket(ticket)
+    if not labels:
+        return {}
+    emails = _emails_from_ticket(ticket)
+    return {label: list(emails) for label in labels}
+
+
+def _ticket_matches(ticket, keywords) -> bool:
+    subject = str(ticket.get("subject") or "")
+    description = str(ticket.get("description_text") or ticket.get("description") or "")
+    haystack = f"{subject}\n{description}".lower()
+    return any(keyword in haystack for keyword in keywords)
+
+
+def _classify_ticket(ticket) -> List[str]:
+    return [label for label, keywords in LIFECYCLE_KEYWORDS.items() if _ticket_matches(ticket, keywords)]
 
 
 def _fetch_ticket(ticket_id) -> Optional[Dict[str, object]]:
@@ -206,7 +585,7 @@ def _fetch_ticket(ticket_id) -> Optional[Dict[str, object]]:
     if not normalized_id:
         return None
 
-    url = f"https://{domain}/api/v2/tickets/{normalized_id}"
+    url = f"{_api_base(domain)}/api/v2/tickets/{normalized_id}"
     try:
         resp = requests.get(url, auth=(api_key, "X"), timeout=15)
         if resp.status_code != 200:
@@ -219,6 +598,10 @@ def _fetch_ticket(ticket_id) -> Optional[Dict[str, object]]:
         return None
 
 
+def _api_base(domain) -> str:
+    return str(CONFIG.get("FRESHSERVICE_BASE_URL") or f"https://{domain}").rstrip("/")
+
+
 def _extract_emails_from_text(raw_text) -> Set[str]:
     text = str(raw_text or "")
     return {email.lower() for email in EMAIL_REGEX.findall(text)}
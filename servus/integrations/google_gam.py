@@ -3,6 +3,7 @@ import logging
 import time
 import os
 import yaml
+from servus import hot_reload, tracing
 from servus.config import CONFIG
 
 logger = logging.getLogger("servus.google")
@@ -35,28 +36,35 @@ def _is_corporate_email(email):
 
 def run_gam(args):
     cmd = [GAM_PATH] + args
-    try:
-        # We capture output but don't strictly fail on non-zero returns 
-        # because sometimes GAM warns about non-critical things.
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
-    except FileNotFoundError:
-        logger.error(f"GAM binary not found at {GAM_PATH}")
-        return False, "", "Binary missing"
+    attributes = {"integration": "google_gam", "gam.command": " ".join(str(arg) for arg in args[:2])}
+    with tracing.span("gam", kind="subprocess", attributes=attributes) as gam_span:
+        try:
+            # We capture output but don't strictly fail on non-zero returns 
+            # because sometimes GAM warns about non-critical things.
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            gam_span.set_attribute("exit_code", result.returncode)
+            if result.returncode != 0:
+                gam_span.set_status(tracing.STATUS_ERROR, f"exit code {result.returncode}")
+            return result.returncode == 0, result.stdout, result.stderr
+        except FileNotFoundError:
+            logger.error(f"GAM binary not found at {GAM_PATH}")
+            gam_span.set_status(tracing.STATUS_ERROR, "Binary missing")
+            return False, "", "Binary missing"
 
 
 def _load_group_policy():
-    if not os.path.exists(GROUP_POLICY_FILE):
-        logger.warning("Google group policy file missing: %s", GROUP_POLICY_FILE)
-        return DEFAULT_GROUP_POLICY
+    """Group policy for the current reload generation (parsed once, not per step)."""
+    return hot_reload.load(GROUP_POLICY_FILE, _read_group_policy, fallback=DEFAULT_GROUP_POLICY)
+
 
-    try:
-        with open(GROUP_POLICY_FILE, "r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle) or {}
-    except Exception as exc:
-        logger.error("Failed to load Google group policy (%s): %s", GROUP_POLICY_FILE, exc)
+def _read_group_policy(path):
+    if not os.path.exists(path):
+        logger.warning("Google group policy file missing: %s", path)
         return DEFAULT_GROUP_POLICY
 
+    with open(path, "r", encoding="utf-8") as handle:
+        data = yaml.safe_load(handle) or {}
+
     global_policy = data.get("global")
     dept_policy = data.get("departments")
     if not isinstance(global_policy, dict):
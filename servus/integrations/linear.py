@@ -7,7 +7,7 @@ logger = logging.getLogger("servus.linear")
 class LinearClient:
     def __init__(self):
         self.api_key = CONFIG.get("LINEAR_API_KEY")
-        self.api_url = "https://api.linear.app/graphql"
+        self.api_url = str(CONFIG.get("LINEAR_API_URL") or "https://api.linear.app/graphql")
         self.headers = {
             "Authorization": self.api_key,
             "Content-Type": "application/json"
@@ -10,7 +10,8 @@ class OktaClient:
     def __init__(self):
         self.domain = CONFIG.get("OKTA_DOMAIN")
         self.token = CONFIG.get("OKTA_TOKEN")
-        self.base_url = f"https://{self.domain}/api/v1"
+        base = str(CONFIG.get("OKTA_BASE_URL") or f"https://{self.domain}").rstrip("/")
+        self.base_url = f"{base}/api/v1"
         self.headers = {
             "Authorization": f"SSWS {self.token}",
             "Content-Type": "application/json",
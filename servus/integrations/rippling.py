@@ -1,16 +1,437 @@
+import contextvars
+import json
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
 import requests
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, List, Optional, Set
 from servus.config import CONFIG
 from servus.models import UserProfile
+from servus.profile_ingest import ProfileIngestor
 
 logger = logging.getLogger("servus.rippling")
 
+# Worker relations and fields UserProfile is built from; list calls request
+# exactly these so profiles come straight from the list payload.
+WORKER_EXPAND = ("department", "employment_type", "manager", "user")
+WORKER_FIELDS = (
+    "id",
+    "user_id",
+    "work_email",
+    "personal_email",
+    "first_name",
+    "last_name",
+    "preferred_first_name",
+    "title",
+    "department",
+    "employment_type",
+    "manager",
+    "manager_email",
+    "user",
+    "start_date",
+    "end_date",
+    "country",
+    "location",
+    "photo",
+    "status",
+    "updated_at",
+)
+
+
+def _list_query() -> str:
+    return urllib.parse.urlencode({"expand": ",".join(WORKER_EXPAND), "fields": ",".join(WORKER_FIELDS)})
+
+
+class WorkerDirectory:
+    """
+    In-memory index of Rippling workers keyed by lowercased work email.
+
+    Each entry keeps the worker id and `updated_at` from the list payload and,
+    once built, the hydrated UserProfile. The first refresh walks the whole
+    roster; later refreshes only pull workers updated past the watermark and
+    drop cached profiles for anyone who changed. Lookups that miss fall back
+    to the API in `RipplingClient.find_user_by_email`.
+
+    A second index maps normalized names (legal and preferred first name plus
+    last name, and the email local part) to work emails, so tickets that only
+    name the person resolve by hash lookup via `match_name`.
+    """
+
+    def __init__(self, profile_ttl_seconds: float = 900.0, page_size: int = 100):
+        self.profile_ttl_seconds = float(profile_ttl_seconds)
+        self.page_size = int(page_size)
+        self.watermark: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+        self._entries: Dict[str, dict] = {}
+        # worker id -> the email it is indexed under, so an email change drops the old key.
+        self._emails: Dict[str, str] = {}
+        self._names: Dict[str, Set[str]] = {}
+        self._name_keys: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, email) -> bool:
+        with self._lock:
+            return str(email or "").strip().lower() in self._entries
+
+    def ingest(self, workers, complete: bool = False) -> int:
+        """
+        Index worker list payloads; returns how many entries were added or
+        changed. `complete` marks the batch as the whole roster, which makes
+        name matches authoritative (see `loaded_at`).
+        """
+        changed = 0
+        with self._lock:
+            for worker in workers or []:
+                worker_id = worker.get("id")
+                email = str(worker.get("work_email") or worker.get("email") or "").strip().lower()
+                if not worker_id or not email:
+                    continue
+                updated_at = worker.get("updated_at")
+                current = self._entries.get(email)
+                if current and current["worker_id"] == worker_id and current["updated_at"] == updated_at:
+                    continue
+                self._forget_previous_email_locked(worker_id, email)
+                self._entries[email] = {"worker_id": worker_id, "updated_at": updated_at, "profile": None, "built_at": None}
+                self._index_name_locked(email, _worker_name_keys(worker, email))
+                changed += 1
+                if updated_at and (self.watermark is None or str(updated_at) > self.watermark):
+                    self.watermark = str(updated_at)
+            if complete:
+                self.loaded_at = time.time()
+        return changed
+
+    def match_name(self, full_name) -> List[str]:
+        """
+        Work emails indexed under `full_name`; more than one means the name is
+        ambiguous. Middle names are ignored when the full form has no hit.
+        """
+        tokens = _name_tokens(full_name)
+        keys = ["".join(tokens)]
+        if len(tokens) > 2:
+            keys.append(tokens[0] + tokens[-1])
+        with self._lock:
+            for key in keys:
+                emails = self._names.get(key)
+                if emails:
+                    return sorted(emails)
+        return []
+
+    def _forget_previous_email_locked(self, worker_id, email) -> None:
+        previous = self._emails.get(worker_id)
+        if previous and previous != email:
+            entry = self._entries.get(previous)
+            if entry is not None and entry["worker_id"] == worker_id:
+                del self._entries[previous]
+                self._index_name_locked(previous, ())
+                self._name_keys.pop(previous, None)
+        self._emails[worker_id] = email
+
+    def _index_name_locked(self, email, keys) -> None:
+        for key in self._name_keys.pop(email, set()):
+            emails = self._names.get(key)
+            if emails is not None:
+                emails.discard(email)
+                if not emails:
+                    del self._names[key]
+        keys = {key for key in keys if key}
+        for key in keys:
+            self._names.setdefault(key, set()).add(email)
+        self._name_keys[email] = keys
+
+    def lookup(self, email) -> Optional[dict]:
+        """Return a copy of the entry for `email`; the profile is omitted once its TTL lapses."""
+        key = str(email or "").strip().lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            result = dict(entry)
+        built_at = result.get("built_at")
+        if result.get("profile") is not None and (
+            built_at is None or time.monotonic() - built_at > self.profile_ttl_seconds
+        ):
+            result["profile"] = None
+        if result.get("profile") is not None:
+            result["profile"] = result["profile"].model_copy(deep=True)
+        return result
+
+    def store_profile(self, email, worker_id, profile) -> None:
+        key = str(email or "").strip().lower()
+        if not key or not worker_id or not isinstance(profile, UserProfile):
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["worker_id"] != worker_id:
+                self._forget_previous_email_locked(worker_id, key)
+                entry = {"worker_id": worker_id, "updated_at": None}
+                self._entries[key] = entry
+            entry["profile"] = profile.model_copy(deep=True)
+            entry["built_at"] = time.monotonic()
+            if key not in self._name_keys:
+                self._index_name_locked(key, _worker_name_keys(profile.model_dump(), key))
+
+    def refresh(self, client) -> int:
+        """Pull the roster (or the delta since the watermark) through `client`; returns changed entries."""
+        with self._refresh_lock:
+            workers = client.list_workers(updated_since=self.watermark, page_size=self.page_size)
+            if workers is None:
+                return 0
+            return self.ingest(workers, complete=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._emails.clear()
+            self._names.clear()
+            self._name_keys.clear()
+            self.watermark = None
+            self.loaded_at = None
+
+
+_directories: Dict[str, WorkerDirectory] = {}
+_directories_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
+_refresh_stop = threading.Event()
+
+
+def worker_directory(base_url: Optional[str] = None) -> Optional[WorkerDirectory]:
+    """Process-wide directory for a Rippling base URL, or None when RIPPLING_DIRECTORY_ENABLED is off."""
+    if not CONFIG.get("RIPPLING_DIRECTORY_ENABLED", True):
+        return None
+    key = str(base_url or CONFIG.get("RIPPLING_BASE_URL") or "https://rest.ripplingapis.com").rstrip("/")
+    with _directories_lock:
+        directory = _directories.get(key)
+        if directory is None:
+            directory = WorkerDirectory(
+                profile_ttl_seconds=CONFIG.get("RIPPLING_DIRECTORY_PROFILE_TTL_SECONDS", 900),
+            )
+            _directories[key] = directory
+        return directory
+
+
+def start_directory_refresh(interval_seconds: Optional[float] = None) -> bool:
+    """
+    Keep the worker directory warm from a daemon thread: one full roster load,
+    then a delta refresh every `interval_seconds` (RIPPLING_DIRECTORY_REFRESH_SECONDS).
+    """
+    global _refresh_thread
+    interval = float(
+        interval_seconds if interval_seconds is not None else CONFIG.get("RIPPLING_DIRECTORY_REFRESH_SECONDS", 0)
+    )
+    if interval <= 0 or worker_directory() is None:
+        return False
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return True
+
+    def _loop():
+        while not _refresh_stop.is_set():
+            client = RipplingClient()
+            directory = worker_directory(client.base_url)
+            if client.token and directory is not None:
+                try:
+                    changed = directory.refresh(client)
+                    logger.debug("Rippling directory refreshed: %s changed, %s indexed", changed, len(directory))
+                except Exception as exc:
+                    logger.warning("⚠️ Rippling directory refresh error: %s", exc)
+            _refresh_stop.wait(interval)
+
+    _refresh_stop.clear()
+    _refresh_thread = threading.Thread(target=_loop, name="servus-rippling-directory", daemon=True)
+    _refresh_thread.start()
+    logger.info("📇 Rippling worker directory refresh every %ss", int(interval))
+    return True
+
+
+def stop_directory_refresh() -> None:
+    global _refresh_thread
+    _refresh_stop.set()
+    if _refresh_thread is not None:
+        _refresh_thread.join(timeout=5)
+        _refresh_thread = None
+
+
+class RosterSnapshot:
+    """
+    Local copy of the Rippling worker list kept current with `updated_at`
+    deltas, so steady-state trigger scans cost one small request yet still
+    see every worker's start and end date.
+
+    Workers are persisted to `path`; the watermark is also written to the
+    scheduler state under `state_key`. If the two disagree (snapshot file
+    lost, state reset) the next sync falls back to a full roster walk.
+    """
+
+    def __init__(self, path, state=None, state_key="rippling_roster_watermark"):
+        self.path = path
+        self.state = state
+        self.state_key = state_key
+        self.watermark: Optional[str] = None
+        self._workers: Dict[str, dict] = {}
+        self._indexed = False
+        self.ingestor = ProfileIngestor()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.warning("⚠️ Ignoring unreadable Rippling roster snapshot %s: %s", self.path, exc)
+            return
+        watermark = payload.get("watermark")
+        expected = self.state.get(self.state_key) if self.state is not None else watermark
+        if not watermark or watermark != expected:
+            logger.info("📇 Rippling roster snapshot watermark mismatch; next sync is a full roster walk.")
+            return
+        self.watermark = watermark
+        self._workers = {str(worker["id"]): worker for worker in payload.get("workers", []) if worker.get("id")}
+
+    def __len__(self):
+        return len(self._workers)
+
+    def workers(self) -> list:
+        with self._lock:
+            return list(self._workers.values())
+
+    def lifecycle_dates(self) -> set:
+        """Distinct start and end dates (YYYY-MM-DD) across the snapshot."""
+        with self._lock:
+            return {
+                str(worker.get(field))[:10]
+                for worker in self._workers.values()
+                for field in ("start_date", "end_date")
+                if worker.get(field)
+            }
+
+    def sync(self, client) -> Optional[list]:
+        """Merge changes since the watermark; returns all workers, or None when Rippling could not be read."""
+        with self._lock:
+            delta = client.list_workers(updated_since=self.watermark)
+            if delta is None:
+                return None
+            full = self.watermark is None
+            if full:
+                self._workers = {}
+            changed = []
+            for worker in delta:
+                worker_id = str(worker.get("id") or "")
+                if not worker_id:
+                    continue
+                if self._workers.get(worker_id) != worker:
+                    self._workers[worker_id] = worker
+                    changed.append(worker)
+                updated_at = worker.get("updated_at")
+                if updated_at and (self.watermark is None or str(updated_at) > self.watermark):
+                    self.watermark = str(updated_at)
+
+            if changed or full:
+                self._save()
+            if not self._indexed:
+                client._index_workers(self._workers.values(), complete=True)
+                self._indexed = True
+            elif changed:
+                client._index_workers(changed)
+            self._preload_profiles(client)
+            logger.info(
+                "📇 Rippling roster %s: %d changed, %d total (watermark %s)",
+                "full sync" if full else "delta sync",
+                len(changed),
+                len(self._workers),
+                self.watermark,
+            )
+            return list(self._workers.values())
+
+    def _preload_profiles(self, client):
+        """
+        Bulk-build profiles for every complete worker and push new or changed
+        ones into the worker directory; unchanged rows are hash hits.
+        """
+        directory = worker_directory(client.base_url)
+        if directory is None:
+            return
+        complete = [worker for worker in self._workers.values() if _is_complete_worker(worker)]
+        result = self.ingestor.ingest([client._profile_fields(worker) for worker in complete])
+        for index in result.fresh:
+            worker = complete[index]
+            directory.store_profile(worker.get("work_email"), worker.get("id"), result.profiles[index])
+        logger.info(
+            "📇 Rippling profiles: %d rows (%d validated, %d reused, %d rejected) at %.0f rows/s",
+            result.rows,
+            result.validated,
+            result.reused,
+            result.rejected,
+            result.rows_per_second,
+        )
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        payload = {"watermark": self.watermark, "workers": list(self._workers.values())}
+        fd, tmp_path = tempfile.mkstemp(prefix=".rippling_roster_", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self.state is not None:
+            self.state.set(self.state_key, self.watermark)
+
+
+_rosters: Dict[tuple, RosterSnapshot] = {}
+
+
+def roster_snapshot(state) -> Optional[RosterSnapshot]:
+    """
+    Roster snapshot tied to a scheduler RunState, or None when delta sync is
+    disabled. The snapshot file defaults to `rippling_roster.json` next to the
+    state file (RIPPLING_ROSTER_SNAPSHOT_FILE overrides).
+    """
+    if state is None or not CONFIG.get("RIPPLING_DELTA_SYNC_ENABLED", True):
+        return None
+    path = str(CONFIG.get("RIPPLING_ROSTER_SNAPSHOT_FILE") or "").strip()
+    if not path:
+        state_dir = os.path.dirname(os.path.abspath(getattr(state, "state_file", "servus_state.json")))
+        path = os.path.join(state_dir, "rippling_roster.json")
+    base_url = str(CONFIG.get("RIPPLING_BASE_URL") or "https://rest.ripplingapis.com").rstrip("/")
+    key = (base_url, os.path.abspath(path))
+    with _directories_lock:
+        snapshot = _rosters.get(key)
+        if snapshot is None or snapshot.state is not state:
+            snapshot = RosterSnapshot(path, state=state)
+            _rosters[key] = snapshot
+        return snapshot
+
 class RipplingClient:
-    def __init__(self):
+    def __init__(self, roster: Optional[RosterSnapshot] = None, share_scan: bool = False):
+        """
+        `share_scan` makes the worker list fetched by the first trigger scan
+        serve every later scan on this client (one dual-validation pass shares
+        one client across its onboarding and offboarding phases).
+        """
+        self.roster = roster
+        self.share_scan = share_scan
+        self._shared_scan = None
+        self._shared_scan_lock = threading.Lock()
         self.token = CONFIG.get("RIPPLING_API_TOKEN")
-        self.base_url = "https://rest.ripplingapis.com"
+        self.base_url = str(CONFIG.get("RIPPLING_BASE_URL") or "https://rest.ripplingapis.com").rstrip("/")
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/json"
@@ -20,10 +441,12 @@ class RipplingClient:
         """
         Fetches workers with a specific start_date.
         If start_date is None, defaults to TODAY.
+        Returns None when Rippling could not be read, so callers can tell a
+        failed scan from a day with no new hires.
         """
         if not self.token:
             logger.error("❌ Rippling Token missing.")
-            return []
+            return None
 
         if not start_date:
             start_date = datetime.now().strftime("%Y-%m-%d")
@@ -38,40 +461,35 @@ class RipplingClient:
         # or use the filter param if we trust it.
         
         # NOTE: In audit_new_hires.py we saw that we had to scan.
-        # Let's implement a scan of the last 100 workers to be safe.
-        
-        url = f"{self.base_url}/workers?limit=100" 
+        # With a roster snapshot attached we scan the whole (delta-synced) roster;
+        # otherwise fall back to a scan of the last 100 workers.
         new_hires = []
         
         try:
-            resp = requests.get(url, headers=self.headers, timeout=10)
-            if resp.status_code != 200:
-                logger.error(f"❌ Rippling API Error: {resp.status_code}")
-                return []
-                
-            data = resp.json()
-            results = data.get("results", [])
+            results = self._scan_workers()
+            if results is None:
+                return None
             
-            for w in results:
-                if w.get("start_date") == start_date:
-                    # Found one! Fetch full details.
-                    profile = self._build_profile(w.get("id"))
-                    if profile:
-                        if not profile.start_date:
-                            profile.start_date = w.get("start_date")
-                        new_hires.append(profile)
+            matches = [w for w in results if w.get("start_date") == start_date]
+            # Found some! Fetch full details.
+            for w, profile in zip(matches, self._build_profiles(matches)):
+                if profile:
+                    if not profile.start_date:
+                        profile.start_date = w.get("start_date")
+                    new_hires.append(profile)
                         
             return new_hires
             
         except Exception as e:
             logger.error(f"❌ Rippling Connection Error: {e}")
-            return []
+            return None
 
     def get_departures(self, end_date=None):
         """
         Fetches workers with a specific end_date (termination).
+        Returns None when Rippling could not be read.
         """
-        if not self.token: return []
+        if not self.token: return None
         
         if not end_date:
             end_date = datetime.now().strftime("%Y-%m-%d")
@@ -79,27 +497,24 @@ class RipplingClient:
         logger.info(f"🔍 Rippling: Scanning for departures on {end_date}...")
         
         # Similar scan logic
-        url = f"{self.base_url}/workers?limit=100" 
         departures = []
         
         try:
-            resp = requests.get(url, headers=self.headers, timeout=10)
-            if resp.status_code != 200: return []
-            
-            results = resp.json().get("results", [])
-            for w in results:
-                # Check for end_date
-                if w.get("end_date") == end_date:
-                    profile = self._build_profile(w.get("id"))
-                    if profile:
-                        if not profile.end_date:
-                            profile.end_date = w.get("end_date")
-                        departures.append(profile)
+            results = self._scan_workers()
+            if results is None:
+                return None
+            # Check for end_date
+            matches = [w for w in results if w.get("end_date") == end_date]
+            for w, profile in zip(matches, self._build_profiles(matches)):
+                if profile:
+                    if not profile.end_date:
+                        profile.end_date = w.get("end_date")
+                    departures.append(profile)
                         
             return departures
         except Exception as e:
             logger.error(f"❌ Rippling Error: {e}")
-            return []
+            return None
 
     def find_user_by_email(self, email):
         """
@@ -108,17 +523,92 @@ class RipplingClient:
         if not self.token: return None
 
         target_email = (email or "").strip().lower()
+        directory = worker_directory(self.base_url)
+        entry = directory.lookup(target_email) if directory is not None else None
+        if entry is not None:
+            if entry.get("profile") is not None:
+                logger.debug("Rippling directory hit for %s", target_email)
+                return entry["profile"]
+            profile = self._build_profile(entry["worker_id"])
+            if profile:
+                directory.store_profile(target_email, entry["worker_id"], profile)
+                return profile
+
         logger.info(f"🔍 Rippling: Looking up {target_email}...")
+        worker_id, profile = self._find_user_via_api(target_email)
+        if profile is not None and directory is not None:
+            directory.store_profile(target_email, worker_id, profile)
+        return profile
+
+    def _scan_workers(self):
+        """Worker list payloads for trigger scans (roster snapshot when attached, else newest 100)."""
+        if not self.share_scan:
+            return self._fetch_scan_workers()
+        with self._shared_scan_lock:
+            if self._shared_scan is None:
+                self._shared_scan = self._fetch_scan_workers()
+            return self._shared_scan
+
+    def _fetch_scan_workers(self):
+        if self.roster is not None:
+            workers = self.roster.sync(self)
+            if workers is not None:
+                return workers
+            logger.warning("⚠️ Rippling roster sync failed; falling back to a recent-workers scan.")
+
+        resp = requests.get(f"{self.base_url}/workers?limit=100&{_list_query()}", headers=self.headers, timeout=10)
+        if resp.status_code != 200:
+            logger.error(f"❌ Rippling API Error: {resp.status_code}")
+            return None
+        results = resp.json().get("results", [])
+        self._index_workers(results)
+        return results
+
+    def list_workers(self, updated_since=None, page_size=100):
+        """
+        Walk `/workers` pages (following `next_link`), optionally only workers
+        with `updated_at` at or after `updated_since`. Returns None on an API error.
+        """
+        url = f"{self.base_url}/workers?limit={int(page_size)}&{_list_query()}"
+        if updated_since:
+            # `ge` rather than `gt`: timestamps are second-granular, so re-read the boundary.
+            query = urllib.parse.quote(f"updated_at ge '{updated_since}'")
+            url = f"{url}&filter={query}"
+        workers = []
+        while url:
+            resp = requests.get(url, headers=self.headers, timeout=10)
+            if resp.status_code != 200:
+                logger.warning(
+                    "⚠️ Rippling worker listing failed: status=%s detail=%s",
+                    resp.status_code,
+                    _response_detail(resp),
+                )
+                return None
+            payload = resp.json()
+            workers.extend(payload.get("results", []))
+            url = payload.get("next_link")
+        return workers
+
+    def _index_workers(self, workers, complete=False):
+        directory = worker_directory(self.base_url)
+        if directory is not None:
+            directory.ingest(workers, complete=complete)
 
+    def _find_user_via_api(self, target_email):
+        """
+        Three-strategy lookup used when the worker directory has no entry.
+        Returns (worker_id, profile); list payloads seen on the way are indexed.
+        """
         try:
             # Strategy 1: direct API filter by work_email.
             query = urllib.parse.quote(f"work_email eq '{target_email}'")
-            url = f"{self.base_url}/workers?filter={query}"
+            url = f"{self.base_url}/workers?filter={query}&{_list_query()}"
             resp = requests.get(url, headers=self.headers, timeout=10)
             if resp.status_code == 200:
                 results = resp.json().get("results", [])
+                self._index_workers(results)
                 if results:
-                    return self._build_profile(results[0].get("id"))
+                    return results[0].get("id"), self._hydrate_worker(results[0])
             else:
                 logger.warning(
                     "⚠️ Rippling worker lookup (work_email filter) failed: status=%s detail=%s",
@@ -128,12 +618,13 @@ class RipplingClient:
 
             # Strategy 2: alternate filter key fallback.
             query_alt = urllib.parse.quote(f"email eq '{target_email}'")
-            url_alt = f"{self.base_url}/workers?filter={query_alt}"
+            url_alt = f"{self.base_url}/workers?filter={query_alt}&{_list_query()}"
             resp_alt = requests.get(url_alt, headers=self.headers, timeout=10)
             if resp_alt.status_code == 200:
                 results_alt = resp_alt.json().get("results", [])
+                self._index_workers(results_alt)
                 if results_alt:
-                    return self._build_profile(results_alt[0].get("id"))
+                    return results_alt[0].get("id"), self._hydrate_worker(results_alt[0])
             else:
                 logger.warning(
                     "⚠️ Rippling worker lookup (email filter) failed: status=%s detail=%s",
@@ -142,18 +633,20 @@ class RipplingClient:
                 )
 
             # Strategy 3: scan fallback for case/schema drift.
-            scan_url = f"{self.base_url}/workers?limit=200"
+            scan_url = f"{self.base_url}/workers?limit=200&{_list_query()}"
             scan_resp = requests.get(scan_url, headers=self.headers, timeout=10)
             if scan_resp.status_code == 200:
-                for worker in scan_resp.json().get("results", []):
+                scanned = scan_resp.json().get("results", [])
+                self._index_workers(scanned)
+                for worker in scanned:
                     worker_email = str(worker.get("work_email") or worker.get("email") or "").strip().lower()
                     if worker_email != target_email:
                         continue
-                    profile = self._build_profile(worker.get("id"))
+                    profile = self._hydrate_worker(worker)
                     if profile and not profile.start_date:
                         # Preserve key fields seen in list payload if detail call is sparse.
                         profile.start_date = worker.get("start_date")
-                    return profile
+                    return worker.get("id"), profile
             else:
                 logger.warning(
                     "⚠️ Rippling worker scan fallback failed: status=%s detail=%s",
@@ -163,85 +656,151 @@ class RipplingClient:
         except Exception as e:
             logger.error(f"❌ Rippling Lookup Error: {e}")
             
-        return None
+        return None, None
+
+    def _build_profiles(self, workers):
+        """
+        Build profiles for worker list payloads. Complete payloads are mapped
+        in place; sparse ones are hydrated with detail calls over a bounded
+        pool (RIPPLING_HYDRATION_CONCURRENCY). Results keep the input order; a
+        worker that fails yields None without affecting the others.
+        """
+        workers = list(workers or [])
+        if not workers:
+            return []
+        complete = [index for index, w in enumerate(workers) if _is_complete_worker(w)]
+        profiles = [None] * len(workers)
+        ingested = ProfileIngestor().ingest([self._profile_fields(workers[index]) for index in complete])
+        for index, profile in zip(complete, ingested.profiles):
+            profiles[index] = profile
+        sparse = [index for index, profile in enumerate(profiles) if profile is None]
+        limit = max(1, min(int(CONFIG.get("RIPPLING_HYDRATION_CONCURRENCY", 8) or 1), len(sparse) or 1))
+        if limit == 1:
+            for index in sparse:
+                profiles[index] = self._hydrate_worker(workers[index])
+        elif sparse:
+            with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="servus-rippling") as pool:
+                # One context copy per task so spans opened inside nest under the caller's span.
+                futures = {
+                    index: pool.submit(contextvars.copy_context().run, self._hydrate_worker, workers[index])
+                    for index in sparse
+                }
+                for index, future in futures.items():
+                    profiles[index] = future.result()
+
+        directory = worker_directory(self.base_url)
+        if directory is not None:
+            for worker, profile in zip(workers, profiles):
+                email = worker.get("work_email") or getattr(profile, "work_email", None)
+                directory.store_profile(email, worker.get("id"), profile)
+        return profiles
+
+    def _hydrate_worker(self, worker):
+        try:
+            return self._profile_from_list_payload(worker) or self._build_profile(worker.get("id"))
+        except Exception as exc:
+            logger.error("❌ Error hydrating Rippling worker %s: %s", worker.get("id"), exc)
+            return None
+
+    def _profile_from_list_payload(self, worker):
+        """
+        Map an expanded list payload to UserProfile without further requests.
+        Returns None for sparse records (relations not expanded, no name
+        source), which then go through the `_build_profile` detail call.
+        """
+        if not _is_complete_worker(worker):
+            return None
+        try:
+            return self._profile_from_payload(worker)
+        except Exception as exc:
+            logger.debug("Rippling list payload for %s not usable directly: %s", worker.get("id"), exc)
+            return None
 
     def _build_profile(self, worker_id):
         """
         Fetches full worker details and maps to UserProfile.
         """
-        url = f"{self.base_url}/workers/{worker_id}?expand=department,employment_type"
+        url = f"{self.base_url}/workers/{worker_id}?expand={','.join(WORKER_EXPAND)}"
         try:
             resp = requests.get(url, headers=self.headers, timeout=10)
             if resp.status_code != 200:
                 return None
 
-            data = resp.json()
+            return self._profile_from_payload(resp.json())
+        except Exception as e:
+            logger.error(f"❌ Error building profile for {worker_id}: {e}")
+            return None
+
+    def _profile_from_payload(self, data):
+        """Map a worker payload to UserProfile; fetches `/users/{id}` only if names are missing."""
+        return UserProfile(**self._profile_fields(data))
 
-            # Safe Parsing
-            dept = (data.get("department") or {}).get("name", "Unknown")
-            emp_type_obj = data.get("employment_type")
-            e_type = emp_type_obj.get("label") if isinstance(emp_type_obj, dict) else "Full-Time"
+    def _profile_fields(self, data):
+        """UserProfile field values from a worker payload, before validation."""
+        # Safe Parsing
+        dept = (data.get("department") or {}).get("name", "Unknown")
+        emp_type_obj = data.get("employment_type")
+        e_type = emp_type_obj.get("label") if isinstance(emp_type_obj, dict) else "Full-Time"
 
-            first_name = data.get("first_name")
-            last_name = data.get("last_name")
-            preferred_first_name = data.get("preferred_first_name")
-            user_id = data.get("user_id")
-            if isinstance(user_id, str) and user_id.strip() and (not first_name or not last_name):
+        first_name = data.get("first_name")
+        last_name = data.get("last_name")
+        preferred_first_name = data.get("preferred_first_name")
+        user_id = data.get("user_id")
+        if not first_name or not last_name:
+            user_name = _user_name_fields(data.get("user"))
+            if not user_name and isinstance(user_id, str) and user_id.strip():
                 user_name = self._fetch_user_name_fields(user_id)
-                first_name = first_name or user_name.get("first_name")
-                last_name = last_name or user_name.get("last_name")
-                preferred_first_name = preferred_first_name or user_name.get("preferred_first_name")
-
-            title_value = data.get("title")
-            if isinstance(title_value, dict):
-                title = title_value.get("name", "Unknown")
-            elif isinstance(title_value, str):
-                title = title_value
-            else:
-                title = "Unknown"
-
-            manager_email = None
-            manager_value = data.get("manager") or data.get("manager_email")
-            if isinstance(manager_value, dict):
-                manager_email = (
-                    manager_value.get("work_email")
-                    or manager_value.get("email")
-                    or manager_value.get("manager_email")
-                )
-            elif isinstance(manager_value, str):
-                manager_email = manager_value
-
-            personal_email = data.get("personal_email")
-            location = data.get("country")
-            if isinstance(location, dict):
-                location = location.get("code") or location.get("name")
-            if not isinstance(location, str) or not location.strip():
-                raw_location = data.get("location")
-                location = raw_location if isinstance(raw_location, str) else "US"
-            location = location.strip() if isinstance(location, str) else "US"
-            if not location:
-                location = "US"
-
-            return UserProfile(
-                first_name=first_name,
-                last_name=last_name,
-                work_email=data.get("work_email"),
-                personal_email=personal_email,
-                department=dept,
-                title=title,
-                manager_email=manager_email,
-                employment_type=e_type,
-                start_date=data.get("start_date"),
-                end_date=data.get("end_date"),
-                location=location,
-                preferred_first_name=preferred_first_name,
-                # Rippling doesn't always expose photo URL in API v1 easily,
-                # but we can try to map it if we find the field.
-                profile_picture_url=data.get("photo"),
+            first_name = first_name or user_name.get("first_name")
+            last_name = last_name or user_name.get("last_name")
+            preferred_first_name = preferred_first_name or user_name.get("preferred_first_name")
+
+        title_value = data.get("title")
+        if isinstance(title_value, dict):
+            title = title_value.get("name", "Unknown")
+        elif isinstance(title_value, str):
+            title = title_value
+        else:
+            title = "Unknown"
+
+        manager_email = None
+        manager_value = data.get("manager") or data.get("manager_email")
+        if isinstance(manager_value, dict):
+            manager_email = (
+                manager_value.get("work_email")
+                or manager_value.get("email")
+                or manager_value.get("manager_email")
             )
-        except Exception as e:
-            logger.error(f"❌ Error building profile for {worker_id}: {e}")
-            return None
+        elif isinstance(manager_value, str):
+            manager_email = manager_value
+
+        personal_email = data.get("personal_email")
+        location = data.get("country")
+        if isinstance(location, dict):
+            location = location.get("code") or location.get("name")
+        if not isinstance(location, str) or not location.strip():
+            raw_location = data.get("location")
+            location = raw_location if isinstance(raw_location, str) else "US"
+        location = location.strip() if isinstance(location, str) else "US"
+        if not location:
+            location = "US"
+
+        return dict(
+            first_name=first_name,
+            last_name=last_name,
+            work_email=data.get("work_email"),
+            personal_email=personal_email,
+            department=dept,
+            title=title,
+            manager_email=manager_email,
+            employment_type=e_type,
+            start_date=data.get("start_date"),
+            end_date=data.get("end_date"),
+            location=location,
+            preferred_first_name=preferred_first_name,
+            # Rippling doesn't always expose photo URL in API v1 easily,
+            # but we can try to map it if we find the field.
+            profile_picture_url=data.get("photo"),
+        )
 
     def _fetch_user_name_fields(self, user_id):
         url = f"{self.base_url}/users/{user_id}"
@@ -256,27 +815,69 @@ class RipplingClient:
                 )
                 return {}
 
-            data = resp.json()
-            name = data.get("name") if isinstance(data, dict) else {}
-            if not isinstance(name, dict):
-                return {}
-
-            first_name = name.get("given_name")
-            last_name = name.get("family_name")
-            preferred = name.get("preferred_given_name")
-            result = {}
-            if isinstance(first_name, str) and first_name.strip():
-                result["first_name"] = first_name.strip()
-            if isinstance(last_name, str) and last_name.strip():
-                result["last_name"] = last_name.strip()
-            if isinstance(preferred, str) and preferred.strip():
-                result["preferred_first_name"] = preferred.strip()
-            return result
+            return _user_name_fields(resp.json())
         except Exception as exc:
             logger.warning("⚠️ Rippling user lookup exception for user_id=%s: %s", user_id, exc)
             return {}
 
 
+def _is_complete_worker(worker) -> bool:
+    """True when an expanded list payload carries everything UserProfile needs."""
+    if not isinstance(worker, dict) or not worker.get("id"):
+        return False
+    if not isinstance(worker.get("department"), dict) or not isinstance(worker.get("employment_type"), dict):
+        return False
+    return bool((worker.get("first_name") and worker.get("last_name")) or _user_name_fields(worker.get("user")))
+
+
+def _name_tokens(text) -> List[str]:
+    """Lowercased alphanumeric name tokens with accents stripped ("José O'Neil" -> ["jose", "oneil"])."""
+    text = unicodedata.normalize("NFKD", str(text or "")).lower()
+    tokens = []
+    for part in re.split(r"[\s._\-]+", text):
+        token = "".join(ch for ch in part if ch.isalnum())
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+def _worker_name_keys(worker, email) -> Set[str]:
+    """Name index keys for a worker payload or profile dict: first/preferred + last, and the email local part."""
+    names = dict(_user_name_fields(worker.get("user")))
+    for field in ("first_name", "last_name", "preferred_first_name"):
+        if isinstance(worker.get(field), str) and worker[field].strip():
+            names[field] = worker[field]
+    keys = set()
+    last = "".join(_name_tokens(names.get("last_name")))
+    if last:
+        for first_field in ("first_name", "preferred_first_name"):
+            first = "".join(_name_tokens(names.get(first_field)))
+            if first:
+                keys.add(first + last)
+    local_part = str(email or "").split("@")[0].split("+")[0]
+    keys.add("".join(_name_tokens(local_part)))
+    return keys
+
+
+def _user_name_fields(user):
+    """First/last/preferred names from a Rippling user record (`name.given_name` etc.)."""
+    name = user.get("name") if isinstance(user, dict) else {}
+    if not isinstance(name, dict):
+        return {}
+
+    first_name = name.get("given_name")
+    last_name = name.get("family_name")
+    preferred = name.get("preferred_given_name")
+    result = {}
+    if isinstance(first_name, str) and first_name.strip():
+        result["first_name"] = first_name.strip()
+    if isinstance(last_name, str) and last_name.strip():
+        result["last_name"] = last_name.strip()
+    if isinstance(preferred, str) and preferred.strip():
+        result["preferred_first_name"] = preferred.strip()
+    return result
+
+
 def _response_detail(response):
     try:
         payload = response.json()
@@ -3,6 +3,7 @@ import requests
 import yaml
 import os
 import time
+from servus import hot_reload
 from servus.config import CONFIG
 
 logger = logging.getLogger("servus.slack")
@@ -15,9 +16,13 @@ def _get_headers():
         "Content-Type": "application/json"
     }
 
+def _api_url(method):
+    base = str(CONFIG.get("SLACK_API_BASE_URL") or "https://slack.com/api").rstrip("/")
+    return f"{base}/{method}"
+
 def _lookup_user_by_email(email):
     """Finds the Slack User ID (e.g., U123456) from an email address."""
-    url = "https://slack.com/api/users.lookupByEmail"
+    url = _api_url("users.lookupByEmail")
     try:
         r = requests.get(url, headers=_get_headers(), params={"email": email}, timeout=10)
         data = r.json()
@@ -46,11 +51,20 @@ def _normalize_list(raw_values):
 
 
 def _load_channel_policy():
-    if not os.path.exists(CHANNELS_FILE):
-        logger.warning("Missing data file: %s. Slack channel assignment skipped.", CHANNELS_FILE)
+    """Channel policy for the current reload generation (parsed once, not per step)."""
+    return hot_reload.load(
+        CHANNELS_FILE,
+        _read_channel_policy,
+        fallback=lambda: {"global": [], "departments": {}, "employment_type": {}},
+    )
+
+
+def _read_channel_policy(path):
+    if not os.path.exists(path):
+        logger.warning("Missing data file: %s. Slack channel assignment skipped.", path)
         return {"global": [], "departments": {}, "employment_type": {}}
 
-    with open(CHANNELS_FILE, "r", encoding="utf-8") as handle:
+    with open(path, "r", encoding="utf-8") as handle:
         config = yaml.safe_load(handle) or {}
 
     global_channels = _normalize_list(config.get("global"))
@@ -154,7 +168,7 @@ def add_to_channels(context):
     logger.info(f"Adding {user.work_email} to {len(target_channels)} Slack channels...")
 
     # 4. Invite User
-    url = "https://slack.com/api/conversations.invite"
+    url = _api_url("conversations.invite")
     added_count = 0
     already_in_channel_count = 0
     failed_channels = []
@@ -212,7 +226,7 @@ def deactivate_user(context):
         
         # Let's try a simple auth test to distinguish
         try:
-            auth_test = requests.post("https://slack.com/api/auth.test", headers=_get_headers())
+            auth_test = requests.post(_api_url("auth.test"), headers=_get_headers())
             if not auth_test.json().get("ok"):
                 logger.error(f"❌ Slack Auth Failed: {auth_test.json().get('error')}")
                 return False
@@ -224,7 +238,7 @@ def deactivate_user(context):
 
     # Check if user is already deleted
     try:
-        info_url = f"https://slack.com/api/users.info?user={user_id}"
+        info_url = f"{_api_url('users.info')}?user={user_id}"
         r = requests.get(info_url, headers=_get_headers())
         info = r.json()
         if info.get("ok") and info.get("user", {}).get("deleted"):
@@ -236,7 +250,8 @@ def deactivate_user(context):
     # 2. Deactivate via SCIM API (DELETE /Users/{id})
     # Note: This requires an Admin token with SCIM scopes or a Grid Admin token.
     # If SCIM is not enabled, we might need to use users.admin.setInactive (Legacy)
-    url = f"https://api.slack.com/scim/v1/Users/{user_id}"
+    scim_base = str(CONFIG.get("SLACK_SCIM_BASE_URL") or "https://api.slack.com/scim/v1").rstrip("/")
+    url = f"{scim_base}/Users/{user_id}"
     headers = _get_headers()
     
     try:
@@ -248,7 +263,7 @@ def deactivate_user(context):
             # Fallback to Legacy Admin API if SCIM fails (e.g. 404/403/501)
             logger.warning(f"⚠️ Slack SCIM Deactivation failed ({resp.status_code}). Trying Legacy API...")
             
-            legacy_url = "https://slack.com/api/users.admin.setInactive"
+            legacy_url = _api_url("users.admin.setInactive")
             legacy_resp = requests.post(legacy_url, headers=headers, data={"user": user_id})
             legacy_data = legacy_resp.json()
             
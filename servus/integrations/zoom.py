@@ -9,7 +9,8 @@ class ZoomClient:
         self.account_id = CONFIG.get("ZOOM_ACCOUNT_ID")
         self.client_id = CONFIG.get("ZOOM_CLIENT_ID")
         self.client_secret = CONFIG.get("ZOOM_CLIENT_SECRET")
-        self.base_url = "https://api.zoom.us/v2"
+        self.base_url = str(CONFIG.get("ZOOM_API_BASE_URL") or "https://api.zoom.us/v2").rstrip("/")
+        self.oauth_url = str(CONFIG.get("ZOOM_OAUTH_URL") or "https://zoom.us/oauth/token")
         self._token = None
 
     def _get_token(self):
@@ -19,7 +20,7 @@ class ZoomClient:
             logger.warning("⚠️ Zoom credentials missing. Skipping Zoom configuration.")
             return None
         
-        url = f"https://zoom.us/oauth/token?grant_type=account_credentials&account_id={self.account_id}"
+        url = f"{self.oauth_url}?grant_type=account_credentials&account_id={self.account_id}"
         try:
             resp = requests.post(url, auth=(self.client_id, self.client_secret))
             if resp.status_code == 200:
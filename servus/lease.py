@@ -0,0 +1,191 @@
+"""
+Active/standby scheduler lease.
+
+Two or more `scheduler.py` instances point SCHEDULER_LEASE_FILE at the same
+SQLite database on shared storage. The instance holding the lease row is
+active and scans and dispatches runs; the others stay on standby and retry
+every heartbeat. The holder renews the row every `ttl / 3` seconds. If it
+stops renewing (host restart, crash, network partition), the row expires
+after `ttl` seconds and a standby takes it over with a bumped `epoch`.
+
+Acquire and renew are a single `BEGIN IMMEDIATE` compare-and-set, so two
+instances can never both win. The holder also stops treating itself as
+active once `ttl` has passed since its last successful renewal, measured on
+its own monotonic clock from before the write. It therefore steps down no
+later than the row expires, even when it cannot reach the database.
+
+`held` only gates new work. Runs record the epoch they were dispatched under
+and `verify(epoch)` it before starting, and shared-state writes are fenced on
+`verify()`, so a holder that stalled and lost the row cannot start a
+duplicate run or overwrite the new holder's state.
+"""
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Optional
+
+from servus import metrics
+
+logger = logging.getLogger("servus.lease")
+
+LEASE_NAME = "scheduler"
+
+
+def default_instance_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SchedulerLease:
+    def __init__(self, path: str, instance_id: str, ttl_seconds: float = 15.0, name: str = LEASE_NAME):
+        self.path = path
+        self.instance_id = instance_id
+        self.ttl_seconds = max(1.0, float(ttl_seconds))
+        self.name = name
+        self.epoch: Optional[int] = None
+        self._valid_until = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lease ("
+                "name TEXT PRIMARY KEY, holder TEXT NOT NULL, epoch INTEGER NOT NULL, "
+                "acquired_at REAL NOT NULL, renewed_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=max(1.0, self.ttl_seconds / 3), isolation_level=None)
+
+    @property
+    def held(self) -> bool:
+        return time.monotonic() < self._valid_until
+
+    def try_acquire(self, now: Optional[float] = None) -> bool:
+        """Take or renew the lease. Returns True while this instance holds it."""
+        started = time.monotonic()
+        now = time.time() if now is None else now
+        was_held = self.held
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT holder, epoch, acquired_at, expires_at FROM lease WHERE name = ?", (self.name,)
+                    ).fetchone()
+                    if row is not None and row[0] != self.instance_id and row[3] > now:
+                        conn.execute("ROLLBACK")
+                        self._valid_until = 0.0
+                        self._publish(was_held, holder=row[0])
+                        return False
+                    if row is not None and row[0] == self.instance_id and row[3] > now:
+                        epoch, acquired_at = row[1], row[2]
+                    else:
+                        epoch, acquired_at = (row[1] if row is not None else 0) + 1, now
+                    conn.execute(
+                        "INSERT OR REPLACE INTO lease (name, holder, epoch, acquired_at, renewed_at, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (self.name, self.instance_id, epoch, acquired_at, now, now + self.ttl_seconds),
+                    )
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as exc:
+            logger.warning("⚠️ Lease %s heartbeat failed: %s", self.path, exc)
+            self._publish(was_held)
+            return self.held
+
+        self.epoch = epoch
+        self._valid_until = started + self.ttl_seconds
+        self._publish(was_held)
+        return True
+
+    def _publish(self, was_held: bool, holder: Optional[str] = None) -> None:
+        held = self.held
+        metrics.SCHEDULER_LEASE_HELD.set(1 if held else 0)
+        if held and not was_held:
+            logger.info("🎖️ Lease acquired by %s (epoch %s); this instance is active.", self.instance_id, self.epoch)
+        elif was_held and not held:
+            logger.warning(
+                "⚠️ Lease lost by %s%s; this instance is now standby.",
+                self.instance_id,
+                f" to {holder}" if holder else "",
+            )
+
+    def verify(self, epoch: Optional[int] = None) -> bool:
+        """
+        True while the lease row still names this instance at `epoch` (default:
+        the epoch it last acquired). Used to fence runs and shared-state writes
+        so an instance that stalled past its TTL cannot act on stale authority.
+        Falls back to `held` when the database cannot be read.
+        """
+        epoch = self.epoch if epoch is None else epoch
+        if not self.held or epoch is None:
+            return False
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT holder, epoch FROM lease WHERE name = ?", (self.name,)).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("⚠️ Lease %s check failed: %s", self.path, exc)
+            return self.held
+        return row is not None and row[0] == self.instance_id and row[1] == epoch
+
+    def release(self) -> None:
+        """Give the lease up so a standby can take over without waiting for expiry."""
+        self._valid_until = 0.0
+        metrics.SCHEDULER_LEASE_HELD.set(0)
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("DELETE FROM lease WHERE name = ? AND holder = ?", (self.name, self.instance_id))
+        except sqlite3.Error as exc:
+            logger.warning("⚠️ Could not release lease %s: %s", self.path, exc)
+
+    def holder(self) -> Optional[dict]:
+        """Current lease row (holder, epoch, renewed_at, expires_at), or None."""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT holder, epoch, renewed_at, expires_at FROM lease WHERE name = ?", (self.name,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return {"holder": row[0], "epoch": row[1], "renewed_at": row[2], "expires_at": row[3]}
+
+    def start(self) -> None:
+        """Try once now, then heartbeat every ttl / 3 seconds from a daemon thread."""
+        self.try_acquire()
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._heartbeat, name="servus-lease", daemon=True)
+        self._thread.start()
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.ttl_seconds / 3):
+            self.try_acquire()
+
+    def stop(self, release: bool = True) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.ttl_seconds)
+            self._thread = None
+        if release:
+            self.release()
+
+
+def configure_lease(config) -> Optional[SchedulerLease]:
+    """Lease at SCHEDULER_LEASE_FILE, or None (single instance, always active) when unset."""
+    path = str(config.get("SCHEDULER_LEASE_FILE") or "").strip()
+    if not path:
+        return None
+    instance_id = str(config.get("SCHEDULER_INSTANCE_ID") or "").strip() or default_instance_id()
+    lease = SchedulerLease(path, instance_id, ttl_seconds=float(config.get("SCHEDULER_LEASE_TTL_SECONDS") or 15))
+    lease.start()
+    return lease
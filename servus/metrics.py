@@ -0,0 +1,376 @@
+"""
+In-process metrics for the scheduler and orchestrator.
+
+Counters, gauges, and histograms are rendered in the Prometheus text
+exposition format and exported either as a node-exporter textfile
+(written atomically after each scan) or from an optional local HTTP
+`/metrics` endpoint. Outbound-call, step, and run metrics are derived from
+finished tracing spans, so every instrumented call site feeds both.
+"""
+import logging
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from servus import tracing
+
+logger = logging.getLogger("servus.metrics")
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+OUTBOUND_SPAN_KINDS = {"http", "subprocess", "winrm"}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels) -> Tuple[str, ...]:
+        unknown = set(labels) - set(self.labelnames)
+        if unknown:
+            raise ValueError(f"Unknown label(s) for {self.name}: {', '.join(sorted(unknown))}")
+        return tuple(str(labels.get(label, "")) for label in self.labelnames)
+
+    def _label_pairs(self, key):
+        return list(zip(self.labelnames, key))
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self, constant_labels=()) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(list(constant_labels) + self._label_pairs(key), value))
+        return lines
+
+    def _render_sample(self, pairs, value):
+        return [f"{self.name}{_format_labels(pairs)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return float(self._values.get(self._key(labels), 0.0))
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount=1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def remove(self, **labels):
+        with self._lock:
+            self._values.pop(self._key(labels), None)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return float(self._values.get(self._key(labels), 0.0))
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._values[key] = state
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["buckets"][index] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return int(state["count"]) if state else 0
+
+    def _render_sample(self, pairs, state):
+        lines = []
+        for bound, bucket_count in zip(self.buckets, state["buckets"]):
+            bucket_labels = _format_labels(pairs + [("le", _format_value(bound))])
+            lines.append(f"{self.name}_bucket{bucket_labels} {bucket_count}")
+        lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{_format_labels(pairs)} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        # Added to every sample, e.g. {"worker": "worker-0"} in worker processes.
+        self.constant_labels: Dict[str, str] = {}
+
+    def _register(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                return existing
+            metric = cls(name, help_text, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name, help_text, labelnames=()) -> Counter:
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()) -> Gauge:
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+            constant_labels = sorted(self.constant_labels.items())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render(constant_labels))
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+# Scheduler
+SCAN_DURATION = REGISTRY.histogram("servus_scan_duration_seconds", "Dual-validation scan wall time.")
+SCANS_TOTAL = REGISTRY.counter("servus_scans_total", "Dual-validation scans by outcome.", ["outcome"])
+SCAN_INTERVAL = REGISTRY.gauge("servus_scan_interval_seconds", "Current dual-validation scan interval.")
+INFLIGHT_RUNS = REGISTRY.gauge("servus_inflight_runs", "Workflow runs queued or executing in the background.")
+RUN_QUEUE_DEPTH = REGISTRY.gauge("servus_run_queue_depth", "Workflow runs waiting for a worker, by priority class.", ["priority"])
+RUN_QUEUE_WAIT = REGISTRY.histogram(
+    "servus_run_queue_wait_seconds", "Time a workflow run waited for a worker, by priority class.", ["priority"]
+)
+WORK_ITEMS_PUBLISHED = REGISTRY.counter(
+    "servus_work_items_published_total", "Runs published to the worker queue.", ["kind"]
+)
+WORK_ITEMS_REDELIVERED = REGISTRY.counter(
+    "servus_work_items_redelivered_total", "Work items claimed again after a worker missed its heartbeat.", ["kind"]
+)
+WORK_ITEMS_FINISHED = REGISTRY.counter(
+    "servus_work_items_finished_total", "Work items finished by workers, by outcome.", ["kind", "outcome"]
+)
+SCHEDULER_LEASE_HELD = REGISTRY.gauge("servus_scheduler_lease_held", "1 while this instance holds the active scheduler lease.")
+LIFECYCLE_TIMERS_PENDING = REGISTRY.gauge("servus_lifecycle_timers_pending", "Validated triggers waiting for their effective time.")
+TRIGGERS_FOUND = REGISTRY.counter(
+    "servus_triggers_found_total", "Rippling lifecycle candidates seen per scan.", ["kind"]
+)
+TRIGGERS_VALIDATED = REGISTRY.counter(
+    "servus_triggers_validated_total", "Candidates confirmed by both Rippling and Freshservice.", ["kind"]
+)
+TRIGGERS_MISMATCHED = REGISTRY.counter(
+    "servus_triggers_mismatched_total", "Rippling candidates with no matching Freshservice ticket.", ["kind"]
+)
+TRIGGER_MATCH_BACKLOG = REGISTRY.gauge(
+    "servus_trigger_match_backlog", "Match-table entries waiting on the other source.", ["kind", "side"]
+)
+TRIGGER_MATCH_OLDEST_WAIT = REGISTRY.gauge(
+    "servus_trigger_match_oldest_wait_seconds", "Age of the oldest one-sided match-table entry.", ["kind", "side"]
+)
+TRIGGER_MATCH_WAIT = REGISTRY.histogram(
+    "servus_trigger_match_wait_seconds",
+    "Time the first-seen side waited before its trigger matched.",
+    ["kind", "side"],
+    buckets=(60.0, 300.0, 900.0, 1800.0, 3600.0, 4 * 3600.0, 12 * 3600.0, 24 * 3600.0, 48 * 3600.0),
+)
+
+# Orchestrator
+RUNS_STARTED = REGISTRY.counter("servus_workflow_runs_started_total", "Workflow runs started.", ["workflow"])
+RUNS_FINISHED = REGISTRY.counter(
+    "servus_workflow_runs_total", "Workflow runs finished by outcome.", ["workflow", "outcome"]
+)
+RUN_DURATION = REGISTRY.histogram("servus_workflow_run_duration_seconds", "Workflow run wall time.", ["workflow"])
+STEP_DURATION = REGISTRY.histogram("servus_step_duration_seconds", "Workflow step latency.", ["action"])
+STEP_FAILURES = REGISTRY.counter("servus_step_failures_total", "Workflow steps that failed.", ["action"])
+
+# Integrations
+OUTBOUND_CALLS = REGISTRY.counter(
+    "servus_outbound_calls_total", "Outbound API/GAM/WinRM calls.", ["integration"]
+)
+OUTBOUND_ERRORS = REGISTRY.counter(
+    "servus_outbound_errors_total", "Outbound calls that errored or returned >= 400.", ["integration"]
+)
+OUTBOUND_DURATION = REGISTRY.histogram(
+    "servus_outbound_call_duration_seconds", "Outbound call latency.", ["integration"]
+)
+
+BULKHEAD_ACTIVE = REGISTRY.gauge("servus_bulkhead_active", "Workflow steps executing in an integration's pool.", ["integration"])
+BULKHEAD_QUEUED = REGISTRY.gauge(
+    "servus_bulkhead_queued", "Workflow steps waiting for a slot in an integration's pool.", ["integration"]
+)
+BULKHEAD_SATURATED = REGISTRY.counter(
+    "servus_bulkhead_saturated_total", "Steps that arrived while their integration's pool was full.", ["integration"]
+)
+BULKHEAD_WAIT = REGISTRY.histogram(
+    "servus_bulkhead_wait_seconds", "Time a step waited for a slot in its integration's pool.", ["integration"]
+)
+
+_textfile_path: Optional[str] = None
+_http_server: Optional[ThreadingHTTPServer] = None
+
+
+def observe_span(span) -> None:
+    """Tracing listener: fold finished spans into run/step/outbound metrics."""
+    seconds = float(span.duration_ms or 0.0) / 1000.0
+    failed = span.status == tracing.STATUS_ERROR
+    attributes = span.attributes or {}
+
+    if span.kind in OUTBOUND_SPAN_KINDS:
+        integration = attributes.get("integration") or "unknown"
+        OUTBOUND_CALLS.inc(integration=integration)
+        OUTBOUND_DURATION.observe(seconds, integration=integration)
+        if failed:
+            OUTBOUND_ERRORS.inc(integration=integration)
+    elif span.name == "workflow.step":
+        action = attributes.get("action") or "unknown"
+        STEP_DURATION.observe(seconds, action=action)
+        if failed:
+            STEP_FAILURES.inc(action=action)
+    elif span.name == "workflow.run":
+        workflow = attributes.get("workflow") or "unknown"
+        RUNS_FINISHED.inc(workflow=workflow, outcome="failed" if failed else "succeeded")
+        RUN_DURATION.observe(seconds, workflow=workflow)
+
+
+tracing.add_span_listener(observe_span)
+
+
+def configure_metrics(config) -> bool:
+    """
+    Enable metric export from METRICS_TEXTFILE and/or METRICS_HTTP_PORT.
+    Returns True when at least one exporter is active.
+    """
+    global _textfile_path
+    textfile = str(config.get("METRICS_TEXTFILE") or "").strip()
+    port = int(config.get("METRICS_HTTP_PORT") or 0)
+    if not textfile and port <= 0:
+        return False
+
+    tracing.instrument_http()
+
+    if textfile:
+        _textfile_path = textfile
+        logger.info("📈 Metrics textfile export -> %s", textfile)
+    if port > 0 and _http_server is None:
+        host = str(config.get("METRICS_HTTP_HOST") or "127.0.0.1")
+        start_http_server(port, host=host)
+    return True
+
+
+def write_textfile(path: Optional[str] = None) -> bool:
+    """Atomically write the registry for the node-exporter textfile collector."""
+    target = path or _textfile_path
+    if not target:
+        return False
+
+    directory = os.path.dirname(target) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".servus_metrics_", suffix=".prom", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(REGISTRY.render())
+            os.replace(temp_path, target)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+    except Exception as exc:
+        logger.warning("⚠️ Failed to write metrics textfile %s: %s", target, exc)
+        return False
+    return True
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics endpoint: " + format, *args)
+
+
+def start_http_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve `/metrics` from a daemon thread."""
+    global _http_server
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="servus-metrics-http", daemon=True)
+    thread.start()
+    _http_server = server
+    logger.info("📈 Metrics endpoint listening on http://%s:%s/metrics", host, server.server_port)
+    return server
+
+
+def stop_http_server() -> None:
+    global _http_server
+    if _http_server is not None:
+        _http_server.shutdown()
+        _http_server.server_close()
+        _http_server = None
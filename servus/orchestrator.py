@@ -4,6 +4,7 @@ from .workflow import Workflow
 from .state import StateManager
 from .actions import ACTIONS
 from .notifier import SlackNotifier
+from . import bulkheads, metrics, tracing
 
 class Orchestrator:
     def __init__(self, wf: Workflow, context: dict, state: StateManager, logger: logging.Logger):
@@ -14,19 +15,33 @@ class Orchestrator:
         self.notifier = SlackNotifier()
 
     def run(self, dry_run=False):
+        span_attributes = {
+            "workflow": self.wf.name,
+            "dry_run": dry_run,
+            "trigger_source": self.ctx.get("trigger_source"),
+            "request_id": self.ctx.get("request_id"),
+        }
+        metrics.RUNS_STARTED.inc(workflow=self.wf.name)
+        with tracing.span("workflow.run", attributes=span_attributes) as run_span:
+            result = self._run(dry_run)
+            if not result.get("success"):
+                run_span.set_status(tracing.STATUS_ERROR, f"{len(result.get('failures', []))} step failure(s)")
+            return result
+
+    def _run(self, dry_run):
         # 🛠️ FIX: Removed reference to self.wf.version
         self.log.info(f"Workflow: {self.wf.name} | dry_run={dry_run}")
         failures = []
         successful_steps = 0
         failed_steps = 0
         step_total = len(self.wf.steps)
-        
+
         # Inject dry_run into context so actions can see it
         self.ctx['dry_run'] = dry_run
         user_email = self.ctx.get("user_profile").work_email if self.ctx.get("user_profile") else "Unknown"
         trigger_source = self.ctx.get("trigger_source")
         request_id = self.ctx.get("request_id")
-        
+
         # Notify Start (Only if not dry run, to avoid spam during testing)
         if not dry_run and self.notifier.allow_start_notification():
             self.notifier.notify_start(
@@ -37,148 +52,16 @@ class Orchestrator:
             )
 
         for index, step in enumerate(self.wf.steps, start=1):
-            self.log.info(f"[{'DRY' if dry_run else 'RUN'}] {step.id}: {step.description} :: {step.action or 'manual'}")
-            if not dry_run and self.notifier.allow_step_notifications():
-                self.notifier.notify_step_start(
-                    self.wf.name,
-                    user_email,
-                    step.id,
-                    step.description,
-                    index,
-                    step_total,
-                    trigger_source=trigger_source,
-                    request_id=request_id,
-                )
-
-            # 1. Handle Manual Steps
-            if step.type == 'manual':
-                # In dry run, we just log and skip
-                if not dry_run:
-                    input(f"   [MANUAL] Press Enter after completing: {step.description} > ")
-                    self.notifier.notify_step_result(
-                        self.wf.name,
-                        user_email,
-                        step.id,
-                        index,
-                        step_total,
-                        "manual",
-                        detail="Manual step acknowledged by operator.",
-                        trigger_source=trigger_source,
-                        request_id=request_id,
-                    )
-                    successful_steps += 1
-                continue
-
-            # 2. Handle Automated Actions
-            if step.type == 'action':
-                if not step.action:
-                    self.log.error(f"Step {step.id} is type 'action' but has no action defined.")
-                    failure_detail = "Step is type 'action' but no action was defined."
-                    failures.append(
-                        {"step_id": step.id, "reason": "missing-action", "detail": failure_detail}
-                    )
-                    failed_steps += 1
-                    if not dry_run and self.notifier.allow_step_notifications():
-                        self.notifier.notify_step_result(
-                            self.wf.name,
-                            user_email,
-                            step.id,
-                            index,
-                            step_total,
-                            "failed",
-                            detail=failure_detail,
-                            trigger_source=trigger_source,
-                            request_id=request_id,
-                        )
-                    continue
-                
-                # Look up the function in our registry
-                func = ACTIONS.get(step.action)
-                if not func:
-                    self.log.error(f"Action '{step.action}' not found in registry (Check servus/actions.py imports).")
-                    failure_detail = f"Action '{step.action}' not found in registry."
-                    failures.append(
-                        {"step_id": step.id, "reason": "action-not-found", "detail": failure_detail}
-                    )
-                    failed_steps += 1
-                    if not dry_run and self.notifier.allow_step_notifications():
-                        self.notifier.notify_step_result(
-                            self.wf.name,
-                            user_email,
-                            step.id,
-                            index,
-                            step_total,
-                            "failed",
-                            detail=failure_detail,
-                            trigger_source=trigger_source,
-                            request_id=request_id,
-                        )
-                    continue
-
-                # Execute
-                try:
-                    # The action function handles dry_run internally if needed
-                    result = func(self.ctx)
-                    action_ok, action_detail = _normalize_action_result(result)
-
-                    if action_ok:
-                        self.log.info(f"   ✅ Success")
-                        successful_steps += 1
-                        if not dry_run and self.notifier.allow_step_notifications():
-                            self.notifier.notify_step_result(
-                                self.wf.name,
-                                user_email,
-                                step.id,
-                                index,
-                                step_total,
-                                "success",
-                                detail=action_detail,
-                                trigger_source=trigger_source,
-                                request_id=request_id,
-                            )
-                    else:
-                        self.log.info("   ⚠️  Action returned failure")
-                        failure_detail = action_detail or "Action returned a failure outcome."
-                        failures.append(
-                            {
-                                "step_id": step.id,
-                                "reason": "action-returned-false",
-                                "detail": failure_detail,
-                            }
-                        )
-                        if not dry_run:
-                            failed_steps += 1
-                            if self.notifier.allow_step_notifications():
-                                self.notifier.notify_step_result(
-                                    self.wf.name,
-                                    user_email,
-                                    step.id,
-                                    index,
-                                    step_total,
-                                    "failed",
-                                    detail=failure_detail,
-                                    trigger_source=trigger_source,
-                                    request_id=request_id,
-                                )
-                            # We continue for now, but in a strict mode we might break.
-
-                except Exception as e:
-                    failures.append({"step_id": step.id, "reason": str(e), "detail": str(e)})
-                    self.log.error(f"   ❌ Exception: {str(e)}")
-                    if not dry_run:
-                        failed_steps += 1
-                        if self.notifier.allow_step_notifications():
-                            self.notifier.notify_step_result(
-                                self.wf.name,
-                                user_email,
-                                step.id,
-                                index,
-                                step_total,
-                                "failed",
-                                detail=str(e),
-                                trigger_source=trigger_source,
-                                request_id=request_id,
-                            )
+            failures_before = len(failures)
+            step_attributes = {"step_id": step.id, "action": step.action or step.type}
+            with tracing.span("workflow.step", attributes=step_attributes) as step_span:
+                outcome = self._run_step(step, index, step_total, dry_run, user_email, failures)
+                if len(failures) > failures_before:
+                    step_span.set_status(tracing.STATUS_ERROR, failures[-1].get("detail"))
+            if outcome == "success":
+                successful_steps += 1
+            elif outcome == "failed":
+                failed_steps += 1
 
         success = len(failures) == 0
         self.log.info(f"Workflow Complete. success={success}")
@@ -202,6 +85,160 @@ class Orchestrator:
             "dry_run": dry_run,
         }
 
+    def _run_step(self, step, index, step_total, dry_run, user_email, failures):
+        """
+        Execute one workflow step, appending to `failures` as needed.
+        Returns "success", "failed", or None when the step is not counted.
+        """
+        trigger_source = self.ctx.get("trigger_source")
+        request_id = self.ctx.get("request_id")
+
+        self.log.info(f"[{'DRY' if dry_run else 'RUN'}] {step.id}: {step.description} :: {step.action or 'manual'}")
+        if not dry_run and self.notifier.allow_step_notifications():
+            self.notifier.notify_step_start(
+                self.wf.name,
+                user_email,
+                step.id,
+                step.description,
+                index,
+                step_total,
+                trigger_source=trigger_source,
+                request_id=request_id,
+            )
+
+        # 1. Handle Manual Steps
+        if step.type == 'manual':
+            # In dry run, we just log and skip
+            if not dry_run:
+                input(f"   [MANUAL] Press Enter after completing: {step.description} > ")
+                self.notifier.notify_step_result(
+                    self.wf.name,
+                    user_email,
+                    step.id,
+                    index,
+                    step_total,
+                    "manual",
+                    detail="Manual step acknowledged by operator.",
+                    trigger_source=trigger_source,
+                    request_id=request_id,
+                )
+                return "success"
+            return None
+
+        # 2. Handle Automated Actions
+        if step.type != 'action':
+            return None
+
+        if not step.action:
+            self.log.error(f"Step {step.id} is type 'action' but has no action defined.")
+            failure_detail = "Step is type 'action' but no action was defined."
+            failures.append(
+                {"step_id": step.id, "reason": "missing-action", "detail": failure_detail}
+            )
+            if not dry_run and self.notifier.allow_step_notifications():
+                self.notifier.notify_step_result(
+                    self.wf.name,
+                    user_email,
+                    step.id,
+                    index,
+                    step_total,
+                    "failed",
+                    detail=failure_detail,
+                    trigger_source=trigger_source,
+                    request_id=request_id,
+                )
+            return "failed"
+
+        # Look up the function in our registry
+        func = ACTIONS.get(step.action)
+        if not func:
+            self.log.error(f"Action '{step.action}' not found in registry (Check servus/actions.py imports).")
+            failure_detail = f"Action '{step.action}' not found in registry."
+            failures.append(
+                {"step_id": step.id, "reason": "action-not-found", "detail": failure_detail}
+            )
+            if not dry_run and self.notifier.allow_step_notifications():
+                self.notifier.notify_step_result(
+                    self.wf.name,
+                    user_email,
+                    step.id,
+                    index,
+                    step_total,
+                    "failed",
+                    detail=failure_detail,
+                    trigger_source=trigger_source,
+                    request_id=request_id,
+                )
+            return "failed"
+
+        # Execute
+        try:
+            # The action function handles dry_run internally if needed.
+            # It runs in its integration's bulkhead so one slow dependency cannot starve the others.
+            result = bulkheads.call(step.action, func, self.ctx)
+            action_ok, action_detail = _normalize_action_result(result)
+
+            if action_ok:
+                self.log.info(f"   ✅ Success")
+                if not dry_run and self.notifier.allow_step_notifications():
+                    self.notifier.notify_step_result(
+                        self.wf.name,
+                        user_email,
+                        step.id,
+                        index,
+                        step_total,
+                        "success",
+                        detail=action_detail,
+                        trigger_source=trigger_source,
+                        request_id=request_id,
+                    )
+                return "success"
+
+            self.log.info("   ⚠️  Action returned failure")
+            failure_detail = action_detail or "Action returned a failure outcome."
+            failures.append(
+                {
+                    "step_id": step.id,
+                    "reason": "action-returned-false",
+                    "detail": failure_detail,
+                }
+            )
+            if dry_run:
+                return None
+            if self.notifier.allow_step_notifications():
+                self.notifier.notify_step_result(
+                    self.wf.name,
+                    user_email,
+                    step.id,
+                    index,
+                    step_total,
+                    "failed",
+                    detail=failure_detail,
+                    trigger_source=trigger_source,
+                    request_id=request_id,
+                )
+            # We continue for now, but in a strict mode we might break.
+            return "failed"
+
+        except Exception as e:
+            failures.append({"step_id": step.id, "reason": str(e), "detail": str(e)})
+            self.log.error(f"   ❌ Exception: {str(e)}")
+            if dry_run:
+                return None
+            if self.notifier.allow_step_notifications():
+                self.notifier.notify_step_result(
+                    self.wf.name,
+                    user_email,
+                    step.id,
+                    index,
+                    step_total,
+                    "failed",
+                    detail=str(e),
+                    trigger_source=trigger_source,
+                    request_id=request_id,
+                )
+            return "failed"
+
 
 def _normalize_action_result(raw_result):
     """
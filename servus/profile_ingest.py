@@ -0,0 +1,121 @@
+"""
+Bulk UserProfile ingestion for large roster payloads.
+
+Rows are plain dicts of UserProfile fields. A page is validated in one
+`TypeAdapter(list[UserProfile])` call instead of one model construction per
+row, and rows whose content hash matches a row validated in the previous
+snapshot reuse that instance (copied) without re-validating. A bad row is
+rejected on its own; the rest of the page still ingests.
+"""
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from pydantic import TypeAdapter, ValidationError
+
+from servus.models import UserProfile
+
+logger = logging.getLogger("servus.profile_ingest")
+
+_PROFILE_LIST = TypeAdapter(List[UserProfile])
+
+
+def row_hash(row: dict) -> str:
+    return hashlib.sha1(json.dumps(row, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IngestResult:
+    profiles: List[Optional[UserProfile]] = field(default_factory=list)
+    # Row indices validated in this call (new or changed since the previous snapshot).
+    fresh: List[int] = field(default_factory=list)
+    validated: int = 0
+    reused: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return len(self.profiles)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+
+class ProfileIngestor:
+    """
+    Validates pages of profile rows, remembering the previous snapshot's
+    rows by content hash. Each `ingest` call replaces the remembered set,
+    so memory tracks current headcount rather than growing forever.
+    """
+
+    def __init__(self, page_size: int = 1000):
+        self.page_size = max(1, int(page_size))
+        self._previous: Dict[str, UserProfile] = {}
+
+    def ingest(self, rows) -> IngestResult:
+        started = time.perf_counter()
+        rows = list(rows or [])
+        result = IngestResult(profiles=[None] * len(rows))
+        current: Dict[str, UserProfile] = {}
+        pending = []
+
+        for index, row in enumerate(rows):
+            digest = row_hash(row)
+            known = self._previous.get(digest) or current.get(digest)
+            if known is not None:
+                result.profiles[index] = known.model_copy()
+                current[digest] = known
+                result.reused += 1
+            else:
+                pending.append((index, digest, row))
+
+        for offset in range(0, len(pending), self.page_size):
+            page = pending[offset:offset + self.page_size]
+            for (index, digest, _), profile in zip(page, self._validate_page([row for _, _, row in page])):
+                if profile is None:
+                    result.rejected += 1
+                    continue
+                result.profiles[index] = profile
+                current[digest] = profile.model_copy()
+                result.fresh.append(index)
+                result.validated += 1
+
+        self._previous = current
+        result.seconds = time.perf_counter() - started
+        logger.debug(
+            "Ingested %d profile rows (%d validated, %d reused, %d rejected) at %.0f rows/s",
+            result.rows,
+            result.validated,
+            result.reused,
+            result.rejected,
+            result.rows_per_second,
+        )
+        return result
+
+    def _validate_page(self, rows) -> List[Optional[UserProfile]]:
+        try:
+            return list(_PROFILE_LIST.validate_python(rows))
+        except ValidationError as exc:
+            reasons = {}
+            for error in exc.errors():
+                if error.get("loc") and isinstance(error["loc"][0], int):
+                    reasons.setdefault(error["loc"][0], f"{'.'.join(map(str, error['loc'][1:]))}: {error['msg']}")
+            if not reasons:
+                return [None] * len(rows)
+            for position, reason in sorted(reasons.items()):
+                logger.warning("⚠️ Rejected profile row %s: %s", rows[position].get("work_email"), reason)
+            bad = set(reasons)
+        good = [position for position in range(len(rows)) if position not in bad]
+        profiles: List[Optional[UserProfile]] = [None] * len(rows)
+        if good:
+            for position, profile in zip(good, self._validate_page([rows[position] for position in good])):
+                profiles[position] = profile
+        return profiles
+
+    def clear(self) -> None:
+        self._previous = {}
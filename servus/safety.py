@@ -4,6 +4,7 @@ from typing import Dict, List, Tuple
 
 import yaml
 
+from servus import hot_reload
 from servus.config import CONFIG
 
 logger = logging.getLogger("servus.safety")
@@ -37,19 +38,22 @@ def _csv_values(raw_value) -> List[str]:
     return _normalize_string_list(str(raw_value).split(","))
 
 
+def _empty_protected_targets() -> Dict[str, List[str]]:
+    return {"emails": [], "usernames": [], "domains": [], "departments": [], "titles_contains": []}
+
+
 def _load_protected_targets_file(path: str) -> Dict[str, List[str]]:
-    if not path:
-        return {"emails": [], "usernames": [], "domains": [], "departments": [], "titles_contains": []}
-
-    if not os.path.exists(path):
-        return {"emails": [], "usernames": [], "domains": [], "departments": [], "titles_contains": []}
-
-    try:
-        with open(path, "r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle) or {}
-    except Exception as exc:
-        logger.error("Failed to load protected targets policy file (%s): %s", path, exc)
-        return {"emails": [], "usernames": [], "domains": [], "departments": [], "titles_contains": []}
+    """File rules for the current reload generation, copied so callers can merge into them."""
+    rules = hot_reload.load(path, _read_protected_targets_file, fallback=_empty_protected_targets)
+    return {key: list(values) for key, values in rules.items()}
+
+
+def _read_protected_targets_file(path: str) -> Dict[str, List[str]]:
+    if not path or not os.path.exists(path):
+        return _empty_protected_targets()
+
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = yaml.safe_load(handle) or {}
 
     return {
         "emails": _normalize_string_list(payload.get("emails")),
@@ -1,35 +1,88 @@
 import json
 import os
 import logging
+import tempfile
+
+from servus.filelock import InterprocessLock
 
 class RunState:
     def __init__(self, state_file="servus_state.json"):
         self.state_file = state_file
         self.data = {}
+        # Scans and background runs share one state file.
+        self._lock = InterprocessLock()
+        # When shared with worker processes, every write re-reads the file under a file lock first.
+        self.shared = False
+        # Optional callable; writes are refused while it returns False (lease fencing).
+        self.fence = None
         self.load()
 
+    def share(self):
+        """Let other processes write this state file too (see `update`)."""
+        self._lock.bind(self.state_file + ".lock")
+        self.shared = True
+
     def load(self):
-        if os.path.exists(self.state_file):
+        with self._lock:
+            if os.path.exists(self.state_file):
+                try:
+                    with open(self.state_file, 'r') as f:
+                        self.data = json.load(f)
+                except Exception as e:
+                    logging.warning(f"Failed to load state file: {e}")
+                    self.data = {}
+
+    def save(self):
+        with self._lock:
+            # Write-then-rename so a concurrent reader never sees a half-written file.
+            directory = os.path.dirname(self.state_file) or "."
+            tmp_path = None
             try:
-                with open(self.state_file, 'r') as f:
-                    self.data = json.load(f)
+                fd, tmp_path = tempfile.mkstemp(prefix=".state_", dir=directory)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.data, f, indent=2)
+                os.replace(tmp_path, self.state_file)
             except Exception as e:
-                logging.warning(f"Failed to load state file: {e}")
-                self.data = {}
+                logging.error(f"Failed to save state: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
 
-    def save(self):
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
-        except Exception as e:
-            logging.error(f"Failed to save state: {e}")
+    def get(self, key, default=None, fresh=False):
+        """`fresh=True` re-reads a shared state file first, so writes from other processes are seen."""
+        with self._lock:
+            if fresh and self.shared:
+                self.load()
+            return self.data.get(key, default)
 
-    def get(self, key, default=None):
-        return self.data.get(key, default)
+    def _write_allowed(self, key):
+        if self.fence is None or self.fence():
+            return True
+        logging.error(f"Refusing to write '{key}' to {self.state_file}: this instance no longer holds the scheduler lease.")
+        return False
 
     def set(self, key, value):
-        self.data[key] = value
-        self.save()
+        with self._lock:
+            if not self._write_allowed(key):
+                return
+            if self.shared:
+                self.load()
+            self.data[key] = value
+            self.save()
+
+    def update(self, key, mutate, default=None, fenced=True):
+        """
+        Atomically replace `key` with `mutate(current)`; safe across processes once shared.
+        `fenced=False` bypasses the lease fence, for records of work that already happened.
+        """
+        with self._lock:
+            if fenced and not self._write_allowed(key):
+                return self.data.get(key, default)
+            if self.shared:
+                self.load()
+            value = mutate(self.data.get(key, default))
+            self.data[key] = value
+            self.save()
+            return value
 
 # 🛠️ THE FIX: Add an alias so both __main__.py and orchestrator.py are happy
 StateManager = RunState
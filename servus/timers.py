@@ -0,0 +1,206 @@
+"""
+Persistent lifecycle timers.
+
+Validated triggers are scheduled for their exact effective time instead of
+running at whatever scan tick first sees them. For example, an onboarding
+fires at ONBOARDING_EFFECTIVE_TIME on the start date, and an access
+revocation fires at OFFBOARDING_EFFECTIVE_TIME on the end date, both in the
+worker's location timezone. Timers live in a heap ordered by due time (UTC
+epoch seconds). They are keyed so re-scheduling the same trigger replaces
+its timer instead of duplicating it, and they are persisted so a restart
+keeps them.
+"""
+import heapq
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from servus.config import CONFIG
+
+logger = logging.getLogger("servus.timers")
+
+DEFAULT_TIMEZONE = "America/Denver"
+
+
+def parse_timezone_map(value) -> Dict[str, str]:
+    """'US=America/Denver,GB=Europe/London' -> {"US": "America/Denver", "GB": "Europe/London"}."""
+    mapping = {}
+    for item in str(value or "").split(","):
+        location, _, zone = item.partition("=")
+        if location.strip() and zone.strip():
+            mapping[location.strip().upper()] = zone.strip()
+    return mapping
+
+
+def location_timezone(location: Optional[str]) -> ZoneInfo:
+    mapping = parse_timezone_map(CONFIG.get("LIFECYCLE_TIMEZONES"))
+    name = mapping.get(str(location or "").strip().upper()) or CONFIG.get("LIFECYCLE_DEFAULT_TIMEZONE") or DEFAULT_TIMEZONE
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning("⚠️ Unknown timezone %r for location %r; using %s.", name, location, DEFAULT_TIMEZONE)
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def effective_at(day, at_time: str, location: Optional[str]) -> Optional[float]:
+    """UTC epoch seconds for `at_time` (HH:MM) local to `location` on `day` (YYYY-MM-DD), or None if unparseable."""
+    try:
+        parsed_day = day if isinstance(day, date) else date.fromisoformat(str(day)[:10])
+        hour, minute = (int(part) for part in str(at_time).split(":", 1))
+        local = datetime(parsed_day.year, parsed_day.month, parsed_day.day, hour, minute, tzinfo=location_timezone(location))
+    except (TypeError, ValueError):
+        return None
+    return local.astimezone(timezone.utc).timestamp()
+
+
+class TimerQueue:
+    """
+    Min-heap of `(due, seq, key)` with a `key -> timer` map; superseded heap
+    items are skipped lazily when popped. Each timer is
+    `{"key", "due", "kind", "payload"}` where the payload is plain JSON.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.timers: Dict[str, dict] = {}
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self._load()
+
+    def __len__(self):
+        with self._lock:
+            return len(self.timers)
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.warning("⚠️ Ignoring unreadable lifecycle timer file %s: %s", self.path, exc)
+            return
+        for timer in payload.get("timers") or []:
+            self._push(timer)
+
+    def reload(self) -> None:
+        """Replace in-memory timers with the file's, e.g. after another instance wrote it."""
+        with self._lock:
+            self.timers = {}
+            self._heap = []
+            self._load()
+
+    def _push(self, timer):
+        self.timers[timer["key"]] = timer
+        heapq.heappush(self._heap, (float(timer["due"]), next(self._seq), timer["key"]))
+
+    def schedule(self, key: str, due: float, kind: str, payload: dict) -> bool:
+        """Add or move the timer for `key`; returns True when it changed."""
+        with self._lock:
+            current = self.timers.get(key)
+            if current is not None and current["due"] == float(due) and current["payload"] == payload:
+                return False
+            self._push({"key": key, "due": float(due), "kind": kind, "payload": payload})
+            self._save()
+        logger.info(
+            "⏲️ %s timer %s due %s",
+            kind,
+            key,
+            datetime.fromtimestamp(float(due), tz=timezone.utc).isoformat(timespec="minutes"),
+        )
+        return True
+
+    def cancel(self, key: str) -> bool:
+        with self._lock:
+            if self.timers.pop(key, None) is None:
+                return False
+            self._save()
+            return True
+
+    def has(self, key: str) -> bool:
+        with self._lock:
+            return key in self.timers
+
+    def list(self) -> List[dict]:
+        """Copies of every pending timer, earliest first."""
+        with self._lock:
+            return [dict(timer) for timer in sorted(self.timers.values(), key=lambda timer: (timer["due"], timer["key"]))]
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            self._discard_superseded()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[dict]:
+        """Remove and return every timer due at or before `now`, earliest first."""
+        now = time.time() if now is None else now
+        due = []
+        with self._lock:
+            while True:
+                self._discard_superseded()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, _, key = heapq.heappop(self._heap)
+                due.append(self.timers.pop(key))
+            if due:
+                self._save()
+        return due
+
+    def _discard_superseded(self):
+        while self._heap:
+            due, _, key = self._heap[0]
+            timer = self.timers.get(key)
+            if timer is not None and timer["due"] == due:
+                return
+            heapq.heappop(self._heap)
+
+    def _save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        payload = {"timers": sorted(self.timers.values(), key=lambda timer: (timer["due"], timer["key"]))}
+        fd, tmp_path = tempfile.mkstemp(prefix=".lifecycle_timers_", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as exc:
+            logger.warning("⚠️ Could not persist lifecycle timers %s: %s", self.path, exc)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def timer_queue(state) -> Optional[TimerQueue]:
+    """
+    Timer queue tied to a scheduler RunState: `lifecycle_timers.json` next to
+    the state file (LIFECYCLE_TIMERS_FILE overrides). None when
+    LIFECYCLE_TIMERS_ENABLED is off, in which case triggers run at scan time.
+    """
+    if state is None or not CONFIG.get("LIFECYCLE_TIMERS_ENABLED", True):
+        return None
+    path = str(CONFIG.get("LIFECYCLE_TIMERS_FILE") or "").strip()
+    if not path:
+        state_dir = os.path.dirname(os.path.abspath(getattr(state, "state_file", "servus_state.json")))
+        path = os.path.join(state_dir, "lifecycle_timers.json")
+    key = os.path.abspath(path)
+    with _timer_queues_lock:
+        queue = _timer_queues.get(key)
+        if queue is None:
+            queue = TimerQueue(path)
+            _timer_queues[key] = queue
+        return queue
+
+
+_timer_queues: Dict[str, TimerQueue] = {}
+_timer_queues_lock = threading.Lock()
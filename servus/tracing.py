@@ -0,0 +1,292 @@
+"""
+Span tracing for SERVUS runs.
+
+Spans form a tree per trace: scheduler scan / workflow run -> step ->
+outbound call (HTTP, GAM subprocess, WinRM). Finished spans are appended as
+JSON lines to a size-rotated local file, so tracing works fully offline.
+`scripts/trace_critical_path.py` reads the file back.
+"""
+import contextvars
+import json
+import logging
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Iterable, List, Optional
+
+from servus import transport
+
+logger = logging.getLogger("servus.tracing")
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+_current_span = contextvars.ContextVar("servus_current_span", default=None)
+_exporter = None
+_listeners = []
+
+
+class Span:
+    def __init__(self, name, trace_id, parent_id=None, kind="internal", request_id=None, attributes=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.request_id = request_id
+        self.attributes = dict(attributes or {})
+        self.status = STATUS_OK
+        self.status_detail = None
+        self.start_time = time.time()
+        self.end_time = None
+        self._start_perf = time.perf_counter()
+        self.duration_ms = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+        if key == "request_id" and value:
+            self.request_id = value
+
+    def set_status(self, status, detail=None):
+        self.status = status
+        if detail:
+            self.status_detail = str(detail)[:500]
+
+    def finish(self):
+        if self.end_time is not None:
+            return
+        self.duration_ms = round((time.perf_counter() - self._start_perf) * 1000.0, 3)
+        self.end_time = self.start_time + (self.duration_ms / 1000.0)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "request_id": self.request_id,
+            "start": round(self.start_time, 6),
+            "end": round(self.end_time, 6) if self.end_time is not None else None,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "status_detail": self.status_detail,
+            "attributes": self.attributes,
+        }
+
+
+class JsonlSpanExporter:
+    """Append finished spans to a JSONL file, rotating by size."""
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backup_count=5):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str, separators=(",", ":"))
+        # handle() takes the handler lock, so concurrent runs never interleave lines.
+        self._handler.handle(logging.makeLogRecord({"msg": line, "levelno": logging.INFO}))
+
+    def close(self) -> None:
+        self._handler.close()
+
+
+def configure_tracing(config) -> bool:
+    """
+    Enable span export when TRACE_ENABLED is set.
+    Returns True when an exporter is active.
+    """
+    global _exporter
+    if not config.get("TRACE_ENABLED"):
+        return False
+    if _exporter is not None:
+        return True
+
+    path = str(config.get("TRACE_FILE") or "servus_state/traces.jsonl")
+    _exporter = JsonlSpanExporter(
+        path,
+        max_bytes=int(config.get("TRACE_MAX_BYTES") or 10 * 1024 * 1024),
+        backup_count=int(config.get("TRACE_BACKUP_COUNT") or 5),
+    )
+    instrument_http()
+    logger.info("🧭 Tracing enabled; spans -> %s", path)
+    return True
+
+
+def instrument_http() -> None:
+    """Emit a span for every outbound HTTP call (idempotent)."""
+    transport.add_middleware(_http_tracing_middleware)
+
+
+def add_span_listener(listener) -> None:
+    """Call `listener(span)` for every finished span, exported or not."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_span_listener(listener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def set_exporter(exporter) -> None:
+    """Swap the active exporter (None disables export)."""
+    global _exporter
+    previous = _exporter
+    _exporter = exporter
+    if previous is not None and previous is not exporter and hasattr(previous, "close"):
+        previous.close()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name, kind="internal", attributes=None, request_id=None):
+    """
+    Open a child of the current span (or a new trace root).
+    Exceptions mark the span as errored and propagate unchanged.
+    """
+    parent = _current_span.get()
+    attrs = dict(attributes or {})
+    effective_request_id = request_id or attrs.get("request_id") or (parent.request_id if parent else None)
+    current = Span(
+        name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        parent_id=parent.span_id if parent else None,
+        kind=kind,
+        request_id=effective_request_id,
+        attributes=attrs,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.set_status(STATUS_ERROR, f"{type(exc).__name__}: {exc}")
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+        _export(current)
+
+
+def _notify_listeners(finished: Span) -> None:
+    for listener in list(_listeners):
+        try:
+            listener(finished)
+        except Exception as exc:
+            logger.debug("Span listener failed: %s", exc)
+
+
+def _export(finished: Span) -> None:
+    _notify_listeners(finished)
+
+    exporter = _exporter
+    if exporter is None:
+        return
+    try:
+        exporter.export(finished)
+    except Exception as exc:
+        logger.debug("Span export failed: %s", exc)
+
+
+def _http_tracing_middleware(request, send):
+    integration = transport.integration_for_url(request.url)
+    attributes = {
+        "integration": integration,
+        "http.method": request.method,
+        "http.url": transport.redact_url(request.url),
+    }
+    # Only outbound calls made inside a scan or run are traced. The rest
+    # (directory refreshes, preflight) still reach span listeners, i.e. the
+    # outbound-call metrics, but are not exported as root traces.
+    if _current_span.get() is None:
+        detached = Span(f"http {integration}", trace_id=None, kind="http", attributes=attributes)
+        try:
+            return _send_recording_status(detached, request, send)
+        except BaseException as exc:
+            detached.set_status(STATUS_ERROR, f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            detached.finish()
+            _notify_listeners(detached)
+
+    with span(f"http {integration}", kind="http", attributes=attributes) as http_span:
+        return _send_recording_status(http_span, request, send)
+
+
+def _send_recording_status(http_span: Span, request, send):
+    response = send(request)
+    status_code = getattr(response, "status_code", None)
+    http_span.set_attribute("http.status_code", status_code)
+    if isinstance(status_code, int) and status_code >= 400:
+        http_span.set_status(STATUS_ERROR, f"HTTP {status_code}")
+    return response
+
+
+# -----------------
+# Trace file readers
+# -----------------
+
+def trace_file_paths(path: str, backup_count: int = 5) -> List[str]:
+    """Rotated files oldest-first, then the live file."""
+    candidates = [f"{path}.{index}" for index in range(backup_count, 0, -1)] + [path]
+    return [candidate for candidate in candidates if os.path.exists(candidate)]
+
+
+def load_spans(paths: Iterable[str]) -> List[Dict[str, object]]:
+    spans = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    spans.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return spans
+
+
+def critical_path(trace_spans: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """
+    Walk from the root, always following the child that finished last.
+    That chain is what bounded the trace's end-to-end latency.
+    """
+    if not trace_spans:
+        return []
+
+    span_ids = {item.get("span_id") for item in trace_spans}
+    children: Dict[object, List[Dict[str, object]]] = {}
+    roots = []
+    for item in trace_spans:
+        parent_id = item.get("parent_id")
+        if parent_id and parent_id in span_ids:
+            children.setdefault(parent_id, []).append(item)
+        else:
+            roots.append(item)
+
+    node = max(roots, key=lambda item: float(item.get("duration_ms") or 0.0))
+    path = [node]
+    while children.get(node.get("span_id")):
+        node = max(children[node["span_id"]], key=lambda item: float(item.get("end") or 0.0))
+        path.append(node)
+    return path
+
+
+def self_time_ms(node: Dict[str, object], trace_spans: List[Dict[str, object]]) -> float:
+    total = float(node.get("duration_ms") or 0.0)
+    child_total = sum(
+        float(item.get("duration_ms") or 0.0)
+        for item in trace_spans
+        if item.get("parent_id") == node.get("span_id")
+    )
+    return max(total - child_total, 0.0)
@@ -0,0 +1,153 @@
+"""
+Shared outbound HTTP layer.
+
+Integrations keep calling `requests` directly. `install()` wraps
+`HTTPAdapter.send` once so cross-cutting concerns (tracing, metrics,
+record/replay) can observe or serve every outbound call as middleware
+without touching each integration module.
+"""
+import logging
+import threading
+import urllib.parse
+from typing import Callable, List
+
+from requests.adapters import HTTPAdapter
+
+from servus.config import CONFIG
+
+logger = logging.getLogger("servus.transport")
+
+# Middleware signature: middleware(prepared_request, send) -> requests.Response
+Middleware = Callable[[object, Callable[[object], object]], object]
+
+_lock = threading.Lock()
+_middlewares: List[Middleware] = []
+_original_send = None
+
+# Well-known SaaS hosts -> integration label used in spans and metrics.
+_HOST_SUFFIXES = (
+    ("ripplingapis.com", "rippling"),
+    ("rippling.com", "rippling"),
+    ("freshservice.com", "freshservice"),
+    ("okta.com", "okta"),
+    ("oktapreview.com", "okta"),
+    ("hooks.slack.com", "slack_webhook"),
+    ("slack.com", "slack"),
+    ("zoom.us", "zoom"),
+    ("linear.app", "linear"),
+    ("ramp.com", "ramp"),
+    ("apple.com", "apple"),
+    ("amazonaws.com", "aws"),
+)
+
+# CONFIG keys whose values identify an integration host or base URL.
+_CONFIGURED_TARGETS = (
+    ("FRESHSERVICE_DOMAIN", "freshservice"),
+    ("OKTA_DOMAIN", "okta"),
+    ("SLACK_WEBHOOK_URL", "slack_webhook"),
+)
+
+# CONFIG keys holding API base URLs. These are matched by URL prefix first so
+# services sharing one host (e.g. the local fake-service suite) stay distinct.
+_CONFIGURED_BASE_URLS = (
+    ("RIPPLING_BASE_URL", "rippling"),
+    ("FRESHSERVICE_BASE_URL", "freshservice"),
+    ("OKTA_BASE_URL", "okta"),
+    ("SLACK_API_BASE_URL", "slack"),
+    ("SLACK_SCIM_BASE_URL", "slack"),
+    ("SLACK_WEBHOOK_URL", "slack_webhook"),
+    ("ZOOM_API_BASE_URL", "zoom"),
+    ("ZOOM_OAUTH_URL", "zoom"),
+    ("LINEAR_API_URL", "linear"),
+    ("SQS_ENDPOINT_URL", "aws"),
+)
+
+
+def install() -> None:
+    """Patch `HTTPAdapter.send` once; safe to call repeatedly."""
+    global _original_send
+    with _lock:
+        if _original_send is not None:
+            return
+        _original_send = HTTPAdapter.send
+
+        def _send(adapter, request, **kwargs):
+            return _dispatch(list(_middlewares), 0, adapter, request, kwargs)
+
+        HTTPAdapter.send = _send
+    logger.debug("Outbound HTTP middleware installed.")
+
+
+def uninstall() -> None:
+    """Restore the original adapter and drop all middleware (tests/tools)."""
+    global _original_send
+    with _lock:
+        if _original_send is not None:
+            HTTPAdapter.send = _original_send
+            _original_send = None
+        _middlewares.clear()
+
+
+def add_middleware(middleware: Middleware) -> None:
+    """Register middleware once; earlier registrations wrap later ones."""
+    with _lock:
+        if middleware not in _middlewares:
+            _middlewares.append(middleware)
+    install()
+
+
+def remove_middleware(middleware: Middleware) -> None:
+    with _lock:
+        if middleware in _middlewares:
+            _middlewares.remove(middleware)
+
+
+def _dispatch(chain, index, adapter, request, kwargs):
+    if index >= len(chain):
+        return _original_send(adapter, request, **kwargs)
+    middleware = chain[index]
+    return middleware(request, lambda req: _dispatch(chain, index + 1, adapter, req, kwargs))
+
+
+def integration_for_url(url: str) -> str:
+    """
+    Map an outbound URL to an integration label ("rippling", "okta", ...).
+    Falls back to the hostname so unknown destinations still group cleanly.
+    """
+    parsed = urllib.parse.urlsplit(str(url or ""))
+    host = (parsed.hostname or "").lower()
+
+    best_label, best_length = None, 0
+    for key, label in _CONFIGURED_BASE_URLS:
+        configured = str(CONFIG.get(key) or "").strip()
+        if "://" not in configured:
+            continue
+        base = urllib.parse.urlsplit(configured)
+        base_path = base.path.rstrip("/")
+        if (base.hostname or "").lower() != host or (base.port or "") != (parsed.port or ""):
+            continue
+        if parsed.path != base_path and not parsed.path.startswith(base_path + "/"):
+            continue
+        if len(base_path) + 1 > best_length:
+            best_label, best_length = label, len(base_path) + 1
+    if best_label:
+        return best_label
+
+    for key, label in _CONFIGURED_TARGETS:
+        configured = str(CONFIG.get(key) or "").strip().lower()
+        if not configured:
+            continue
+        configured_host = urllib.parse.urlsplit(configured).hostname or configured
+        if host and host == configured_host.lower():
+            return label
+
+    for suffix, label in _HOST_SUFFIXES:
+        if host == suffix or host.endswith("." + suffix):
+            return label
+    return host or "unknown"
+
+
+def redact_url(url: str) -> str:
+    """Drop query strings (tokens, filters with PII) from URLs kept in telemetry."""
+    parsed = urllib.parse.urlsplit(str(url or ""))
+    return urllib.parse.urlunsplit((parsed.scheme, parsed.netloc, parsed.path, "", ""))
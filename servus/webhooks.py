@@ -0,0 +1,285 @@
+"""
+Local webhook receiver for event-driven dual validation.
+
+Rippling and Freshservice POST lifecycle events to `/webhooks/rippling` and
+`/webhooks/freshservice`. Each delivery carries a Unix timestamp
+(`X-Servus-Timestamp`) and an HMAC-SHA256 signature over
+`"<timestamp>." + body` (`X-Servus-Signature: sha256=<hex>`) made with that
+source's shared secret. Deliveries outside WEBHOOK_TOLERANCE_SECONDS are
+refused, and signatures and `X-Servus-Delivery` ids seen within the window
+are acknowledged without being applied again, so a captured request cannot
+be replayed. Accepted events are normalized into the trigger match table,
+and `on_event` is called so the scheduler can validate right away instead of
+waiting for the next poll. Polling stays on as the reconciliation backstop.
+"""
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from servus.integrations import freshservice
+from servus.timers import location_timezone
+
+logger = logging.getLogger("servus.webhooks")
+
+SIGNATURE_HEADER = "X-Servus-Signature"
+TIMESTAMP_HEADER = "X-Servus-Timestamp"
+DELIVERY_HEADER = "X-Servus-Delivery"
+SOURCES = ("rippling", "freshservice")
+MAX_BODY_BYTES = 1024 * 1024
+DEFAULT_TOLERANCE_SECONDS = 300
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def sign(secret: str, body: bytes, timestamp) -> str:
+    message = str(timestamp).encode("utf-8") + b"." + body
+    return "sha256=" + hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, header: Optional[str], timestamp: Optional[str]) -> bool:
+    if not secret or not header or not timestamp:
+        return False
+    return hmac.compare_digest(sign(secret, body, str(timestamp).strip()), header.strip())
+
+
+class WebhookReceiver:
+    """
+    Verifies and normalizes webhook deliveries into `table` observations.
+    `handle` is transport-agnostic so it can be driven without HTTP.
+    """
+
+    def __init__(
+        self,
+        table,
+        secrets: Dict[str, str],
+        on_event: Optional[Callable[[], None]] = None,
+        today=None,
+        accepting: Optional[Callable[[], bool]] = None,
+        tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+    ):
+        self.table = table
+        self.secrets = {source: str(secret or "") for source, secret in secrets.items()}
+        self.on_event = on_event
+        # False on a lease standby: deliveries get 503 so the sender retries against the active instance.
+        self.accepting = accepting
+        self.tolerance_seconds = float(tolerance_seconds)
+        self._today = today
+        # Signatures and delivery ids seen inside the tolerance window -> when they may be forgotten.
+        self._seen: Dict[str, float] = {}
+        self._seen_lock = threading.Lock()
+        self.accepted = 0
+        self.rejected = 0
+
+    def today(self, location: Optional[str] = None) -> str:
+        """Today (YYYY-MM-DD) in `location`'s lifecycle timezone, as the scheduler's timers see it."""
+        if self._today:
+            return str(self._today)
+        return datetime.fromtimestamp(time.time(), location_timezone(location)).date().isoformat()
+
+    def handle(
+        self,
+        source: str,
+        body: bytes,
+        signature: Optional[str],
+        timestamp: Optional[str] = None,
+        delivery_id: Optional[str] = None,
+    ) -> Tuple[int, str]:
+        """Returns (HTTP status, message) for one delivery."""
+        if source not in SOURCES:
+            return 404, "unknown webhook source"
+        if self.accepting is not None and not self.accepting():
+            return 503, "standby instance"
+        if not verify_signature(self.secrets.get(source, ""), body, signature, timestamp):
+            self.rejected += 1
+            logger.warning("⚠️ Rejected %s webhook with a missing or invalid signature.", source)
+            return 401, "invalid signature"
+        now = time.time()
+        try:
+            skew = abs(now - float(str(timestamp).strip()))
+        except ValueError:
+            skew = float("inf")
+        if skew > self.tolerance_seconds:
+            self.rejected += 1
+            logger.warning("⚠️ Rejected %s webhook signed outside the %.0fs tolerance window.", source, self.tolerance_seconds)
+            return 401, "stale timestamp"
+        if not self._first_delivery(source, signature, delivery_id, now):
+            logger.info("🔁 Ignoring replayed %s webhook delivery.", source)
+            return 200, "duplicate delivery"
+        try:
+            payload = json.loads(body.decode("utf-8") or "{}")
+        except ValueError:
+            self.rejected += 1
+            return 400, "invalid JSON"
+        if not isinstance(payload, dict):
+            self.rejected += 1
+            return 400, "expected a JSON object"
+
+        observations = self.normalize_rippling(payload) if source == "rippling" else self.normalize_freshservice(payload)
+        self.accepted += 1
+        for kind, email, ref in observations:
+            if self.table.observe(kind, source, email, ref):
+                logger.info("🔗 %s webhook completed the %s match for %s.", source, kind, email)
+        if observations:
+            self.table.save()
+            logger.info("📬 %s webhook: %d lifecycle observation(s).", source, len(observations))
+            if self.on_event is not None:
+                self.on_event()
+        return 202, "accepted"
+
+    def normalize_rippling(self, payload) -> List[Tuple[str, str, str]]:
+        """Worker events whose start or end date is today become Rippling-side observations."""
+        worker = payload.get("data") or payload.get("worker") or payload
+        if not isinstance(worker, dict):
+            return []
+        email = str(worker.get("work_email") or "").strip().lower()
+        if not email:
+            return []
+        today = self.today(_worker_location(worker))
+        observations = []
+        if str(worker.get("start_date") or "") == today:
+            observations.append(("onboarding", email, today))
+        if str(worker.get("end_date") or "") == today:
+            observations.append(("offboarding", email, today))
+        return observations
+
+    def normalize_freshservice(self, payload) -> List[Tuple[str, str, str]]:
+        """Lifecycle tickets become Freshservice-side observations for every email they mention."""
+        ticket = payload.get("ticket") or payload
+        if not isinstance(ticket, dict):
+            return []
+        ticket_id = ticket.get("id") or ticket.get("ticket_id")
+        if ticket_id is None:
+            return []
+        return [
+            (kind, email, str(ticket_id))
+            for kind, emails in freshservice.lifecycle_ticket_emails(ticket).items()
+            for email in emails
+        ]
+
+    def _first_delivery(self, source, signature, delivery_id, now) -> bool:
+        """Remember this delivery; False if its signature or delivery id was already seen."""
+        keys = [f"{source}:sig:{signature.strip()}"]
+        if delivery_id and str(delivery_id).strip():
+            keys.append(f"{source}:id:{str(delivery_id).strip()}")
+        with self._seen_lock:
+            for key, forget_at in list(self._seen.items()):
+                if forget_at <= now:
+                    del self._seen[key]
+            if any(key in self._seen for key in keys):
+                return False
+            # A timestamp may sit up to one tolerance ahead of our clock.
+            for key in keys:
+                self._seen[key] = now + 2 * self.tolerance_seconds
+        return True
+
+
+def _worker_location(worker) -> Optional[str]:
+    """Worker country code or location name, read the way the Rippling client builds profiles."""
+    location = worker.get("country")
+    if isinstance(location, dict):
+        location = location.get("code") or location.get("name")
+    if not isinstance(location, str) or not location.strip():
+        location = worker.get("location")
+    return location.strip() if isinstance(location, str) and location.strip() else None
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    receiver: WebhookReceiver = None
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        prefix, _, source = path.rpartition("/")
+        if prefix != "/webhooks":
+            self._reply(404, "not found")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._reply(413, "payload too large")
+            return
+        body = self.rfile.read(length) if length > 0 else b""
+        try:
+            status, message = self.receiver.handle(
+                source,
+                body,
+                self.headers.get(SIGNATURE_HEADER),
+                timestamp=self.headers.get(TIMESTAMP_HEADER),
+                delivery_id=self.headers.get(DELIVERY_HEADER),
+            )
+        except Exception as exc:
+            logger.error("❌ Webhook handling failed for %s: %s", source, exc)
+            status, message = 500, "internal error"
+        self._reply(status, message)
+
+    def _reply(self, status, message):
+        body = json.dumps({"status": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("webhook endpoint: " + format, *args)
+
+
+def start_webhook_server(receiver: WebhookReceiver, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve `/webhooks/<source>` from a daemon thread."""
+    global _server
+    handler = type("WebhookHandler", (_WebhookHandler,), {"receiver": receiver})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="servus-webhooks", daemon=True)
+    thread.start()
+    _server = server
+    logger.info("📬 Webhook receiver listening on http://%s:%s/webhooks/<source>", host, server.server_port)
+    return server
+
+
+def stop_webhook_server() -> None:
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
+
+
+def configure_webhooks(
+    config,
+    table,
+    on_event: Optional[Callable[[], None]] = None,
+    accepting: Optional[Callable[[], bool]] = None,
+) -> Optional[WebhookReceiver]:
+    """
+    Start the receiver when WEBHOOK_PORT is set. Sources without a secret
+    are refused (every delivery gets 401), and while `accepting()` is False
+    every delivery gets 503. Returns the receiver, or None.
+    """
+    port = int(config.get("WEBHOOK_PORT") or 0)
+    if port <= 0:
+        return None
+    secrets = {
+        "rippling": str(config.get("RIPPLING_WEBHOOK_SECRET") or ""),
+        "freshservice": str(config.get("FRESHSERVICE_WEBHOOK_SECRET") or ""),
+    }
+    if not any(secrets.values()):
+        logger.error("❌ WEBHOOK_PORT is set but no webhook secrets are configured; receiver not started.")
+        return None
+    for source, secret in secrets.items():
+        if not secret:
+            logger.warning("⚠️ No %s webhook secret configured; %s deliveries will be rejected.", source, source)
+    receiver = WebhookReceiver(
+        table,
+        secrets,
+        on_event=on_event,
+        accepting=accepting,
+        tolerance_seconds=float(config.get("WEBHOOK_TOLERANCE_SECONDS") or DEFAULT_TOLERANCE_SECONDS),
+    )
+    if _server is None:
+        start_webhook_server(receiver, port, host=str(config.get("WEBHOOK_HOST") or "127.0.0.1"))
+    return receiver
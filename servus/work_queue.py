@@ -0,0 +1,322 @@
+"""
+Durable work queue between the scheduler and worker processes.
+
+With WORK_QUEUE_BACKEND set, the scheduler publishes each validated run as
+a JSON work item instead of running it in-process. Worker processes
+(`scripts/scheduler.py worker --processes N`, on one or more hosts) claim
+items, heartbeat while they run, and complete them. A claim is a
+visibility timeout: if a worker dies and stops heartbeating, the item
+becomes visible again and another worker redelivers it. After
+WORK_QUEUE_MAX_ATTEMPTS deliveries the item is parked as failed instead.
+
+Backends share one interface (`publish`, `is_active`, `claim`, `heartbeat`,
+`complete`, `fail`, `stats`):
+
+- `SQLiteWorkQueue` (default) is a single table in a local database file.
+  Items are claimed in priority-class order, oldest first, and an active
+  item (or one completed within `dedupe_seconds`) blocks a duplicate
+  publish of the same key.
+- `SQSWorkQueue` uses the SQS client plumbing from `badge_queue`, so
+  workers can run on other hosts. SQS has no priorities, so items are
+  delivered roughly in publish order, and publish dedupe is local to the
+  scheduler process.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from typing import Dict, Optional
+
+from servus import metrics
+from servus.inflight import PRIORITIES
+
+logger = logging.getLogger("servus.work_queue")
+
+_RANKS = {name: rank for rank, name in enumerate(PRIORITIES)}
+
+
+class SQLiteWorkQueue:
+    def __init__(self, path: str, max_attempts: int = 3, dedupe_seconds: float = 300.0):
+        self.path = path
+        self.max_attempts = max(1, int(max_attempts))
+        self.dedupe_seconds = float(dedupe_seconds)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS work_items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    dedupe_key TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    description TEXT NOT NULL DEFAULT '',
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    claimed_by TEXT,
+                    receipt TEXT,
+                    visible_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    last_error TEXT NOT NULL DEFAULT ''
+                );
+                CREATE UNIQUE INDEX IF NOT EXISTS work_items_active_key
+                    ON work_items (dedupe_key) WHERE status IN ('queued', 'claimed');
+                CREATE INDEX IF NOT EXISTS work_items_ready
+                    ON work_items (status, priority, created_at);
+                """
+            )
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def publish(self, kind: str, key: str, payload: dict, priority: str = "onboarding", description: str = "") -> bool:
+        """Queue an item; False when the same key is active or completed within `dedupe_seconds`."""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                recent = conn.execute(
+                    "SELECT status FROM work_items WHERE dedupe_key = ? AND "
+                    "(status IN ('queued', 'claimed') OR (status = 'done' AND updated_at > ?)) LIMIT 1",
+                    (key, now - self.dedupe_seconds),
+                ).fetchone()
+                if recent is not None:
+                    conn.execute("ROLLBACK")
+                    logger.info("⏭️  Work item %s already %s; not publishing again.", key, recent[0])
+                    return False
+                conn.execute(
+                    "INSERT INTO work_items (kind, dedupe_key, priority, description, payload, visible_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (kind, key, _RANKS[priority], description or key, json.dumps(payload), now, now, now),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        metrics.WORK_ITEMS_PUBLISHED.inc(kind=kind)
+        logger.info("📤 Published %s work item %s (%s).", kind, key, priority)
+        return True
+
+    def is_active(self, key: str) -> bool:
+        """True while an item for `key` is queued or claimed by a worker."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM work_items WHERE dedupe_key = ? AND status IN ('queued', 'claimed') LIMIT 1", (key,)
+            ).fetchone()
+        return row is not None
+
+    def claim(self, worker_id: str, visibility_seconds: float) -> Optional[dict]:
+        """Claim the next visible item (expired claims included), or None."""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                while True:
+                    row = conn.execute(
+                        "SELECT id, kind, dedupe_key, priority, description, payload, attempts, status "
+                        "FROM work_items WHERE status IN ('queued', 'claimed') AND visible_at <= ? "
+                        "ORDER BY priority, created_at, id LIMIT 1",
+                        (now,),
+                    ).fetchone()
+                    if row is None:
+                        conn.execute("COMMIT")
+                        return None
+                    item_id, kind, key, rank, description, payload, attempts, status = row
+                    if attempts >= self.max_attempts:
+                        conn.execute(
+                            "UPDATE work_items SET status = 'failed', receipt = NULL, updated_at = ?, "
+                            "last_error = 'gave up after ' || attempts || ' deliveries' WHERE id = ?",
+                            (now, item_id),
+                        )
+                        logger.error("❌ Work item %s failed %d deliveries; parking it as failed.", key, attempts)
+                        continue
+                    receipt = uuid.uuid4().hex
+                    conn.execute(
+                        "UPDATE work_items SET status = 'claimed', attempts = attempts + 1, claimed_by = ?, "
+                        "receipt = ?, visible_at = ?, updated_at = ? WHERE id = ?",
+                        (worker_id, receipt, now + visibility_seconds, now, item_id),
+                    )
+                    conn.execute("COMMIT")
+                    break
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        if status == "claimed":
+            metrics.WORK_ITEMS_REDELIVERED.inc(kind=kind)
+            logger.warning("♻️ Redelivering work item %s after a missed heartbeat.", key)
+        return {
+            "id": item_id,
+            "kind": kind,
+            "key": key,
+            "priority": PRIORITIES[rank],
+            "description": description,
+            "payload": json.loads(payload),
+            "attempts": attempts + 1,
+            "receipt": receipt,
+        }
+
+    def _update_claimed(self, item: dict, sql: str, params: tuple) -> bool:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                f"UPDATE work_items SET {sql} WHERE id = ? AND receipt = ? AND status = 'claimed'",
+                params + (item["id"], item["receipt"]),
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, item: dict, visibility_seconds: float) -> bool:
+        """Extend the claim; False if it expired and was redelivered to someone else."""
+        now = time.time()
+        return self._update_claimed(item, "visible_at = ?, updated_at = ?", (now + visibility_seconds, now))
+
+    def complete(self, item: dict) -> bool:
+        done = self._update_claimed(item, "status = 'done', receipt = NULL, updated_at = ?", (time.time(),))
+        metrics.WORK_ITEMS_FINISHED.inc(kind=item["kind"], outcome="done" if done else "stale")
+        if not done:
+            logger.warning("⚠️ Work item %s finished after its claim was redelivered.", item["key"])
+        return done
+
+    def fail(self, item: dict, error: str, retry_after: float = 60.0) -> bool:
+        """Release the claim so the item is retried after `retry_after` seconds (until max attempts)."""
+        now = time.time()
+        released = self._update_claimed(
+            item,
+            "status = 'queued', receipt = NULL, visible_at = ?, updated_at = ?, last_error = ?",
+            (now + retry_after, now, str(error)[:500]),
+        )
+        metrics.WORK_ITEMS_FINISHED.inc(kind=item["kind"], outcome="error")
+        return released
+
+    def stats(self) -> Dict[str, int]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM work_items GROUP BY status").fetchall()
+        return {"backend": "sqlite", **{status: count for status, count in rows}}
+
+    def prune(self, older_than_seconds: float = 7 * 24 * 3600) -> int:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "DELETE FROM work_items WHERE status IN ('done', 'failed') AND updated_at < ?",
+                (time.time() - older_than_seconds,),
+            )
+            return cursor.rowcount
+
+
+class SQSWorkQueue:
+    def __init__(self, queue_url: str, client=None, max_attempts: int = 3, dedupe_seconds: float = 300.0, wait_seconds: int = 5):
+        if client is None:
+            from servus.integrations import badge_queue
+
+            client = badge_queue.get_sqs_client()
+        self.queue_url = queue_url
+        self.client = client
+        self.max_attempts = max(1, int(max_attempts))
+        self.dedupe_seconds = float(dedupe_seconds)
+        self.wait_seconds = int(wait_seconds)
+        self._published: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, kind: str, key: str, payload: dict, priority: str = "onboarding", description: str = "") -> bool:
+        now = time.time()
+        with self._lock:
+            if now - self._published.get(key, float("-inf")) < self.dedupe_seconds:
+                logger.info("⏭️  Work item %s published %.0fs ago; not publishing again.", key, now - self._published[key])
+                return False
+            self._published = {k: at for k, at in self._published.items() if now - at < self.dedupe_seconds}
+            self._published[key] = now
+        body = {"kind": kind, "key": key, "priority": priority, "description": description or key, "payload": payload}
+        self.client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(body))
+        metrics.WORK_ITEMS_PUBLISHED.inc(kind=kind)
+        logger.info("📤 Published %s work item %s to SQS (%s).", kind, key, priority)
+        return True
+
+    def is_active(self, key: str) -> bool:
+        """SQS cannot be searched by key: True while `key` is inside this process's publish dedupe window."""
+        with self._lock:
+            return time.time() - self._published.get(key, float("-inf")) < self.dedupe_seconds
+
+    def claim(self, worker_id: str, visibility_seconds: float) -> Optional[dict]:
+        while True:
+            response = self.client.receive_message(
+                QueueUrl=self.queue_url,
+                MaxNumberOfMessages=1,
+                VisibilityTimeout=int(visibility_seconds),
+                WaitTimeSeconds=self.wait_seconds,
+                AttributeNames=["ApproximateReceiveCount"],
+            )
+            messages = response.get("Messages") or []
+            if not messages:
+                return None
+            message = messages[0]
+            body = json.loads(message["Body"])
+            attempts = int((message.get("Attributes") or {}).get("ApproximateReceiveCount") or 1)
+            if attempts > self.max_attempts:
+                logger.error("❌ Work item %s failed %d deliveries; dropping it.", body.get("key"), attempts - 1)
+                self.client.delete_message(QueueUrl=self.queue_url, ReceiptHandle=message["ReceiptHandle"])
+                continue
+            if attempts > 1:
+                metrics.WORK_ITEMS_REDELIVERED.inc(kind=body["kind"])
+                logger.warning("♻️ Redelivering work item %s (delivery %d).", body["key"], attempts)
+            return {
+                "id": message["MessageId"],
+                "kind": body["kind"],
+                "key": body["key"],
+                "priority": body.get("priority") or "onboarding",
+                "description": body.get("description") or body["key"],
+                "payload": body.get("payload") or {},
+                "attempts": attempts,
+                "receipt": message["ReceiptHandle"],
+            }
+
+    def heartbeat(self, item: dict, visibility_seconds: float) -> bool:
+        try:
+            self.client.change_message_visibility(
+                QueueUrl=self.queue_url, ReceiptHandle=item["receipt"], VisibilityTimeout=int(visibility_seconds)
+            )
+        except Exception as exc:
+            logger.warning("⚠️ Could not extend SQS claim on %s: %s", item["key"], exc)
+            return False
+        return True
+
+    def complete(self, item: dict) -> bool:
+        try:
+            self.client.delete_message(QueueUrl=self.queue_url, ReceiptHandle=item["receipt"])
+        except Exception as exc:
+            logger.warning("⚠️ Could not delete completed SQS item %s: %s", item["key"], exc)
+            metrics.WORK_ITEMS_FINISHED.inc(kind=item["kind"], outcome="stale")
+            return False
+        metrics.WORK_ITEMS_FINISHED.inc(kind=item["kind"], outcome="done")
+        return True
+
+    def fail(self, item: dict, error: str, retry_after: float = 60.0) -> bool:
+        metrics.WORK_ITEMS_FINISHED.inc(kind=item["kind"], outcome="error")
+        return self.heartbeat(item, retry_after)
+
+    def stats(self) -> Dict[str, int]:
+        return {"backend": "sqs", "published_recently": len(self._published)}
+
+
+def configure_work_queue(config, state_dir: str = "servus_state"):
+    """
+    Queue for WORK_QUEUE_BACKEND ("sqlite" or "sqs"), or None when unset, in
+    which case runs stay on the in-process registry.
+    """
+    backend = str(config.get("WORK_QUEUE_BACKEND") or "").strip().lower()
+    if not backend:
+        return None
+    max_attempts = int(config.get("WORK_QUEUE_MAX_ATTEMPTS") or 3)
+    dedupe_seconds = float(config.get("WORK_QUEUE_DEDUPE_SECONDS") or 300)
+    if backend == "sqlite":
+        path = str(config.get("WORK_QUEUE_FILE") or "").strip() or os.path.join(state_dir, "work_queue.db")
+        return SQLiteWorkQueue(path, max_attempts=max_attempts, dedupe_seconds=dedupe_seconds)
+    if backend == "sqs":
+        queue_url = str(config.get("WORK_QUEUE_SQS_URL") or "").strip()
+        if not queue_url:
+            raise ValueError("WORK_QUEUE_BACKEND=sqs requires WORK_QUEUE_SQS_URL")
+        return SQSWorkQueue(queue_url, max_attempts=max_attempts, dedupe_seconds=dedupe_seconds)
+    raise ValueError(f"Unsupported WORK_QUEUE_BACKEND: {backend}")
@@ -0,0 +1,47 @@
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "benchmark_cohort.py"
+SPEC = importlib.util.spec_from_file_location("benchmark_cohort", SCRIPT_PATH)
+benchmark_cohort = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(benchmark_cohort)
+
+
+class BenchmarkCohortTests(unittest.TestCase):
+    def test_percentile_uses_nearest_rank(self):
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(benchmark_cohort.percentile(values, 50), 50.0)
+        self.assertEqual(benchmark_cohort.percentile(values, 99), 99.0)
+        self.assertIsNone(benchmark_cohort.percentile([], 95))
+
+    def test_cohort_runs_through_scheduler_against_fakes(self):
+        report = benchmark_cohort.run_benchmark(new_hires=2, departures=1, seed=3)
+
+        self.assertEqual(report["completed"]["onboarding"], 2)
+        self.assertEqual(report["completed"]["offboarding"], 1)
+        self.assertEqual(report["steps"]["google_gam.move_user_ou"]["count"], 2)
+        self.assertIn("p99_ms", report["steps"]["slack.add_to_channels"])
+        self.assertGreater(report["outbound"]["rippling"]["count"], 0)
+        self.assertGreater(report["outbound"]["google_gam"]["count"], 0)
+        self.assertEqual(
+            report["outbound_calls_total"], sum(item["count"] for item in report["outbound"].values())
+        )
+
+    def test_recorded_cohort_replays_from_cassette(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/cohort.jsonl"
+            recorded = benchmark_cohort.run_benchmark(new_hires=2, departures=1, seed=5, record_path=path)
+            replayed = benchmark_cohort.run_benchmark(replay_path=path)
+
+        self.assertEqual(replayed["completed"]["onboarding"], recorded["completed"]["onboarding"])
+        self.assertEqual(replayed["completed"]["offboarding"], recorded["completed"]["offboarding"])
+        self.assertEqual(sum(replayed["fake_service_calls"].values()), 0)
+        self.assertEqual(replayed["parameters"]["cassette_replayed_from"], path)
+        self.assertEqual(replayed["outbound"]["rippling"]["count"], recorded["outbound"]["rippling"]["count"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from servus import bulkheads, metrics
+from servus.config import CONFIG
+
+
+class BulkheadTests(unittest.TestCase):
+    def setUp(self):
+        metrics.REGISTRY.reset()
+        bulkheads.shutdown_bulkheads()
+
+    def tearDown(self):
+        bulkheads.shutdown_bulkheads()
+
+    def test_saturated_integration_does_not_block_other_integrations(self):
+        release = threading.Event()
+        gam_started = threading.Semaphore(0)
+
+        def slow_gam(context):
+            gam_started.release()
+            release.wait(5)
+            return True
+
+        with patch.dict(CONFIG, {"BULKHEADS_ENABLED": True, "BULKHEAD_SIZES": "google_gam=2", "BULKHEAD_DEFAULT_SIZE": 3}):
+            callers = ThreadPoolExecutor(max_workers=3)
+            try:
+                gam_calls = [
+                    callers.submit(bulkheads.call, "google_gam.add_groups", slow_gam, {}) for _ in range(3)
+                ]
+                for _ in range(2):
+                    self.assertTrue(gam_started.acquire(timeout=5))
+                deadline = time.monotonic() + 5
+                while bulkheads.snapshot()["google_gam"]["queued"] < 1 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                self.assertEqual(bulkheads.call("slack.add_to_channels", lambda context: "posted", {}), "posted")
+                self.assertEqual(bulkheads.snapshot()["google_gam"], {"size": 2, "active": 2, "queued": 1})
+                self.assertEqual(bulkheads.snapshot()["slack"]["size"], 3)
+                self.assertEqual(metrics.BULKHEAD_SATURATED.value(integration="google_gam"), 1)
+                self.assertEqual(metrics.BULKHEAD_QUEUED.value(integration="google_gam"), 1)
+
+                release.set()
+                self.assertEqual([call.result(timeout=5) for call in gam_calls], [True, True, True])
+            finally:
+                release.set()
+                callers.shutdown(wait=True)
+        self.assertEqual(metrics.BULKHEAD_ACTIVE.value(integration="google_gam"), 0)
+
+    def test_builtin_steps_and_disabled_bulkheads_run_inline(self):
+        caller = threading.current_thread()
+        on_caller = lambda context: threading.current_thread() is caller
+
+        self.assertTrue(bulkheads.call("builtin.validate_profile", on_caller, {}))
+        self.assertFalse(bulkheads.call("okta.find_user", on_caller, {}))
+        with patch.dict(CONFIG, {"BULKHEADS_ENABLED": False}):
+            self.assertTrue(bulkheads.call("ad.validate_user_exists", on_caller, {}))
+
+        with self.assertRaises(RuntimeError):
+            bulkheads.call("zoom.configure_user", lambda context: (_ for _ in ()).throw(RuntimeError("zoom down")), {})
+
+    def test_parse_sizes_skips_bad_entries(self):
+        self.assertEqual(bulkheads.parse_sizes("google_gam=2, AD=1,slack=x,okta=0,=3"), {"google_gam": 2, "ad": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
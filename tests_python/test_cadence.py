@@ -0,0 +1,81 @@
+import importlib.util
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from servus.cadence import AdaptiveCadence, parse_hour_range
+from servus.core.trigger_validator import ValidatedTrigger
+from servus.models import UserProfile
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
+SPEC = importlib.util.spec_from_file_location("scheduler", SCRIPT_PATH)
+scheduler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(scheduler)
+
+
+class AdaptiveCadenceTests(unittest.TestCase):
+    def test_quiet_scans_back_off_to_ceiling_and_activity_resets_to_floor(self):
+        cadence = AdaptiveCadence(min_seconds=60, max_seconds=900, backoff=2.0)
+        quiet = datetime(2026, 3, 7, 3, 0)
+
+        intervals = [cadence.after_scan(0, now=quiet) for _ in range(6)]
+        self.assertEqual(intervals, [120, 240, 480, 900, 900, 900])
+        self.assertEqual(cadence.after_scan(2, now=quiet), 60)
+        self.assertEqual(cadence.after_scan(0, now=quiet), 120)
+
+    def test_lifecycle_date_hot_window_holds_the_floor(self):
+        cadence = AdaptiveCadence(min_seconds=60, max_seconds=900, hot_hours=(6, 12))
+        cadence.set_lifecycle_dates(["2026-03-02", "2026-03-13T00:00:00Z", None])
+        for _ in range(5):
+            cadence.after_scan(0, now=datetime(2026, 3, 1, 9, 0))
+
+        self.assertEqual(cadence.current(datetime(2026, 3, 1, 9, 0)), 900)
+        self.assertEqual(cadence.current(datetime(2026, 3, 2, 5, 59)), 900)
+        self.assertEqual(cadence.current(datetime(2026, 3, 2, 8, 30)), 60)
+        self.assertEqual(cadence.current(datetime(2026, 3, 13, 11, 0)), 60)
+        self.assertEqual(cadence.current(datetime(2026, 3, 13, 12, 0)), 900)
+
+    def test_parse_hour_range_falls_back_on_bad_input(self):
+        self.assertEqual(parse_hour_range("6-12"), (6, 12))
+        self.assertEqual(parse_hour_range("12-6"), (0, 18))
+        self.assertEqual(parse_hour_range("mornings"), (0, 18))
+
+
+class ScanActivityTests(unittest.TestCase):
+    def test_already_completed_triggers_do_not_hold_the_floor(self):
+        user = UserProfile(
+            first_name="Kayla",
+            last_name="Durgee",
+            work_email="kayla.durgee@boom.aero",
+            department="IT",
+            employment_type="Salaried, full-time",
+            start_date="2026-03-02",
+        )
+        trigger = ValidatedTrigger(user, "rippling:onboarding:kayla.durgee@boom.aero", "freshservice:ticket_id:7")
+        cadence = AdaptiveCadence(min_seconds=60, max_seconds=900, backoff=2.0)
+        quiet = datetime(2026, 3, 7, 3, 0)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state = scheduler.RunState(state_file=str(Path(temp_dir) / "scheduler_state.json"))
+            override_csv = str(Path(temp_dir) / "manual_onboarding_overrides.csv")
+            scheduler.ensure_override_csv(override_csv)
+            with patch.object(scheduler, "scheduler_state", state), patch.object(
+                scheduler, "OVERRIDE_CSV_PATH", override_csv
+            ), patch.object(
+                scheduler.trigger_validator, "validate_and_fetch_onboarding_context", return_value=[trigger]
+            ), patch.object(
+                scheduler.trigger_validator, "validate_and_fetch_offboarding_context", return_value=[]
+            ), patch.object(scheduler, "run_onboarding") as run_onboarding_mock:
+                scheduler._record_successful_onboarding(user, "dual_validation")
+                intervals = [cadence.after_scan(scheduler.job_scan_dual_validation(), now=quiet) for _ in range(3)]
+
+        run_onboarding_mock.assert_not_called()
+        self.assertEqual(intervals, [120, 240, 480])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from servus import cassette
+from servus.config import CONFIG
+from servus.core import trigger_validator
+from servus.fake_services import FakeServices
+from servus.integrations import zoom
+
+
+class CassetteTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / "day.jsonl")
+
+    def tearDown(self):
+        cassette.stop()
+        self.tmp.cleanup()
+
+    def test_request_key_ignores_volatile_params_and_masks_secrets(self):
+        first = cassette.request_key("get", "https://x.test/api/v2/tickets?updated_since=2026-01-01&page=1", None)
+        second = cassette.request_key("GET", "https://x.test/api/v2/tickets?page=1&updated_since=2026-02-01", None)
+        self.assertEqual(first, second)
+        self.assertEqual(
+            cassette.sanitize_url("https://x.test/p?access_token=abc&q=1"), "https://x.test/p?access_token=%2A%2A%2A&q=1"
+        )
+        self.assertEqual(
+            cassette.sanitize_payload({"user": {"api_key": "k", "name": "a"}}),
+            {"user": {"api_key": cassette.REDACTED, "name": "a"}},
+        )
+
+    def test_recorded_scan_replays_offline_without_secrets(self):
+        with FakeServices(seed=11) as fakes, patch.dict(CONFIG, fakes.config_overrides()):
+            seeded = fakes.seed_cohort(new_hires=2, departures=1)
+            cassette.start_recording(self.path, endpoints={key: CONFIG.get(key) for key in cassette.ENDPOINT_KEYS})
+            recorded_onboarding = trigger_validator.validate_and_fetch_onboarding_context()
+            recorded_offboarding = trigger_validator.validate_and_fetch_offboarding_context()
+            zoom.ZoomClient()._get_token()
+            cassette.stop()
+            live_calls = dict(fakes.call_counts)
+
+        text = Path(self.path).read_text(encoding="utf-8")
+        self.assertNotIn(fakes.config_overrides()["ZOOM_CLIENT_SECRET"], text)
+        entries = [json.loads(line) for line in text.splitlines()[1:]]
+        token_entries = [entry for entry in entries if "/oauth/" in entry["url"]]
+        self.assertEqual(json.loads(token_entries[0]["body"])["access_token"], cassette.REDACTED)
+
+        player = cassette.start_replay(self.path)
+        with patch.dict(CONFIG, {**fakes.config_overrides(), **player.endpoints}):
+            onboarding = trigger_validator.validate_and_fetch_onboarding_context(as_of=player.recorded_date)
+            offboarding = trigger_validator.validate_and_fetch_offboarding_context(as_of=player.recorded_date)
+
+        self.assertEqual(len(recorded_onboarding), 2)
+        self.assertEqual(len(recorded_offboarding), 1)
+        self.assertEqual(sorted(t.user_profile.work_email for t in onboarding), sorted(seeded["new_hires"]))
+        self.assertEqual(sorted(t.user_profile.work_email for t in offboarding), sorted(seeded["departures"]))
+        self.assertEqual(player.misses, [])
+        self.assertEqual(dict(fakes.call_counts), live_calls)
+
+    def test_replay_miss_surfaces_as_connection_error(self):
+        Path(self.path).write_text(json.dumps({"servus_cassette": 1, "endpoints": {}}) + "\n", encoding="utf-8")
+        player = cassette.start_replay(self.path)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            requests.get("https://unrecorded.test/api", timeout=1)
+        self.assertEqual(len(player.misses), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import importlib.util
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from servus import control
+from servus.core.manual_override_queue import READY_STATUS, ManualOverrideRequest, enqueue_request, ensure_override_csv
+from servus.inflight import InflightRegistry
+from servus.models import UserProfile
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
+SPEC = importlib.util.spec_from_file_location("scheduler", SCRIPT_PATH)
+scheduler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(scheduler)
+
+
+def _request(request_id="REQ-CTL-1"):
+    user = UserProfile(
+        first_name="Kayla",
+        last_name="Durgee",
+        work_email="kayla.durgee@boom.aero",
+        department="TechOps",
+        title="Systems Engineer",
+        employment_type="Salaried, full-time",
+        start_date="2000-01-01",
+        location="US",
+    )
+    return ManualOverrideRequest(
+        request_id=request_id,
+        user_profile=user,
+        confirmation_source_a="rippling:worker_id:697924b36aa907afbec5b964",
+        confirmation_source_b="freshservice:ticket_id:140",
+    )
+
+
+class ControlSocketTests(unittest.TestCase):
+    def test_socket_round_trip_and_errors(self):
+        api = control.ControlAPI({"echo": lambda request: {"echo": request.get("value")}})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "ctl.sock")
+            control.start_control_server(api, path)
+            try:
+                self.assertEqual(control.send_command(path, "echo", value=3), {"ok": True, "echo": 3})
+                reply = control.send_command(path, "reboot")
+                self.assertFalse(reply["ok"])
+                self.assertEqual(reply["commands"], ["echo"])
+                self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+            finally:
+                control.stop_control_server()
+            self.assertFalse(os.path.exists(path))
+            with self.assertRaises(OSError):
+                control.send_command(path, "echo")
+
+    def test_reconfigure_swaps_handlers_on_the_running_socket(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "ctl.sock")
+            config = {"SCHEDULER_CONTROL_SOCKET": path}
+            control.configure_control(config, {"version": lambda request: {"generation": 1}})
+            try:
+                with patch.object(control.os, "umask", wraps=os.umask) as umask:
+                    control.configure_control(config, {"version": lambda request: {"generation": 2}})
+                umask.assert_not_called()
+                self.assertEqual(control.send_command(path, "version"), {"ok": True, "generation": 2})
+            finally:
+                control.stop_control_server()
+
+    def test_socket_is_bound_under_an_owner_only_umask(self):
+        api = control.ControlAPI({})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.object(control.os, "umask", wraps=os.umask) as umask:
+                control.start_control_server(api, os.path.join(temp_dir, "ctl.sock"))
+            control.stop_control_server()
+        self.assertEqual(umask.call_args_list[0].args, (0o077,))
+        self.assertEqual(len(umask.call_args_list), 2)
+
+
+class SchedulerControlTests(unittest.TestCase):
+    def test_enqueue_dispatches_ready_row_and_status_reports_it_in_flight(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_onboarding(user, trigger_source, request_id=None):
+            started.set()
+            release.wait(5)
+            scheduler._record_successful_onboarding(user, trigger_source, request_id=request_id)
+            return True
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state = scheduler.RunState(state_file=str(Path(temp_dir) / "scheduler_state.json"))
+            override_csv = str(Path(temp_dir) / "manual_onboarding_overrides.csv")
+            pending_csv = str(Path(temp_dir) / "pending_offboards.csv")
+            ensure_override_csv(override_csv)
+            enqueue_request(override_csv, _request(), status=READY_STATUS)
+            registry = InflightRegistry(max_workers=2)
+            with patch.object(scheduler, "scheduler_state", state), patch.object(
+                scheduler, "run_registry", registry
+            ), patch.object(scheduler, "OVERRIDE_CSV_PATH", override_csv), patch.object(
+                scheduler, "PENDING_OFFBOARD_CSV_PATH", pending_csv
+            ), patch.object(scheduler, "run_onboarding", side_effect=slow_onboarding):
+                api = control.ControlAPI(scheduler.CONTROL_HANDLERS)
+                reply = api.handle({"command": "enqueue", "request_id": "REQ-CTL-1"})
+                self.assertEqual(reply["outcome"], "dispatched")
+                self.assertTrue(started.wait(5))
+
+                self.assertEqual(api.handle({"command": "enqueue", "request_id": "REQ-CTL-1"})["outcome"], "in_flight")
+                status = api.handle({"command": "status", "query": "REQ-CTL-1"})
+                self.assertEqual([run["key"] for run in status["inflight"]], ["onboarding:kayla.durgee@boom.aero|2000-01-01"])
+                self.assertEqual(status["manual_queue"][0]["status"], READY_STATUS)
+                self.assertEqual(len(api.handle({"command": "list-inflight"})["runs"]), 1)
+
+                release.set()
+                self.assertTrue(registry.wait(timeout=5))
+                registry.shutdown()
+
+                status = api.handle({"command": "status", "query": "Kayla.Durgee@boom.aero"})
+                self.assertEqual(status["inflight"], [])
+                self.assertEqual(status["manual_queue"], [])
+                self.assertEqual(status["completed"][0]["request_id"], "REQ-CTL-1")
+
+    def test_enqueue_rejects_unknown_rows_and_scan_now_sets_the_event(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            override_csv = str(Path(temp_dir) / "manual_onboarding_overrides.csv")
+            ensure_override_csv(override_csv)
+            enqueue_request(override_csv, _request("REQ-CTL-HOLD"))
+            with patch.object(scheduler, "OVERRIDE_CSV_PATH", override_csv):
+                api = control.ControlAPI(scheduler.CONTROL_HANDLERS)
+                self.assertFalse(api.handle({"command": "enqueue", "request_id": "REQ-NOPE"})["ok"])
+                self.assertEqual(api.handle({"command": "enqueue", "request_id": "REQ-CTL-HOLD"})["outcome"], "not_ready")
+
+        scheduler.scan_requested.clear()
+        self.assertTrue(control.ControlAPI(scheduler.CONTROL_HANDLERS).handle({"command": "scan-now"})["ok"])
+        self.assertTrue(scheduler.scan_requested.is_set())
+        scheduler.scan_requested.clear()
+
+    def test_enqueue_with_inline_registry_requests_a_scan_instead_of_running(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            override_csv = str(Path(temp_dir) / "manual_onboarding_overrides.csv")
+            ensure_override_csv(override_csv)
+            enqueue_request(override_csv, _request(), status=READY_STATUS)
+            scheduler.scan_requested.clear()
+            with patch.object(scheduler, "OVERRIDE_CSV_PATH", override_csv), patch.object(
+                scheduler, "run_registry", InflightRegistry(max_workers=0)
+            ), patch.object(scheduler, "run_onboarding") as run_onboarding_mock:
+                reply = control.ControlAPI(scheduler.CONTROL_HANDLERS).handle(
+                    {"command": "enqueue", "request_id": "REQ-CTL-1"}
+                )
+
+            run_onboarding_mock.assert_not_called()
+            self.assertEqual(reply["outcome"], "scan_requested")
+            self.assertTrue(scheduler.scan_requested.is_set())
+            scheduler.scan_requested.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from servus import transport
+from servus.config import CONFIG
+from servus.core import trigger_validator
+from servus.fake_services import FakeServices
+from servus.integrations import badge_queue, slack
+from servus.integrations.rippling import RipplingClient
+
+
+class FakeServicesTests(unittest.TestCase):
+    def setUp(self):
+        self.fakes = FakeServices(seed=7).start()
+        self.config_patch = patch.dict(CONFIG, self.fakes.config_overrides())
+        self.config_patch.start()
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.fakes.stop()
+
+    def test_dual_validation_runs_against_seeded_cohort(self):
+        seeded = self.fakes.seed_cohort(new_hires=3, departures=2)
+
+        onboarding = trigger_validator.validate_and_fetch_onboarding_context()
+        offboarding = trigger_validator.validate_and_fetch_offboarding_context()
+
+        self.assertEqual(sorted(m.user_profile.work_email for m in onboarding), sorted(seeded["new_hires"]))
+        self.assertEqual(sorted(m.user_profile.work_email for m in offboarding), sorted(seeded["departures"]))
+        self.assertEqual(onboarding[0].user_profile.first_name, "Hire")
+        self.assertGreater(self.fakes.call_counts["freshservice"], 0)
+
+    def test_rippling_profile_is_built_from_worker_and_user_records(self):
+        worker = self.fakes.add_worker("Kayla", "Durgee", start_date="2026-03-02", department="Flight Test")
+        profile = RipplingClient()._build_profile(worker["id"])
+
+        self.assertEqual(profile.work_email, "kayla.durgee@boom.aero")
+        self.assertEqual(profile.last_name, "Durgee")
+        self.assertEqual(profile.department, "Flight Test")
+
+    def test_slack_lookup_and_channel_invite(self):
+        email = self.fakes.add_worker("Ada", "Lovelace")["work_email"]
+        user_id = slack._lookup_user_by_email(email)
+        self.assertTrue(user_id)
+
+        url = slack._api_url("conversations.invite")
+        first = requests.post(url, json={"channel": "C1", "users": user_id}, timeout=5).json()
+        second = requests.post(url, json={"channel": "C1", "users": user_id}, timeout=5).json()
+        self.assertTrue(first["ok"])
+        self.assertEqual(second["error"], "already_in_channel")
+
+    def test_sqs_send_message_json_and_query_protocols(self):
+        self.assertTrue(badge_queue.send_print_job({"first_name": "Ada", "email": "ada@boom.aero"}))
+        resp = requests.post(
+            self.fakes.url("sqs"),
+            data={"Action": "SendMessage", "QueueUrl": CONFIG["SQS_BADGE_QUEUE_URL"], "MessageBody": "hi"},
+            timeout=5,
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("<MessageId>", resp.text)
+        self.assertEqual(len(self.fakes.sqs_messages), 2)
+
+    def test_rate_limit_and_error_injection(self):
+        self.fakes.set_behavior("okta", rate_limit_per_sec=2, retry_after_seconds=3)
+        statuses = [requests.get(f"{self.fakes.url('okta')}/api/v1/users", timeout=5) for _ in range(3)]
+        self.assertEqual([r.status_code for r in statuses], [200, 200, 429])
+        self.assertEqual(statuses[-1].headers["Retry-After"], "3")
+        self.assertEqual(self.fakes.throttled_counts["okta"], 1)
+
+        self.fakes.set_behavior("zoom", error_rate=1.0, error_status=503)
+        resp = requests.get(f"{self.fakes.url('zoom')}/v2/users/nobody@boom.aero", timeout=5)
+        self.assertEqual(resp.status_code, 503)
+
+    def test_shared_host_urls_map_to_their_integration(self):
+        self.assertEqual(transport.integration_for_url(f"{self.fakes.url('rippling')}/workers"), "rippling")
+        self.assertEqual(transport.integration_for_url(f"{self.fakes.url('slack')}/api/auth.test"), "slack")
+        self.assertEqual(transport.integration_for_url(f"{self.fakes.url('freshservice')}/api/v2/tickets"),
+                         "freshservice")
+
+
+if __name__ == "__main__":
+    unittest.main()
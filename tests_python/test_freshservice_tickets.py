@@ -0,0 +1,165 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from servus.config import CONFIG
+from servus.fake_services import FakeServices
+from servus.integrations import freshservice
+from servus.integrations.rippling import RipplingClient, worker_directory
+from servus.state import RunState
+
+
+class FreshserviceTicketCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fakes = FakeServices(seed=4).start()
+        self.config_patch = patch.dict(CONFIG, self.fakes.config_overrides())
+        self.config_patch.start()
+        self.state = RunState(state_file=str(Path(self.tmp.name) / "scheduler_state.json"))
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.fakes.stop()
+        self.tmp.cleanup()
+
+    def _scan(self, cache):
+        ids = freshservice.scan_for_onboarding_tickets(minutes_lookback=1440, cache=cache)
+        return ids, freshservice.map_ticket_ids_by_email(ids, cache=cache)
+
+    def test_repeat_scans_only_reprocess_tickets_whose_updated_at_moved(self):
+        first = self.fakes.add_ticket("New hire: Ada", "Onboard ada.lovelace@boom.aero")
+        self.fakes.add_ticket("Laptop broken", "Screen cracked")
+        cache = freshservice.ticket_cache(self.state)
+
+        ids, mapping = self._scan(cache)
+        self.assertEqual(ids, [str(first["id"])])
+        self.assertEqual(mapping["ada.lovelace@boom.aero"], str(first["id"]))
+
+        self.fakes.reset_counts()
+        self.assertEqual(self._scan(cache), (ids, mapping))
+        # One delta list call; emails come from the cache, not a detail fetch.
+        self.assertEqual(self.fakes.call_counts["freshservice"], 1)
+
+        first.update({
+            "description_text": "Onboard grace.hopper@boom.aero",
+            "description": "<div>Onboard grace.hopper@boom.aero</div>",
+            "updated_at": "2999-01-01T00:00:00Z",
+        })
+        self.fakes.reset_counts()
+        _, mapping = self._scan(cache)
+        self.assertEqual(mapping["grace.hopper@boom.aero"], str(first["id"]))
+        self.assertNotIn("ada.lovelace@boom.aero", mapping)
+        self.assertEqual(self.fakes.call_counts["freshservice"], 2)
+
+        reloaded = freshservice.TicketCache(cache.path)
+        self.assertIn("grace.hopper@boom.aero", reloaded.emails(first["id"]))
+        self.assertEqual(reloaded.watermark, "2999-01-01T00:00:00Z")
+
+    def test_listing_failure_is_not_an_empty_feed(self):
+        first = self.fakes.add_ticket("New hire: Ada", "Onboard ada.lovelace@boom.aero")
+        with patch.object(freshservice, "_list_tickets", return_value=None):
+            self.assertIsNone(freshservice.scan_for_onboarding_tickets(minutes_lookback=1440))
+            # A cold cache has nothing to fall back on.
+            self.assertIsNone(freshservice.scan_for_onboarding_tickets(minutes_lookback=1440, cache=freshservice.TicketCache()))
+
+        cache = freshservice.ticket_cache(self.state)
+        ids, _ = self._scan(cache)
+        with patch.object(freshservice, "_list_tickets", side_effect=ConnectionError("reset")):
+            self.assertEqual(freshservice.scan_for_onboarding_tickets(minutes_lookback=1440, cache=cache), ids)
+        self.assertEqual(ids, [str(first["id"])])
+
+    def test_uncached_scan_follows_pagination(self):
+        for index in range(45):
+            self.fakes.add_ticket(f"Offboard crew {index}", f"Termination for crew.{index}@boom.aero")
+
+        self.assertEqual(len(freshservice.scan_for_offboarding_tickets(minutes_lookback=60)), 45)
+
+    def test_fetch_ticket_data_reads_ticket_once(self):
+        worker = self.fakes.add_worker("Kayla", "Durgee")
+        ticket = self.fakes.add_ticket(
+            "New hire", "Please onboard employee - Kayla Durgee has been hired with start date of: 2026-03-02"
+        )
+        self.fakes.reset_counts()
+
+        profile = freshservice.fetch_ticket_data(ticket["id"])
+
+        self.assertEqual(profile.work_email, worker["work_email"])
+        self.assertEqual(self.fakes.call_counts["freshservice"], 1)
+
+    def test_fetch_ticket_data_matches_by_name_from_indexed_roster(self):
+        worker = self.fakes.add_worker("Kayla", "Durgee", email_domain="boomsupersonic.com")
+        ticket = self.fakes.add_ticket(
+            "New hire", "Please onboard employee - Kayla Durgee has been hired with start date of: 2026-03-02"
+        )
+        client = RipplingClient()
+        worker_directory(client.base_url).refresh(client)
+        self.fakes.reset_counts()
+
+        profile = freshservice.fetch_ticket_data(ticket["id"])
+
+        # The guessed kayla.durgee@boom.aero would miss; the name index resolves it directly.
+        self.assertEqual(profile.work_email, worker["work_email"])
+        self.assertEqual(self.fakes.call_counts["rippling"], 1)
+
+    def test_ambiguous_name_is_reported_and_narrowed_by_ticket_email(self):
+        self.fakes.add_worker("Sam", "Lee", email_domain="boom.aero")
+        other = self.fakes.add_worker("Sam", "Lee", email_domain="boomsupersonic.com")
+        ticket = self.fakes.add_ticket(
+            "New hire", f"Please onboard employee - Sam Lee has been hired. Contact {other['work_email']}"
+        )
+        client = RipplingClient()
+        worker_directory(client.base_url).refresh(client)
+
+        profile = freshservice.fetch_ticket_data(ticket["id"])
+        self.assertEqual(profile.work_email, other["work_email"])
+
+        ambiguous = self.fakes.add_ticket("New hire", "Please onboard employee - Sam Lee has been hired.")
+        with self.assertLogs("servus.freshservice", level="WARNING") as logs:
+            freshservice.fetch_ticket_data(ambiguous["id"])
+        self.assertTrue(any("matches 2 Rippling workers" in line for line in logs.output))
+
+
+class FreshserviceFilterModeTests(unittest.TestCase):
+    def setUp(self):
+        self.fakes = FakeServices(seed=6).start()
+        overrides = dict(self.fakes.config_overrides())
+        overrides.update({
+            "FRESHSERVICE_SCAN_MODE": "filter",
+            "FRESHSERVICE_ONBOARDING_FILTER_QUERY": "category:'Employee Onboarding' AND type:'Service Request'",
+        })
+        self.config_patch = patch.dict(CONFIG, overrides)
+        self.config_patch.start()
+        self.tagged = self.fakes.add_ticket(
+            "Welcome aboard", "Kayla starts Monday", category="Employee Onboarding", ticket_type="Service Request"
+        )
+        self.untagged = self.fakes.add_ticket("New hire: Ada", "Onboard ada.lovelace@boom.aero")
+        for index in range(40):
+            self.fakes.add_ticket(f"Printer {index}", "Out of toner")
+        self.fakes.reset_counts()
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.fakes.stop()
+
+    def test_filter_mode_only_pulls_tagged_tickets(self):
+        ids = freshservice.scan_for_onboarding_tickets(minutes_lookback=60)
+
+        self.assertEqual(ids, [str(self.tagged["id"])])
+        self.assertEqual(self.fakes.call_counts["freshservice"], 1)
+
+    def test_hybrid_mode_keeps_keyword_fallback_for_untagged_tickets(self):
+        with patch.dict(CONFIG, {"FRESHSERVICE_SCAN_MODE": "hybrid"}):
+            ids = freshservice.scan_for_onboarding_tickets(minutes_lookback=60)
+
+        self.assertEqual(ids, [str(self.untagged["id"]), str(self.tagged["id"])])
+
+    def test_rejected_filter_query_falls_back_to_keyword_scan(self):
+        with patch.dict(CONFIG, {"FRESHSERVICE_ONBOARDING_FILTER_QUERY": "("}):
+            ids = freshservice.scan_for_onboarding_tickets(minutes_lookback=60)
+
+        self.assertEqual(ids, [str(self.untagged["id"])])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import contextvars
+import importlib.util
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from servus import hot_reload
+from servus.config import CONFIG
+from servus.inflight import InflightRegistry
+from servus.state import RunState
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
+SPEC = importlib.util.spec_from_file_location("scheduler", SCRIPT_PATH)
+scheduler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(scheduler)
+
+
+def _read_yaml(path):
+    with open(path, "r", encoding="utf-8") as handle:
+        return yaml.safe_load(handle)
+
+
+class HotReloadTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "google_groups.yaml")
+        self._write({"global": ["all-staff"]})
+        self.config_patch = patch.object(hot_reload.servus_config, "read_config", side_effect=lambda: (dict(CONFIG), None))
+        self.config_patch.start()
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.temp_dir.cleanup()
+
+    def _write(self, payload):
+        with open(self.path, "w", encoding="utf-8") as handle:
+            handle.write(payload if isinstance(payload, str) else yaml.safe_dump(payload))
+
+    def test_running_workflow_keeps_its_generation_across_reload(self):
+        with hot_reload.pinned():
+            self.assertEqual(hot_reload.load(self.path, _read_yaml), {"global": ["all-staff"]})
+            self._write({"global": ["all-staff", "engineering"]})
+
+            result = hot_reload.reload()
+            self.assertTrue(result["ok"])
+            self.assertIn(self.path, result["files"])
+
+            # Still pinned, also on threads that copy the context (bulkheads).
+            seen = []
+            context = contextvars.copy_context()
+            thread = threading.Thread(target=context.run, args=(lambda: seen.append(hot_reload.load(self.path, _read_yaml)),))
+            thread.start()
+            thread.join()
+            self.assertEqual(seen, [{"global": ["all-staff"]}])
+            self.assertEqual(hot_reload.load(self.path, _read_yaml), {"global": ["all-staff"]})
+
+        self.assertEqual(hot_reload.load(self.path, _read_yaml), {"global": ["all-staff", "engineering"]})
+
+    def test_broken_file_rejects_reload_and_keeps_config_and_policies(self):
+        hot_reload.load(self.path, _read_yaml)
+        generation = hot_reload.current().number
+        self._write("global: [unterminated")
+
+        with patch.object(
+            hot_reload.servus_config, "read_config", return_value=({**CONFIG, "SLACK_TOKEN": "rotated"}, None)
+        ):
+            result = hot_reload.reload()
+
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["generation"], generation)
+        self.assertNotEqual(CONFIG.get("SLACK_TOKEN"), "rotated")
+        self.assertEqual(hot_reload.load(self.path, _read_yaml), {"global": ["all-staff"]})
+
+    def test_config_changes_are_applied_in_place_and_reported(self):
+        with patch.dict(CONFIG, {"SCHEDULER_PARALLEL_PHASES": True}):
+            with patch.object(
+                hot_reload.servus_config, "read_config", return_value=({**CONFIG, "SCHEDULER_PARALLEL_PHASES": False}, None)
+            ):
+                result = hot_reload.reload()
+            self.assertTrue(result["ok"])
+            self.assertEqual(result["config_changed"], ["SCHEDULER_PARALLEL_PHASES"])
+            self.assertFalse(CONFIG["SCHEDULER_PARALLEL_PHASES"])
+
+    def test_scheduler_reload_rejects_offboarding_workflow_without_policy_gate(self):
+        workflow_path = os.path.join(self.temp_dir.name, "offboard_us.yaml")
+        with open(workflow_path, "w", encoding="utf-8") as handle:
+            yaml.safe_dump(
+                {
+                    "name": "SERVUS Offboarding",
+                    "description": "edited",
+                    "steps": [
+                        {
+                            "id": "okta_kill",
+                            "type": "action",
+                            "action": "okta.deactivate_user",
+                            "description": "Deactivate Okta",
+                        }
+                    ],
+                },
+                handle,
+            )
+        generation = hot_reload.current().number
+        with patch.object(scheduler, "_workflow_paths_for_preflight", return_value=[workflow_path]):
+            result = scheduler._reload_runtime()
+        self.assertFalse(result["ok"])
+        self.assertIn("builtin.validate_target_email", " ".join(result["errors"]))
+        self.assertEqual(hot_reload.current().number, generation)
+
+
+class ConfigReloadTests(unittest.TestCase):
+    def test_key_removed_from_dotenv_is_unset_on_reload(self):
+        config_module = hot_reload.servus_config
+        with patch.dict(os.environ), patch.object(config_module, "_DOTENV_KEYS", set()), patch.object(
+            config_module, "fetch_aws_secrets", return_value={}
+        ), patch.object(config_module, "_PROCESS_ENVIRON", {}), patch.dict(CONFIG):
+            with patch.object(config_module, "dotenv_values", return_value={"SERVUS_BULKHEADS_ENABLED": "false"}):
+                config_module.reload_config()
+            self.assertFalse(CONFIG["BULKHEADS_ENABLED"])
+
+            with patch.object(config_module, "dotenv_values", return_value={}):
+                changed = config_module.reload_config()
+
+            self.assertNotIn("SERVUS_BULKHEADS_ENABLED", os.environ)
+            self.assertIn("BULKHEADS_ENABLED", changed)
+            self.assertTrue(CONFIG["BULKHEADS_ENABLED"])
+
+    def test_rejected_reload_leaves_the_environment_alone(self):
+        config_module = hot_reload.servus_config
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(os.environ, {"SERVUS_OLD_SETTING": "1"}), patch.object(
+            config_module, "_DOTENV_KEYS", {"SERVUS_OLD_SETTING"}
+        ), patch.object(config_module, "fetch_aws_secrets", return_value={}), patch.object(
+            config_module, "_PROCESS_ENVIRON", {}
+        ), patch.object(
+            config_module, "dotenv_values", return_value={"SERVUS_SLACK_ADMIN_TOKEN": "rotated"}
+        ), patch.dict(CONFIG):
+            policy_path = os.path.join(temp_dir, "google_groups.yaml")
+            with open(policy_path, "w", encoding="utf-8") as handle:
+                handle.write("global: [all-staff]")
+            hot_reload.load(policy_path, _read_yaml)
+            with open(policy_path, "w", encoding="utf-8") as handle:
+                handle.write("global: [unterminated")
+            environ_before = dict(os.environ)
+
+            result = hot_reload.reload()
+
+            self.assertFalse(result["ok"])
+            self.assertEqual(dict(os.environ), environ_before)
+            self.assertEqual(config_module._DOTENV_KEYS, {"SERVUS_OLD_SETTING"})
+            self.assertNotEqual(CONFIG.get("SLACK_TOKEN"), "rotated")
+
+
+class GracefulDrainTests(unittest.TestCase):
+    def tearDown(self):
+        scheduler.draining.clear()
+        scheduler.scan_requested.clear()
+
+    def test_drain_parks_queued_runs_and_waits_for_running_ones(self):
+        registry = InflightRegistry(max_workers=1, reserved_workers=0)
+        started = threading.Event()
+        release = threading.Event()
+        ran = []
+
+        def _slow():
+            started.set()
+            release.wait(5)
+            ran.append("slow")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state = RunState(state_file=os.path.join(temp_dir, "scheduler_state.json"))
+            with patch.object(scheduler, "run_registry", registry), patch.object(scheduler, "scheduler_state", state):
+                self.assertTrue(scheduler._dispatch_run("onboarding:a", _slow))
+                started.wait(5)
+                self.assertTrue(scheduler._dispatch_run("onboarding:b", ran.append, "queued"))
+
+                scheduler._request_drain()
+                self.assertFalse(scheduler._dispatch_run("onboarding:c", ran.append, "late"))
+                with self.assertRaisesRegex(ValueError, "draining"):
+                    scheduler._control_scan_now({})
+
+                threading.Timer(0.2, release.set).start()
+                self.assertTrue(scheduler._drain(timeout=5))
+                self.assertEqual(ran, ["slow"])
+                self.assertEqual([run["key"] for run in state.get(scheduler.PARKED_RUNS_KEY)], ["onboarding:b"])
+
+                self.assertEqual(scheduler._report_parked_runs(), 1)
+                self.assertEqual(state.get(scheduler.PARKED_RUNS_KEY), [])
+
+    def test_drain_deadline_parks_runs_that_are_still_executing(self):
+        registry = InflightRegistry(max_workers=1, reserved_workers=0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def _stuck():
+            started.set()
+            release.wait(5)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state = RunState(state_file=os.path.join(temp_dir, "scheduler_state.json"))
+            with patch.object(scheduler, "run_registry", registry), patch.object(scheduler, "scheduler_state", state):
+                scheduler._dispatch_run("offboarding:a", _stuck, priority="offboarding")
+                started.wait(5)
+                self.assertFalse(scheduler._drain(timeout=0.1))
+                parked = state.get(scheduler.PARKED_RUNS_KEY)
+            release.set()
+        self.assertEqual([(run["key"], run["priority"]) for run in parked], [("offboarding:a", "offboarding")])
+
+
+if __name__ == "__main__":
+    unittest.main()
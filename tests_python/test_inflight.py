@@ -0,0 +1,175 @@
+import importlib.util
+import tempfile
+import threading
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from servus.core.trigger_validator import ValidatedTrigger
+from servus.inflight import InflightRegistry
+from servus.models import UserProfile
+from servus.timers import effective_at
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
+SPEC = importlib.util.spec_from_file_location("scheduler", SCRIPT_PATH)
+scheduler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(scheduler)
+
+
+class InflightRegistryTests(unittest.TestCase):
+    def test_duplicate_key_is_refused_while_running(self):
+        registry = InflightRegistry(max_workers=2)
+        release = threading.Event()
+        try:
+            first = registry.submit("onboarding:a", release.wait, 5, description="a")
+            self.assertIsNotNone(first)
+            self.assertIsNone(registry.submit("onboarding:a", lambda: None))
+            self.assertEqual([run["key"] for run in registry.snapshot()], ["onboarding:a"])
+
+            release.set()
+            self.assertTrue(first.result(timeout=5))
+            self.assertTrue(registry.wait(timeout=5))
+            self.assertIsNotNone(registry.submit("onboarding:a", lambda: "again"))
+        finally:
+            registry.shutdown()
+
+    def test_inline_registry_runs_synchronously_and_isolates_errors(self):
+        registry = InflightRegistry(max_workers=0)
+
+        def boom():
+            raise RuntimeError("nope")
+
+        self.assertEqual(registry.submit("k", lambda: 42).result(), 42)
+        self.assertIsInstance(registry.submit("k", boom).exception(), RuntimeError)
+        self.assertEqual(len(registry), 0)
+
+    def test_queued_runs_start_by_priority_then_age(self):
+        registry = InflightRegistry(max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+        order = []
+
+        def busy():
+            started.set()
+            release.wait(5)
+
+        try:
+            registry.submit("onboarding:busy", busy)
+            self.assertTrue(started.wait(5))
+            for key, priority in [
+                ("onboarding:a", "onboarding"),
+                ("manual:b", "manual_override"),
+                ("onboarding:c", "onboarding"),
+                ("offboarding:d", "offboarding"),
+                ("offboarding:e", "emergency_revocation"),
+            ]:
+                registry.submit(key, order.append, key, priority=priority)
+            queued = [run["key"] for run in registry.snapshot() if run["state"] == "queued"]
+            self.assertEqual(queued, ["offboarding:e", "offboarding:d", "manual:b", "onboarding:a", "onboarding:c"])
+
+            release.set()
+            self.assertTrue(registry.wait(timeout=5))
+            self.assertEqual(order, queued)
+            with self.assertRaises(ValueError):
+                registry.submit("x", lambda: None, priority="whenever")
+        finally:
+            registry.shutdown()
+
+    def test_reserved_worker_runs_revocation_while_onboardings_hold_every_worker(self):
+        registry = InflightRegistry(max_workers=2, reserved_workers=1)
+        release = threading.Event()
+        try:
+            for index in range(4):
+                registry.submit(f"onboarding:{index}", release.wait, 5)
+            revoked = registry.submit("offboarding:x", lambda: "revoked", priority="emergency_revocation")
+            self.assertEqual(revoked.result(timeout=2), "revoked")
+            self.assertEqual(len(registry), 4)
+        finally:
+            release.set()
+            registry.shutdown()
+        self.assertEqual(len(registry), 0)
+
+
+class SchedulerBackgroundRunTests(unittest.TestCase):
+    def test_overdue_departures_are_emergency_revocations(self):
+        user = UserProfile(
+            first_name="Kayla",
+            last_name="Durgee",
+            work_email="kayla.durgee@boom.aero",
+            department="IT",
+            employment_type="Contractor",
+            end_date="2026-03-02",
+            location="US",
+        )
+        morning = effective_at("2026-03-02", "09:00", "US")
+        evening = effective_at("2026-03-02", "18:00", "US")
+        with patch.dict(scheduler.CONFIG, {"OFFBOARDING_EFFECTIVE_TIME": "17:00"}):
+            self.assertEqual(scheduler._offboarding_priority(user, today=date(2026, 3, 1), now=morning), "offboarding")
+            self.assertEqual(scheduler._offboarding_priority(user, today=date(2026, 3, 2), now=morning), "offboarding")
+            self.assertEqual(
+                scheduler._offboarding_priority(user, today=date(2026, 3, 2), now=evening), "emergency_revocation"
+            )
+            self.assertEqual(scheduler._offboarding_priority(user, today=date(2026, 3, 3)), "emergency_revocation")
+
+    def test_departure_priority_uses_the_workers_local_date(self):
+        user = UserProfile(
+            first_name="Kayla",
+            last_name="Durgee",
+            work_email="kayla.durgee@boom.aero",
+            department="IT",
+            employment_type="Contractor",
+            end_date="2026-03-02",
+            location="US",
+        )
+        config = {"OFFBOARDING_EFFECTIVE_TIME": "17:00", "LIFECYCLE_TIMEZONES": "US=Pacific/Pago_Pago"}
+        with patch.dict(scheduler.CONFIG, config):
+            # 2026-03-03 02:00 UTC is still 15:00 on 2026-03-02 in Pago Pago (UTC-11).
+            afternoon = effective_at("2026-03-02", "15:00", "US")
+            self.assertEqual(scheduler._offboarding_priority(user, now=afternoon), "offboarding")
+            self.assertEqual(
+                scheduler._offboarding_priority(user, now=effective_at("2026-03-02", "17:30", "US")), "emergency_revocation"
+            )
+
+    def test_scan_returns_while_run_continues_and_next_scan_skips_it(self):
+        user = UserProfile(
+            first_name="Kayla",
+            last_name="Durgee",
+            work_email="kayla.durgee@boom.aero",
+            department="IT",
+            title="Engineer",
+            employment_type="Salaried, full-time",
+            start_date="2000-01-01",
+            location="US",
+        )
+        trigger = ValidatedTrigger(user, "rippling:onboarding:kayla.durgee@boom.aero", "freshservice:ticket_id:7")
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_onboarding(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return True
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state = scheduler.RunState(state_file=str(Path(temp_dir) / "scheduler_state.json"))
+            registry = InflightRegistry(max_workers=2)
+            with patch.object(scheduler, "scheduler_state", state), patch.object(
+                scheduler, "run_registry", registry
+            ), patch.object(
+                scheduler.trigger_validator, "validate_and_fetch_onboarding_context", return_value=[trigger]
+            ), patch.object(scheduler, "run_onboarding", side_effect=slow_onboarding) as run_onboarding_mock:
+                self.assertEqual(scheduler._process_validated_onboarding(), 1)
+                self.assertTrue(started.wait(5))
+                self.assertEqual(scheduler._process_validated_onboarding(), 0)
+                release.set()
+                self.assertTrue(registry.wait(timeout=5))
+                registry.shutdown()
+
+            run_onboarding_mock.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
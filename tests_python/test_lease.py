@@ -0,0 +1,176 @@
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from servus.core.match_table import MatchTable
+from servus.lease import SchedulerLease
+from servus.models import UserProfile
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
+SPEC = importlib.util.spec_from_file_location("scheduler", SCRIPT_PATH)
+scheduler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(scheduler)
+
+
+class SchedulerLeaseTests(unittest.TestCase):
+    def test_one_holder_at_a_time_and_standby_takes_over_after_expiry(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "lease.db")
+            primary = SchedulerLease(path, "host-a:1", ttl_seconds=15)
+            standby = SchedulerLease(path, "host-b:2", ttl_seconds=15)
+            now = time.time()
+
+            self.assertTrue(primary.try_acquire(now=now))
+            self.assertTrue(primary.held)
+            self.assertFalse(standby.try_acquire(now=now + 5))
+            self.assertFalse(standby.held)
+            self.assertTrue(primary.try_acquire(now=now + 10))
+            self.assertEqual(primary.epoch, 1)
+
+            # Primary stops heartbeating; its last renewal expires at now + 25.
+            self.assertFalse(standby.try_acquire(now=now + 24))
+            self.assertTrue(standby.try_acquire(now=now + 26))
+            self.assertEqual(standby.epoch, 2)
+            self.assertEqual(standby.holder()["holder"], "host-b:2")
+
+            self.assertFalse(primary.try_acquire(now=now + 27))
+            self.assertFalse(primary.held)
+
+    def test_release_hands_over_immediately(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "lease.db")
+            primary = SchedulerLease(path, "host-a:1")
+            standby = SchedulerLease(path, "host-b:2")
+            self.assertTrue(primary.try_acquire())
+            self.assertFalse(standby.try_acquire())
+
+            primary.release()
+            self.assertFalse(primary.held)
+            self.assertTrue(standby.try_acquire())
+            self.assertIsNone(SchedulerLease(os.path.join(temp_dir, "other.db"), "x").holder())
+
+
+class SchedulerStandbyTests(unittest.TestCase):
+    def test_standby_refuses_dispatch_and_active_runs_record_the_instance(self):
+        user = UserProfile(
+            first_name="Kayla",
+            last_name="Durgee",
+            work_email="kayla.durgee@boom.aero",
+            department="IT",
+            employment_type="Salaried, full-time",
+            start_date="2026-03-02",
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "lease.db")
+            primary = SchedulerLease(path, "host-a:1")
+            standby = SchedulerLease(path, "host-b:2")
+            primary.try_acquire()
+            standby.try_acquire()
+            state = scheduler.RunState(state_file=str(Path(temp_dir) / "scheduler_state.json"))
+            work = MagicMock(return_value=True)
+
+            with patch.object(scheduler, "scheduler_state", state), patch.object(scheduler, "scheduler_lease", standby):
+                self.assertFalse(scheduler._dispatch_run("onboarding:k", work))
+                with self.assertRaisesRegex(ValueError, "host-a:1"):
+                    scheduler._control_scan_now({})
+            work.assert_not_called()
+
+            with patch.object(scheduler, "scheduler_state", state), patch.object(scheduler, "scheduler_lease", primary):
+                self.assertTrue(scheduler._dispatch_run("onboarding:k", work))
+                scheduler._record_successful_onboarding(user, "dual_validation", request_id="REQ-1")
+            work.assert_called_once()
+            record = state.get(scheduler.ONBOARDING_SUCCESS_KEY)["kayla.durgee@boom.aero|2026-03-02"]
+            self.assertEqual(record["instance"], "host-a:1")
+
+    def test_stalled_holder_is_fenced_after_takeover(self):
+        user = UserProfile(
+            first_name="Kayla",
+            last_name="Durgee",
+            work_email="kayla.durgee@boom.aero",
+            department="IT",
+            employment_type="Salaried, full-time",
+            start_date="2026-03-02",
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "lease.db")
+            primary = SchedulerLease(path, "host-a:1", ttl_seconds=15)
+            standby = SchedulerLease(path, "host-b:2", ttl_seconds=15)
+            now = time.time()
+            primary.try_acquire(now=now)
+            self.assertTrue(primary.verify())
+
+            # The primary stalls past its TTL; its local clock has not caught up yet.
+            self.assertTrue(standby.try_acquire(now=now + 16))
+            self.assertTrue(primary.held)
+            self.assertFalse(primary.verify())
+            self.assertTrue(standby.verify())
+
+            state = scheduler.RunState(state_file=str(Path(temp_dir) / "scheduler_state.json"))
+            table = MatchTable(os.path.join(temp_dir, "trigger_match_table.json"))
+            state.fence = table.fence = scheduler._lease_fence
+            work = MagicMock(return_value=True)
+            with patch.object(scheduler, "scheduler_state", state), patch.object(scheduler, "scheduler_lease", primary):
+                self.assertTrue(scheduler._dispatch_run("onboarding:k", work))
+                state.set("parked_runs", ["onboarding:k"])
+                table.observe("onboarding", "rippling", "kayla.durgee@boom.aero", "2026-03-02")
+                table.save()
+
+            work.assert_not_called()
+            self.assertIsNone(state.get("parked_runs"))
+            self.assertFalse(os.path.exists(os.path.join(temp_dir, "trigger_match_table.json")))
+
+    def test_lease_lost_mid_run_still_records_completion_and_next_holder_skips_it(self):
+        user = UserProfile(
+            first_name="Kayla",
+            last_name="Durgee",
+            work_email="kayla.durgee@boom.aero",
+            department="IT",
+            employment_type="Salaried, full-time",
+            start_date="2026-03-02",
+        )
+        trigger = scheduler.ValidatedTrigger(user, "rippling:onboarding:k", "freshservice:ticket_id:7")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "lease.db")
+            state_file = str(Path(temp_dir) / "scheduler_state.json")
+            primary = SchedulerLease(path, "host-a:1", ttl_seconds=15)
+            standby = SchedulerLease(path, "host-b:2", ttl_seconds=15)
+            now = time.time()
+            primary.try_acquire(now=now)
+            state = scheduler.RunState(state_file=state_file)
+            state.fence = scheduler._lease_fence
+
+            def provision_then_stall():
+                # The standby takes over while this run's side effects are under way.
+                standby.try_acquire(now=now + 16)
+                scheduler._record_successful_onboarding(user, "dual_validation", request_id="REQ-1")
+                return True
+
+            with patch.object(scheduler, "scheduler_state", state), patch.object(scheduler, "scheduler_lease", primary):
+                self.assertTrue(scheduler._dispatch_run("onboarding:k", provision_then_stall))
+            self.assertFalse(primary.verify())
+
+            record = scheduler.RunState(state_file=state_file).get(scheduler.ONBOARDING_SUCCESS_KEY)[
+                "kayla.durgee@boom.aero|2026-03-02"
+            ]
+            self.assertEqual((record["instance"], record["epoch"]), ("host-a:1", 1))
+
+            next_state = scheduler.RunState(state_file=state_file)
+            next_state.fence = scheduler._lease_fence
+            work = MagicMock(return_value=True)
+            with patch.object(scheduler, "scheduler_state", next_state), patch.object(
+                scheduler, "scheduler_lease", standby
+            ), patch.object(
+                scheduler.trigger_validator, "validate_and_fetch_onboarding_context", return_value=[trigger]
+            ), patch.object(scheduler, "_execute_validated_onboarding", work):
+                self.assertEqual(scheduler._process_validated_onboarding(), 0)
+            work.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from servus import metrics
+from servus.config import CONFIG
+from servus.core import trigger_validator
+from servus.core.match_table import MatchTable, match_table
+from servus.models import UserProfile
+from servus.state import RunState
+
+
+def _profile(email, start_date="2026-03-02"):
+    return UserProfile(
+        first_name="Casey",
+        last_name="Example",
+        work_email=email,
+        personal_email=None,
+        department="IT",
+        title="Engineer",
+        employment_type="Salaried, full-time",
+        start_date=start_date,
+        location="US",
+    )
+
+
+class MatchTableTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / "trigger_match_table.json")
+        metrics.REGISTRY.reset()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_match_resolves_when_second_side_arrives_and_reports_wait(self):
+        table = MatchTable(self.path)
+        self.assertEqual(table.sync("onboarding", "rippling", {"Ada@boom.aero": "2026-03-02"}, now=1000.0), [])
+        table.sync("onboarding", "rippling", {"ada@boom.aero": "2026-03-02"}, now=1300.0)
+
+        self.assertEqual(table.waiting("onboarding", "rippling", now=1600.0), {"ada@boom.aero": 600.0})
+        self.assertEqual(metrics.TRIGGER_MATCH_BACKLOG.value(kind="onboarding", side="rippling"), 1)
+        table.save()
+
+        reloaded = MatchTable(self.path)
+        self.assertTrue(reloaded.observe("onboarding", "freshservice", "ada@boom.aero", "501", now=1600.0))
+        self.assertEqual(reloaded.ref("onboarding", "ada@boom.aero", "freshservice"), "501")
+        self.assertEqual(reloaded.matched("onboarding"), ["ada@boom.aero"])
+        self.assertEqual(reloaded.waiting("onboarding", "rippling", now=1700.0), {})
+        self.assertEqual(metrics.TRIGGER_MATCH_WAIT.count(kind="onboarding", side="rippling"), 1)
+        self.assertEqual(metrics.TRIGGER_MATCH_BACKLOG.value(kind="onboarding", side="rippling"), 0)
+
+    def test_side_dropping_out_of_feed_unmatches_and_stale_entries_prune(self):
+        table = MatchTable()
+        table.sync("offboarding", "rippling", {"bo@boom.aero": "2026-03-02"}, now=0.0)
+        self.assertEqual(table.sync("offboarding", "freshservice", {"bo@boom.aero": "9"}, now=10.0), ["bo@boom.aero"])
+
+        table.sync("offboarding", "freshservice", {}, now=20.0)
+        self.assertEqual(table.matched("offboarding"), [])
+        self.assertEqual(table.waiting("offboarding", "rippling", now=20.0), {"bo@boom.aero": 20.0})
+
+        table.observe("offboarding", "freshservice", "old@boom.aero", "7", now=30.0)
+        self.assertEqual(table.prune(now=30.0 + 3 * 24 * 3600), 2)
+        self.assertIsNone(table.get("offboarding", "bo@boom.aero"))
+
+    def test_sync_keeps_event_observed_refs_for_the_grace_window(self):
+        table = MatchTable()
+        table.sync("onboarding", "rippling", {"ada@boom.aero": "2026-03-02"}, now=0.0)
+        self.assertTrue(table.observe("onboarding", "freshservice", "ada@boom.aero", "501", now=10.0))
+
+        # The poll's listing does not include ticket 501 yet.
+        table.sync("onboarding", "freshservice", {"bo@boom.aero": "502"}, now=20.0)
+        self.assertEqual(table.ref("onboarding", "ada@boom.aero", "freshservice"), "501")
+        self.assertEqual(table.matched("onboarding"), ["ada@boom.aero"])
+
+        with patch.dict(CONFIG, {"TRIGGER_MATCH_EVENT_GRACE_MINUTES": 5}):
+            table.sync("onboarding", "freshservice", {"bo@boom.aero": "502"}, now=10.0 + 6 * 60)
+        self.assertIsNone(table.ref("onboarding", "ada@boom.aero", "freshservice"))
+        self.assertEqual(table.matched("onboarding"), [])
+
+    def test_sync_listing_an_observed_side_clears_the_event_flag(self):
+        table = MatchTable()
+        table.observe("offboarding", "freshservice", "bo@boom.aero", "9", now=0.0)
+        table.sync("offboarding", "freshservice", {"bo@boom.aero": "9"}, now=10.0)
+        self.assertNotIn("observed", table.get("offboarding", "bo@boom.aero")["freshservice"])
+
+        # From here on the feed owns the side: dropping out of it removes it at once.
+        table.sync("offboarding", "freshservice", {}, now=20.0)
+        self.assertIsNone(table.get("offboarding", "bo@boom.aero"))
+
+
+class TriggerValidatorMatchTableTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state = RunState(state_file=str(Path(self.tmp.name) / "scheduler_state.json"))
+        self.config_patch = patch.dict(CONFIG, {"RIPPLING_DELTA_SYNC_ENABLED": False})
+        self.config_patch.start()
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.tmp.cleanup()
+
+    @patch("servus.core.trigger_validator.freshservice.ticket_cache", return_value=None)
+    @patch("servus.core.trigger_validator.freshservice.map_ticket_ids_by_email")
+    @patch("servus.core.trigger_validator.freshservice.scan_for_onboarding_tickets", return_value=[])
+    @patch("servus.core.trigger_validator.RipplingClient.get_new_hires")
+    def test_waiting_candidate_warns_once_then_validates_when_ticket_lands(
+        self, mock_get_new_hires, _mock_scan, mock_map, _mock_cache
+    ):
+        mock_get_new_hires.return_value = [_profile("casey.example@boom.aero")]
+        mock_map.return_value = {}
+
+        with self.assertLogs("servus.trigger_validator", level="INFO") as first:
+            self.assertEqual(trigger_validator.validate_and_fetch_onboarding_context(state=self.state), [])
+        with self.assertLogs("servus.trigger_validator", level="INFO") as second:
+            self.assertEqual(trigger_validator.validate_and_fetch_onboarding_context(state=self.state), [])
+        self.assertTrue(any("MISMATCH" in line for line in first.output))
+        self.assertFalse(any("MISMATCH" in line for line in second.output))
+        self.assertTrue(any("still waiting on Freshservice" in line for line in second.output))
+
+        mock_map.return_value = {"casey.example@boom.aero": "777"}
+        validated = trigger_validator.validate_and_fetch_onboarding_context(state=self.state)
+
+        self.assertEqual([match.confirmation_source_b for match in validated], ["freshservice:ticket_id:777"])
+        self.assertTrue((Path(self.tmp.name) / "trigger_match_table.json").exists())
+
+    @patch("servus.core.trigger_validator.freshservice.ticket_cache", return_value=None)
+    @patch("servus.core.trigger_validator.freshservice.map_ticket_ids_by_email")
+    @patch("servus.core.trigger_validator.freshservice.scan_for_onboarding_tickets", return_value=["888"])
+    @patch("servus.core.trigger_validator.RipplingClient.get_new_hires", return_value=[])
+    def test_tickets_without_rippling_candidates_still_enter_the_backlog(self, _mock_hires, _mock_scan, mock_map, _mock_cache):
+        mock_map.return_value = {"dana.example@boom.aero": "888"}
+
+        self.assertEqual(trigger_validator.validate_and_fetch_onboarding_context(state=self.state), [])
+
+        table = match_table(self.state)
+        self.assertEqual(list(table.waiting("onboarding", "freshservice")), ["dana.example@boom.aero"])
+
+    @patch("servus.core.trigger_validator.freshservice.ticket_cache", return_value=None)
+    @patch("servus.core.trigger_validator.freshservice.map_ticket_ids_by_email")
+    @patch("servus.core.trigger_validator.freshservice.scan_for_onboarding_tickets")
+    @patch("servus.core.trigger_validator.RipplingClient.get_new_hires")
+    def test_failed_feed_keeps_its_side_instead_of_syncing_empty(self, mock_hires, mock_scan, mock_map, _mock_cache):
+        mock_hires.return_value = [_profile("casey.example@boom.aero")]
+        mock_scan.return_value = ["777"]
+        mock_map.return_value = {"casey.example@boom.aero": "777"}
+        self.assertEqual(len(trigger_validator.validate_and_fetch_onboarding_context(state=self.state)), 1)
+
+        # Freshservice errors: the match survives and Rippling still drives the trigger.
+        mock_scan.return_value = None
+        validated = trigger_validator.validate_and_fetch_onboarding_context(state=self.state)
+        self.assertEqual([match.confirmation_source_b for match in validated], ["freshservice:ticket_id:777"])
+
+        # Rippling errors: its side is kept for the next successful scan.
+        mock_hires.return_value = None
+        mock_scan.return_value = ["777"]
+        self.assertEqual(trigger_validator.validate_and_fetch_onboarding_context(state=self.state), [])
+        self.assertEqual(match_table(self.state).matched("onboarding"), ["casey.example@boom.aero"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import tempfile
+import unittest
+import urllib.request
+from pathlib import Path
+
+from servus import metrics, tracing
+
+
+class MetricsRenderTests(unittest.TestCase):
+    def test_counter_and_histogram_render_prometheus_text(self):
+        registry = metrics.MetricsRegistry()
+        calls = registry.counter("demo_calls_total", "Demo calls.", ["integration"])
+        latency = registry.histogram("demo_latency_seconds", "Demo latency.", buckets=(0.1, 1.0))
+
+        calls.inc(integration="okta")
+        calls.inc(2, integration="okta")
+        latency.observe(0.05)
+        latency.observe(0.5)
+
+        text = registry.render()
+        self.assertIn("# TYPE demo_calls_total counter", text)
+        self.assertIn('demo_calls_total{integration="okta"} 3', text)
+        self.assertIn('demo_latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('demo_latency_seconds_bucket{le="1"} 2', text)
+        self.assertIn('demo_latency_seconds_bucket{le="+Inf"} 2', text)
+        self.assertIn("demo_latency_seconds_count 2", text)
+
+    def test_unknown_label_is_rejected(self):
+        registry = metrics.MetricsRegistry()
+        calls = registry.counter("demo_total", "Demo.", ["integration"])
+        with self.assertRaises(ValueError):
+            calls.inc(workflow="x")
+
+    def test_label_values_are_escaped(self):
+        registry = metrics.MetricsRegistry()
+        gauge = registry.gauge("demo_gauge", "Demo.", ["name"])
+        gauge.set(1, name='a"b')
+        self.assertIn('demo_gauge{name="a\\"b"} 1', registry.render())
+
+
+class MetricsSpanListenerTests(unittest.TestCase):
+    def test_spans_feed_step_and_outbound_metrics(self):
+        before_calls = metrics.OUTBOUND_CALLS.value(integration="unit_test_api")
+        before_errors = metrics.OUTBOUND_ERRORS.value(integration="unit_test_api")
+        before_steps = metrics.STEP_DURATION.count(action="unit.test_action")
+
+        with tracing.span("workflow.step", attributes={"action": "unit.test_action"}):
+            with tracing.span("http unit_test_api", kind="http", attributes={"integration": "unit_test_api"}):
+                pass
+            with tracing.span("http unit_test_api", kind="http", attributes={"integration": "unit_test_api"}) as bad:
+                bad.set_status(tracing.STATUS_ERROR, "HTTP 500")
+
+        self.assertEqual(metrics.OUTBOUND_CALLS.value(integration="unit_test_api"), before_calls + 2)
+        self.assertEqual(metrics.OUTBOUND_ERRORS.value(integration="unit_test_api"), before_errors + 1)
+        self.assertEqual(metrics.STEP_DURATION.count(action="unit.test_action"), before_steps + 1)
+
+
+class MetricsExportTests(unittest.TestCase):
+    def test_textfile_written_atomically(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / "collector" / "servus.prom"
+            self.assertTrue(metrics.write_textfile(str(target)))
+            content = target.read_text(encoding="utf-8")
+            self.assertIn("servus_scans_total", content)
+            self.assertEqual([p.name for p in target.parent.iterdir()], ["servus.prom"])
+
+    def test_http_endpoint_serves_metrics(self):
+        server = metrics.start_http_server(0)
+        try:
+            port = server.server_port
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+                body = resp.read().decode("utf-8")
+                self.assertEqual(resp.status, 200)
+            self.assertIn("servus_outbound_calls_total", body)
+        finally:
+            metrics.stop_http_server()
+
+
+if __name__ == "__main__":
+    unittest.main()
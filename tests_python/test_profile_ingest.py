@@ -0,0 +1,51 @@
+import unittest
+
+from servus.models import UserProfile
+from servus.profile_ingest import ProfileIngestor
+
+
+def _row(index, **overrides):
+    row = {
+        "first_name": "Crew",
+        "last_name": f"Member{index}",
+        "work_email": f"crew.member{index}@boom.aero",
+        "department": " Flight Test ",
+        "employment_type": "Salaried, full-time",
+        "start_date": "2026-03-02",
+    }
+    row.update(overrides)
+    return row
+
+
+class ProfileIngestorTests(unittest.TestCase):
+    def test_page_is_validated_in_bulk_and_unchanged_rows_are_reused(self):
+        ingestor = ProfileIngestor(page_size=50)
+        rows = [_row(index) for index in range(120)]
+
+        first = ingestor.ingest(rows)
+        self.assertEqual((first.validated, first.reused, first.rejected), (120, 0, 0))
+        self.assertIsInstance(first.profiles[0], UserProfile)
+        self.assertEqual(first.profiles[0].department, "Flight Test")
+        self.assertGreater(first.rows_per_second, 0)
+
+        rows[5] = _row(5, title="Lead")
+        second = ingestor.ingest(rows)
+        self.assertEqual((second.validated, second.reused), (1, 119))
+        self.assertEqual(second.fresh, [5])
+        self.assertEqual(second.profiles[5].title, "Lead")
+
+        second.profiles[0].title = "Mutated"
+        self.assertIsNone(ingestor.ingest(rows).profiles[0].title)
+
+    def test_bad_row_is_rejected_without_failing_the_page(self):
+        rows = [_row(0), _row(1, work_email="not-an-email"), _row(2, first_name=None)]
+        result = ProfileIngestor().ingest(rows)
+
+        self.assertEqual(result.rejected, 2)
+        self.assertIsNotNone(result.profiles[0])
+        self.assertIsNone(result.profiles[1])
+        self.assertIsNone(result.profiles[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
+import tempfile
+import threading
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
-from servus.integrations.rippling import RipplingClient, _response_detail
+from servus.config import CONFIG
+from servus.fake_services import FakeServices
+from servus.integrations.rippling import RipplingClient, _response_detail, roster_snapshot, worker_directory
+from servus.state import RunState
 
 
 class _FakeResponse:
@@ -76,10 +83,214 @@ class RipplingClientTests(unittest.TestCase):
         self.assertEqual(profile.preferred_first_name, "Kayla")
         self.assertEqual(profile.location, "US")
 
+    def test_profiles_come_from_expanded_list_payload_with_detail_fallback_for_sparse(self):
+        client = RipplingClient()
+        complete = {
+            "id": "w1",
+            "work_email": "kayla.durgee@boom.aero",
+            "department": {"name": "IT"},
+            "employment_type": {"label": "Salaried, full-time"},
+            "manager": {"work_email": "boss@boom.aero"},
+            "user": {"name": {"given_name": "Kayla", "family_name": "Durgee"}},
+            "title": "Engineer",
+        }
+        sparse = {"id": "w2", "work_email": "ada.lovelace@boom.aero"}
+
+        with patch.object(client, "_build_profile", return_value="detail-profile") as mock_build:
+            profiles = client._build_profiles([complete, sparse])
+
+        self.assertEqual(profiles[0].first_name, "Kayla")
+        self.assertEqual(profiles[0].manager_email, "boss@boom.aero")
+        self.assertEqual(profiles[1], "detail-profile")
+        mock_build.assert_called_once_with("w2")
+
     def test_response_detail_prefers_detail_field(self):
         detail = _response_detail(_FakeResponse(payload={"detail": "scope missing"}))
         self.assertEqual(detail, "scope missing")
 
+    def test_build_profiles_is_bounded_ordered_and_isolates_failures(self):
+        client = RipplingClient()
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def fake_build(worker_id):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+            if worker_id == "w3":
+                raise RuntimeError("boom")
+            return f"profile-{worker_id}"
+
+        workers = [{"id": f"w{index}"} for index in range(8)]
+        with patch.dict(CONFIG, {"RIPPLING_HYDRATION_CONCURRENCY": 3}), \
+                patch.object(client, "_build_profile", side_effect=fake_build):
+            profiles = client._build_profiles(workers)
+
+        self.assertEqual(profiles[:3], ["profile-w0", "profile-w1", "profile-w2"])
+        self.assertIsNone(profiles[3])
+        self.assertEqual(profiles[-1], "profile-w7")
+        self.assertEqual(active["peak"], 3)
+
+
+class WorkerDirectoryTests(unittest.TestCase):
+    def setUp(self):
+        self.fakes = FakeServices(seed=5).start()
+        self.config_patch = patch.dict(CONFIG, self.fakes.config_overrides())
+        self.config_patch.start()
+        self.client = RipplingClient()
+        self.directory = worker_directory(self.client.base_url)
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.fakes.stop()
+
+    def test_lookup_after_refresh_is_served_from_memory(self):
+        worker = self.fakes.add_worker("Kayla", "Durgee", department="Flight Test")
+        self.fakes.add_worker("Ada", "Lovelace")
+        self.assertEqual(self.directory.refresh(self.client), 2)
+
+        first = self.client.find_user_by_email("KAYLA.DURGEE@boom.aero")
+        self.fakes.reset_counts()
+        second = self.client.find_user_by_email("kayla.durgee@boom.aero")
+
+        self.assertEqual(first.department, "Flight Test")
+        self.assertEqual(second.work_email, worker["work_email"])
+        self.assertEqual(self.fakes.call_counts["rippling"], 0)
+        second.department = "Mutated"
+        self.assertEqual(self.client.find_user_by_email("kayla.durgee@boom.aero").department, "Flight Test")
+
+    def test_refresh_pulls_only_updated_workers_and_drops_stale_profiles(self):
+        worker = self.fakes.add_worker("Kayla", "Durgee", title="Engineer")
+        self.directory.refresh(self.client)
+        self.assertEqual(self.client.find_user_by_email("kayla.durgee@boom.aero").title, "Engineer")
+
+        self.fakes.workers[worker["id"]].update({"title": "Lead Engineer", "updated_at": "2999-01-01T00:00:00Z"})
+        self.assertEqual(self.directory.refresh(self.client), 1)
+        self.assertEqual(self.directory.watermark, "2999-01-01T00:00:00Z")
+        self.assertEqual(self.directory.refresh(self.client), 0)
+        self.assertEqual(self.client.find_user_by_email("kayla.durgee@boom.aero").title, "Lead Engineer")
+
+    def test_scan_hydrates_in_parallel_and_warms_directory(self):
+        for index in range(4):
+            self.fakes.add_worker("Hire", f"N{index}", start_date="2026-03-02")
+        self.fakes.add_worker("Other", "Person", start_date="2026-04-01")
+        self.fakes.set_behavior("rippling", latency_ms=50)
+
+        started = time.perf_counter()
+        hires = self.client.get_new_hires("2026-03-02")
+        elapsed = time.perf_counter() - started
+        self.fakes.reset_counts()
+
+        self.assertEqual([p.last_name for p in hires], ["N3", "N2", "N1", "N0"])
+        self.assertLess(elapsed, 0.05 * 9)
+        self.assertEqual(self.client.find_user_by_email("hire.n2@boom.aero").last_name, "N2")
+        self.assertEqual(self.fakes.call_counts["rippling"], 0)
+
+    def test_miss_falls_back_to_api_and_is_cached(self):
+        self.fakes.add_worker("Grace", "Hopper")
+        profile = self.client.find_user_by_email("grace.hopper@boom.aero")
+        self.fakes.reset_counts()
+
+        self.assertEqual(self.client.find_user_by_email("grace.hopper@boom.aero").last_name, profile.last_name)
+        self.assertEqual(self.fakes.call_counts["rippling"], 0)
+        self.assertIsNone(self.client.find_user_by_email("nobody@boom.aero"))
+
+    def test_name_index_matches_normalized_and_preferred_names(self):
+        kayla = self.fakes.add_worker("Kayla", "Durgee")
+        jose = self.fakes.add_worker("José", "O'Neil", email_domain="boom.aero")
+        self.fakes.rippling_users[kayla["user_id"]]["name"]["preferred_given_name"] = "Kay"
+        self.directory.refresh(self.client)
+
+        self.assertEqual(self.directory.match_name("kay durgee"), [kayla["work_email"]])
+        self.assertEqual(self.directory.match_name("Kayla Marie Durgee"), [kayla["work_email"]])
+        self.assertEqual(self.directory.match_name("Jose ONeil"), [jose["work_email"]])
+        self.assertEqual(self.directory.match_name("Nobody Here"), [])
+
+    def test_name_index_reports_ambiguity_and_follows_renames(self):
+        first = self.fakes.add_worker("Sam", "Lee")
+        second = self.fakes.add_worker("Samuel", "Lee")
+        self.fakes.rippling_users[second["user_id"]]["name"]["preferred_given_name"] = "Sam"
+        self.directory.refresh(self.client)
+        self.assertEqual(self.directory.match_name("Sam Lee"), sorted([first["work_email"], second["work_email"]]))
+
+        self.fakes.rippling_users[second["user_id"]]["name"]["preferred_given_name"] = None
+        self.fakes.workers[second["id"]]["updated_at"] = "2999-01-01T00:00:00Z"
+        self.directory.refresh(self.client)
+
+        self.assertEqual(self.directory.match_name("Sam Lee"), [first["work_email"]])
+        self.assertEqual(self.directory.match_name("Samuel Lee"), [second["work_email"]])
+
+    def test_email_change_drops_the_previous_email(self):
+        worker = self.fakes.add_worker("Kayla", "Durgee")
+        self.directory.refresh(self.client)
+        self.assertIsNotNone(self.client.find_user_by_email("kayla.durgee@boom.aero"))
+
+        self.fakes.workers[worker["id"]].update(
+            {"work_email": "kayla.smith@boom.aero", "updated_at": "2999-01-01T00:00:00Z"}
+        )
+        self.assertEqual(self.directory.refresh(self.client), 1)
+
+        self.assertNotIn("kayla.durgee@boom.aero", self.directory)
+        self.assertIn("kayla.smith@boom.aero", self.directory)
+        self.assertIsNone(self.directory.lookup("kayla.durgee@boom.aero"))
+        self.assertEqual(len(self.directory), 1)
+
+
+class RosterSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fakes = FakeServices(seed=9).start()
+        self.config_patch = patch.dict(CONFIG, self.fakes.config_overrides())
+        self.config_patch.start()
+        self.state = RunState(state_file=str(Path(self.tmp.name) / "scheduler_state.json"))
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.fakes.stop()
+        self.tmp.cleanup()
+
+    def test_delta_sync_sees_changes_beyond_newest_page(self):
+        workers = [self.fakes.add_worker("Crew", f"M{index}", start_date="2025-01-01") for index in range(120)]
+        for index, worker in enumerate(workers):
+            worker["updated_at"] = f"2025-01-01T{index // 60:02d}:{index % 60:02d}:00Z"
+        client = RipplingClient(roster=roster_snapshot(self.state))
+        self.assertEqual(client.get_new_hires("2026-05-04"), [])
+        self.assertEqual(len(client.roster), 120)
+        self.assertEqual(self.state.get("rippling_roster_watermark"), client.roster.watermark)
+
+        # The oldest worker is outside the newest-100 page but changes today.
+        self.fakes.workers[workers[0]["id"]].update({"start_date": "2026-05-04", "updated_at": "2999-01-01T00:00:00Z"})
+        self.fakes.reset_counts()
+        hires = RipplingClient(roster=roster_snapshot(self.state)).get_new_hires("2026-05-04")
+
+        self.assertEqual([profile.last_name for profile in hires], ["M0"])
+        # One delta listing; the profile is built from the expanded list payload.
+        self.assertEqual(self.fakes.call_counts["rippling"], 1)
+
+    def test_sync_preloads_directory_profiles(self):
+        self.fakes.add_worker("Grace", "Hopper", department="Avionics")
+        RipplingClient(roster=roster_snapshot(self.state)).get_new_hires("2026-05-04")
+        self.fakes.reset_counts()
+
+        profile = RipplingClient().find_user_by_email("grace.hopper@boom.aero")
+        self.assertEqual(profile.department, "Avionics")
+        self.assertEqual(self.fakes.call_counts["rippling"], 0)
+
+    def test_snapshot_reloads_from_disk_and_resyncs_on_watermark_mismatch(self):
+        self.fakes.add_worker("Ada", "Lovelace", end_date="2026-05-04")
+        RipplingClient(roster=roster_snapshot(self.state)).get_departures("2026-05-04")
+
+        reloaded = RunState(state_file=self.state.state_file)
+        snapshot = roster_snapshot(reloaded)
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot.watermark, self.state.get("rippling_roster_watermark"))
+
+        reloaded.set("rippling_roster_watermark", None)
+        self.assertIsNone(roster_snapshot(RunState(state_file=self.state.state_file)).watermark)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,61 @@
+import importlib.util
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from servus.config import CONFIG
+from servus.fake_services import FakeServices
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
+SPEC = importlib.util.spec_from_file_location("scheduler", SCRIPT_PATH)
+scheduler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(scheduler)
+
+
+class ScanPhaseTests(unittest.TestCase):
+    def test_phases_run_concurrently_and_failures_stay_isolated(self):
+        def slow(result):
+            def _phase():
+                time.sleep(0.2)
+                return result
+            return _phase
+
+        def broken():
+            time.sleep(0.2)
+            raise RuntimeError("manual queue unreadable")
+
+        started = time.perf_counter()
+        results = scheduler._run_scan_phases({"onboarding": slow(2), "offboarding": slow(1), "manual_override": broken})
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(results["onboarding"], (2, None))
+        self.assertEqual(results["offboarding"], (1, None))
+        self.assertIsInstance(results["manual_override"][1], RuntimeError)
+
+        with patch.dict(scheduler.CONFIG, {"SCHEDULER_PARALLEL_PHASES": False}):
+            serial = scheduler._run_scan_phases({"onboarding": slow(2), "offboarding": slow(1)})
+        self.assertEqual(serial, {"onboarding": (2, None), "offboarding": (1, None)})
+
+    def test_scan_phases_share_one_rippling_worker_listing(self):
+        with tempfile.TemporaryDirectory() as temp_dir, FakeServices(seed=12) as fakes:
+            for index in range(3):
+                fakes.add_worker("Crew", f"M{index}", start_date="2020-01-01")
+            state = scheduler.RunState(state_file=str(Path(temp_dir) / "scheduler_state.json"))
+            override_csv = str(Path(temp_dir) / "manual_onboarding_overrides.csv")
+            scheduler.ensure_override_csv(override_csv)
+            fakes.reset_counts()
+            with patch.dict(CONFIG, fakes.config_overrides()), patch.object(
+                scheduler, "scheduler_state", state
+            ), patch.object(scheduler, "OVERRIDE_CSV_PATH", override_csv):
+                self.assertEqual(scheduler.job_scan_dual_validation(), 0)
+
+            self.assertEqual(fakes.call_counts["rippling"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
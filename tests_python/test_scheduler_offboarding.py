@@ -2,11 +2,13 @@ import csv
 import importlib.util
 import tempfile
 import unittest
+from datetime import date
 from pathlib import Path
 from unittest.mock import patch
 
 from servus.core.trigger_validator import ValidatedTrigger
 from servus.models import UserProfile
+from servus.work_queue import SQLiteWorkQueue
 
 
 SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
@@ -153,6 +155,90 @@ class SchedulerOffboardingTests(unittest.TestCase):
             self.assertEqual(rows[0]["status"], "PENDING")
             run_offboarding_mock.assert_not_called()
 
+    def test_live_departure_waits_for_end_of_day_timer(self):
+        validated = _validated_departure(email="timer.user@boom.aero", end_date="2999-01-01", ticket_id="144")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pending_csv = str(Path(temp_dir) / "pending_offboards.csv")
+            state = scheduler.RunState(state_file=str(Path(temp_dir) / "scheduler_state.json"))
+            with patch.object(scheduler, "PENDING_OFFBOARD_CSV_PATH", pending_csv), patch.object(
+                scheduler, "scheduler_state", state
+            ), patch.dict(
+                scheduler.CONFIG,
+                {"OFFBOARDING_EXECUTION_ENABLED": True, "OFFBOARDING_EFFECTIVE_TIME": "17:00"},
+                clear=False,
+            ), patch.object(
+                scheduler.trigger_validator,
+                "validate_and_fetch_offboarding_context",
+                return_value=[validated],
+            ), patch.object(
+                scheduler,
+                "run_offboarding",
+                return_value=True,
+            ) as run_offboarding_mock:
+                scheduler._process_validated_offboarding()
+                scheduler._process_validated_offboarding()
+                queue = scheduler.timer_queue(state)
+                self.assertEqual(len(queue), 1)
+                self.assertEqual(self._read_rows(pending_csv)[0]["status"], "PENDING")
+                run_offboarding_mock.assert_not_called()
+
+                due = scheduler.effective_at("2999-01-01", "17:00", "US")
+                self.assertEqual(scheduler._run_due_timers(now=due - 1), 0)
+                self.assertEqual(scheduler._run_due_timers(now=due), 1)
+
+            run_offboarding_mock.assert_called_once()
+            self.assertEqual(self._read_rows(pending_csv), [])
+            self.assertEqual(len(queue), 0)
+
+    def test_same_day_departure_past_its_end_time_is_dispatched_as_emergency(self):
+        # UTC+14: midnight on the host's "today" has already passed there.
+        validated = _validated_departure(email="late.user@boom.aero", end_date=date.today().isoformat(), ticket_id="150")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pending_csv = str(Path(temp_dir) / "pending_offboards.csv")
+            with patch.object(scheduler, "PENDING_OFFBOARD_CSV_PATH", pending_csv), patch.dict(
+                scheduler.CONFIG,
+                {
+                    "OFFBOARDING_EXECUTION_ENABLED": True,
+                    "OFFBOARDING_EFFECTIVE_TIME": "00:00",
+                    "LIFECYCLE_TIMEZONES": "US=Pacific/Kiritimati",
+                },
+                clear=False,
+            ), patch.object(
+                scheduler.trigger_validator,
+                "validate_and_fetch_offboarding_context",
+                return_value=[validated],
+            ), patch.object(scheduler, "_dispatch_run", return_value=True) as dispatch_mock:
+                self.assertEqual(scheduler._process_validated_offboarding(), 1)
+
+            self.assertEqual(dispatch_mock.call_args.kwargs["priority"], "emergency_revocation")
+
+    def test_departure_claimed_by_a_worker_is_not_restaged_or_republished(self):
+        validated = _validated_departure(email="claimed.user@boom.aero", ticket_id="151")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pending_csv = str(Path(temp_dir) / "pending_offboards.csv")
+            queue = SQLiteWorkQueue(str(Path(temp_dir) / "work_queue.db"))
+            key = scheduler._run_key("offboarding", validated.user_profile)
+            queue.publish("validated_offboarding", key, {}, priority="offboarding")
+            queue.claim("host-a/worker-0", 60)
+            with patch.object(scheduler, "PENDING_OFFBOARD_CSV_PATH", pending_csv), patch.object(
+                scheduler, "work_queue", queue
+            ), patch.dict(
+                scheduler.CONFIG,
+                {"OFFBOARDING_EXECUTION_ENABLED": True},
+                clear=False,
+            ), patch.object(
+                scheduler.trigger_validator,
+                "validate_and_fetch_offboarding_context",
+                return_value=[validated],
+            ), patch.object(scheduler, "_stage_pending_offboarding") as stage_mock:
+                self.assertEqual(scheduler._process_validated_offboarding(), 0)
+
+            stage_mock.assert_not_called()
+            self.assertEqual(queue.stats(), {"backend": "sqlite", "claimed": 1})
+
 
 if __name__ == "__main__":
     unittest.main()
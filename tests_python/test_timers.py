@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from servus.config import CONFIG
+from servus.timers import TimerQueue, effective_at
+
+
+class EffectiveTimeTests(unittest.TestCase):
+    def test_effective_time_is_local_to_worker_location(self):
+        with patch.dict(CONFIG, {"LIFECYCLE_TIMEZONES": "US=America/Denver,GB=Europe/London"}):
+            denver = effective_at("2026-03-13", "17:00", "US")
+            london = effective_at("2026-03-13", "17:00", "gb")
+            winter = effective_at("2026-01-13", "17:00", "US")
+
+        self.assertEqual(datetime.fromtimestamp(denver, tz=timezone.utc).isoformat(), "2026-03-13T23:00:00+00:00")
+        self.assertEqual(datetime.fromtimestamp(london, tz=timezone.utc).isoformat(), "2026-03-13T17:00:00+00:00")
+        self.assertEqual(datetime.fromtimestamp(winter, tz=timezone.utc).isoformat(), "2026-01-14T00:00:00+00:00")
+        self.assertIsNone(effective_at("someday", "17:00", "US"))
+
+
+class TimerQueueTests(unittest.TestCase):
+    def test_timers_pop_in_due_order_and_rescheduling_replaces(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "lifecycle_timers.json")
+            queue = TimerQueue(path)
+            queue.schedule("offboarding:a@boom.aero", 300, "offboarding", {"n": 1})
+            queue.schedule("onboarding:b@boom.aero", 100, "onboarding", {"n": 2})
+            queue.schedule("offboarding:a@boom.aero", 200, "offboarding", {"n": 3})
+            self.assertFalse(queue.schedule("onboarding:b@boom.aero", 100, "onboarding", {"n": 2}))
+
+            reloaded = TimerQueue(path)
+            self.assertEqual(reloaded.next_due(), 100)
+            self.assertEqual(reloaded.pop_due(now=50), [])
+            self.assertEqual([timer["payload"]["n"] for timer in reloaded.pop_due(now=1000)], [2, 3])
+            self.assertEqual(len(TimerQueue(path)), 0)
+
+    def test_cancelled_timer_never_fires(self):
+        queue = TimerQueue()
+        queue.schedule("onboarding:c@boom.aero", 10, "onboarding", {})
+        self.assertTrue(queue.cancel("onboarding:c@boom.aero"))
+        self.assertEqual(queue.pop_due(now=100), [])
+        self.assertIsNone(queue.next_due())
+
+
+if __name__ == "__main__":
+    unittest.main()
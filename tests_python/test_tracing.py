@@ -0,0 +1,133 @@
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from servus import metrics, tracing
+from servus.orchestrator import Orchestrator
+from servus.state import RunState
+from servus.workflow import Workflow, WorkflowStep
+
+
+class _ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span.to_dict())
+
+
+class _QuietNotifier:
+    def allow_start_notification(self):
+        return False
+
+    def allow_step_notifications(self):
+        return False
+
+    def notify_run_summary(self, *args, **kwargs):
+        pass
+
+
+class _DummyProfile:
+    work_email = "kayla.durgee@boom.aero"
+
+
+class TracingTests(unittest.TestCase):
+    def setUp(self):
+        self.exporter = _ListExporter()
+        tracing.set_exporter(self.exporter)
+
+    def tearDown(self):
+        tracing.set_exporter(None)
+
+    def test_child_spans_inherit_trace_and_request_id(self):
+        with tracing.span("workflow.run", attributes={"request_id": "ONB-140"}) as root:
+            with tracing.span("workflow.step") as child:
+                pass
+
+        self.assertEqual(child.trace_id, root.trace_id)
+        self.assertEqual(child.parent_id, root.span_id)
+        self.assertEqual(child.request_id, "ONB-140")
+        self.assertEqual([item["name"] for item in self.exporter.spans], ["workflow.step", "workflow.run"])
+
+    def test_exception_marks_span_error(self):
+        with self.assertRaises(RuntimeError):
+            with tracing.span("boom"):
+                raise RuntimeError("kaboom")
+        self.assertEqual(self.exporter.spans[0]["status"], tracing.STATUS_ERROR)
+        self.assertIn("kaboom", self.exporter.spans[0]["status_detail"])
+
+    @patch.dict(
+        "servus.orchestrator.ACTIONS",
+        {"test.ok": lambda ctx: True, "test.fail": lambda ctx: False},
+        clear=False,
+    )
+    def test_orchestrator_emits_run_and_step_spans(self):
+        wf = Workflow(
+            name="Trace Workflow",
+            description="Test",
+            steps=[
+                WorkflowStep(id="ok", description="passes", type="action", action="test.ok"),
+                WorkflowStep(id="bad", description="fails", type="action", action="test.fail"),
+            ],
+        )
+        context = {"user_profile": _DummyProfile(), "request_id": "ONB-141", "trigger_source": "test"}
+        orch = Orchestrator(wf, context, RunState(state_file=str(Path(tempfile.gettempdir()) / "trace_state.json")),
+                            logging.getLogger("test.tracing"))
+        orch.notifier = _QuietNotifier()
+        orch.run(dry_run=False)
+
+        by_name = {}
+        for item in self.exporter.spans:
+            by_name.setdefault(item["name"], []).append(item)
+        run_span = by_name["workflow.run"][0]
+        step_spans = by_name["workflow.step"]
+        self.assertEqual(run_span["request_id"], "ONB-141")
+        self.assertEqual(run_span["status"], tracing.STATUS_ERROR)
+        self.assertEqual([s["attributes"]["step_id"] for s in step_spans], ["ok", "bad"])
+        self.assertEqual([s["status"] for s in step_spans], [tracing.STATUS_OK, tracing.STATUS_ERROR])
+        self.assertTrue(all(s["parent_id"] == run_span["span_id"] for s in step_spans))
+
+    def test_jsonl_exporter_round_trip_and_critical_path(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = str(Path(temp_dir) / "traces.jsonl")
+            exporter = tracing.JsonlSpanExporter(trace_path)
+            tracing.set_exporter(exporter)
+            with tracing.span("workflow.run", attributes={"request_id": "OFF-9"}):
+                with tracing.span("workflow.step", attributes={"step_id": "fast"}):
+                    pass
+                with tracing.span("workflow.step", attributes={"step_id": "slow"}):
+                    with tracing.span("http okta", kind="http"):
+                        pass
+            tracing.set_exporter(None)
+
+            spans = tracing.load_spans(tracing.trace_file_paths(trace_path))
+
+        self.assertEqual(len(spans), 4)
+        path = tracing.critical_path(spans)
+        self.assertEqual([item["name"] for item in path], ["workflow.run", "workflow.step", "http okta"])
+        self.assertEqual(path[1]["attributes"]["step_id"], "slow")
+
+    def test_outbound_call_outside_a_span_is_counted_but_not_traced(self):
+        request = SimpleNamespace(method="GET", url="https://unit-test-outbound.example/api?token=x")
+        send = lambda req: SimpleNamespace(status_code=503)
+        label = "unit-test-outbound.example"
+        before_calls = metrics.OUTBOUND_CALLS.value(integration=label)
+        before_errors = metrics.OUTBOUND_ERRORS.value(integration=label)
+
+        tracing._http_tracing_middleware(request, send)
+        self.assertEqual(self.exporter.spans, [])
+        self.assertEqual(metrics.OUTBOUND_CALLS.value(integration=label), before_calls + 1)
+        self.assertEqual(metrics.OUTBOUND_ERRORS.value(integration=label), before_errors + 1)
+
+        with tracing.span("scan.onboarding"):
+            tracing._http_tracing_middleware(request, send)
+        self.assertEqual([item["name"] for item in self.exporter.spans], [f"http {label}", "scan.onboarding"])
+        self.assertEqual(self.exporter.spans[0]["attributes"]["http.url"], f"https://{label}/api")
+        self.assertEqual(metrics.OUTBOUND_CALLS.value(integration=label), before_calls + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
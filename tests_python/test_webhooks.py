@@ -0,0 +1,112 @@
+import json
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+from servus import webhooks
+from servus.config import CONFIG
+from servus.core.match_table import MatchTable
+
+
+class WebhookReceiverTests(unittest.TestCase):
+    def setUp(self):
+        self.table = MatchTable()
+        self.fired = threading.Event()
+        self.receiver = webhooks.WebhookReceiver(
+            self.table,
+            {"rippling": "r-secret", "freshservice": "f-secret"},
+            on_event=self.fired.set,
+            today="2026-03-02",
+        )
+        self.server = webhooks.start_webhook_server(self.receiver, 0)
+
+    def tearDown(self):
+        webhooks.stop_webhook_server()
+
+    def _post(self, source, payload, secret=None, timestamp=None, delivery_id=None):
+        body = json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{self.server.server_port}/webhooks/{source}", data=body, method="POST"
+        )
+        timestamp = str(int(time.time())) if timestamp is None else str(timestamp)
+        request.add_header(webhooks.TIMESTAMP_HEADER, timestamp)
+        if secret:
+            request.add_header(webhooks.SIGNATURE_HEADER, webhooks.sign(secret, body, timestamp))
+        if delivery_id:
+            request.add_header(webhooks.DELIVERY_HEADER, delivery_id)
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+
+    def test_signed_events_from_both_sources_resolve_the_match(self):
+        ticket = {"ticket": {"id": 88, "subject": "New hire", "description_text": "Onboard kayla.durgee@boom.aero"}}
+        self.assertEqual(self._post("freshservice", ticket, secret="f-secret"), 202)
+        self.assertTrue(self.fired.is_set())
+        self.assertEqual(self.table.matched("onboarding"), [])
+
+        worker = {"event": "worker.updated", "data": {"work_email": "Kayla.Durgee@boom.aero", "start_date": "2026-03-02"}}
+        self.assertEqual(self._post("rippling", worker, secret="r-secret"), 202)
+
+        self.assertEqual(self.table.matched("onboarding"), ["kayla.durgee@boom.aero"])
+        self.assertEqual(self.table.ref("onboarding", "kayla.durgee@boom.aero", "freshservice"), "88")
+
+    def test_unsigned_or_wrongly_signed_events_are_rejected(self):
+        worker = {"data": {"work_email": "x@boom.aero", "start_date": "2026-03-02"}}
+        self.assertEqual(self._post("rippling", worker), 401)
+        self.assertEqual(self._post("rippling", worker, secret="f-secret"), 401)
+        self.assertEqual(self._post("unknown", worker, secret="r-secret"), 404)
+        self.assertIsNone(self.table.get("onboarding", "x@boom.aero"))
+        self.assertFalse(self.fired.is_set())
+
+    def test_non_lifecycle_events_are_accepted_without_triggering_a_scan(self):
+        worker = {"data": {"work_email": "x@boom.aero", "start_date": "2026-04-01"}}
+        ticket = {"ticket": {"id": 9, "subject": "Printer jam", "description_text": "x@boom.aero"}}
+        self.assertEqual(self._post("rippling", worker, secret="r-secret"), 202)
+        self.assertEqual(self._post("freshservice", ticket, secret="f-secret"), 202)
+        self.assertFalse(self.fired.is_set())
+
+    def test_standby_receiver_answers_503_without_touching_the_table(self):
+        standby = webhooks.WebhookReceiver(self.table, {"rippling": "r-secret"}, today="2026-03-02", accepting=lambda: False)
+        body = json.dumps({"data": {"work_email": "x@boom.aero", "start_date": "2026-03-02"}}).encode("utf-8")
+
+        self.assertEqual(standby.handle("rippling", body, webhooks.sign("r-secret", body, 1), timestamp="1")[0], 503)
+        self.assertIsNone(self.table.get("onboarding", "x@boom.aero"))
+
+    def test_stale_and_replayed_deliveries_are_not_applied(self):
+        worker = {"data": {"work_email": "x@boom.aero", "start_date": "2026-03-02"}}
+        self.assertEqual(self._post("rippling", worker, secret="r-secret", timestamp=int(time.time()) - 3600), 401)
+        self.assertIsNone(self.table.get("onboarding", "x@boom.aero"))
+
+        body = json.dumps(worker).encode("utf-8")
+        timestamp = str(int(time.time()))
+        signature = webhooks.sign("r-secret", body, timestamp)
+        self.assertEqual(self.receiver.handle("rippling", body, signature, timestamp=timestamp), (202, "accepted"))
+        self.table.sync("onboarding", "rippling", {}, now=time.time() + 2 * 3600)
+        self.fired.clear()
+
+        # A captured request replayed inside the window is acknowledged but not applied.
+        self.assertEqual(self.receiver.handle("rippling", body, signature, timestamp=timestamp)[0], 200)
+        self.assertIsNone(self.table.get("onboarding", "x@boom.aero"))
+        # A redelivery re-signed with a new timestamp is still recognized by its delivery id.
+        self.assertEqual(self._post("rippling", worker, secret="r-secret", timestamp=int(time.time()) - 1, delivery_id="evt-1"), 202)
+        self.assertEqual(self._post("rippling", worker, secret="r-secret", timestamp=int(time.time()) + 1, delivery_id="evt-1"), 200)
+
+    def test_today_follows_the_workers_lifecycle_timezone(self):
+        receiver = webhooks.WebhookReceiver(self.table, {"rippling": "r-secret"})
+        # 2026-03-02 20:00 UTC is already 2026-03-03 on Kiritimati (UTC+14).
+        with patch.dict(CONFIG, {"LIFECYCLE_TIMEZONES": "KI=Pacific/Kiritimati", "LIFECYCLE_DEFAULT_TIMEZONE": "UTC"}):
+            with patch.object(webhooks.time, "time", return_value=1772481600.0):
+                self.assertEqual(receiver.today(), "2026-03-02")
+                observations = receiver.normalize_rippling(
+                    {"data": {"work_email": "k@boom.aero", "country": {"code": "KI"}, "start_date": "2026-03-03"}}
+                )
+        self.assertEqual(observations, [("onboarding", "k@boom.aero", "2026-03-03")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from servus import metrics
+from servus.config import CONFIG
+from servus.core.trigger_validator import ValidatedTrigger
+from servus.fake_services import FakeServices
+from servus.integrations import badge_queue
+from servus.models import UserProfile
+from servus.state import RunState
+from servus.work_queue import SQLiteWorkQueue, SQSWorkQueue, configure_work_queue
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "scheduler.py"
+SPEC = importlib.util.spec_from_file_location("scheduler", SCRIPT_PATH)
+scheduler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(scheduler)
+
+
+def _trigger(email="kayla.durgee@boom.aero"):
+    first, last = email.split("@")[0].split(".")
+    return ValidatedTrigger(
+        user_profile=UserProfile(
+            first_name=first.title(),
+            last_name=last.title(),
+            work_email=email,
+            department="IT",
+            employment_type="Salaried, full-time",
+            start_date="2026-03-02",
+        ),
+        confirmation_source_a="rippling",
+        confirmation_source_b="freshservice",
+    )
+
+
+class SQLiteWorkQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "work_queue.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_claims_in_priority_order_and_dedupes_active_and_recent_keys(self):
+        queue = SQLiteWorkQueue(self.path)
+        self.assertTrue(queue.publish("validated_onboarding", "onboarding:a", {"n": 1}))
+        self.assertTrue(queue.publish("validated_offboarding", "offboarding:b", {"n": 2}, priority="offboarding"))
+        self.assertTrue(queue.publish("validated_offboarding", "offboarding:c", {"n": 3}, priority="emergency_revocation"))
+        self.assertFalse(queue.publish("validated_onboarding", "onboarding:a", {"n": 1}))
+
+        claimed = [queue.claim("w1", 60) for _ in range(3)]
+        self.assertEqual([item["key"] for item in claimed], ["offboarding:c", "offboarding:b", "onboarding:a"])
+        self.assertIsNone(queue.claim("w1", 60))
+
+        self.assertTrue(queue.complete(claimed[2]))
+        self.assertFalse(queue.publish("validated_onboarding", "onboarding:a", {"n": 1}))
+        self.assertEqual(queue.stats(), {"backend": "sqlite", "claimed": 2, "done": 1})
+
+    def test_expired_claim_is_redelivered_and_stale_receipt_cannot_complete(self):
+        queue = SQLiteWorkQueue(self.path, max_attempts=2)
+        queue.publish("validated_onboarding", "onboarding:a", {"n": 1})
+        first = queue.claim("w1", 0.5)
+        self.assertIsNone(queue.claim("w2", 60))
+
+        time.sleep(0.6)
+        second = queue.claim("w2", 0.5)
+        self.assertEqual(second["key"], "onboarding:a")
+        self.assertEqual(second["attempts"], 2)
+        self.assertFalse(queue.heartbeat(first, 60))
+        self.assertFalse(queue.complete(first))
+
+        # The second worker dies too: max_attempts parks the item instead of looping.
+        time.sleep(0.6)
+        self.assertIsNone(queue.claim("w3", 60))
+        self.assertEqual(queue.stats()["failed"], 1)
+
+    def test_heartbeat_keeps_the_claim_and_fail_requeues(self):
+        queue = SQLiteWorkQueue(self.path)
+        queue.publish("validated_onboarding", "onboarding:a", {"n": 1})
+        item = queue.claim("w1", 0.5)
+        self.assertTrue(queue.heartbeat(item, 60))
+        time.sleep(0.6)
+        self.assertIsNone(queue.claim("w2", 60))
+
+        self.assertTrue(queue.fail(item, "boom", retry_after=0))
+        retried = queue.claim("w2", 60)
+        self.assertEqual(retried["attempts"], 2)
+
+    def test_configure_work_queue_backends(self):
+        self.assertIsNone(configure_work_queue({"WORK_QUEUE_BACKEND": ""}))
+        queue = configure_work_queue({"WORK_QUEUE_BACKEND": "sqlite"}, state_dir=self.temp_dir.name)
+        self.assertEqual(queue.path, self.path)
+        with self.assertRaisesRegex(ValueError, "WORK_QUEUE_SQS_URL"):
+            configure_work_queue({"WORK_QUEUE_BACKEND": "sqs"})
+        with self.assertRaisesRegex(ValueError, "Unsupported"):
+            configure_work_queue({"WORK_QUEUE_BACKEND": "kafka"})
+
+
+class SQSWorkQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.fakes = FakeServices(seed=7).start()
+        self.config_patch = patch.dict(CONFIG, self.fakes.config_overrides())
+        self.config_patch.start()
+
+    def tearDown(self):
+        self.config_patch.stop()
+        self.fakes.stop()
+
+    def test_publish_claim_redeliver_and_complete_against_fake_sqs(self):
+        queue = SQSWorkQueue(CONFIG["SQS_BADGE_QUEUE_URL"], client=badge_queue.get_sqs_client(), wait_seconds=0)
+        self.assertTrue(queue.publish("validated_onboarding", "onboarding:a", {"n": 1}))
+        self.assertFalse(queue.publish("validated_onboarding", "onboarding:a", {"n": 1}))
+
+        first = queue.claim("w1", 1)
+        self.assertEqual(first["payload"], {"n": 1})
+        self.assertIsNone(queue.claim("w2", 1))
+        self.assertTrue(queue.heartbeat(first, 0))
+
+        second = queue.claim("w2", 30)
+        self.assertEqual(second["attempts"], 2)
+        self.assertTrue(queue.complete(second))
+        self.assertEqual(self.fakes.sqs_messages, [])
+
+
+class SchedulerWorkQueueTests(unittest.TestCase):
+    def test_dispatch_publishes_and_worker_runs_it_once(self):
+        trigger = _trigger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state = RunState(state_file=os.path.join(temp_dir, "scheduler_state.json"))
+            queue = SQLiteWorkQueue(os.path.join(temp_dir, "work_queue.db"))
+            runs = []
+
+            def _fake_onboarding(user, trigger_source="dual_validation", request_id=None):
+                runs.append(user.work_email)
+                scheduler._record_successful_onboarding(user, trigger_source, request_id=request_id)
+                return True
+
+            with patch.object(scheduler, "scheduler_state", state), patch.object(
+                scheduler, "work_queue", queue
+            ), patch.object(scheduler, "run_onboarding", side_effect=_fake_onboarding):
+                key = scheduler._run_key("onboarding", trigger.user_profile)
+                self.assertTrue(
+                    scheduler._dispatch_run(key, scheduler._execute_validated_onboarding, trigger, description="onboarding")
+                )
+                self.assertFalse(scheduler._dispatch_run(key, scheduler._execute_validated_onboarding, trigger))
+                self.assertEqual(runs, [])
+
+                item = scheduler.work_once(queue, "host-a/worker-0", visibility_seconds=60)
+                self.assertEqual(item["kind"], "validated_onboarding")
+                self.assertIsNone(scheduler.work_once(queue, "host-a/worker-0", visibility_seconds=60))
+
+                # A redelivered copy (worker died after recording success) is not run again.
+                scheduler._execute_work_item(item)
+
+            self.assertEqual(runs, ["kayla.durgee@boom.aero"])
+            self.assertEqual(queue.stats()["done"], 1)
+            self.assertIn("kayla.durgee@boom.aero|2026-03-02", state.get(scheduler.ONBOARDING_SUCCESS_KEY))
+
+    def test_worker_exports_its_own_metrics_after_each_item(self):
+        trigger = _trigger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state = RunState(state_file=os.path.join(temp_dir, "scheduler_state.json"))
+            queue = SQLiteWorkQueue(os.path.join(temp_dir, "work_queue.db"))
+            textfile = os.path.join(temp_dir, "servus.prom")
+
+            def _fake_onboarding(user, trigger_source="dual_validation", request_id=None):
+                metrics.RUNS_STARTED.inc(workflow="onboarding-test")
+                return True
+
+            with patch.dict(CONFIG, {"METRICS_TEXTFILE": textfile, "METRICS_HTTP_PORT": 0}), patch.object(
+                metrics, "_textfile_path", None
+            ), patch.object(metrics.REGISTRY, "constant_labels", {}), patch.object(
+                scheduler, "scheduler_state", state
+            ), patch.object(scheduler, "run_onboarding", side_effect=_fake_onboarding):
+                self.assertTrue(scheduler._configure_worker_exporters(2))
+                finished = metrics.WORK_ITEMS_FINISHED.value(kind="validated_onboarding", outcome="done")
+                queue.publish("validated_onboarding", "onboarding:a", {"trigger": scheduler._trigger_payload(trigger)})
+                scheduler.work_once(queue, "host-a/worker-2", visibility_seconds=60)
+
+                self.assertEqual(
+                    metrics.WORK_ITEMS_FINISHED.value(kind="validated_onboarding", outcome="done"), finished + 1
+                )
+                with open(os.path.join(temp_dir, "servus.worker-2.prom"), "r", encoding="utf-8") as handle:
+                    exported = handle.read()
+
+            self.assertFalse(os.path.exists(textfile))
+            self.assertIn('servus_workflow_runs_started_total{worker="worker-2",workflow="onboarding-test"}', exported)
+            self.assertIn('servus_work_items_finished_total{worker="worker-2",kind="validated_onboarding",outcome="done"}', exported)
+
+    def test_shared_state_update_keeps_writes_from_other_processes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "scheduler_state.json")
+            scheduler_side = RunState(state_file=path)
+            worker_side = RunState(state_file=path)
+            scheduler_side.share()
+            worker_side.share()
+
+            worker_side.update("onboarding_success", lambda history: {**(history or {}), "a": 1})
+            scheduler_side.update("onboarding_success", lambda history: {**(history or {}), "b": 2})
+            scheduler_side.set("roster", [])
+
+            self.assertEqual(RunState(state_file=path).get("onboarding_success"), {"a": 1, "b": 2})
+
+    def test_redelivered_item_sees_success_recorded_by_another_process(self):
+        trigger = _trigger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "scheduler_state.json")
+            stale_worker = RunState(state_file=path)
+            first_worker = RunState(state_file=path)
+            stale_worker.share()
+            first_worker.share()
+            item = {"kind": "validated_onboarding", "payload": {"trigger": scheduler._trigger_payload(trigger)}}
+
+            # The first worker finished the run; the second loaded its state before that.
+            with patch.object(scheduler, "scheduler_state", first_worker):
+                scheduler._record_successful_onboarding(trigger.user_profile, "dual_validation")
+            with patch.object(scheduler, "scheduler_state", stale_worker), patch.object(
+                scheduler, "run_onboarding", return_value=True
+            ) as run_onboarding:
+                self.assertTrue(scheduler._execute_work_item(item))
+            run_onboarding.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()